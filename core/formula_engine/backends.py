@@ -0,0 +1,207 @@
+"""
+Formula backend registry.
+
+Each FormulaBackend describes one formula engine: how to create its
+processor, whether it can run here, which Excel functions it implements and
+how fast it is relative to the others. The registry routes each compiled
+formula to the fastest available backend that implements every function it
+uses, and lists the remaining backends to fall back to when an engine turns
+a formula down at evaluation time (e.g. UnsupportedFormulaError for a
+mixed-type column).
+
+Processors are imported only when a backend is used, so the registry can be
+inspected where COM is unavailable.
+"""
+
+import importlib
+import importlib.util
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Union
+
+import pandas as pd
+
+from core.formula_engine.formula_parser import ArrayLiteral, NameReference, iter_nodes
+from core.rule_engine.rule_parser import CompiledFormula, compile_formula
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FormulaBackend:
+    """A formula engine and what it can evaluate"""
+    name: str
+    processor_path: str  # "module:Class" of the processor, imported on first use
+    speed_rank: int  # Lower is faster
+    # Excel functions implemented; None means every function (Excel itself)
+    functions: Optional[FrozenSet[str]] = None
+    # Whether the processor takes CompiledFormula objects instead of formula text
+    accepts_compiled: bool = False
+    # Whether cell references and array constants can be evaluated
+    supports_references: bool = False
+    # Module that must be importable for the backend to run
+    requires_module: Optional[str] = None
+    processor_options: Optional[Dict[str, Any]] = None
+
+    def is_available(self) -> bool:
+        """Whether the backend can run in this environment"""
+        return self.requires_module is None or importlib.util.find_spec(self.requires_module) is not None
+
+    def supports(self, compiled: CompiledFormula) -> bool:
+        """
+        Check whether every function and reference in a formula is implemented.
+
+        Args:
+            compiled: Compiled formula
+
+        Returns:
+            True if the backend can translate the formula (invalid formulas are
+            accepted so the syntax error is reported per column)
+        """
+        if not compiled.is_valid:
+            return True
+        if self.functions is not None and not compiled.functions <= self.functions:
+            return False
+        if not self.supports_references:
+            return not any(isinstance(node, (NameReference, ArrayLiteral)) for node in iter_nodes(compiled.ast))
+        return True
+
+    def unsupported_functions(self, compiled: CompiledFormula) -> FrozenSet[str]:
+        """Functions of a formula this backend does not implement"""
+        if self.functions is None or not compiled.is_valid:
+            return frozenset()
+        return compiled.functions - self.functions
+
+    def create_processor(self, **options):
+        """
+        Create a processor for this backend.
+
+        Args:
+            **options: Processor options (e.g. visible for Excel)
+
+        Returns:
+            Processor usable as a context manager, exposing process_formulas()
+        """
+        module_name, class_name = self.processor_path.split(":")
+        processor_class = getattr(importlib.import_module(module_name), class_name)
+        return processor_class(track_errors=True, **{**(self.processor_options or {}), **options})
+
+    def formula_for(self, compiled: CompiledFormula, text: str) -> Union[str, CompiledFormula]:
+        """The formula in the form the processor takes"""
+        return compiled if self.accepts_compiled else text
+
+
+class FormulaBackendRegistry:
+    """
+    Registered formula backends, with per-formula routing and fallback order.
+    """
+
+    def __init__(self, backends: Optional[List[FormulaBackend]] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            backends: Backends to register
+        """
+        self._backends: Dict[str, FormulaBackend] = {}
+        for backend in backends or []:
+            self.register(backend)
+
+    def register(self, backend: FormulaBackend) -> None:
+        """Add or replace a backend"""
+        self._backends[backend.name] = backend
+
+    def get(self, name: str) -> FormulaBackend:
+        """
+        Look up a backend by name.
+
+        Raises:
+            ValueError: If no backend has that name
+        """
+        if name not in self._backends:
+            raise ValueError(f"Unknown formula backend '{name}'. Must be one of: {', '.join(self._backends)}")
+        return self._backends[name]
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._backends)
+
+    def available_backends(self) -> List[FormulaBackend]:
+        """Backends that can run here, fastest first"""
+        return sorted((b for b in self._backends.values() if b.is_available()), key=lambda b: b.speed_rank)
+
+    def candidates(self, formula: Union[str, CompiledFormula]) -> List[FormulaBackend]:
+        """
+        Available backends that support a formula, fastest first.
+
+        Args:
+            formula: Formula text or compiled formula
+
+        Returns:
+            Backends to try in order; the first is the routed backend
+        """
+        compiled = formula if isinstance(formula, CompiledFormula) else compile_formula(formula)
+        return [backend for backend in self.available_backends() if backend.supports(compiled)]
+
+    def route(self, formula: Union[str, CompiledFormula]) -> Optional[FormulaBackend]:
+        """Fastest available backend supporting a formula, or None if none does"""
+        candidates = self.candidates(formula)
+        return candidates[0] if candidates else None
+
+    def capability_matrix(self, functions: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Which backend implements which Excel function.
+
+        Args:
+            functions: Functions to list (default: every function a backend declares)
+
+        Returns:
+            Boolean DataFrame indexed by function, one column per backend
+            (fastest first), with an "available" row saying whether the
+            backend can run here
+        """
+        if functions is None:
+            functions = sorted(set().union(*(b.functions for b in self._backends.values()
+                                             if b.functions is not None)))
+        backends = sorted(self._backends.values(), key=lambda b: b.speed_rank)
+        matrix = pd.DataFrame(
+            {b.name: [b.functions is None or f.upper() in b.functions for f in functions] for b in backends},
+            index=pd.Index([f.upper() for f in functions], name="function")
+        )
+        matrix.loc["available"] = [b.is_available() for b in backends]
+        return matrix
+
+
+def _supported_functions(module_name: str) -> FrozenSet[str]:
+    """Function table of a processor module"""
+    return frozenset(importlib.import_module(module_name).SUPPORTED_FUNCTIONS)
+
+
+def default_backend_registry() -> FormulaBackendRegistry:
+    """
+    Registry of the bundled backends: native (vectorized, in memory), SQLite
+    (out of core) and Excel via COM where pywin32 is installed.
+    """
+    return FormulaBackendRegistry([
+        FormulaBackend(
+            name="native",
+            processor_path="core.formula_engine.native_formula_processor:NativeFormulaProcessor",
+            speed_rank=0,
+            functions=_supported_functions("core.formula_engine.native_formula_processor"),
+            accepts_compiled=True
+        ),
+        FormulaBackend(
+            name="sqlite",
+            processor_path="core.formula_engine.sqlite_formula_processor:SqliteFormulaProcessor",
+            speed_rank=1,
+            functions=_supported_functions("core.formula_engine.sqlite_formula_processor"),
+            accepts_compiled=True
+        ),
+        FormulaBackend(
+            name="excel",
+            processor_path="core.formula_engine.excel_formula_processor:ExcelFormulaProcessor",
+            speed_rank=2,
+            supports_references=True,
+            requires_module="win32com"
+        ),
+    ])
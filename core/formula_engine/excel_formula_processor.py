@@ -366,6 +366,34 @@ class ExcelFormulaProcessor:
 
         return value
 
+    def _convert_result_values(self, range_values: Any, num_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert the values read back from a single-column result range.
+
+        Args:
+            range_values: Range.Value as returned by COM (a scalar for one row,
+                          otherwise a tuple of one-element row tuples)
+            num_rows: Number of rows in the range
+
+        Returns:
+            Tuple of (typed result array, error column array)
+        """
+        if num_rows == 1:
+            values = np.empty(1, dtype=object)
+            values[0] = range_values
+        else:
+            values = np.array(range_values, dtype=object).reshape(num_rows, -1)[:, 0]
+
+        # Infer a bool/float column in one step, falling back to object for mixed results
+        result_values = pd.Series(values, dtype=object).infer_objects().to_numpy()
+
+        # Excel error strings and COM error codes, classified with a single lookup
+        error_lookup = {**self.EXCEL_ERRORS, **self.COM_ERROR_CODES}
+        errors = pd.Series(values, dtype=object).map(error_lookup)
+        error_values = errors.where(errors.notna(), "").to_numpy(dtype=object)
+
+        return result_values, error_values
+
     def prepare_data_for_excel(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Prepare DataFrame for Excel by converting problematic data types.
@@ -464,8 +492,8 @@ class ExcelFormulaProcessor:
         if not self.excel or not self.workbook:
             self.start_excel()
 
-        # Create a copy of the input DataFrame
-        result_df = data.copy()
+        # New result and error columns, assigned to the output once at the end
+        new_columns: Dict[str, Any] = {}
 
         # Prepare data for Excel
         excel_compatible_df = self.prepare_data_for_excel(data)
@@ -520,12 +548,12 @@ class ExcelFormulaProcessor:
 
             for output_col, formula_template in formulas.items():
                 # Add new column for formula results
-                result_df[output_col] = np.nan
+                new_columns[output_col] = np.full(num_rows, np.nan)
 
                 # Also add error tracking column if enabled
                 if self.track_errors:
                     error_col = f"{output_col}_Error"
-                    result_df[error_col] = ""
+                    new_columns[error_col] = np.full(num_rows, "", dtype=object)
 
                 # Replace column references with named ranges
                 formula = formula_template
@@ -558,12 +586,9 @@ class ExcelFormulaProcessor:
                 except Exception as e:
                     logger.error(f"[Session {self.session_id}] Error setting formula '{formula}': {str(e)}")
                     # If formula setting fails, mark all cells in column as error
-                    for i in range(num_rows):
-                        error_msg = f"ERROR: {str(e)}"
-                        # Use our utility for safe value setting
-                        set_dataframe_value(result_df, i, output_col, error_msg)
-                        if self.track_errors:
-                            set_dataframe_value(result_df, i, f"{output_col}_Error", "FORMULA_SETTING_ERROR")
+                    new_columns[output_col] = np.full(num_rows, f"ERROR: {str(e)}", dtype=object)
+                    if self.track_errors:
+                        new_columns[f"{output_col}_Error"] = np.full(num_rows, "FORMULA_SETTING_ERROR", dtype=object)
                     continue
 
                 # Store mapping for later retrieval
@@ -582,8 +607,6 @@ class ExcelFormulaProcessor:
 
             # Retrieve formula results
             for output_col, formula_col in formula_col_mapping.items():
-                error_col = f"{output_col}_Error" if self.track_errors else None
-
                 # Get the range with formula results
                 if num_rows > 0:
                     result_range = self.worksheet.Range(
@@ -591,39 +614,17 @@ class ExcelFormulaProcessor:
                         self.worksheet.Cells(start_row + num_rows - 1, formula_col)
                     )
 
-                    # Get values all at once
-                    result_values = result_range.Value
-
-                    # Handle both single and multiple row results
-                    if num_rows == 1:
-                        value = result_values
-                        # Use our utility for safe value setting
-                        set_dataframe_value(result_df, 0, output_col, value)
+                    # Get values all at once and convert them column-wise
+                    result_values, error_values = self._convert_result_values(result_range.Value, num_rows)
+                    new_columns[output_col] = result_values
+                    if self.track_errors:
+                        new_columns[f"{output_col}_Error"] = error_values
 
-                        # Track error if needed
-                        if error_col:
-                            if isinstance(value, str) and value in self.EXCEL_ERRORS:
-                                set_dataframe_value(result_df, i, error_col, self.normalize_excel_error(value))
-                            elif isinstance(value, (int, float)) and value in self.COM_ERROR_CODES:
-                                set_dataframe_value(result_df, i, error_col, self.COM_ERROR_CODES[value])
-                            else:
-                                pass  # No error detected
-
-                    else:
-                        # Convert tuple of tuples to list
-                        for i, value_tuple in enumerate(result_values):
-                            # Get the actual value (first item in tuple)
-                            if isinstance(value_tuple, tuple):
-                                value = value_tuple[0]
-                            else:
-                                value = value_tuple
-
-                            # Use our utility for safe value setting
-                            set_dataframe_value(result_df, i, output_col, value)
-
-                            # Track error if needed
-                            if error_col and self.is_excel_error(value):
-                                set_dataframe_value(result_df, i, error_col, self.normalize_excel_error(value))
+            result_df = data.copy()
+            if new_columns:
+                # Drop any existing output columns so they are replaced, not duplicated
+                result_df = result_df.drop(columns=[c for c in new_columns if c in result_df.columns])
+                result_df = pd.concat([result_df, pd.DataFrame(new_columns, index=data.index)], axis=1)
 
             return result_df
 
@@ -651,8 +652,8 @@ class ExcelFormulaProcessor:
         if not self.excel or not self.workbook:
             self.start_excel()
 
-        # Create a copy of the input DataFrame
-        result_df = data.copy()
+        # New result and error columns, assigned to the output once at the end
+        new_columns: Dict[str, Any] = {}
 
         # Prepare data for Excel
         excel_compatible_df = self.prepare_data_for_excel(data)
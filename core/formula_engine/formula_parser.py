@@ -0,0 +1,464 @@
+"""
+Excel formula tokenizer and parser.
+
+Turns the ``=``-prefixed formulas used by validation rules (with ``[Column]``
+style column references) into a small abstract syntax tree that evaluation
+backends can walk without re-scanning the formula text.
+"""
+
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+
+class FormulaSyntaxError(ValueError):
+    """Raised when a formula cannot be tokenized or parsed"""
+
+    def __init__(self, message: str, position: Optional[int] = None):
+        self.position = position
+        if position is not None:
+            message = f"{message} (at position {position})"
+        super().__init__(message)
+
+
+# Excel error literals that may appear directly in a formula
+ERROR_LITERALS = ("#DIV/0!", "#N/A", "#NAME?", "#NULL!", "#NUM!", "#REF!",
+                  "#VALUE!", "#GETTING_DATA", "#SPILL!", "#CALC!")
+
+# Comparison operators (lowest precedence)
+COMPARISON_OPERATORS = ("=", "<>", "<", "<=", ">", ">=")
+
+
+# --- Tokens -----------------------------------------------------------------
+
+@dataclass(frozen=True)
+class Token:
+    """A single lexical token of a formula"""
+    kind: str  # NUMBER, STRING, BOOL, ERROR, COLUMN, NAME, FUNC, OP, LPAREN, RPAREN, COMMA, SEMICOLON, LBRACE, RBRACE
+    value: str
+    position: int
+
+
+_NUMBER_RE = re.compile(r'\d+(\.\d*)?([eE][+-]?\d+)?|\.\d+([eE][+-]?\d+)?')
+_NAME_RE = re.compile(r"[A-Za-z_$][A-Za-z0-9_.$:!]*")
+_OPERATOR_CHARS = ("<>", "<=", ">=", "+", "-", "*", "/", "^", "&", "=", "<", ">", "%")
+
+
+def tokenize(formula: str) -> List[Token]:
+    """
+    Split a formula into tokens.
+
+    Args:
+        formula: Formula text, with or without the leading "="
+
+    Returns:
+        List of tokens (the leading "=" is not included)
+
+    Raises:
+        FormulaSyntaxError: If the formula contains an unterminated string,
+            column reference or an unexpected character
+    """
+    if not isinstance(formula, str):
+        raise FormulaSyntaxError("Formula must be a string")
+
+    text = formula
+    pos = 0
+    length = len(text)
+
+    # Skip leading whitespace and the "=" prefix
+    while pos < length and text[pos].isspace():
+        pos += 1
+    if pos < length and text[pos] == "=":
+        pos += 1
+
+    tokens: List[Token] = []
+    while pos < length:
+        char = text[pos]
+
+        if char.isspace():
+            pos += 1
+            continue
+
+        # String literal, "" is an escaped quote
+        if char == '"':
+            start = pos
+            pos += 1
+            chunks = []
+            while True:
+                end = text.find('"', pos)
+                if end == -1:
+                    raise FormulaSyntaxError("Unterminated string literal", start)
+                chunks.append(text[pos:end])
+                if end + 1 < length and text[end + 1] == '"':
+                    chunks.append('"')
+                    pos = end + 2
+                    continue
+                pos = end + 1
+                break
+            tokens.append(Token("STRING", "".join(chunks), start))
+            continue
+
+        # Column reference [Column Name]
+        if char == "[":
+            end = text.find("]", pos + 1)
+            if end == -1:
+                raise FormulaSyntaxError("Unterminated column reference", pos)
+            name = text[pos + 1:end]
+            if not name or "[" in name:
+                raise FormulaSyntaxError("Invalid column reference", pos)
+            tokens.append(Token("COLUMN", name, pos))
+            pos = end + 1
+            continue
+
+        # Error literal such as #N/A
+        if char == "#":
+            for error in ERROR_LITERALS:
+                if text[pos:pos + len(error)].upper() == error:
+                    tokens.append(Token("ERROR", error, pos))
+                    pos += len(error)
+                    break
+            else:
+                raise FormulaSyntaxError("Unknown error literal", pos)
+            continue
+
+        # Numbers
+        if char.isdigit() or (char == "." and pos + 1 < length and text[pos + 1].isdigit()):
+            match = _NUMBER_RE.match(text, pos)
+            tokens.append(Token("NUMBER", match.group(0), pos))
+            pos = match.end()
+            continue
+
+        # Function names, booleans and bare names (cell references, named ranges)
+        match = _NAME_RE.match(text, pos)
+        if match:
+            word = match.group(0)
+            end = match.end()
+            # Look past whitespace for an opening parenthesis
+            lookahead = end
+            while lookahead < length and text[lookahead].isspace():
+                lookahead += 1
+            if lookahead < length and text[lookahead] == "(":
+                tokens.append(Token("FUNC", word.upper(), pos))
+            elif word.upper() in ("TRUE", "FALSE"):
+                tokens.append(Token("BOOL", word.upper(), pos))
+            else:
+                tokens.append(Token("NAME", word, pos))
+            pos = end
+            continue
+
+        if char == "(":
+            tokens.append(Token("LPAREN", char, pos))
+        elif char == ")":
+            tokens.append(Token("RPAREN", char, pos))
+        elif char == ",":
+            tokens.append(Token("COMMA", char, pos))
+        elif char == ";":
+            tokens.append(Token("SEMICOLON", char, pos))
+        elif char == "{":
+            tokens.append(Token("LBRACE", char, pos))
+        elif char == "}":
+            tokens.append(Token("RBRACE", char, pos))
+        else:
+            for operator in _OPERATOR_CHARS:
+                if text.startswith(operator, pos):
+                    tokens.append(Token("OP", operator, pos))
+                    pos += len(operator)
+                    break
+            else:
+                raise FormulaSyntaxError(f"Unexpected character '{char}'", pos)
+            continue
+
+        pos += 1
+
+    return tokens
+
+
+# --- AST nodes --------------------------------------------------------------
+# Nodes are frozen dataclasses so that structurally identical subtrees compare
+# and hash equal, which lets callers cache and share them.
+
+@dataclass(frozen=True)
+class NumberLiteral:
+    value: float
+
+
+@dataclass(frozen=True)
+class StringLiteral:
+    value: str
+
+
+@dataclass(frozen=True)
+class BooleanLiteral:
+    value: bool
+
+
+@dataclass(frozen=True)
+class ErrorLiteral:
+    value: str  # One of ERROR_LITERALS
+
+
+@dataclass(frozen=True)
+class ArrayLiteral:
+    rows: Tuple[Tuple['FormulaNode', ...], ...]
+
+
+@dataclass(frozen=True)
+class ColumnReference:
+    name: str
+
+
+@dataclass(frozen=True)
+class NameReference:
+    """Bare name such as a cell reference (A1), range (A1:B2) or named range"""
+    name: str
+
+
+@dataclass(frozen=True)
+class UnaryOperation:
+    operator: str  # "-", "+" or "%" (postfix)
+    operand: 'FormulaNode'
+
+
+@dataclass(frozen=True)
+class BinaryOperation:
+    operator: str
+    left: 'FormulaNode'
+    right: 'FormulaNode'
+
+
+@dataclass(frozen=True)
+class FunctionCall:
+    name: str  # Upper-case function name
+    args: Tuple['FormulaNode', ...]
+
+
+FormulaNode = Union[NumberLiteral, StringLiteral, BooleanLiteral, ErrorLiteral, ArrayLiteral,
+                    ColumnReference, NameReference, UnaryOperation, BinaryOperation, FunctionCall]
+
+
+# --- Parser -----------------------------------------------------------------
+
+class _Parser:
+    """Recursive-descent parser following Excel operator precedence"""
+
+    # Binary operator precedence levels, lowest first
+    _LEVELS = (
+        COMPARISON_OPERATORS,
+        ("&",),
+        ("+", "-"),
+        ("*", "/"),
+        ("^",),
+    )
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.index = 0
+
+    def _peek(self) -> Optional[Token]:
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def _next(self) -> Token:
+        token = self._peek()
+        if token is None:
+            raise FormulaSyntaxError("Unexpected end of formula")
+        self.index += 1
+        return token
+
+    def _expect(self, kind: str) -> Token:
+        token = self._next()
+        if token.kind != kind:
+            raise FormulaSyntaxError(f"Expected {kind} but found '{token.value}'", token.position)
+        return token
+
+    def parse(self) -> FormulaNode:
+        if not self.tokens:
+            raise FormulaSyntaxError("Empty formula")
+        node = self._parse_level(0)
+        token = self._peek()
+        if token is not None:
+            raise FormulaSyntaxError(f"Unexpected token '{token.value}'", token.position)
+        return node
+
+    def _parse_level(self, level: int) -> FormulaNode:
+        if level == len(self._LEVELS):
+            return self._parse_unary()
+
+        node = self._parse_level(level + 1)
+        operators = self._LEVELS[level]
+        while True:
+            token = self._peek()
+            if token is None or token.kind != "OP" or token.value not in operators:
+                return node
+            self.index += 1
+            right = self._parse_level(level + 1)
+            node = BinaryOperation(token.value, node, right)
+
+    def _parse_unary(self) -> FormulaNode:
+        token = self._peek()
+        if token is not None and token.kind == "OP" and token.value in ("-", "+"):
+            self.index += 1
+            return UnaryOperation(token.value, self._parse_unary())
+        return self._parse_postfix()
+
+    def _parse_postfix(self) -> FormulaNode:
+        node = self._parse_primary()
+        token = self._peek()
+        while token is not None and token.kind == "OP" and token.value == "%":
+            self.index += 1
+            node = UnaryOperation("%", node)
+            token = self._peek()
+        return node
+
+    def _parse_primary(self) -> FormulaNode:
+        token = self._next()
+
+        if token.kind == "NUMBER":
+            return NumberLiteral(float(token.value))
+        if token.kind == "STRING":
+            return StringLiteral(token.value)
+        if token.kind == "BOOL":
+            return BooleanLiteral(token.value == "TRUE")
+        if token.kind == "ERROR":
+            return ErrorLiteral(token.value)
+        if token.kind == "COLUMN":
+            return ColumnReference(token.value)
+        if token.kind == "NAME":
+            return NameReference(token.value)
+        if token.kind == "LPAREN":
+            node = self._parse_level(0)
+            self._expect("RPAREN")
+            return node
+        if token.kind == "LBRACE":
+            return self._parse_array(token)
+        if token.kind == "FUNC":
+            return self._parse_function(token)
+
+        raise FormulaSyntaxError(f"Unexpected token '{token.value}'", token.position)
+
+    def _parse_function(self, name_token: Token) -> FormulaNode:
+        self._expect("LPAREN")
+        args: List[FormulaNode] = []
+
+        token = self._peek()
+        if token is not None and token.kind == "RPAREN":
+            self.index += 1
+            return FunctionCall(name_token.value, tuple(args))
+
+        while True:
+            args.append(self._parse_level(0))
+            token = self._next()
+            if token.kind == "RPAREN":
+                break
+            if token.kind != "COMMA":
+                raise FormulaSyntaxError(f"Expected ',' or ')' but found '{token.value}'", token.position)
+
+        return FunctionCall(name_token.value, tuple(args))
+
+    def _parse_array(self, open_token: Token) -> FormulaNode:
+        rows: List[Tuple[FormulaNode, ...]] = []
+        row: List[FormulaNode] = []
+        while True:
+            row.append(self._parse_unary())
+            token = self._next()
+            if token.kind == "COMMA":
+                continue
+            if token.kind == "SEMICOLON":
+                rows.append(tuple(row))
+                row = []
+                continue
+            if token.kind == "RBRACE":
+                rows.append(tuple(row))
+                break
+            raise FormulaSyntaxError(f"Unexpected token '{token.value}' in array constant", token.position)
+
+        if len({len(r) for r in rows}) != 1:
+            raise FormulaSyntaxError("Array constant rows must have the same length", open_token.position)
+        return ArrayLiteral(tuple(rows))
+
+
+def parse_formula(formula: str) -> FormulaNode:
+    """
+    Parse a formula into an AST.
+
+    Args:
+        formula: Formula text such as '=NOT(ISBLANK([Column]))'
+
+    Returns:
+        Root node of the formula AST
+
+    Raises:
+        FormulaSyntaxError: If the formula is not syntactically valid
+    """
+    return _Parser(tokenize(formula)).parse()
+
+
+def iter_nodes(node: FormulaNode):
+    """Yield every node of an AST in depth-first order (parents first)"""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        yield current
+        if isinstance(current, UnaryOperation):
+            stack.append(current.operand)
+        elif isinstance(current, BinaryOperation):
+            stack.append(current.right)
+            stack.append(current.left)
+        elif isinstance(current, FunctionCall):
+            stack.extend(reversed(current.args))
+        elif isinstance(current, ArrayLiteral):
+            for row in reversed(current.rows):
+                stack.extend(reversed(row))
+
+
+# --- Cross-formula analysis -------------------------------------------------
+
+# Leaf nodes are cheap to evaluate (or cached separately) and are never worth sharing
+_LEAF_NODES = (NumberLiteral, StringLiteral, BooleanLiteral, ErrorLiteral, ColumnReference, NameReference)
+
+
+@dataclass(frozen=True)
+class SubexpressionPlan:
+    """
+    Common subexpressions across a batch of formula ASTs.
+
+    Treating the ASTs as one DAG, identical subtrees collapse into a single
+    node; ``shared`` holds the non-leaf nodes that occur more than once and so
+    should be computed once and reused for the rest of the batch.
+    """
+    shared: FrozenSet[FormulaNode]
+    total_nodes: int  # Nodes across all ASTs, counting repeats
+    unique_nodes: int  # Nodes in the deduplicated DAG
+
+    @property
+    def deduplicated_nodes(self) -> int:
+        """Number of node evaluations saved by sharing identical subtrees"""
+        return self.total_nodes - self.unique_nodes
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary suitable for run reports"""
+        return {
+            "total_nodes": self.total_nodes,
+            "unique_nodes": self.unique_nodes,
+            "deduplicated_nodes": self.deduplicated_nodes,
+            "shared_subexpressions": len(self.shared)
+        }
+
+
+def plan_subexpressions(asts: Iterable[FormulaNode]) -> SubexpressionPlan:
+    """
+    Find the subtrees shared between (and within) a batch of formula ASTs.
+
+    Args:
+        asts: Root nodes of the formulas evaluated together
+
+    Returns:
+        SubexpressionPlan describing the deduplicated DAG
+    """
+    counts: Counter = Counter()
+    for ast in asts:
+        counts.update(iter_nodes(ast))
+
+    shared = frozenset(node for node, count in counts.items()
+                       if count > 1 and not isinstance(node, _LEAF_NODES))
+    return SubexpressionPlan(shared, sum(counts.values()), len(counts))
@@ -0,0 +1,804 @@
+"""
+Native formula processor.
+
+Evaluates the Excel formulas used by validation rules directly on DataFrame
+columns with NumPy/pandas, without starting Excel. It exposes the same
+interface as ExcelFormulaProcessor (context manager, process_formulas,
+process_formulas_bulk) and produces the same result and ``_Error`` columns,
+so it can be used wherever the COM processor is used today.
+
+Supported functions: IF, IFERROR, AND, OR, NOT, ISBLANK, ISERROR, ISNUMBER,
+ISTEXT, LEFT, RIGHT, LEN, TRIM, UPPER, LOWER, ABS, plus the arithmetic,
+concatenation and comparison operators. Formulas using anything else raise
+UnsupportedFormulaError so the caller can use the Excel processor instead.
+"""
+
+import logging
+import uuid
+from typing import Any, Dict, FrozenSet, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from core.formula_engine.formula_parser import (
+    ArrayLiteral, BinaryOperation, BooleanLiteral, ColumnReference, ErrorLiteral,
+    FormulaNode, FormulaSyntaxError, FunctionCall, NameReference, NumberLiteral,
+    StringLiteral, SubexpressionPlan, UnaryOperation, iter_nodes, plan_subexpressions
+)
+from core.rule_engine.rule_parser import CompiledFormula, compile_formula
+
+logger = logging.getLogger("NativeFormulaProcessor")
+
+
+class UnsupportedFormulaError(NotImplementedError):
+    """Raised when a formula uses a feature the native engine cannot evaluate"""
+
+
+# Value type tags. Every intermediate result is a set of parallel arrays:
+# a tag per row, a float array for numbers/booleans, an optional object
+# array holding text and an optional int8 array of error codes.
+BLANK = 0
+NUMBER = 1
+TEXT = 2
+BOOL = 3
+ERROR = 4
+
+# Excel error values by error code (the codes of Excel's ERROR.TYPE where it
+# has one). Code 0 means no error; error rows have an ERROR tag and a non-zero code.
+ERROR_VALUES = ("", "#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A",
+                "#GETTING_DATA", "#SPILL!", "#CALC!")
+ERROR_CODES = {value: code for code, value in enumerate(ERROR_VALUES) if code}
+
+# Excel sort order when comparing values of different types: number < text < logical
+_TYPE_RANK = np.array([0, 0, 1, 2, 3], dtype=np.int8)
+
+# Serial number of 1970-01-01 in Excel's 1900 date system
+_EXCEL_EPOCH = np.datetime64('1899-12-30', 'D')
+
+# Functions the native engine implements, with (min_args, max_args)
+SUPPORTED_FUNCTIONS = {
+    "IF": (2, 3),
+    "IFERROR": (2, 2),
+    "AND": (1, 255),
+    "OR": (1, 255),
+    "NOT": (1, 1),
+    "ISBLANK": (1, 1),
+    "ISERROR": (1, 1),
+    "ISNUMBER": (1, 1),
+    "ISTEXT": (1, 1),
+    "LEFT": (1, 2),
+    "RIGHT": (1, 2),
+    "LEN": (1, 1),
+    "TRIM": (1, 1),
+    "UPPER": (1, 1),
+    "LOWER": (1, 1),
+    "ABS": (1, 1),
+}
+
+
+class _Values:
+    """
+    Column of Excel values held as parallel NumPy arrays.
+
+    Arrays have either one element (a literal, broadcast against columns)
+    or one element per data row.
+    """
+
+    __slots__ = ("tag", "num", "txt", "err")
+
+    def __init__(self, tag: np.ndarray, num: np.ndarray, txt: Optional[np.ndarray] = None,
+                 err: Optional[np.ndarray] = None):
+        self.tag = tag
+        self.num = num
+        self.txt = txt
+        self.err = err  # None when no row can hold an error
+
+    def __len__(self):
+        return len(self.tag)
+
+    def text(self) -> np.ndarray:
+        """Object array of the text slot ("" where there is no text)"""
+        if self.txt is None:
+            return np.full(len(self.tag), "", dtype=object)
+        return self.txt
+
+    def errors(self) -> np.ndarray:
+        """int8 array of the error codes (0 where there is no error)"""
+        if self.err is None:
+            return np.zeros(len(self.tag), dtype=np.int8)
+        return self.err
+
+    @classmethod
+    def constant(cls, tag: int, num: float = 0.0, txt: Optional[str] = None) -> '_Values':
+        return cls(
+            np.array([tag], dtype=np.int8),
+            np.array([num], dtype=np.float64),
+            None if txt is None else np.array([txt], dtype=object)
+        )
+
+    @classmethod
+    def error(cls, code: int) -> '_Values':
+        return cls(
+            np.array([ERROR], dtype=np.int8),
+            np.zeros(1, dtype=np.float64),
+            None,
+            np.array([code], dtype=np.int8)
+        )
+
+    @classmethod
+    def booleans(cls, mask: np.ndarray) -> '_Values':
+        return cls(np.full(len(mask), BOOL, dtype=np.int8), mask.astype(np.float64))
+
+    @classmethod
+    def numbers(cls, num: np.ndarray) -> '_Values':
+        return cls(np.full(len(num), NUMBER, dtype=np.int8), num.astype(np.float64, copy=False))
+
+    @classmethod
+    def texts(cls, txt: np.ndarray) -> '_Values':
+        return cls(np.full(len(txt), TEXT, dtype=np.int8), np.zeros(len(txt)), txt)
+
+
+def _broadcast(*values: _Values):
+    """Broadcast values to a common length"""
+    size = max(len(v) for v in values)
+    result = []
+    for v in values:
+        if len(v) == size:
+            result.append(v)
+        else:
+            result.append(_Values(
+                np.broadcast_to(v.tag, size),
+                np.broadcast_to(v.num, size),
+                None if v.txt is None else np.broadcast_to(v.txt, size),
+                None if v.err is None else np.broadcast_to(v.err, size)
+            ))
+    return result
+
+
+def _select(condition: np.ndarray, when_true: _Values, when_false: _Values) -> _Values:
+    """Row-wise choice between two values"""
+    when_true, when_false = _broadcast(when_true, when_false)
+    txt = err = None
+    if when_true.txt is not None or when_false.txt is not None:
+        txt = np.where(condition, when_true.text(), when_false.text())
+    if when_true.err is not None or when_false.err is not None:
+        err = np.where(condition, when_true.errors(), when_false.errors())
+    return _Values(
+        np.where(condition, when_true.tag, when_false.tag).astype(np.int8, copy=False),
+        np.where(condition, when_true.num, when_false.num),
+        txt,
+        err
+    )
+
+
+def _with_errors(result: _Values, *operands: _Values) -> _Values:
+    """
+    Propagate errors from operands into a result.
+    The leftmost operand's error wins, matching Excel's evaluation order.
+    """
+    codes = None
+    for operand in operands:
+        if operand.err is None:
+            continue
+        codes = operand.err if codes is None else np.where(codes != 0, codes, operand.err)
+    if codes is None:
+        return result
+    mask = codes != 0
+    if not mask.any():
+        return result
+    errors = _Values(np.full(len(codes), ERROR, dtype=np.int8), np.zeros(len(codes)), None, codes)
+    return _select(mask, errors, result)
+
+
+def _error_where(mask: np.ndarray, result: _Values, error: str) -> _Values:
+    """Replace rows selected by mask with an Excel error"""
+    if not np.any(mask):
+        return result
+    return _select(mask, _Values.error(ERROR_CODES[error]), result)
+
+
+def _format_numbers(num: np.ndarray) -> np.ndarray:
+    """Convert numbers to text the way Excel's General format does"""
+    num = np.asarray(num, dtype=np.float64)
+    integral = np.isfinite(num) & (np.floor(num) == num) & (np.abs(num) < 1e15)
+    if integral.all():
+        return num.astype(np.int64).astype(str).astype(object)
+    result = np.empty(len(num), dtype=object)
+    result[integral] = num[integral].astype(np.int64).astype(str)
+    others = ~integral
+    result[others] = [format(value, '.15g') for value in num[others]]
+    return result
+
+
+def _to_text(value: _Values) -> _Values:
+    """Coerce values to text (errors pass through)"""
+    tag = value.tag
+    if (tag == TEXT).all():
+        return value
+    txt = np.array(value.text(), dtype=object)
+    numbers = tag == NUMBER
+    if numbers.any():
+        txt[numbers] = _format_numbers(np.asarray(value.num)[numbers])
+    booleans = tag == BOOL
+    if booleans.any():
+        txt[booleans] = np.where(np.asarray(value.num)[booleans] != 0, "TRUE", "FALSE")
+    blanks = tag == BLANK
+    if blanks.any():
+        txt[blanks] = ""
+    return _with_errors(_Values.texts(txt), value)
+
+
+def _to_number(value: _Values) -> _Values:
+    """Coerce values to numbers; text that is not numeric becomes #VALUE!"""
+    tag = value.tag
+    num = np.array(value.num, dtype=np.float64)
+    num[tag == BLANK] = 0.0
+    result = _Values.numbers(num)
+    texts = tag == TEXT
+    if texts.any():
+        parsed = pd.to_numeric(pd.Series(value.text()[texts]).str.strip(), errors='coerce').to_numpy(np.float64)
+        num[texts] = parsed
+        result = _error_where(texts & np.isnan(num), _Values.numbers(num), "#VALUE!")
+    return _with_errors(result, value)
+
+
+def _to_bool(value: _Values) -> _Values:
+    """Coerce values to logicals; text other than TRUE/FALSE becomes #VALUE!"""
+    tag = value.tag
+    truth = np.asarray(value.num) != 0
+    result = _Values.booleans(truth)
+    texts = tag == TEXT
+    if texts.any():
+        upper = pd.Series(value.text()[texts]).str.upper().to_numpy(object)
+        truth = truth.copy()
+        truth[texts] = upper == "TRUE"
+        invalid = np.zeros(len(tag), dtype=bool)
+        invalid[texts] = (upper != "TRUE") & (upper != "FALSE")
+        result = _error_where(invalid, _Values.booleans(truth), "#VALUE!")
+    return _with_errors(result, value)
+
+
+def _lower(txt: np.ndarray) -> np.ndarray:
+    return pd.Series(txt, dtype=object).str.lower().to_numpy(object)
+
+
+def _from_series(series: pd.Series) -> _Values:
+    """Convert a DataFrame column to Excel values"""
+    dtype = series.dtype
+    values = series.to_numpy()
+    size = len(values)
+
+    if pd.api.types.is_bool_dtype(dtype) and dtype != object and not series.hasnans:
+        return _Values.booleans(values.astype(bool))
+
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        # The Excel path writes dates as MM/DD/YYYY, so time of day is dropped
+        if getattr(dtype, 'tz', None) is not None:
+            values = series.dt.tz_localize(None).to_numpy()
+        blank = pd.isna(values)
+        serial = (values.astype('datetime64[D]') - _EXCEL_EPOCH).astype(np.float64)
+        serial[blank] = 0.0
+        tag = np.where(blank, BLANK, NUMBER).astype(np.int8)
+        return _Values(tag, serial)
+
+    if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype) and dtype != object:
+        # Copied: blanks are zeroed below and the input must not change
+        num = series.to_numpy(dtype=np.float64, na_value=np.nan, copy=True)
+        blank = np.isnan(num)
+        num[blank] = 0.0
+        tag = np.where(blank, BLANK, NUMBER).astype(np.int8)
+        return _Values(tag, num)
+
+    values = values.astype(object, copy=False)
+    missing = pd.isna(values)
+    inferred = pd.api.types.infer_dtype(values, skipna=True)
+
+    if inferred in ("string", "empty"):
+        # Empty strings are written to Excel as empty cells
+        blank = missing.copy()
+        blank[~missing] = values[~missing] == ""
+        txt = np.where(blank, "", values).astype(object)
+        tag = np.where(blank, BLANK, TEXT).astype(np.int8)
+        return _Values(tag, np.zeros(size), txt)
+
+    # Mixed content: classify each value once
+    tag = np.empty(size, dtype=np.int8)
+    num = np.zeros(size, dtype=np.float64)
+    txt = np.full(size, "", dtype=object)
+    for i, value in enumerate(values):
+        if missing[i] or (isinstance(value, str) and value == ""):
+            tag[i] = BLANK
+        elif isinstance(value, (bool, np.bool_)):
+            tag[i] = BOOL
+            num[i] = float(value)
+        elif isinstance(value, (int, float, np.number)):
+            tag[i] = NUMBER
+            num[i] = float(value)
+        elif isinstance(value, (pd.Timestamp, np.datetime64)) or hasattr(value, 'toordinal'):
+            tag[i] = NUMBER
+            num[i] = float((np.datetime64(pd.Timestamp(value).date(), 'D') - _EXCEL_EPOCH).astype(int))
+        else:
+            tag[i] = TEXT
+            txt[i] = str(value)
+    return _Values(tag, num, txt)
+
+
+class _VectorEvaluator:
+    """Evaluates formula ASTs against the columns of a DataFrame"""
+
+    def __init__(self, data: pd.DataFrame, shared: FrozenSet[FormulaNode] = frozenset()):
+        self.data = data
+        self.size = len(data)
+        self._columns: Dict[str, _Values] = {}
+        # Subexpressions common to several formulas, computed once per batch
+        self._shared = shared
+        self._shared_values: Dict[FormulaNode, _Values] = {}
+
+    def column(self, name: str) -> _Values:
+        if name not in self._columns:
+            if name not in self.data.columns:
+                raise FormulaSyntaxError(f"Formula references non-existent column: {name}")
+            self._columns[name] = _from_series(self.data[name])
+        return self._columns[name]
+
+    def evaluate(self, node: FormulaNode) -> _Values:
+        """Evaluate a node and broadcast the result to the number of data rows"""
+        value = self._evaluate(node)
+        if len(value) != self.size:
+            value = _Values(
+                np.broadcast_to(value.tag, self.size),
+                np.broadcast_to(value.num, self.size),
+                None if value.txt is None else np.broadcast_to(value.txt, self.size),
+                None if value.err is None else np.broadcast_to(value.err, self.size)
+            )
+        return value
+
+    def _evaluate(self, node: FormulaNode) -> _Values:
+        if self._shared and isinstance(node, (FunctionCall, BinaryOperation, UnaryOperation)) \
+                and node in self._shared:
+            value = self._shared_values.get(node)
+            if value is None:
+                value = self._shared_values[node] = self._evaluate_node(node)
+            return value
+        return self._evaluate_node(node)
+
+    def _evaluate_node(self, node: FormulaNode) -> _Values:
+        if isinstance(node, ColumnReference):
+            return self.column(node.name)
+        if isinstance(node, NumberLiteral):
+            return _Values.constant(NUMBER, node.value)
+        if isinstance(node, StringLiteral):
+            return _Values.constant(TEXT, txt=node.value)
+        if isinstance(node, BooleanLiteral):
+            return _Values.constant(BOOL, float(node.value))
+        if isinstance(node, ErrorLiteral):
+            return _Values.error(ERROR_CODES[node.value])
+        if isinstance(node, UnaryOperation):
+            return self._unary(node)
+        if isinstance(node, BinaryOperation):
+            return self._binary(node)
+        if isinstance(node, FunctionCall):
+            return self._function(node)
+        if isinstance(node, (NameReference, ArrayLiteral)):
+            raise UnsupportedFormulaError(f"Cell references and array constants are not supported: {node}")
+        raise UnsupportedFormulaError(f"Unsupported formula element: {node}")
+
+    # --- Operators ---------------------------------------------------------
+
+    def _unary(self, node: UnaryOperation) -> _Values:
+        if node.operator == "+":
+            return self._evaluate(node.operand)
+        operand = _to_number(self._evaluate(node.operand))
+        if node.operator == "-":
+            num = -operand.num
+        else:
+            num = operand.num / 100.0
+        return _with_errors(_Values.numbers(np.asarray(num)), operand)
+
+    def _binary(self, node: BinaryOperation) -> _Values:
+        left = self._evaluate(node.left)
+        right = self._evaluate(node.right)
+        operator = node.operator
+
+        if operator == "&":
+            left_text, right_text = _broadcast(_to_text(left), _to_text(right))
+            result = _Values.texts(left_text.text() + right_text.text())
+            return _with_errors(result, left_text, right_text)
+
+        if operator in ("=", "<>", "<", "<=", ">", ">="):
+            return self._compare(operator, left, right)
+
+        left_num, right_num = _broadcast(_to_number(left), _to_number(right))
+        a = np.asarray(left_num.num)
+        b = np.asarray(right_num.num)
+        with np.errstate(all='ignore'):
+            if operator == "+":
+                num = a + b
+            elif operator == "-":
+                num = a - b
+            elif operator == "*":
+                num = a * b
+            elif operator == "/":
+                num = a / b
+            elif operator == "^":
+                num = np.power(a, b)
+            else:
+                raise UnsupportedFormulaError(f"Unsupported operator: {operator}")
+
+        result = _Values.numbers(num)
+        if operator == "/":
+            result = _error_where(b == 0, result, "#DIV/0!")
+        result = _error_where(~np.isfinite(num) & (result.tag != ERROR), result, "#NUM!")
+        return _with_errors(result, left_num, right_num)
+
+    def _compare(self, operator: str, left: _Values, right: _Values) -> _Values:
+        left, right = _broadcast(left, right)
+        left_tag = np.asarray(left.tag)
+        right_tag = np.asarray(right.tag)
+
+        # A blank compares as the empty value of the other side's type
+        left_type = np.where(left_tag == BLANK, np.where(right_tag == BLANK, NUMBER, right_tag), left_tag)
+        right_type = np.where(right_tag == BLANK, np.where(left_tag == BLANK, NUMBER, left_tag), right_tag)
+        left_rank = _TYPE_RANK[left_type]
+        right_rank = _TYPE_RANK[right_type]
+
+        order = np.sign(left_rank.astype(np.int16) - right_rank).astype(np.int8)
+        same_type = left_rank == right_rank
+
+        scalar = same_type & (left_rank != 1)
+        if scalar.any():
+            diff = np.sign(np.asarray(left.num) - np.asarray(right.num)).astype(np.int8)
+            order = np.where(scalar, diff, order)
+
+        texts = same_type & (left_rank == 1)
+        if texts.any():
+            # Text comparison is case-insensitive
+            a = _lower(np.asarray(left.text())[texts])
+            b = _lower(np.asarray(right.text())[texts])
+            order = order.copy()
+            order[texts] = (a > b).astype(np.int8) - (a < b).astype(np.int8)
+
+        if operator == "=":
+            truth = order == 0
+        elif operator == "<>":
+            truth = order != 0
+        elif operator == "<":
+            truth = order < 0
+        elif operator == "<=":
+            truth = order <= 0
+        elif operator == ">":
+            truth = order > 0
+        else:
+            truth = order >= 0
+
+        return _with_errors(_Values.booleans(truth), left, right)
+
+    # --- Functions ---------------------------------------------------------
+
+    def _function(self, node: FunctionCall) -> _Values:
+        name = node.name
+        if name not in SUPPORTED_FUNCTIONS:
+            raise UnsupportedFormulaError(f"Function {name} is not supported by the native engine")
+
+        min_args, max_args = SUPPORTED_FUNCTIONS[name]
+        if not min_args <= len(node.args) <= max_args:
+            raise FormulaSyntaxError(f"Wrong number of arguments to {name}")
+
+        handler = getattr(self, f"_fn_{name.lower()}")
+        return handler(node.args)
+
+    def _fn_if(self, args) -> _Values:
+        condition = _to_bool(self._evaluate(args[0]))
+        when_true = self._evaluate(args[1])
+        when_false = self._evaluate(args[2]) if len(args) > 2 else _Values.constant(BOOL, 0.0)
+        condition, when_true, when_false = _broadcast(condition, when_true, when_false)
+        # Errors in the branch a row does not take do not reach it
+        result = _select(np.asarray(condition.num) != 0, when_true, when_false)
+        return _with_errors(result, condition)
+
+    def _fn_iferror(self, args) -> _Values:
+        value = self._evaluate(args[0])
+        fallback = self._evaluate(args[1])
+        if value.err is None:
+            return value
+        value, fallback = _broadcast(value, fallback)
+        return _select(np.asarray(value.err) != 0, fallback, value)
+
+    def _logical(self, args, combine) -> _Values:
+        accumulated = None
+        counted = None
+        operands = []
+        for arg in args:
+            value = self._evaluate(arg)
+            operands.append(value)
+            tag = value.tag
+            if isinstance(arg, ColumnReference):
+                # Text and blanks in references are ignored
+                considered = (tag == NUMBER) | (tag == BOOL)
+                truth = np.asarray(value.num) != 0
+            else:
+                logical = _to_bool(value)
+                considered = tag != BLANK
+                truth = np.asarray(logical.num) != 0
+                operands[-1] = _with_errors(logical, value)
+
+            if accumulated is None:
+                accumulated = np.where(considered, truth, combine is np.logical_and)
+                counted = considered
+            else:
+                accumulated, truth, considered = np.broadcast_arrays(accumulated, truth, considered)
+                accumulated = np.where(considered, combine(accumulated, truth), accumulated)
+                counted = np.logical_or(counted, considered)
+
+        result = _error_where(~counted, _Values.booleans(np.asarray(accumulated)), "#VALUE!")
+        return _with_errors(result, *operands)
+
+    def _fn_and(self, args) -> _Values:
+        return self._logical(args, np.logical_and)
+
+    def _fn_or(self, args) -> _Values:
+        return self._logical(args, np.logical_or)
+
+    def _fn_not(self, args) -> _Values:
+        logical = _to_bool(self._evaluate(args[0]))
+        return _with_errors(_Values.booleans(np.asarray(logical.num) == 0), logical)
+
+    def _fn_isblank(self, args) -> _Values:
+        return _Values.booleans(np.asarray(self._evaluate(args[0]).tag) == BLANK)
+
+    def _fn_iserror(self, args) -> _Values:
+        return _Values.booleans(np.asarray(self._evaluate(args[0]).errors()) != 0)
+
+    def _fn_isnumber(self, args) -> _Values:
+        return _Values.booleans(np.asarray(self._evaluate(args[0]).tag) == NUMBER)
+
+    def _fn_istext(self, args) -> _Values:
+        return _Values.booleans(np.asarray(self._evaluate(args[0]).tag) == TEXT)
+
+    def _substring(self, args, from_left: bool) -> _Values:
+        text = _to_text(self._evaluate(args[0]))
+        count = _to_number(self._evaluate(args[1])) if len(args) > 1 else _Values.constant(NUMBER, 1.0)
+        text, count = _broadcast(text, count)
+
+        counts = np.trunc(np.asarray(count.num))
+        strings = pd.Series(np.asarray(text.text()), dtype=object)
+        if len(count) and (counts == counts[0]).all():
+            n = max(int(counts[0]), 0) if np.isfinite(counts[0]) else 0
+            sliced = strings.str[:n] if from_left else (strings.str[-n:] if n else strings.str[:0])
+        else:
+            sliced = pd.Series([
+                s[:max(int(n), 0)] if from_left else (s[-int(n):] if n > 0 else "")
+                for s, n in zip(strings, np.nan_to_num(counts))
+            ], dtype=object)
+
+        result = _Values.texts(sliced.to_numpy(object))
+        result = _error_where(counts < 0, result, "#VALUE!")
+        return _with_errors(result, text, count)
+
+    def _fn_left(self, args) -> _Values:
+        return self._substring(args, from_left=True)
+
+    def _fn_right(self, args) -> _Values:
+        return self._substring(args, from_left=False)
+
+    def _fn_len(self, args) -> _Values:
+        text = _to_text(self._evaluate(args[0]))
+        lengths = pd.Series(np.asarray(text.text()), dtype=object).str.len().to_numpy(np.float64)
+        return _with_errors(_Values.numbers(lengths), text)
+
+    def _string_function(self, args, transform) -> _Values:
+        text = _to_text(self._evaluate(args[0]))
+        strings = pd.Series(np.asarray(text.text()), dtype=object)
+        return _with_errors(_Values.texts(transform(strings.str).to_numpy(object)), text)
+
+    def _fn_trim(self, args) -> _Values:
+        # Excel's TRIM removes leading/trailing spaces and collapses runs of spaces
+        return self._string_function(args, lambda s: s.strip(" ").str.replace(r" {2,}", " ", regex=True))
+
+    def _fn_upper(self, args) -> _Values:
+        return self._string_function(args, lambda s: s.upper())
+
+    def _fn_lower(self, args) -> _Values:
+        return self._string_function(args, lambda s: s.lower())
+
+    def _fn_abs(self, args) -> _Values:
+        number = _to_number(self._evaluate(args[0]))
+        return _with_errors(_Values.numbers(np.abs(np.asarray(number.num))), number)
+
+
+class NativeFormulaProcessor:
+    """
+    Evaluates Excel formulas natively with NumPy/pandas.
+
+    Drop-in replacement for ExcelFormulaProcessor for the formula subset used
+    by validation rules. Runs on any platform and needs no Excel installation.
+    """
+
+    # Excel error values and their Python representations (mirrors ExcelFormulaProcessor)
+    EXCEL_ERRORS = {
+        "#DIV/0!": "ERROR_DIV_ZERO",
+        "#N/A": "ERROR_NA",
+        "#NAME?": "ERROR_NAME",
+        "#NULL!": "ERROR_NULL",
+        "#NUM!": "ERROR_NUM",
+        "#REF!": "ERROR_REF",
+        "#VALUE!": "ERROR_VALUE",
+        "#GETTING_DATA": "ERROR_GETTING_DATA",
+        "#SPILL!": "ERROR_SPILL",
+        "#CALC!": "ERROR_CALC"
+    }
+
+    # Error column values by error code, looked up with one take per column
+    ERROR_OUTPUTS = np.array([""] + list(map(EXCEL_ERRORS.get, ERROR_VALUES[1:])), dtype=object)
+
+    def __init__(self, track_errors: bool = True, share_subexpressions: bool = True, **kwargs):
+        """
+        Initialize the native processor.
+
+        Args:
+            track_errors: Whether to add an ``<output>_Error`` column per formula
+            share_subexpressions: Compute subexpressions that several formulas in
+                                  one call have in common only once
+            **kwargs: Accepted for interface compatibility with ExcelFormulaProcessor
+                      (visible, template_path) and ignored
+        """
+        self.track_errors = track_errors
+        self.share_subexpressions = share_subexpressions
+        self.session_id = str(uuid.uuid4())[:8]
+        # Subexpression plan of the most recent process_formulas call
+        self.last_plan: Optional[SubexpressionPlan] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.cleanup()
+        return False
+
+    def cleanup(self):
+        """Nothing to release; present for interface compatibility"""
+        pass
+
+    def supports_formula(self, formula: Union[str, CompiledFormula]) -> bool:
+        """
+        Check whether a formula can be evaluated by the native engine.
+
+        Args:
+            formula: Excel formula or an already compiled formula
+
+        Returns:
+            True if every function and reference in the formula is supported
+        """
+        compiled = formula if isinstance(formula, CompiledFormula) else compile_formula(formula)
+        if not compiled.is_valid:
+            # Syntax errors are reported per column during evaluation
+            return True
+
+        for node in iter_nodes(compiled.ast):
+            if isinstance(node, (NameReference, ArrayLiteral)):
+                return False
+            if isinstance(node, FunctionCall) and node.name not in SUPPORTED_FUNCTIONS:
+                return False
+        return True
+
+    def process_formulas(
+            self,
+            data: pd.DataFrame,
+            formulas: Dict[str, Union[str, CompiledFormula]],
+            input_range: str = "A2",
+            use_bulk_method: bool = True
+    ) -> pd.DataFrame:
+        """
+        Evaluate formulas against a DataFrame.
+
+        Args:
+            data: Input DataFrame to process
+            formulas: Dictionary mapping output column names to Excel formulas
+                      (formula text or CompiledFormula from ValidationRuleParser)
+            input_range: Ignored, present for interface compatibility
+            use_bulk_method: Ignored, evaluation is always columnar
+
+        Returns:
+            DataFrame with formula results added as new columns
+        """
+        return self.process_formulas_bulk(data, formulas, input_range)
+
+    def process_formulas_bulk(
+            self,
+            data: pd.DataFrame,
+            formulas: Dict[str, Union[str, CompiledFormula]],
+            input_range: str = "A2"
+    ) -> pd.DataFrame:
+        """
+        Evaluate formulas column-wise against a DataFrame.
+
+        Args:
+            data: Input DataFrame to process
+            formulas: Dictionary mapping output column names to Excel formulas
+                      (formula text or CompiledFormula from ValidationRuleParser)
+            input_range: Ignored, present for interface compatibility
+
+        Returns:
+            DataFrame with formula results added as new columns
+
+        Raises:
+            UnsupportedFormulaError: If a formula uses functions the native engine
+                does not implement
+        """
+        compiled_formulas = {
+            output_col: formula if isinstance(formula, CompiledFormula) else compile_formula(formula)
+            for output_col, formula in formulas.items()
+        }
+
+        # Treat the formulas as one DAG so shared subtrees are evaluated once
+        shared: FrozenSet[FormulaNode] = frozenset()
+        if self.share_subexpressions:
+            self.last_plan = plan_subexpressions(c.ast for c in compiled_formulas.values() if c.is_valid)
+            shared = self.last_plan.shared
+            if self.last_plan.deduplicated_nodes:
+                logger.debug(f"[Session {self.session_id}] Deduplicated {self.last_plan.deduplicated_nodes} "
+                             f"of {self.last_plan.total_nodes} formula nodes")
+
+        evaluator = _VectorEvaluator(data, shared)
+        num_rows = len(data)
+        new_columns: Dict[str, Any] = {}
+
+        for output_col, compiled in compiled_formulas.items():
+            error_col = f"{output_col}_Error"
+            try:
+                if not compiled.is_valid:
+                    raise FormulaSyntaxError(compiled.error)
+                values = evaluator.evaluate(compiled.ast)
+            except FormulaSyntaxError as e:
+                # Same outcome as a formula Excel refuses to accept
+                logger.error(f"[Session {self.session_id}] Error setting formula '{compiled.text}': {str(e)}")
+                new_columns[output_col] = np.full(num_rows, f"ERROR: {str(e)}", dtype=object)
+                if self.track_errors:
+                    new_columns[error_col] = np.full(num_rows, "FORMULA_SETTING_ERROR", dtype=object)
+                continue
+
+            result_values, error_values = self._to_output(values)
+            new_columns[output_col] = result_values
+            if self.track_errors:
+                new_columns[error_col] = error_values
+
+        result_df = data.copy()
+        if new_columns:
+            # Drop any existing output columns so they are replaced, not duplicated
+            result_df = result_df.drop(columns=[c for c in new_columns if c in result_df.columns])
+            result_df = pd.concat([result_df, pd.DataFrame(new_columns, index=data.index)], axis=1)
+        return result_df
+
+    def _to_output(self, values: _Values):
+        """
+        Convert evaluated values to the result and error column contents
+        produced by the Excel processor.
+        """
+        tag = np.asarray(values.tag)
+        num = np.asarray(values.num)
+        size = len(tag)
+        if values.err is None:
+            codes = None
+            errors = np.full(size, "", dtype=object)
+        else:
+            codes = np.asarray(values.err)
+            errors = self.ERROR_OUTPUTS[codes]
+
+        if (tag == BOOL).all():
+            return num != 0, errors
+        if (tag == NUMBER).all():
+            # Adding 0.0 turns -0.0 into 0.0, as Excel never shows a negative zero
+            return num.astype(np.float64) + 0.0, errors
+
+        result = np.empty(size, dtype=object)
+        booleans = tag == BOOL
+        result[booleans] = num[booleans] != 0
+        numbers = (tag == NUMBER) | (tag == BLANK)  # a formula never returns a blank, it returns 0
+        result[numbers] = np.where(tag[numbers] == BLANK, 0.0, num[numbers])
+        texts = tag == TEXT
+        if texts.any():
+            result[texts] = np.asarray(values.txt)[texts]
+        error_rows = tag == ERROR
+        if error_rows.any():
+            result[error_rows] = errors[error_rows]
+        return result, errors
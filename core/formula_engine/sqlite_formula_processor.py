@@ -0,0 +1,876 @@
+"""
+SQLite formula processor.
+
+Evaluates validation rule formulas out of core. The columns the formulas
+reference are loaded once into a local SQLite database file and each formula
+is translated into a SQL expression, so SQLite works through the rows a page
+at a time instead of pandas holding every intermediate array. Per-party
+GC/DNC counts can be computed with GROUP BY without materializing the
+results (aggregate_by_party). Only the standard library sqlite3 module is used.
+
+It exposes the same interface as ExcelFormulaProcessor and
+NativeFormulaProcessor (context manager, process_formulas,
+process_formulas_bulk) and produces the same result and ``_Error`` columns.
+
+Supported functions: IF, AND, OR, NOT, ISBLANK, ISNUMBER, ISTEXT, LEFT, RIGHT,
+LEN, TRIM, ABS, plus the arithmetic, concatenation and comparison operators,
+on columns holding one type of value (numbers or dates, text, or logicals).
+Anything else raises UnsupportedFormulaError so the caller can use another
+processor.
+
+Each formula node translates to two SQL expressions: its value (NULL for a
+blank) and its Excel error (NULL, or an error literal such as '#DIV/0!').
+Errors propagate leftmost operand first, as in the native engine.
+"""
+
+import logging
+import os
+import sqlite3
+import tempfile
+import uuid
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from core.formula_engine.formula_parser import (
+    ArrayLiteral, BinaryOperation, BooleanLiteral, ColumnReference, ErrorLiteral,
+    FormulaNode, FormulaSyntaxError, FunctionCall, NameReference, NumberLiteral,
+    StringLiteral, UnaryOperation, iter_nodes
+)
+from core.formula_engine.native_formula_processor import (
+    BOOL, ERROR_VALUES, NUMBER, TEXT, NativeFormulaProcessor, UnsupportedFormulaError
+)
+from core.rule_engine.rule_parser import CompiledFormula, compile_formula
+
+logger = logging.getLogger("SqliteFormulaProcessor")
+
+DEFAULT_DATABASE_DIR = "data/temp/sqlite"
+
+# Functions the SQLite engine implements, with (min_args, max_args)
+SUPPORTED_FUNCTIONS = {
+    "IF": (2, 3),
+    "AND": (1, 255),
+    "OR": (1, 255),
+    "NOT": (1, 1),
+    "ISBLANK": (1, 1),
+    "ISNUMBER": (1, 1),
+    "ISTEXT": (1, 1),
+    "LEFT": (1, 2),
+    "RIGHT": (1, 2),
+    "LEN": (1, 1),
+    "TRIM": (1, 1),
+    "ABS": (1, 1),
+}
+
+# Column holding more than one type of value; formulas reading it are not translated
+MIXED = -1
+
+_TABLE = "source"
+_ROW = "_row"
+_SQL_TYPES = {NUMBER: "REAL", TEXT: "TEXT", BOOL: "INTEGER"}
+_TYPE_RANK = {NUMBER: 0, TEXT: 1, BOOL: 2}
+_COMPARISONS = {"=": "=", "<>": "<>", "<": "<", "<=": "<=", ">": ">", ">=": ">="}
+# Comparison outcome for the sign of left - right
+_ORDER_TRUTH = {
+    "=": lambda order: order == 0,
+    "<>": lambda order: order != 0,
+    "<": lambda order: order < 0,
+    "<=": lambda order: order <= 0,
+    ">": lambda order: order > 0,
+    ">=": lambda order: order >= 0,
+}
+_LARGEST_FLOAT = "1.7976931348623157e308"
+# Marker used by TRIM to collapse runs of spaces (a private-use character)
+_TRIM_MARKER = "char(57344)"
+_EXCEL_EPOCH = np.datetime64('1899-12-30', 'D')
+
+
+@dataclass(frozen=True)
+class _Sql:
+    """A translated formula node"""
+    value: str                   # SQL for the value; NULL is a blank
+    kind: Optional[int]          # NUMBER, TEXT or BOOL; None for an error literal
+    error: Optional[str] = None  # SQL for the Excel error literal, None if it cannot fail
+    nullable: bool = True        # Whether the value can be blank
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _text_literal(text: str) -> str:
+    return "'" + text.replace("'", "''") + "'"
+
+
+def _first_error(*errors: Optional[str]) -> Optional[str]:
+    """SQL for the first error of several (leftmost wins, as in Excel)"""
+    errors = [error for error in errors if error is not None]
+    if not errors:
+        return None
+    if len(errors) == 1:
+        return errors[0]
+    return f"COALESCE({', '.join(errors)})"
+
+
+def _error_when(condition: str, error: str) -> str:
+    return f"CASE WHEN {condition} THEN '{error}' END"
+
+
+def _empty_value(kind: int) -> str:
+    """The value a blank takes when compared with or coerced to a type"""
+    return "''" if kind == TEXT else "0"
+
+
+def _filled(expr: _Sql, empty: str) -> str:
+    return f"COALESCE({expr.value}, {empty})" if expr.nullable else expr.value
+
+
+def _as_number(expr: _Sql) -> _Sql:
+    """Coerce to a number; blanks are 0"""
+    if expr.kind is None:
+        return _Sql("NULL", NUMBER, expr.error, nullable=False)
+    if expr.kind == TEXT:
+        raise UnsupportedFormulaError("Text to number coercion is not supported by the SQLite engine")
+    value = _filled(expr, "0")
+    if expr.kind == BOOL:
+        value = f"({value} * 1.0)"
+    return _Sql(value, NUMBER, expr.error, nullable=False)
+
+
+def _as_text(expr: _Sql) -> _Sql:
+    """Coerce to text the way Excel's General format does; blanks are empty text"""
+    if expr.kind is None:
+        return _Sql("NULL", TEXT, expr.error, nullable=False)
+    if expr.kind == TEXT:
+        return _Sql(_filled(expr, "''"), TEXT, expr.error, nullable=False)
+    if expr.kind == NUMBER:
+        # Adding 0.0 turns -0.0 into 0.0
+        text = f"printf('%.15g', {expr.value} + 0.0)"
+    else:
+        text = f"CASE WHEN {expr.value} THEN 'TRUE' ELSE 'FALSE' END"
+    if expr.nullable:
+        text = f"CASE WHEN {expr.value} IS NULL THEN '' ELSE {text} END"
+    return _Sql(text, TEXT, expr.error, nullable=False)
+
+
+def _as_bool(expr: _Sql) -> _Sql:
+    """Coerce to a logical; text other than TRUE/FALSE is #VALUE!"""
+    if expr.kind is None:
+        return _Sql("0", BOOL, expr.error, nullable=False)
+    if expr.kind != TEXT:
+        return _Sql(f"({_filled(expr, '0')} <> 0)", BOOL, expr.error, nullable=False)
+    invalid = _error_when(f"{expr.value} IS NOT NULL AND UPPER({expr.value}) NOT IN ('TRUE', 'FALSE')", "#VALUE!")
+    text = _filled(expr, "''")
+    return _Sql(f"(UPPER({text}) = 'TRUE')", BOOL, _first_error(expr.error, invalid), nullable=False)
+
+
+def _column_kind(series: pd.Series) -> int:
+    """Value type of a column (MIXED if it holds more than one)"""
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype) and dtype != object:
+        return BOOL
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return NUMBER
+    if pd.api.types.is_numeric_dtype(dtype) and dtype != object:
+        return NUMBER
+    inferred = pd.api.types.infer_dtype(series, skipna=True)
+    if inferred in ("string", "empty"):
+        return TEXT
+    if inferred == "boolean":
+        return BOOL
+    if inferred in ("integer", "floating", "mixed-integer-float", "decimal"):
+        return NUMBER
+    if inferred in ("datetime", "datetime64", "date"):
+        return NUMBER
+    return MIXED
+
+
+def _column_values(series: pd.Series, kind: int) -> List[Any]:
+    """Column values as SQLite parameters (None for blanks)"""
+    if kind == TEXT:
+        values = series.to_numpy(dtype=object)
+        # Empty strings are blank cells, as in the native engine
+        blank = pd.isna(values) | (values == "")
+        return np.where(blank, None, values).tolist()
+    if kind == BOOL:
+        values = series.to_numpy(dtype=object)
+        blank = pd.isna(values)
+        return np.where(blank, None, np.where(blank, False, values).astype(bool).astype(np.int64)).tolist()
+    if pd.api.types.is_datetime64_any_dtype(series.dtype) or \
+            pd.api.types.infer_dtype(series, skipna=True) in ("datetime", "datetime64", "date"):
+        # Dates are Excel serial numbers; time of day is dropped as on the Excel path
+        dates = pd.to_datetime(series)
+        if getattr(dates.dtype, 'tz', None) is not None:
+            dates = dates.dt.tz_localize(None)
+        values = dates.to_numpy()
+        blank = pd.isna(values)
+        serial = (values.astype('datetime64[D]') - _EXCEL_EPOCH).astype(np.float64)
+        return np.where(blank, None, serial).tolist()
+    numbers = pd.to_numeric(series).to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.where(np.isnan(numbers), None, numbers).tolist()
+
+
+class _SqlTranslator:
+    """Translates formula ASTs to SQL over the loaded table"""
+
+    def __init__(self, column_kinds: Dict[str, int], has_pow: bool):
+        self.column_kinds = column_kinds
+        self.has_pow = has_pow
+
+    def translate(self, node: FormulaNode) -> _Sql:
+        if isinstance(node, ColumnReference):
+            kind = self.column_kinds.get(node.name)
+            if kind is None:
+                raise FormulaSyntaxError(f"Formula references non-existent column: {node.name}")
+            if kind == MIXED:
+                raise UnsupportedFormulaError(f"Column {node.name} holds mixed value types")
+            return _Sql(_quote(node.name), kind)
+        if isinstance(node, NumberLiteral):
+            return _Sql(repr(float(node.value)), NUMBER, nullable=False)
+        if isinstance(node, StringLiteral):
+            return _Sql(_text_literal(node.value), TEXT, nullable=False)
+        if isinstance(node, BooleanLiteral):
+            return _Sql("1" if node.value else "0", BOOL, nullable=False)
+        if isinstance(node, ErrorLiteral):
+            return _Sql("NULL", None, _text_literal(node.value), nullable=False)
+        if isinstance(node, UnaryOperation):
+            return self._unary(node)
+        if isinstance(node, BinaryOperation):
+            return self._binary(node)
+        if isinstance(node, FunctionCall):
+            return self._function(node)
+        if isinstance(node, (NameReference, ArrayLiteral)):
+            raise UnsupportedFormulaError(f"Cell references and array constants are not supported: {node}")
+        raise UnsupportedFormulaError(f"Unsupported formula element: {node}")
+
+    # --- Operators ---------------------------------------------------------
+
+    def _unary(self, node: UnaryOperation) -> _Sql:
+        if node.operator == "+":
+            return self.translate(node.operand)
+        operand = _as_number(self.translate(node.operand))
+        if node.operator == "-":
+            return _Sql(f"(-{operand.value})", NUMBER, operand.error, nullable=False)
+        return _Sql(f"({operand.value} / 100.0)", NUMBER, operand.error, nullable=False)
+
+    def _binary(self, node: BinaryOperation) -> _Sql:
+        left = self.translate(node.left)
+        right = self.translate(node.right)
+        operator = node.operator
+
+        if operator == "&":
+            left, right = _as_text(left), _as_text(right)
+            return _Sql(f"({left.value} || {right.value})", TEXT, _first_error(left.error, right.error),
+                        nullable=False)
+
+        if operator in _COMPARISONS:
+            return self._compare(operator, left, right)
+
+        left, right = _as_number(left), _as_number(right)
+        a, b = left.value, right.value
+        if operator in ("+", "-", "*"):
+            value = f"({a} {operator} {b})"
+        elif operator == "/":
+            value = f"({a} * 1.0 / {b})"
+        elif operator == "^" and self.has_pow:
+            value = f"pow({a}, {b})"
+        else:
+            raise UnsupportedFormulaError(f"Operator {operator} is not supported by the SQLite engine")
+
+        # NaN comes back from SQLite as NULL, infinities as values beyond the largest float
+        own_error = f"CASE WHEN {value} IS NULL OR ABS({value}) > {_LARGEST_FLOAT} THEN '#NUM!' END"
+        if operator == "/":
+            own_error = (f"CASE WHEN {b} = 0 THEN '#DIV/0!' "
+                         f"WHEN {value} IS NULL OR ABS({value}) > {_LARGEST_FLOAT} THEN '#NUM!' END")
+        return _Sql(value, NUMBER, _first_error(left.error, right.error, own_error), nullable=False)
+
+    def _compare(self, operator: str, left: _Sql, right: _Sql) -> _Sql:
+        error = _first_error(left.error, right.error)
+        sql_operator = _COMPARISONS[operator]
+        if left.kind is None or right.kind is None:
+            return _Sql("0", BOOL, error, nullable=False)
+
+        def compare(a: str, b: str, kind: int) -> str:
+            # Text comparison is case-insensitive
+            collate = " COLLATE NOCASE" if kind == TEXT else ""
+            return f"({a} {sql_operator} {b}{collate})"
+
+        if left.kind == right.kind:
+            empty = _empty_value(left.kind)
+            return _Sql(compare(_filled(left, empty), _filled(right, empty), left.kind), BOOL, error,
+                        nullable=False)
+
+        # Values of different types order number < text < logical; a blank
+        # compares as the empty value of the other side's type
+        by_type = "1" if _ORDER_TRUTH[operator](_TYPE_RANK[left.kind] - _TYPE_RANK[right.kind]) else "0"
+        branches = []
+        if left.nullable and right.nullable:
+            branches.append(f"WHEN {left.value} IS NULL AND {right.value} IS NULL THEN {compare('0', '0', NUMBER)}")
+        if left.nullable:
+            branches.append(f"WHEN {left.value} IS NULL THEN "
+                            f"{compare(_empty_value(right.kind), right.value, right.kind)}")
+        if right.nullable:
+            branches.append(f"WHEN {right.value} IS NULL THEN "
+                            f"{compare(left.value, _empty_value(left.kind), left.kind)}")
+        value = f"(CASE {' '.join(branches)} ELSE {by_type} END)" if branches else by_type
+        return _Sql(value, BOOL, error, nullable=False)
+
+    # --- Functions ---------------------------------------------------------
+
+    def _function(self, node: FunctionCall) -> _Sql:
+        name = node.name
+        if name not in SUPPORTED_FUNCTIONS:
+            raise UnsupportedFormulaError(f"Function {name} is not supported by the SQLite engine")
+
+        min_args, max_args = SUPPORTED_FUNCTIONS[name]
+        if not min_args <= len(node.args) <= max_args:
+            raise FormulaSyntaxError(f"Wrong number of arguments to {name}")
+
+        handler = getattr(self, f"_fn_{name.lower()}")
+        return handler(node.args)
+
+    def _fn_if(self, args) -> _Sql:
+        condition = _as_bool(self.translate(args[0]))
+        when_true = self.translate(args[1])
+        when_false = self.translate(args[2]) if len(args) > 2 else _Sql("0", BOOL, nullable=False)
+        if None not in (when_true.kind, when_false.kind) and when_true.kind != when_false.kind:
+            raise UnsupportedFormulaError("IF branches of different types are not supported by the SQLite engine")
+
+        value = f"(CASE WHEN {condition.value} THEN {when_true.value} ELSE {when_false.value} END)"
+        # Only the chosen branch's error propagates
+        branch_error = None
+        if when_true.error is not None or when_false.error is not None:
+            branch_error = (f"(CASE WHEN {condition.value} THEN {when_true.error or 'NULL'} "
+                            f"ELSE {when_false.error or 'NULL'} END)")
+        return _Sql(value, when_true.kind if when_true.kind is not None else when_false.kind,
+                    _first_error(condition.error, branch_error), when_true.nullable or when_false.nullable)
+
+    def _logical(self, args, is_and: bool) -> _Sql:
+        terms, counted, errors = [], [], []
+        for arg in args:
+            value = self.translate(arg)
+            if isinstance(arg, ColumnReference):
+                # Text and blanks in references are ignored
+                if value.kind == TEXT:
+                    continue
+                considered = f"{value.value} IS NOT NULL"
+                truth = f"({value.value} <> 0)"
+            else:
+                logical = _as_bool(value)
+                considered = None
+                if value.nullable:
+                    considered = f"{value.value} IS NOT NULL"
+                    if value.error is not None:
+                        considered = f"{considered} OR {value.error} IS NOT NULL"
+                truth = logical.value
+                errors.append(logical.error)
+
+            if considered is None:
+                terms.append(truth)
+                counted.append("1")
+            else:
+                terms.append(f"(CASE WHEN {considered} THEN {truth} ELSE {1 if is_and else 0} END)")
+                counted.append(f"({considered})")
+
+        value = f"({(' AND ' if is_and else ' OR ').join(terms)})" if terms else ("1" if is_and else "0")
+        none_counted = None
+        if "1" not in counted:
+            none_counted = _error_when(f"NOT ({' OR '.join(counted)})", "#VALUE!") if counted else "'#VALUE!'"
+        return _Sql(value, BOOL, _first_error(*errors, none_counted), nullable=False)
+
+    def _fn_and(self, args) -> _Sql:
+        return self._logical(args, is_and=True)
+
+    def _fn_or(self, args) -> _Sql:
+        return self._logical(args, is_and=False)
+
+    def _fn_not(self, args) -> _Sql:
+        logical = _as_bool(self.translate(args[0]))
+        return _Sql(f"(NOT {logical.value})", BOOL, logical.error, nullable=False)
+
+    def _is_kind(self, args, kind: Optional[int]) -> _Sql:
+        """ISBLANK (kind None), ISNUMBER and ISTEXT; errors are neither and do not propagate"""
+        value = self.translate(args[0])
+        conditions = []
+        if kind is None:
+            if not value.nullable:
+                return _Sql("0", BOOL, nullable=False)
+            conditions.append(f"{value.value} IS NULL")
+        else:
+            if value.kind != kind:
+                return _Sql("0", BOOL, nullable=False)
+            if value.nullable:
+                conditions.append(f"{value.value} IS NOT NULL")
+        if value.error is not None:
+            conditions.append(f"{value.error} IS NULL")
+        return _Sql(f"({' AND '.join(conditions)})" if conditions else "1", BOOL, nullable=False)
+
+    def _fn_isblank(self, args) -> _Sql:
+        return self._is_kind(args, None)
+
+    def _fn_isnumber(self, args) -> _Sql:
+        return self._is_kind(args, NUMBER)
+
+    def _fn_istext(self, args) -> _Sql:
+        return self._is_kind(args, TEXT)
+
+    def _substring(self, args, from_left: bool) -> _Sql:
+        text = _as_text(self.translate(args[0]))
+        count = _as_number(self.translate(args[1])) if len(args) > 1 else _Sql("1.0", NUMBER, nullable=False)
+        n = f"CAST({count.value} AS INTEGER)"
+        if from_left:
+            value = f"SUBSTR({text.value}, 1, MAX({n}, 0))"
+        else:
+            value = f"(CASE WHEN {n} > 0 THEN SUBSTR({text.value}, -{n}) ELSE '' END)"
+        error = _first_error(text.error, count.error, _error_when(f"{n} < 0", "#VALUE!"))
+        return _Sql(value, TEXT, error, nullable=False)
+
+    def _fn_left(self, args) -> _Sql:
+        return self._substring(args, from_left=True)
+
+    def _fn_right(self, args) -> _Sql:
+        return self._substring(args, from_left=False)
+
+    def _fn_len(self, args) -> _Sql:
+        text = _as_text(self.translate(args[0]))
+        return _Sql(f"CAST(LENGTH({text.value}) AS REAL)", NUMBER, text.error, nullable=False)
+
+    def _fn_trim(self, args) -> _Sql:
+        # Excel's TRIM removes leading/trailing spaces and collapses runs of spaces:
+        # "a   b" -> "a <m> <m> <m>b" -> "a <m>b" -> "a b"
+        text = _as_text(self.translate(args[0]))
+        value = (f"REPLACE(REPLACE(REPLACE(TRIM({text.value}, ' '), ' ', ' ' || {_TRIM_MARKER}), "
+                 f"{_TRIM_MARKER} || ' ', ''), {_TRIM_MARKER}, '')")
+        return _Sql(value, TEXT, text.error, nullable=False)
+
+    def _fn_abs(self, args) -> _Sql:
+        number = _as_number(self.translate(args[0]))
+        return _Sql(f"ABS({number.value})", NUMBER, number.error, nullable=False)
+
+
+class SqliteFormulaProcessor:
+    """
+    Evaluates Excel formulas with SQL over a disk-backed SQLite copy of the data.
+
+    Drop-in replacement for ExcelFormulaProcessor for the formula subset used
+    by validation rules, for extracts too large to evaluate in memory.
+    """
+
+    # Excel error values and their Python representations (mirrors ExcelFormulaProcessor)
+    EXCEL_ERRORS = NativeFormulaProcessor.EXCEL_ERRORS
+
+    def __init__(self, track_errors: bool = True, database_path: Optional[str] = None,
+                 database_dir: Optional[str] = None, cache_size_mb: int = 64,
+                 fetch_rows: int = 50000, **kwargs):
+        """
+        Initialize the SQLite processor.
+
+        Args:
+            track_errors: Whether to add an ``<output>_Error`` column per formula
+            database_path: Database file to use (kept on cleanup); by default a
+                           temporary file is created and removed on cleanup
+            database_dir: Directory for the temporary database file
+                          (default: data/temp/sqlite)
+            cache_size_mb: SQLite page cache size, which bounds its memory use
+            fetch_rows: Rows loaded or fetched per round trip
+            **kwargs: Accepted for interface compatibility with ExcelFormulaProcessor
+                      (visible, template_path) and ignored
+        """
+        self.track_errors = track_errors
+        self.cache_size_mb = cache_size_mb
+        self.fetch_rows = fetch_rows
+        self.session_id = str(uuid.uuid4())[:8]
+        self._owns_database = database_path is None
+        if database_path is None:
+            directory = Path(database_dir) if database_dir else Path(DEFAULT_DATABASE_DIR)
+            directory.mkdir(parents=True, exist_ok=True)
+            handle, database_path = tempfile.mkstemp(prefix=f"formulas_{self.session_id}_", suffix=".sqlite",
+                                                     dir=str(directory))
+            os.close(handle)
+        self.database_path = str(database_path)
+        self._connection: Optional[sqlite3.Connection] = None
+        self.column_kinds: Dict[str, int] = {}
+        self.row_count = 0
+        # (weak reference to the loaded DataFrame, its length) so repeated calls reuse the table
+        self._loaded_from = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.cleanup()
+        return False
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.database_path)
+            self._connection.execute("PRAGMA journal_mode = OFF")
+            self._connection.execute("PRAGMA synchronous = OFF")
+            self._connection.execute("PRAGMA temp_store = FILE")
+            self._connection.execute(f"PRAGMA cache_size = {-int(self.cache_size_mb * 1024)}")
+        return self._connection
+
+    def cleanup(self):
+        """Close the database and remove it if it is a temporary file"""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        self._loaded_from = None
+        if self._owns_database:
+            try:
+                os.remove(self.database_path)
+            except OSError:
+                pass
+
+    def _has_pow(self) -> bool:
+        """Whether this SQLite build has the math functions (pow)"""
+        try:
+            self.connection.execute("SELECT pow(2, 2)")
+            return True
+        except sqlite3.OperationalError:
+            return False
+
+    @staticmethod
+    def referenced_columns(formulas: Iterable[Union[str, CompiledFormula]]) -> List[str]:
+        """
+        Columns the formulas read, in first-use order.
+
+        Args:
+            formulas: Excel formulas or compiled formulas
+
+        Returns:
+            List of column names
+        """
+        columns = {}
+        for formula in formulas:
+            compiled = formula if isinstance(formula, CompiledFormula) else compile_formula(formula)
+            if compiled.is_valid:
+                for node in iter_nodes(compiled.ast):
+                    if isinstance(node, ColumnReference):
+                        columns[node.name] = True
+        return list(columns)
+
+    def supports_formula(self, formula: Union[str, CompiledFormula]) -> bool:
+        """
+        Check whether a formula's functions and references can be translated to SQL.
+
+        Column types are only known once data is loaded, so a supported formula
+        can still raise UnsupportedFormulaError on data with mixed-type columns.
+
+        Args:
+            formula: Excel formula or an already compiled formula
+
+        Returns:
+            True if every function and reference in the formula is supported
+        """
+        compiled = formula if isinstance(formula, CompiledFormula) else compile_formula(formula)
+        if not compiled.is_valid:
+            # Syntax errors are reported per column during evaluation
+            return True
+
+        for node in iter_nodes(compiled.ast):
+            if isinstance(node, (NameReference, ArrayLiteral)):
+                return False
+            if isinstance(node, FunctionCall) and node.name not in SUPPORTED_FUNCTIONS:
+                return False
+            if isinstance(node, BinaryOperation) and node.operator == "^" and not self._has_pow():
+                return False
+        return True
+
+    def load(self, data: Union[pd.DataFrame, Iterable[pd.DataFrame]], columns: List[str]) -> int:
+        """
+        Load columns of a DataFrame, or of a sequence of DataFrame chunks, into the database.
+
+        Chunks let an extract be loaded without holding it in memory at once;
+        the value type of each column is taken from the first chunk.
+
+        Args:
+            data: DataFrame, or iterable of DataFrame chunks with the same columns
+            columns: Columns to load (absent columns are skipped)
+
+        Returns:
+            Number of rows loaded
+        """
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+        connection = self.connection
+        connection.execute(f"DROP TABLE IF EXISTS {_TABLE}")
+        self.column_kinds = {}
+        self.row_count = 0
+        self._loaded_from = None
+
+        loaded_columns = None
+        for chunk in chunks:
+            if loaded_columns is None:
+                loaded_columns = [c for c in dict.fromkeys(columns) if c in chunk.columns]
+                self.column_kinds = {c: _column_kind(chunk[c]) for c in loaded_columns}
+                # Mixed-type columns are not loaded; formulas reading them are not translated
+                stored = [c for c in loaded_columns if self.column_kinds[c] != MIXED]
+                definitions = [f"{_ROW} INTEGER PRIMARY KEY"] + [
+                    f"{_quote(c)} {_SQL_TYPES[self.column_kinds[c]]}" for c in stored
+                ]
+                connection.execute(f"CREATE TABLE {_TABLE} ({', '.join(definitions)})")
+                insert = (f"INSERT INTO {_TABLE} ({', '.join([_ROW] + [_quote(c) for c in stored])}) "
+                          f"VALUES ({', '.join(['?'] * (len(stored) + 1))})")
+
+            for start in range(0, len(chunk), self.fetch_rows):
+                block = chunk.iloc[start:start + self.fetch_rows]
+                row_numbers = range(self.row_count, self.row_count + len(block))
+                values = [_column_values(block[c], self.column_kinds[c]) for c in stored]
+                connection.executemany(insert, zip(row_numbers, *values))
+                self.row_count += len(block)
+        if loaded_columns is None:
+            # No chunks: an empty table of blank text columns
+            self.column_kinds = {c: TEXT for c in dict.fromkeys(columns)}
+            definitions = [f"{_ROW} INTEGER PRIMARY KEY"] + [f"{_quote(c)} TEXT" for c in self.column_kinds]
+            connection.execute(f"CREATE TABLE {_TABLE} ({', '.join(definitions)})")
+        connection.commit()
+
+        if isinstance(data, pd.DataFrame):
+            self._loaded_from = (weakref.ref(data), len(data))
+        logger.debug(f"[Session {self.session_id}] Loaded {self.row_count} rows x "
+                     f"{len(self.column_kinds)} columns into {self.database_path}")
+        return self.row_count
+
+    def _ensure_loaded(self, data: pd.DataFrame, columns: List[str]) -> None:
+        """Load data unless this DataFrame's needed columns are already in the table"""
+        if self._loaded_from is not None and self._loaded_from[0]() is data \
+                and self._loaded_from[1] == len(data) \
+                and all(c in self.column_kinds for c in columns if c in data.columns):
+            return
+        self.load(data, list(self.column_kinds) + columns if self._loaded_from else columns)
+
+    def _translate(self, compiled_formulas: Dict[str, CompiledFormula]) -> Dict[str, Any]:
+        """Translate each formula, or keep the syntax error to report for its column"""
+        translator = _SqlTranslator(self.column_kinds, self._has_pow())
+        translated = {}
+        for output_col, compiled in compiled_formulas.items():
+            try:
+                if not compiled.is_valid:
+                    raise FormulaSyntaxError(compiled.error)
+                translated[output_col] = translator.translate(compiled.ast)
+            except FormulaSyntaxError as e:
+                logger.error(f"[Session {self.session_id}] Error setting formula '{compiled.text}': {str(e)}")
+                translated[output_col] = e
+        return translated
+
+    @staticmethod
+    def _compile_all(formulas: Dict[str, Union[str, CompiledFormula]]) -> Dict[str, CompiledFormula]:
+        return {
+            output_col: formula if isinstance(formula, CompiledFormula) else compile_formula(formula)
+            for output_col, formula in formulas.items()
+        }
+
+    def process_formulas(
+            self,
+            data: pd.DataFrame,
+            formulas: Dict[str, Union[str, CompiledFormula]],
+            input_range: str = "A2",
+            use_bulk_method: bool = True
+    ) -> pd.DataFrame:
+        """
+        Evaluate formulas against a DataFrame.
+
+        Args:
+            data: Input DataFrame to process
+            formulas: Dictionary mapping output column names to Excel formulas
+                      (formula text or CompiledFormula from ValidationRuleParser)
+            input_range: Ignored, present for interface compatibility
+            use_bulk_method: Ignored, evaluation is always set-based
+
+        Returns:
+            DataFrame with formula results added as new columns
+        """
+        return self.process_formulas_bulk(data, formulas, input_range)
+
+    def process_formulas_bulk(
+            self,
+            data: pd.DataFrame,
+            formulas: Dict[str, Union[str, CompiledFormula]],
+            input_range: str = "A2"
+    ) -> pd.DataFrame:
+        """
+        Evaluate formulas with one SQL query over the loaded columns.
+
+        Args:
+            data: Input DataFrame to process
+            formulas: Dictionary mapping output column names to Excel formulas
+                      (formula text or CompiledFormula from ValidationRuleParser)
+            input_range: Ignored, present for interface compatibility
+
+        Returns:
+            DataFrame with formula results added as new columns
+
+        Raises:
+            UnsupportedFormulaError: If a formula cannot be translated to SQL
+        """
+        compiled_formulas = self._compile_all(formulas)
+        self._ensure_loaded(data, self.referenced_columns(compiled_formulas.values()))
+        translated = self._translate(compiled_formulas)
+
+        num_rows = len(data)
+        queried = {output_col: sql for output_col, sql in translated.items() if isinstance(sql, _Sql)}
+        fetched = self._fetch(queried, num_rows)
+
+        new_columns: Dict[str, Any] = {}
+        for output_col, sql in translated.items():
+            error_col = f"{output_col}_Error"
+            if not isinstance(sql, _Sql):
+                # Same outcome as a formula Excel refuses to accept
+                new_columns[output_col] = np.full(num_rows, f"ERROR: {str(sql)}", dtype=object)
+                if self.track_errors:
+                    new_columns[error_col] = np.full(num_rows, "FORMULA_SETTING_ERROR", dtype=object)
+                continue
+
+            values, errors = fetched[output_col]
+            result_values, error_values = self._to_output(sql.kind, values, errors)
+            new_columns[output_col] = result_values
+            if self.track_errors:
+                new_columns[error_col] = error_values
+
+        result_df = data.copy()
+        if new_columns:
+            # Drop any existing output columns so they are replaced, not duplicated
+            result_df = result_df.drop(columns=[c for c in new_columns if c in result_df.columns])
+            result_df = pd.concat([result_df, pd.DataFrame(new_columns, index=data.index)], axis=1)
+        return result_df
+
+    def _fetch(self, queried: Dict[str, _Sql], num_rows: int) -> Dict[str, Any]:
+        """Run the value and error expressions of every formula in one query, in row order"""
+        if self.row_count != num_rows:
+            raise ValueError(f"Loaded table has {self.row_count} rows, data has {num_rows}")
+        fetched = {output_col: (np.empty(num_rows, dtype=object), np.empty(num_rows, dtype=object))
+                   for output_col in queried}
+        if not queried:
+            return fetched
+
+        selected = []
+        for sql in queried.values():
+            selected += [sql.value, sql.error or "NULL"]
+        cursor = self.connection.execute(f"SELECT {', '.join(selected)} FROM {_TABLE} ORDER BY {_ROW}")
+        position = 0
+        while True:
+            rows = cursor.fetchmany(self.fetch_rows)
+            if not rows:
+                break
+            columns = list(zip(*rows))
+            end = position + len(rows)
+            for i, output_col in enumerate(queried):
+                values, errors = fetched[output_col]
+                values[position:end] = columns[2 * i]
+                errors[position:end] = columns[2 * i + 1]
+            position = end
+        return fetched
+
+    def _to_output(self, kind: Optional[int], values: np.ndarray, errors: np.ndarray):
+        """
+        Convert fetched values to the result and error column contents
+        produced by the Excel processor.
+        """
+        size = len(values)
+        error_rows = ~pd.isna(errors)
+        blank = pd.isna(values) & ~error_rows
+        output_errors = np.full(size, "", dtype=object)
+
+        if not error_rows.any() and not blank.any():
+            if kind == BOOL:
+                return values.astype(bool), output_errors
+            if kind == NUMBER:
+                # Adding 0.0 turns -0.0 into 0.0, as Excel never shows a negative zero
+                return values.astype(np.float64) + 0.0, output_errors
+
+        result = np.empty(size, dtype=object)
+        present = ~blank & ~error_rows
+        if kind == BOOL:
+            result[present] = values[present].astype(bool)
+        elif kind == NUMBER:
+            result[present] = values[present].astype(np.float64) + 0.0
+        else:
+            result[present] = values[present]
+        # A formula never returns a blank, it returns 0
+        result[blank] = 0.0
+        if error_rows.any():
+            # Error literals to the native engine's error codes, then to the error column values
+            codes = pd.Categorical(errors[error_rows], categories=ERROR_VALUES).codes
+            output_errors[error_rows] = result[error_rows] = NativeFormulaProcessor.ERROR_OUTPUTS[codes]
+        return result, output_errors
+
+    def aggregate_by_party(
+            self,
+            data: Optional[Union[pd.DataFrame, Iterable[pd.DataFrame]]],
+            formulas: Dict[str, Union[str, CompiledFormula]],
+            party_column: str
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Count each formula's GC, DNC and error results per responsible party with GROUP BY.
+
+        Results are classified as the evaluator classifies them: a result that
+        is TRUE (or a non-zero number, or the text "TRUE") is GC, anything else
+        is DNC, and Excel errors are also counted as errors. No result column
+        is materialized, so memory use does not grow with the row count.
+
+        Args:
+            data: DataFrame or iterable of DataFrame chunks to load, or None to
+                  use the table already loaded (which must include party_column)
+            formulas: Dictionary mapping output column names to Excel formulas
+            party_column: Responsible-party column to group by
+
+        Returns:
+            Dictionary mapping output columns to DataFrames indexed by party, in
+            sorted order, with gc_count, pc_count, dnc_count, error_count and
+            total_count columns. Rows with a blank party are counted under a
+            None index entry, so the column sums are the overall counts.
+
+        Raises:
+            UnsupportedFormulaError: If a formula cannot be translated to SQL
+            FormulaSyntaxError: If a formula is invalid
+        """
+        compiled_formulas = self._compile_all(formulas)
+        columns = self.referenced_columns(compiled_formulas.values()) + [party_column]
+        if data is not None:
+            self.load(data, columns)
+        if party_column not in self.column_kinds:
+            raise ValueError(f"Party column {party_column} is not loaded")
+        if self.column_kinds[party_column] == MIXED:
+            raise UnsupportedFormulaError(f"Column {party_column} holds mixed value types")
+
+        translated = self._translate(compiled_formulas)
+        selected = []
+        for output_col, sql in translated.items():
+            if not isinstance(sql, _Sql):
+                raise sql
+            error = sql.error or "NULL"
+            if sql.kind == TEXT:
+                truthy = f"UPPER({sql.value}) = 'TRUE'"
+            elif sql.kind is None:
+                truthy = "0"
+            else:
+                truthy = f"COALESCE({sql.value}, 0) <> 0"
+            gc = f"SUM(CASE WHEN {error} IS NULL AND {truthy} THEN 1 ELSE 0 END)"
+            selected += [gc, f"SUM({error} IS NOT NULL)"]
+
+        party = _quote(party_column)
+        rows = self.connection.execute(
+            f"SELECT {party}, COUNT(*), {', '.join(selected)} FROM {_TABLE} GROUP BY {party} ORDER BY {party}"
+        ).fetchall()
+
+        # The blank-party group (NULL) sorts first; it goes last, as groupby would drop it
+        rows = [row for row in rows if row[0] is not None] + [row for row in rows if row[0] is None]
+        parties = pd.Index([row[0] for row in rows], dtype=object)
+        totals = np.array([row[1] for row in rows], dtype=np.int64)
+        aggregates = {}
+        for i, output_col in enumerate(translated):
+            gc_counts = np.array([row[2 + 2 * i] for row in rows], dtype=np.int64)
+            error_counts = np.array([row[3 + 2 * i] for row in rows], dtype=np.int64)
+            aggregates[output_col] = pd.DataFrame({
+                "gc_count": gc_counts,
+                "pc_count": np.zeros(len(rows), dtype=np.int64),
+                "dnc_count": totals - gc_counts,
+                "error_count": error_counts,
+                "total_count": totals
+            }, index=parties)
+        return aggregates
@@ -3,11 +3,20 @@ import pandas as pd
 import numpy as np
 import logging
 
+from .row_index import PartyCodes
+
 logger = logging.getLogger(__name__)
 
 # Define compliance status types
 ComplianceStatus = Literal["GC", "PC", "DNC"]  # Generally Conforms, Partially Conforms, Does Not Conform
 
+# Per-row status codes produced by ComplianceDeterminer.classify_results
+STATUS_EXCLUDED = -1  # Null result, not counted
+STATUS_GC = 0
+STATUS_PC = 1
+STATUS_DNC = 2
+STATUS_NAMES = ("GC", "PC", "DNC")  # Status code -> ComplianceStatus
+
 
 class ComplianceDeterminer:
     """
@@ -72,50 +81,137 @@ class ComplianceDeterminer:
         logger.warning(f"Unrecognized validation result: {result}, defaulting to DNC")
         return "DNC"
 
-    def determine_overall_compliance(self,
-                                     result_df: pd.DataFrame,
-                                     compliance_column: str,
-                                     rule_threshold: float = 1.0) -> Tuple[ComplianceStatus, Dict[str, Any]]:
+    def classify_results(self,
+                         results: pd.Series,
+                         rule_threshold: float = 1.0,
+                         error_mask: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Determine overall compliance status for results from a single rule.
+        Classify a whole column of validation results at once.
+
+        Applies the same rules as determine_row_compliance, using NumPy masks
+        instead of a per-row loop.
 
         Args:
-            result_df: DataFrame with validation results
-            compliance_column: Column name containing validation results
+            results: Series of validation results
             rule_threshold: Rule-specific threshold
+            error_mask: Rows the formula processor reported as Excel errors
+                        (see error_mask_from_column), if known
 
         Returns:
-            Tuple of (compliance_status, compliance_metrics)
+            Tuple of (status codes, error mask). Status codes are int8 values
+            STATUS_GC, STATUS_PC, STATUS_DNC, or STATUS_EXCLUDED for null results.
+            The error mask flags results that are error strings ("ERROR...")
+            or that error_mask flags.
         """
-        # Count items for each compliance status
-        gc_count = 0
-        pc_count = 0
-        dnc_count = 0
-        error_count = 0
-        total_count = len(result_df)
-
-        # Calculate compliance status for each row
-        for _, row in result_df.iterrows():
-            result = row[compliance_column]
-
-            # Skip nulls/NaNs
-            if pd.isna(result):
-                total_count -= 1
-                continue
-
-            # Count by status
-            if isinstance(result, str) and result.startswith("ERROR"):
-                error_count += 1
-                dnc_count += 1  # Errors count as DNC
-            else:
-                status = self.determine_row_compliance(result, rule_threshold)
-                if status == "GC":
-                    gc_count += 1
-                elif status == "PC":
-                    pc_count += 1
-                else:  # DNC
-                    dnc_count += 1
+        size = len(results)
+        codes = np.full(size, STATUS_DNC, dtype=np.int8)
+        errors = np.zeros(size, dtype=bool)
+
+        if error_mask is not None and error_mask.any():
+            # Error rows are DNC; the others are classified as a column of their own,
+            # which is typed (e.g. bool) once the error strings are left out
+            errors = np.asarray(error_mask, dtype=bool).copy()
+            valid = ~errors
+            if valid.any():
+                codes[valid], errors[valid] = self.classify_results(results[valid].infer_objects(),
+                                                                    rule_threshold)
+            return codes, errors
+
+        # Fast paths for typed columns
+        if pd.api.types.is_bool_dtype(results.dtype) and not results.hasnans:
+            codes[results.to_numpy(dtype=bool)] = STATUS_GC
+            return codes, errors
+        if pd.api.types.is_numeric_dtype(results.dtype) and not pd.api.types.is_bool_dtype(results.dtype):
+            values = results.to_numpy(dtype=np.float64, na_value=np.nan)
+            self._classify_numbers(values, codes, np.ones(size, dtype=bool), rule_threshold)
+            codes[np.isnan(values)] = STATUS_EXCLUDED
+            return codes, errors
 
+        values = results.to_numpy(dtype=object)
+        missing = pd.isna(values)
+        present = ~missing
+        kind = pd.api.types.infer_dtype(values, skipna=True)
+
+        if kind == "boolean":
+            booleans = present.copy()
+            booleans[present] = values[present].astype(bool)
+            codes[booleans] = STATUS_GC
+        elif kind in ("floating", "integer", "mixed-integer-float", "decimal"):
+            numbers = np.zeros(size, dtype=np.float64)
+            numbers[present] = values[present].astype(np.float64)
+            self._classify_numbers(numbers, codes, present, rule_threshold)
+        elif kind == "string":
+            self._classify_strings(values, codes, errors, present)
+        elif kind != "empty":
+            # Mixed column: split it by Python type, classifying each distinct type once
+            value_types = pd.Series(values, dtype=object).map(type).to_numpy(dtype=object)
+            booleans = np.zeros(size, dtype=bool)
+            numbers = np.zeros(size, dtype=bool)
+            strings = np.zeros(size, dtype=bool)
+            for value_type in pd.unique(value_types[present]):
+                # Compare types by identity: == against a NumPy scalar type is not elementwise
+                mask = present & np.fromiter((t is value_type for t in value_types), bool, size)
+                if issubclass(value_type, (bool, np.bool_)):
+                    booleans |= mask
+                elif issubclass(value_type, (int, float, np.number)):
+                    numbers |= mask
+                elif issubclass(value_type, str):
+                    strings |= mask
+
+            if booleans.any():
+                codes[booleans] = np.where(values[booleans].astype(bool), STATUS_GC, STATUS_DNC)
+            if numbers.any():
+                number_values = np.zeros(size, dtype=np.float64)
+                number_values[numbers] = values[numbers].astype(np.float64)
+                self._classify_numbers(number_values, codes, numbers, rule_threshold)
+            if strings.any():
+                self._classify_strings(values, codes, errors, strings)
+
+            unrecognized = present & ~(booleans | numbers | strings)
+            if unrecognized.any():
+                logger.warning(f"Unrecognized validation result: {values[unrecognized][0]} "
+                               f"({int(unrecognized.sum())} values), defaulting to DNC")
+
+        codes[missing] = STATUS_EXCLUDED
+        return codes, errors
+
+    def _classify_numbers(self,
+                          values: np.ndarray,
+                          codes: np.ndarray,
+                          mask: np.ndarray,
+                          rule_threshold: float) -> None:
+        """Classify numeric results selected by mask (0.0 to 1.0 scale)"""
+        codes[mask & (values >= rule_threshold)] = STATUS_GC
+        codes[mask & (values < rule_threshold) & (values >= self.pc_threshold)] = STATUS_PC
+
+    def _classify_strings(self,
+                          values: np.ndarray,
+                          codes: np.ndarray,
+                          errors: np.ndarray,
+                          mask: np.ndarray) -> None:
+        """Classify string results selected by mask"""
+        strings = pd.Series(values[mask], dtype=object).astype(str)
+        is_error = strings.str.startswith("ERROR").to_numpy(dtype=bool)
+        upper = strings.str.upper()
+        is_true = (upper == "TRUE").to_numpy(dtype=bool)
+        recognized = is_error | strings.str.startswith("#").to_numpy(dtype=bool) | \
+            is_true | (upper == "FALSE").to_numpy(dtype=bool)
+
+        codes[mask] = np.where(is_true, STATUS_GC, STATUS_DNC)
+        errors[mask] = is_error
+
+        if not recognized.all():
+            first = strings[~recognized].iloc[0]
+            logger.warning(f"Unrecognized validation result: {first} "
+                           f"({int((~recognized).sum())} values), defaulting to DNC")
+
+    def _metrics_from_counts(self,
+                             gc_count: int,
+                             pc_count: int,
+                             dnc_count: int,
+                             error_count: int,
+                             total_count: int) -> Tuple[ComplianceStatus, Dict[str, Any]]:
+        """Build the overall status and metrics dict from status counts"""
         # Prevent division by zero
         if total_count == 0:
             return "DNC", {
@@ -156,42 +252,215 @@ class ComplianceDeterminer:
 
         return overall_status, metrics
 
-    def aggregate_by_responsible_party(self,
-                                       result_df: pd.DataFrame,
-                                       compliance_column: str,
-                                       responsible_party_column: str,
-                                       rule_threshold: float = 1.0) -> Dict[str, Dict[str, Any]]:
+    def determine_overall_compliance(self,
+                                     result_df: pd.DataFrame,
+                                     compliance_column: str,
+                                     rule_threshold: float = 1.0,
+                                     error_mask: Optional[np.ndarray] = None
+                                     ) -> Tuple[ComplianceStatus, Dict[str, Any]]:
         """
-        Aggregate compliance results by responsible party.
+        Determine overall compliance status for results from a single rule.
 
         Args:
             result_df: DataFrame with validation results
-            compliance_column: Column with validation results
-            responsible_party_column: Column with responsible party names
+            compliance_column: Column name containing validation results
+            rule_threshold: Rule-specific threshold
+            error_mask: Rows the formula processor reported as Excel errors, if known
+
+        Returns:
+            Tuple of (compliance_status, compliance_metrics)
+        """
+        codes, errors = self.classify_results(result_df[compliance_column], rule_threshold, error_mask)
+
+        # Null results are excluded from the total; errors count as DNC
+        counts = np.bincount(codes[codes != STATUS_EXCLUDED], minlength=3)
+        return self._metrics_from_counts(
+            int(counts[STATUS_GC]),
+            int(counts[STATUS_PC]),
+            int(counts[STATUS_DNC]),
+            int(errors.sum()),
+            int(counts.sum())
+        )
+
+    def count_by_party(self,
+                       result_series: pd.Series,
+                       party_codes: PartyCodes,
+                       rule_threshold: float = 1.0,
+                       error_mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Count result statuses per responsible party on the party codes.
+
+        Args:
+            result_series: Validation results, one per row
+            party_codes: Factorized responsible-party column of the same rows
             rule_threshold: Rule-specific threshold
+            error_mask: Rows the formula processor reported as Excel errors, if known
+
+        Returns:
+            Array of shape (parties, 5) with the GC, PC, DNC, error and total
+            counts of each party code
+        """
+        codes, errors = self.classify_results(result_series, rule_threshold, error_mask)
+        party_count = len(party_codes.labels)
+        parties = party_codes.codes.astype(np.int64)
+
+        # One bincount over party * 3 + status gives the party x status matrix
+        counted = (parties >= 0) & (codes != STATUS_EXCLUDED)
+        status_counts = np.bincount(
+            parties[counted] * 3 + codes[counted], minlength=party_count * 3
+        ).reshape(party_count, 3)
+        known = parties >= 0
+        error_counts = np.bincount(parties[known & errors], minlength=party_count)
+
+        counts = np.empty((party_count, 5), dtype=np.int64)
+        counts[:, :3] = status_counts
+        counts[:, 3] = error_counts
+        counts[:, 4] = status_counts.sum(axis=1)
+        return counts
+
+    def party_statuses(self, counts: np.ndarray) -> np.ndarray:
+        """
+        Compliance status code of each party from its status counts.
+
+        Args:
+            counts: Party count matrix from count_by_party
+
+        Returns:
+            int8 array of STATUS_GC/STATUS_PC/STATUS_DNC per party code
+        """
+        totals = counts[:, 4]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gc_rate = counts[:, 0] / totals
+            pc_rate = counts[:, 1] / totals
+        statuses = np.full(len(counts), STATUS_DNC, dtype=np.int8)
+        statuses[gc_rate + pc_rate >= self.pc_threshold] = STATUS_PC
+        statuses[gc_rate >= self.gc_threshold] = STATUS_GC
+        # Parties without counted rows do not conform
+        statuses[totals == 0] = STATUS_DNC
+        return statuses
+
+    def party_results_from_counts(self,
+                                  counts: np.ndarray,
+                                  labels: List[Any]) -> Dict[str, Dict[str, Any]]:
+        """
+        Map a party count matrix back to per-party status and metrics.
+
+        Args:
+            counts: Party count matrix from count_by_party
+            labels: Party label of each code
 
         Returns:
             Dictionary mapping responsible parties to their compliance metrics
         """
-        # Group by responsible party
-        grouped = result_df.groupby(responsible_party_column)
+        statuses = self.party_statuses(counts)
         results = {}
-
-        # Calculate compliance for each group
-        for party, group_df in grouped:
+        for party, status, (gc_count, pc_count, dnc_count, error_count, total_count) in zip(
+                labels, statuses, counts.tolist()):
             # Convert party to string if it's a Timestamp to avoid dictionary key error
             if pd.api.types.is_datetime64_any_dtype(type(party)):
                 party_key = str(party)
             else:
                 party_key = party
-                
-            status, metrics = self.determine_overall_compliance(
-                group_df, compliance_column, rule_threshold
-            )
+
+            if total_count == 0:
+                metrics = {"gc_rate": 0, "pc_rate": 0, "dnc_rate": 0, "gc_count": 0, "pc_count": 0,
+                           "dnc_count": 0, "error_count": 0, "total_count": 0}
+            else:
+                metrics = {
+                    "gc_rate": gc_count / total_count,
+                    "pc_rate": pc_count / total_count,
+                    "dnc_rate": dnc_count / total_count,
+                    "gc_count": gc_count,
+                    "pc_count": pc_count,
+                    "dnc_count": dnc_count,
+                    "error_count": error_count,
+                    "total_count": total_count
+                }
 
             results[party_key] = {
-                "status": status,
+                "status": STATUS_NAMES[status],
                 "metrics": metrics
             }
 
-        return results
\ No newline at end of file
+        return results
+
+    def aggregate_by_responsible_party(self,
+                                       result_df: pd.DataFrame,
+                                       compliance_column: str,
+                                       responsible_party_column: str,
+                                       rule_threshold: float = 1.0,
+                                       party_codes: Optional[PartyCodes] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate compliance results by responsible party.
+
+        Args:
+            result_df: DataFrame with validation results
+            compliance_column: Column with validation results
+            responsible_party_column: Column with responsible party names
+            rule_threshold: Rule-specific threshold
+            party_codes: Factorized party column of result_df's rows
+                         (factorized here if not provided)
+
+        Returns:
+            Dictionary mapping responsible parties to their compliance metrics
+        """
+        if party_codes is None:
+            party_codes = PartyCodes.from_series(result_df[responsible_party_column])
+        counts = self.count_by_party(result_df[compliance_column], party_codes, rule_threshold)
+        return self.party_results_from_counts(counts, party_codes.labels)
+
+
+def error_mask_from_column(errors: Optional[pd.Series]) -> Optional[np.ndarray]:
+    """
+    Rows a formula processor reported as Excel errors in a result's ``_Error`` column.
+
+    Args:
+        errors: Error column ("" or null where the row has no error), or None
+
+    Returns:
+        Boolean mask, or None if there is no error column
+    """
+    if errors is None:
+        return None
+    values = errors.to_numpy(dtype=object)
+    return pd.notna(values) & (values != "")
+
+
+def party_status_matrix(rule_results: List[Any]) -> Optional[Tuple[np.ndarray, PartyCodes]]:
+    """
+    Stack the per-party status codes of rule results that share one party factorization.
+
+    Args:
+        rule_results: Rule evaluation results (RuleEvaluationResult-like objects)
+
+    Returns:
+        Tuple of (int8 array of shape (rules, parties), shared PartyCodes) for the
+        results grouped by party, or None if any of them lacks status codes or
+        uses a different factorization
+    """
+    grouped = [result for result in rule_results if getattr(result, 'party_results', None)]
+    if not grouped:
+        return None
+    party_codes = getattr(grouped[0], 'party_codes', None)
+    if party_codes is None or any(getattr(result, 'party_codes', None) is not party_codes
+                                  or getattr(result, 'party_statuses', None) is None for result in grouped):
+        return None
+    return np.vstack([result.party_statuses for result in grouped]), party_codes
+
+
+def status_counts_by_party(statuses: np.ndarray) -> np.ndarray:
+    """
+    Count status codes per party over a (rules, parties) status matrix.
+
+    Args:
+        statuses: Status codes; codes outside GC/PC/DNC (e.g. -1 for N/A) are not counted
+
+    Returns:
+        Array of shape (parties, 3) with the GC, PC and DNC counts of each party
+    """
+    party_count = statuses.shape[1]
+    parties = np.broadcast_to(np.arange(party_count, dtype=np.int64), statuses.shape)
+    counted = (statuses >= STATUS_GC) & (statuses <= STATUS_DNC)
+    return np.bincount(
+        parties[counted] * 3 + statuses[counted], minlength=party_count * 3
+    ).reshape(party_count, 3)
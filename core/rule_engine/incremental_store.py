@@ -0,0 +1,280 @@
+"""
+Incremental row-level re-validation for registered data sources.
+
+Rule formulas only read values from their own row, so a row whose referenced
+values are unchanged since the previous run has the same result. For each
+registered source the store keeps, per rule, a hash of every row's referenced
+values next to that row's result. On the next run only rows with unseen hashes
+(appended or edited rows) are evaluated; stored results are reused for the
+rest and compliance metrics are recomputed from the merged column.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .rule_manager import ValidationRule
+from .rule_evaluator import RuleEvaluationResult, RuleEvaluator
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STORE_DIR = "data/temp/incremental"
+
+# Runs of consecutive rows listed in a report; the counts cover all rows
+MAX_REPORTED_RANGES = 20
+
+
+def row_ranges(index: pd.Index, mask: np.ndarray, limit: int = MAX_REPORTED_RANGES) -> List[List[Any]]:
+    """
+    Describe the selected rows as runs of consecutive rows.
+
+    Args:
+        index: Row labels
+        mask: Rows to describe
+        limit: Maximum number of runs to list
+
+    Returns:
+        Up to limit [first label, last label] pairs, in row order
+    """
+    positions = np.flatnonzero(mask)
+    if len(positions) == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(positions) != 1)
+    starts = np.concatenate(([positions[0]], positions[breaks + 1]))[:limit]
+    ends = np.concatenate((positions[breaks], [positions[-1]]))[:limit]
+    return [[first, last] for first, last in zip(index[starts].tolist(), index[ends].tolist())]
+
+
+def hash_rows(data_df: pd.DataFrame, columns: List[Any]) -> np.ndarray:
+    """
+    Hash the values of the given columns for every row.
+
+    Object columns also hash each value's Python type, since 1 and "1" hash
+    alike as values but evaluate differently.
+
+    Args:
+        data_df: Data to hash
+        columns: Columns to include in each row's hash
+
+    Returns:
+        uint64 array with one hash per row
+    """
+    parts = {}
+    for position, column in enumerate(columns):
+        series = data_df[column]
+        parts[f"v{position}"] = series.to_numpy()
+        if series.dtype == object:
+            parts[f"t{position}"] = series.map(lambda value: type(value).__name__).to_numpy()
+
+    if not parts:
+        return np.zeros(len(data_df), dtype=np.uint64)
+    return pd.util.hash_pandas_object(pd.DataFrame(parts), index=False).to_numpy()
+
+
+class IncrementalResultStore:
+    """
+    Per-source store of row hashes and results from the previous run.
+    """
+
+    def __init__(self, store_dir: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            store_dir: Directory for stored run state (default: data/temp/incremental)
+        """
+        self.store_dir = Path(store_dir) if store_dir else Path(DEFAULT_STORE_DIR)
+
+    def _entry_path(self, source_id: str, rule: ValidationRule, formula_backend: Optional[str]) -> Path:
+        """File holding a rule's previous results for a source"""
+        compiled = rule.compiled_formula
+        formula_text = compiled.text if compiled is not None else str(rule.formula)
+        key = hashlib.sha256("\x1f".join([
+            formula_text, rule.name, str(formula_backend), repr(rule.get_required_columns())
+        ]).encode("utf-8")).hexdigest()
+        safe_source = "".join(c if c.isalnum() or c in "-_" else "_" for c in str(source_id))
+        return self.store_dir / safe_source / f"{key}.pkl"
+
+    def _load(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Load stored state, ignoring missing or unreadable files"""
+        if not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Could not read incremental state {path}: {str(e)}")
+            return None
+
+    def record(self,
+               source_id: str,
+               result: RuleEvaluationResult,
+               data_df: pd.DataFrame,
+               formula_backend: Optional[str] = None,
+               row_hashes: Optional[np.ndarray] = None) -> bool:
+        """
+        Save a rule's results on a source for the next incremental run.
+
+        Args:
+            source_id: Registered data source ID
+            result: Evaluation result covering every row of data_df
+            data_df: Data the rule was evaluated against
+            formula_backend: Formula backend that produced the results
+            row_hashes: Precomputed row hashes of the rule's referenced columns
+
+        Returns:
+            True if the state was saved
+        """
+        rule = result.rule
+        try:
+            if row_hashes is None:
+                row_hashes = hash_rows(data_df, rule.get_required_columns())
+            error_column = f"{result.result_column}_Error"
+            evaluated_df = result.evaluated_df
+            state = {
+                "result_column": result.result_column,
+                "row_hashes": row_hashes,
+                "results": evaluated_df[result.result_column].to_numpy(),
+                "errors": evaluated_df[error_column].to_numpy() if error_column in evaluated_df.columns else None
+            }
+
+            path = self._entry_path(source_id, rule, formula_backend)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, path)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            return True
+        except Exception as e:
+            logger.warning(f"Could not save incremental state for rule {rule.rule_id}: {str(e)}")
+            return False
+
+    def evaluate(self,
+                 source_id: str,
+                 rules: List[ValidationRule],
+                 data_df: pd.DataFrame,
+                 evaluator: RuleEvaluator,
+                 responsible_party_column: Optional[str] = None) -> Tuple[Dict[str, RuleEvaluationResult], Dict[str, Any]]:
+        """
+        Evaluate rules against a source, re-evaluating only new or changed rows.
+
+        Args:
+            source_id: Registered data source ID
+            rules: Rules to evaluate
+            data_df: Current data of the source
+            evaluator: RuleEvaluator used for the rows that need evaluation
+            responsible_party_column: Column identifying responsible parties
+
+        Returns:
+            Tuple of (rule_id -> RuleEvaluationResult, incremental run report). The
+            report counts reused and evaluated rows and lists the first
+            MAX_REPORTED_RANGES runs of each (see row_ranges)
+        """
+        formula_backend = evaluator.formula_backend
+        num_rows = len(data_df)
+
+        # Match each rule's rows against the hashes stored by the previous run
+        plans = []
+        needs_evaluation = np.zeros(num_rows, dtype=bool)
+        for rule in rules:
+            try:
+                is_valid, error = rule.validate_with_dataframe(data_df)
+                if not is_valid:
+                    raise ValueError(f"Rule validation failed: {error}")
+                row_hashes = hash_rows(data_df, rule.get_required_columns())
+            except Exception as e:
+                logger.error(f"Error evaluating rule {rule.rule_id}: {str(e)}")
+                continue
+
+            state = self._load(self._entry_path(source_id, rule, formula_backend))
+            positions = np.full(num_rows, -1, dtype=np.int64)
+            if state is not None and 0 < len(state["row_hashes"]) == len(state["results"]):
+                # Identical rows share a result, so match against each stored hash's first row
+                stored_hashes = pd.Index(state["row_hashes"])
+                first_rows = ~stored_hashes.duplicated(keep="first")
+                matches = stored_hashes[first_rows].get_indexer(row_hashes)
+                stored_rows = np.flatnonzero(first_rows)
+                positions = np.where(matches >= 0, stored_rows[np.maximum(matches, 0)], -1)
+
+            reused = positions >= 0
+            needs_evaluation |= ~reused
+            plans.append((rule, row_hashes, state, positions, reused))
+
+        # Evaluate every rule that has changed rows on the union of those rows, in one batch
+        changed_rules = [rule for rule, _, _, _, reused in plans if not reused.all()]
+        fresh_results: Dict[str, RuleEvaluationResult] = {}
+        if changed_rules:
+            changed_df = data_df[needs_evaluation]
+            fresh_results = evaluator.evaluate_multiple_rules(changed_rules, changed_df, responsible_party_column)
+        changed_positions = np.flatnonzero(needs_evaluation)
+
+        results: Dict[str, RuleEvaluationResult] = {}
+        rule_reports: Dict[str, Dict[str, int]] = {}
+        for rule, row_hashes, state, positions, reused in plans:
+            fresh = fresh_results.get(rule.rule_id)
+            if not reused.all() and fresh is None:
+                continue  # Evaluation failed; already logged by the evaluator
+
+            result_column = fresh.result_column if fresh is not None else state["result_column"]
+            error_column = f"{result_column}_Error"
+            merged_results = np.empty(num_rows, dtype=object)
+            merged_errors = np.full(num_rows, "", dtype=object)
+
+            if reused.any():
+                merged_results[reused] = state["results"][positions[reused]]
+                if state["errors"] is not None:
+                    merged_errors[reused] = state["errors"][positions[reused]]
+
+            if fresh is not None:
+                # Fresh results cover the changed rows; pick this rule's unreused rows among them
+                take = ~reused[changed_positions]
+                target = changed_positions[take]
+                merged_results[target] = fresh.evaluated_df[result_column].to_numpy()[take]
+                if error_column in fresh.evaluated_df.columns:
+                    merged_errors[target] = fresh.evaluated_df[error_column].to_numpy()[take]
+
+            evaluated_df = RuleEvaluator._project_columns(
+                data_df, RuleEvaluator._required_columns(rule, responsible_party_column)
+            ).assign(**{
+                result_column: pd.Series(merged_results, index=data_df.index).infer_objects(),
+                error_column: pd.Series(merged_errors, index=data_df.index)
+            })
+
+            # Recompute compliance from the merged result column
+            result = evaluator._build_evaluation_result(
+                rule, evaluated_df, result_column, responsible_party_column, source_df=data_df
+            )
+            if result is None:
+                continue
+
+            results[rule.rule_id] = result
+            rule_reports[rule.rule_id] = {
+                "reused_rows": int(reused.sum()),
+                "evaluated_rows": int((~reused).sum())
+            }
+            self.record(source_id, result, data_df, formula_backend, row_hashes=row_hashes)
+
+        report = {
+            "source_id": source_id,
+            "total_rows": num_rows,
+            "reused_rows": int(num_rows - needs_evaluation.sum()) if plans else 0,
+            "evaluated_rows": int(needs_evaluation.sum()) if plans else 0,
+            "reused_row_ranges": row_ranges(data_df.index, ~needs_evaluation) if plans else [],
+            "evaluated_row_ranges": row_ranges(data_df.index, needs_evaluation) if plans else [],
+            "rules": rule_reports
+        }
+        logger.info(f"Incremental run for source {source_id}: reused {report['reused_rows']} of "
+                    f"{num_rows} rows, evaluated {report['evaluated_rows']}")
+        return results, report
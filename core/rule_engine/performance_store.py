@@ -0,0 +1,205 @@
+"""
+Persistent history of per-rule evaluation performance.
+
+Every validation run records, for each rule it evaluated, the wall-clock
+time, row count, formula backend and worker count in a small SQLite
+database. The history feeds the scheduler's cost model and the progress
+pipeline's ETA, and answers "which rules are slowest" across recent runs.
+"""
+
+import datetime
+import logging
+import sqlite3
+import threading
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DB_PATH = "data/performance/rule_performance.db"
+
+# Number of a rule's most recent runs averaged into its seconds-per-row estimate
+DEFAULT_HISTORY_WINDOW = 5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rule_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    rule_id TEXT NOT NULL,
+    rule_name TEXT,
+    seconds REAL NOT NULL,
+    row_count INTEGER NOT NULL,
+    backend TEXT,
+    workers INTEGER NOT NULL DEFAULT 1,
+    batched INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_rule_runs_rule ON rule_runs (rule_id, id);
+CREATE INDEX IF NOT EXISTS idx_rule_runs_run ON rule_runs (run_id);
+"""
+
+
+class RulePerformanceStore:
+    """
+    SQLite-backed store of per-rule evaluation timings.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize the store. The database is created on the first recorded run.
+
+        Args:
+            db_path: Path of the SQLite database (default: data/performance/rule_performance.db)
+        """
+        self.db_path = Path(db_path) if db_path else Path(DEFAULT_DB_PATH)
+        self._schema_ready = False
+        self._schema_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a connection, creating the database and its schema on first use.
+
+        Raises:
+            sqlite3.Error, OSError: If the database cannot be created or opened
+        """
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                    with closing(self._open()) as conn, conn:
+                        conn.executescript(_SCHEMA)
+                    self._schema_ready = True
+        return self._open()
+
+    def _open(self) -> sqlite3.Connection:
+        # A connection per operation keeps the store safe to use from worker threads
+        conn = sqlite3.connect(str(self.db_path), timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def record_run(self,
+                   timings: Iterable[Dict[str, Any]],
+                   row_count: int,
+                   backend: Optional[str] = None,
+                   workers: int = 1,
+                   run_id: Optional[str] = None) -> str:
+        """
+        Record the rule timings of one validation run.
+
+        Args:
+            timings: Per-rule dicts with rule_id, seconds and optionally rule_name
+                     and batched (True when the time is a share of a batch)
+            row_count: Number of rows the rules were evaluated on
+            backend: Formula backend used
+            workers: Number of parallel workers
+            run_id: Run identifier (generated if not given)
+
+        Returns:
+            The run identifier
+        """
+        run_id = run_id or uuid.uuid4().hex
+        recorded_at = datetime.datetime.now().isoformat()
+        rows = [
+            (run_id, recorded_at, timing["rule_id"], timing.get("rule_name"), float(timing["seconds"]),
+             int(row_count), backend, int(workers), int(bool(timing.get("batched", False))))
+            for timing in timings
+        ]
+        if not rows:
+            return run_id
+
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany(
+                    "INSERT INTO rule_runs (run_id, recorded_at, rule_id, rule_name, seconds, row_count, "
+                    "backend, workers, batched) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not record rule performance: {str(e)}")
+        return run_id
+
+    def seconds_per_row(self,
+                        rule_ids: Optional[List[str]] = None,
+                        window: int = DEFAULT_HISTORY_WINDOW) -> Dict[str, float]:
+        """
+        Average seconds per row over each rule's most recent runs.
+
+        Args:
+            rule_ids: Rules to look up (default: all recorded rules)
+            window: Number of most recent runs per rule to average
+
+        Returns:
+            Dictionary mapping rule IDs to seconds per row
+        """
+        query = """
+            SELECT rule_id, AVG(seconds * 1.0 / row_count) AS seconds_per_row
+            FROM (
+                SELECT rule_id, seconds, row_count,
+                       ROW_NUMBER() OVER (PARTITION BY rule_id ORDER BY id DESC) AS recency
+                FROM rule_runs
+                WHERE row_count > 0 {rule_filter}
+            )
+            WHERE recency <= ?
+            GROUP BY rule_id
+        """
+        params: List[Any] = []
+        rule_filter = ""
+        if rule_ids is not None:
+            if not rule_ids:
+                return {}
+            rule_filter = f"AND rule_id IN ({', '.join('?' for _ in rule_ids)})"
+            params.extend(rule_ids)
+        params.append(window)
+        if not self.db_path.exists():
+            return {}
+
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(query.format(rule_filter=rule_filter), params).fetchall()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not read rule performance history: {str(e)}")
+            return {}
+        return {row["rule_id"]: row["seconds_per_row"] for row in rows}
+
+    def slowest_rules(self, limit: int = 10, recent_runs: int = 20, per_row: bool = False) -> List[Dict[str, Any]]:
+        """
+        Find the slowest rules across recent validation runs.
+
+        Args:
+            limit: Maximum number of rules to return
+            recent_runs: Number of most recent runs to consider
+            per_row: Rank by average seconds per row instead of average seconds
+
+        Returns:
+            List of dicts with rule_id, rule_name, runs, avg_seconds, max_seconds,
+            avg_seconds_per_row and avg_rows, slowest first
+        """
+        order = "avg_seconds_per_row" if per_row else "avg_seconds"
+        query = f"""
+            SELECT rule_id,
+                   MAX(rule_name) AS rule_name,
+                   COUNT(*) AS runs,
+                   AVG(seconds) AS avg_seconds,
+                   MAX(seconds) AS max_seconds,
+                   AVG(CASE WHEN row_count > 0 THEN seconds * 1.0 / row_count END) AS avg_seconds_per_row,
+                   AVG(row_count) AS avg_rows
+            FROM rule_runs
+            WHERE run_id IN (
+                SELECT run_id FROM rule_runs GROUP BY run_id ORDER BY MAX(id) DESC LIMIT ?
+            )
+            GROUP BY rule_id
+            ORDER BY {order} DESC
+            LIMIT ?
+        """
+        if not self.db_path.exists():
+            return []
+
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(query, (recent_runs, limit)).fetchall()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not read rule performance history: {str(e)}")
+            return []
+        return [dict(row) for row in rows]
@@ -0,0 +1,360 @@
+"""
+Process-pool rule evaluation over shared-memory columns.
+
+The columns referenced by the rules are published once into
+multiprocessing.shared_memory blocks. Each worker process attaches to the
+blocks when it starts and wraps them in a DataFrame without copying, then
+evaluates groups of rules with the native formula backend, one
+evaluate_rules_batch call per group, in the order chosen by a cost-aware
+work-stealing scheduler. Workers send back only the result arrays and
+compliance metrics, so throughput scales with the number of cores instead
+of being serialized by the GIL.
+
+The scheduler submits tasks from its own threads, so the pool does not fork:
+workers are started with the forkserver method where available, else spawn.
+
+Numeric, boolean and datetime columns are shared as their raw buffers. Other
+columns are shared as factorized integer codes; each worker rebuilds their
+values once from the codes and the (usually small) set of unique values.
+"""
+
+import concurrent.futures
+import logging
+import math
+import multiprocessing
+import os
+import time
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .compliance_determiner import ComplianceDeterminer
+from .rule_manager import ValidationRule
+from .rule_evaluator import RuleEvaluationResult, RuleEvaluator
+from .rule_scheduler import RuleCostModel, WorkStealingScheduler
+
+logger = logging.getLogger(__name__)
+
+# NumPy dtype kinds whose buffers are shared as-is (bool, ints, floats, datetimes, timedeltas)
+_RAW_KINDS = "biufMm"
+
+# Tasks per worker the rules are grouped into; more tasks leave more work to steal
+TASKS_PER_WORKER = 4
+
+# Per-process state of a pool worker, set by _init_worker
+_worker_state: Dict[str, Any] = {}
+
+
+class SharedColumnStore:
+    """
+    Shared-memory copy of a set of DataFrame columns.
+    """
+
+    def __init__(self, data_df: pd.DataFrame, columns: List[Any]):
+        """
+        Publish columns of a DataFrame into shared memory.
+
+        Args:
+            data_df: Data to publish
+            columns: Columns to publish
+        """
+        self.num_rows = len(data_df)
+        self.blocks: List[shared_memory.SharedMemory] = []
+        self.specs: List[Dict[str, Any]] = []
+        self.shared_bytes = 0
+
+        try:
+            for column in dict.fromkeys(columns):
+                self.specs.append(self._publish(column, data_df[column]))
+        except Exception:
+            self.close()
+            raise
+
+    def _publish(self, column: Any, series: pd.Series) -> Dict[str, Any]:
+        """Copy one column into a new shared memory block and describe it"""
+        dtype = series.dtype
+        if isinstance(dtype, np.dtype) and dtype.kind in _RAW_KINDS:
+            values = series.to_numpy()
+            spec = {"column": column, "kind": "raw"}
+        else:
+            values, uniques = pd.factorize(series, use_na_sentinel=True)
+            spec = {"column": column, "kind": "codes", "uniques": np.asarray(uniques, dtype=object)}
+
+        # Zero-size blocks are not allowed
+        block = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        self.blocks.append(block)
+        np.ndarray(values.shape, dtype=values.dtype, buffer=block.buf)[:] = values
+        self.shared_bytes += values.nbytes
+
+        spec.update({"name": block.name, "dtype": values.dtype.str, "length": len(values)})
+        return spec
+
+    def close(self) -> None:
+        """Release and remove all shared memory blocks"""
+        for block in self.blocks:
+            try:
+                block.close()
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self.blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def attach_columns(specs: List[Dict[str, Any]]) -> Tuple[pd.DataFrame, List[shared_memory.SharedMemory]]:
+    """
+    Build a DataFrame over published shared memory columns.
+
+    Raw columns are read-only views of the shared buffers; factorized columns
+    are rebuilt from their codes.
+
+    Args:
+        specs: Column descriptions from SharedColumnStore.specs
+
+    Returns:
+        Tuple of (DataFrame on a RangeIndex, attached blocks to keep alive)
+    """
+    blocks = []
+    columns = {}
+    for spec in specs:
+        block = shared_memory.SharedMemory(name=spec["name"])
+        blocks.append(block)
+        values = np.ndarray((spec["length"],), dtype=np.dtype(spec["dtype"]), buffer=block.buf)
+        values.flags.writeable = False
+
+        if spec["kind"] == "raw":
+            columns[spec["column"]] = values
+        else:
+            uniques = spec["uniques"]
+            rebuilt = np.full(len(values), None, dtype=object)
+            present = values >= 0
+            rebuilt[present] = uniques[values[present]]
+            columns[spec["column"]] = rebuilt
+
+    return pd.DataFrame(columns, copy=False), blocks
+
+
+def _init_worker(specs: List[Dict[str, Any]], gc_threshold: float, pc_threshold: float) -> None:
+    """Attach a pool worker to the shared columns and create its evaluator"""
+    data_df, blocks = attach_columns(specs)
+    _worker_state.update({
+        "data": data_df,
+        "blocks": blocks,
+        "evaluator": RuleEvaluator(
+            compliance_determiner=ComplianceDeterminer(gc_threshold, pc_threshold),
+            formula_backend="native"
+        )
+    })
+
+
+def _evaluate_batch(rules: List[ValidationRule], responsible_party_column: Optional[str]) -> Dict[str, Any]:
+    """
+    Evaluate a batch of rules in a pool worker.
+
+    Returns:
+        Dictionary with compact per-rule outputs and the batch's timing
+    """
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    data_df = _worker_state["data"]
+    evaluator = _worker_state["evaluator"]
+    results = evaluator.evaluate_rules_batch(rules, data_df, responsible_party_column)
+
+    outputs = {}
+    for rule_id, result in results.items():
+        evaluated = result.evaluated_df
+        error_column = f"{result.result_column}_Error"
+        values = evaluated[result.result_column]
+        errors = evaluated[error_column].to_numpy(dtype=object) if error_column in evaluated.columns else None
+        error_rows = np.flatnonzero(pd.notna(errors) & (errors != "")) if errors is not None else np.array([], dtype=np.int64)
+
+        outputs[rule_id] = {
+            "result_column": result.result_column,
+            # Bool columns travel as one byte per row; everything else as its own array
+            "values": values.to_numpy(dtype=bool) if values.dtype == bool else values.to_numpy(),
+            "has_error_column": errors is not None,
+            "error_rows": error_rows,
+            "error_messages": errors[error_rows] if errors is not None else np.array([], dtype=object),
+            "compliance_status": result.compliance_status,
+            "compliance_metrics": result.compliance_metrics,
+            "party_results": result.party_results,
+            "formula_backend": result.formula_backend
+        }
+
+    return {
+        "results": outputs,
+        "pid": os.getpid(),
+        "rules": len(rules),
+        "seconds": time.perf_counter() - start,
+        "cpu_seconds": time.process_time() - cpu_start,
+        "rule_cpu_seconds": {timing["rule_id"]: timing["cpu_seconds"] for timing in evaluator.last_rule_timings}
+    }
+
+
+def default_mp_context():
+    """Start method for pool workers that does not fork the (multi-threaded) parent"""
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return multiprocessing.get_context(method)
+
+
+def available_cpus() -> int:
+    """Number of CPUs this process may run on"""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+class ProcessPoolRuleEvaluator:
+    """
+    Evaluates rules in a process pool over shared-memory columns.
+    """
+
+    def __init__(self,
+                 max_workers: Optional[int] = None,
+                 compliance_determiner: Optional[ComplianceDeterminer] = None,
+                 mp_context=None,
+                 cost_model: Optional[RuleCostModel] = None):
+        """
+        Initialize the process pool evaluator.
+
+        Args:
+            max_workers: Maximum number of worker processes (default: CPU count)
+            compliance_determiner: Determiner whose thresholds the workers apply
+            mp_context: Multiprocessing context for the pool (default: forkserver,
+                        or spawn where forkserver is unavailable)
+            cost_model: Cost model ordering the rules (default: AST estimates only)
+        """
+        self.max_workers = max_workers or available_cpus()
+        self.compliance_determiner = compliance_determiner or ComplianceDeterminer()
+        self.mp_context = mp_context or default_mp_context()
+        self.cost_model = cost_model or RuleCostModel()
+        self.last_run_stats: Optional[Dict[str, Any]] = None
+
+    def evaluate_rules(self,
+                       rules: List[ValidationRule],
+                       data_df: pd.DataFrame,
+                       responsible_party_column: Optional[str] = None) -> Dict[str, RuleEvaluationResult]:
+        """
+        Evaluate rules across worker processes.
+
+        Rules that fail validation against the data are skipped, as in
+        RuleEvaluator.evaluate_multiple_rules.
+
+        Args:
+            rules: Rules to evaluate
+            data_df: Data to evaluate against
+            responsible_party_column: Column identifying responsible parties
+
+        Returns:
+            Dictionary mapping rule IDs to RuleEvaluationResult objects
+        """
+        valid_rules = []
+        for rule in rules:
+            is_valid, error = rule.validate_with_dataframe(data_df)
+            if is_valid:
+                valid_rules.append(rule)
+            else:
+                logger.error(f"Error evaluating rule {rule.rule_id}: Rule validation failed: {error}")
+        if not valid_rules:
+            return {}
+
+        columns = []
+        for rule in valid_rules:
+            columns.extend(RuleEvaluator._required_columns(rule, responsible_party_column))
+        columns = [c for c in dict.fromkeys(columns) if c in data_df.columns]
+        if not columns and len(data_df.columns) > 0:
+            columns = [data_df.columns[0]]
+
+        num_workers = max(1, min(self.max_workers, len(valid_rules)))
+        scheduler = WorkStealingScheduler(num_workers, self.cost_model)
+        batch_size = math.ceil(len(valid_rules) / (num_workers * TASKS_PER_WORKER))
+
+        rules_by_id = {rule.rule_id: rule for rule in valid_rules}
+        start = time.perf_counter()
+        results = {}
+        batch_stats = []
+        rule_cpu_seconds = {}
+        with SharedColumnStore(data_df, columns) as store:
+            publish_seconds = time.perf_counter() - start
+            logger.info(f"Evaluating {len(valid_rules)} rules in {num_workers} processes, up to {batch_size} "
+                        f"per task, over {len(columns)} shared columns ({store.shared_bytes} bytes)")
+
+            with concurrent.futures.ProcessPoolExecutor(
+                    max_workers=num_workers,
+                    mp_context=self.mp_context,
+                    initializer=_init_worker,
+                    initargs=(store.specs, self.compliance_determiner.gc_threshold,
+                              self.compliance_determiner.pc_threshold)) as executor:
+                # Start every worker from this thread, so rule timings leave out process startup
+                startup_start = time.perf_counter()
+                concurrent.futures.wait([executor.submit(os.getpid) for _ in range(num_workers)])
+                startup_seconds = time.perf_counter() - startup_start
+
+                # One scheduler thread per process keeps exactly one group of rules in flight on each
+                outputs = scheduler.run_batches(
+                    valid_rules, len(data_df),
+                    lambda batch: executor.submit(_evaluate_batch, batch, responsible_party_column).result(),
+                    batch_size
+                )
+                # Every rule of a group maps to the group's output
+                for output in {id(output): output for output in outputs.values() if output is not None}.values():
+                    batch_stats.append({k: output[k] for k in ("pid", "rules", "seconds", "cpu_seconds")})
+                    rule_cpu_seconds.update(output["rule_cpu_seconds"])
+                    for rule_id, compact in output["results"].items():
+                        results[rule_id] = self._rebuild_result(
+                            rules_by_id[rule_id], compact, data_df, responsible_party_column
+                        )
+
+            shared_bytes = store.shared_bytes
+
+        self.last_run_stats = {
+            "workers": num_workers,
+            "shared_columns": len(columns),
+            "shared_bytes": shared_bytes,
+            "publish_seconds": publish_seconds,
+            "startup_seconds": startup_seconds,
+            "total_seconds": time.perf_counter() - start,
+            "batch_size": batch_size,
+            "batches": batch_stats,
+            # Worker CPU time; the scheduler threads only wait on the workers
+            "rule_cpu_seconds": rule_cpu_seconds,
+            "schedule": scheduler.last_run_stats
+        }
+
+        # Keep the input rule order
+        return {rule_id: results[rule_id] for rule_id in rules_by_id if rule_id in results}
+
+    @staticmethod
+    def _rebuild_result(rule: ValidationRule,
+                        compact: Dict[str, Any],
+                        data_df: pd.DataFrame,
+                        responsible_party_column: Optional[str]) -> RuleEvaluationResult:
+        """Rebuild a RuleEvaluationResult from a worker's compact output"""
+        result_column = compact["result_column"]
+        columns = {result_column: pd.Series(compact["values"], index=data_df.index)}
+        if compact["has_error_column"]:
+            errors = np.full(len(data_df), "", dtype=object)
+            errors[compact["error_rows"]] = compact["error_messages"]
+            columns[f"{result_column}_Error"] = pd.Series(errors, index=data_df.index)
+
+        evaluated_df = RuleEvaluator._project_columns(
+            data_df, RuleEvaluator._required_columns(rule, responsible_party_column)
+        ).assign(**columns)
+        result = RuleEvaluationResult(
+            rule=rule,
+            result_df=evaluated_df,
+            result_column=result_column,
+            compliance_status=compact["compliance_status"],
+            compliance_metrics=compact["compliance_metrics"],
+            party_results=compact["party_results"],
+            source_df=data_df
+        )
+        result.formula_backend = compact["formula_backend"]
+        return result
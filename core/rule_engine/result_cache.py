@@ -0,0 +1,322 @@
+"""
+Disk-backed cache of rule evaluation results.
+
+Results are keyed by the rule's normalized formula, threshold and name, the
+compliance thresholds, the formula backend and a content fingerprint of the
+columns the rule reads. Rerunning an analytic against an unchanged extract
+therefore reuses the stored result columns and metrics instead of
+re-evaluating the formula. Entries are evicted least-recently-used once the
+cache directory grows past its size limit.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import weakref
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from .rule_manager import ValidationRule
+from .rule_evaluator import RuleEvaluationResult, RuleEvaluator
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored payload layout changes so old entries are ignored
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_CACHE_DIR = "data/temp/rule_results"
+DEFAULT_MAX_SIZE_MB = 256
+
+
+class RuleResultCache:
+    """
+    Size-bounded LRU cache of RuleEvaluationResult outputs stored on disk.
+    """
+
+    def __init__(self,
+                 cache_dir: Optional[str] = None,
+                 max_size_mb: float = DEFAULT_MAX_SIZE_MB,
+                 gc_threshold: float = 0.95,
+                 pc_threshold: float = 0.80):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache entries (default: data/temp/rule_results)
+            max_size_mb: Maximum total size of the cache directory in megabytes
+            gc_threshold: GC threshold of the ComplianceDeterminer producing the results
+            pc_threshold: PC threshold of the ComplianceDeterminer producing the results
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(DEFAULT_CACHE_DIR)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.gc_threshold = gc_threshold
+        self.pc_threshold = pc_threshold
+        # (id of frame, column) -> (weakref to the frame, digest)
+        self._column_digests: Dict[Tuple[int, Any], Tuple[weakref.ref, str]] = {}
+        self.stats: Dict[str, int] = {}
+        self.begin_run()
+
+    def begin_run(self) -> None:
+        """Reset the per-run statistics and column fingerprints"""
+        self._column_digests = {}
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    # --- Keys ---------------------------------------------------------------
+
+    def _memoized_digest(self, data_df: pd.DataFrame, column: Any) -> Optional[str]:
+        """Digest memoized for this frame, if any"""
+        entry = self._column_digests.get((id(data_df), column))
+        # The id of a freed frame is reused, so the entry must still refer to this frame
+        if entry is None or entry[0]() is not data_df:
+            return None
+        return entry[1]
+
+    def _memoize_digest(self, data_df: pd.DataFrame, column: Any, digest: str) -> None:
+        self._column_digests[(id(data_df), column)] = (weakref.ref(data_df), digest)
+
+    def _column_digest(self, data_df: pd.DataFrame, column: Any) -> str:
+        """Content hash of one column (values, Python types and dtype), memoized per run"""
+        digest = self._memoized_digest(data_df, column)
+        if digest is None:
+            series = data_df[column]
+            hasher = hashlib.sha256(f"{column}|{series.dtype}".encode("utf-8"))
+            hasher.update(pd.util.hash_pandas_object(series, index=False).to_numpy().tobytes())
+            if series.dtype == object:
+                # 1 and "1" hash alike as values but evaluate differently
+                types = series.map(lambda value: type(value).__name__)
+                hasher.update(pd.util.hash_pandas_object(types, index=False).to_numpy().tobytes())
+            digest = hasher.hexdigest()
+            self._memoize_digest(data_df, column, digest)
+        return digest
+
+    def _index_digest(self, data_df: pd.DataFrame) -> str:
+        """Hash of the row index, so cached result arrays align with the data"""
+        digest = self._memoized_digest(data_df, "__index__")
+        if digest is None:
+            digest = hashlib.sha256(
+                pd.util.hash_pandas_object(data_df.index).to_numpy().tobytes()
+            ).hexdigest()
+            self._memoize_digest(data_df, "__index__", digest)
+        return digest
+
+    def make_key(self,
+                 rule: ValidationRule,
+                 data_df: pd.DataFrame,
+                 responsible_party_column: Optional[str] = None,
+                 formula_backend: Optional[str] = None,
+                 thresholds: Optional[Tuple[float, float]] = None) -> Optional[str]:
+        """
+        Build the cache key for evaluating a rule against a DataFrame.
+
+        Args:
+            rule: Rule to evaluate
+            data_df: Data the rule is evaluated against
+            responsible_party_column: Column identifying responsible parties
+            formula_backend: Formula backend producing the results
+            thresholds: (gc_threshold, pc_threshold) of the ComplianceDeterminer
+                        producing the results (default: the cache's own)
+
+        Returns:
+            Hex digest key, or None if a referenced column is missing
+        """
+        compiled = rule.compiled_formula
+        formula_text = compiled.text if compiled is not None else str(rule.formula)
+        columns = self._key_columns(rule, responsible_party_column)
+        if any(column not in data_df.columns for column in columns):
+            return None
+
+        parts = [
+            f"v{CACHE_FORMAT_VERSION}",
+            formula_text,
+            repr(float(rule.threshold)),
+            rule.name,
+            str(responsible_party_column),
+            str(formula_backend),
+            repr(tuple(float(t) for t in (thresholds or (self.gc_threshold, self.pc_threshold)))),
+            self._index_digest(data_df)
+        ]
+        parts.extend(self._column_digest(data_df, column) for column in columns)
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _key_columns(rule: ValidationRule, responsible_party_column: Optional[str]) -> List[Any]:
+        """Columns whose content determines a rule's results"""
+        columns = list(dict.fromkeys(rule.get_required_columns()))
+        if responsible_party_column and responsible_party_column not in columns:
+            columns.append(responsible_party_column)
+        return columns
+
+    # --- Lookup and store ---------------------------------------------------
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def lookup(self,
+               rule: ValidationRule,
+               data_df: pd.DataFrame,
+               responsible_party_column: Optional[str] = None,
+               formula_backend: Optional[str] = None,
+               thresholds: Optional[Tuple[float, float]] = None) -> Optional[RuleEvaluationResult]:
+        """
+        Get a cached result for a rule, rebuilt against the current data.
+
+        Args:
+            rule: Rule to evaluate
+            data_df: Data the rule is evaluated against
+            responsible_party_column: Column identifying responsible parties
+            formula_backend: Formula backend producing the results
+            thresholds: (gc_threshold, pc_threshold) of the evaluator's ComplianceDeterminer
+
+        Returns:
+            RuleEvaluationResult, or None on a cache miss
+        """
+        try:
+            key = self.make_key(rule, data_df, responsible_party_column, formula_backend, thresholds)
+            path = self._entry_path(key) if key else None
+            if path is None or not path.exists():
+                self.stats["misses"] += 1
+                return None
+
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+            # Mark as recently used for LRU eviction
+            os.utime(path, None)
+        except Exception as e:
+            logger.warning(f"Could not read cached result for rule {rule.rule_id}: {str(e)}")
+            self.stats["misses"] += 1
+            return None
+
+        # Rebuild the projected result frame on the current index
+        evaluated_df = RuleEvaluator._project_columns(data_df, self._key_columns(rule, responsible_party_column))
+        evaluated_df = evaluated_df.assign(**{
+            name: pd.Series(values, index=data_df.index)
+            for name, values in payload["columns"].items()
+        })
+
+        self.stats["hits"] += 1
+        logger.debug(f"Cache hit for rule {rule.rule_id}")
+        result = RuleEvaluationResult(
+            rule=rule,
+            result_df=evaluated_df,
+            result_column=payload["result_column"],
+            compliance_status=payload["compliance_status"],
+            compliance_metrics=payload["compliance_metrics"],
+            party_results=payload["party_results"],
+            source_df=data_df
+        )
+        # Entries written before backend routing do not record the backend
+        result.formula_backend = payload.get("formula_backend")
+        return result
+
+    def store(self,
+              result: RuleEvaluationResult,
+              data_df: pd.DataFrame,
+              responsible_party_column: Optional[str] = None,
+              formula_backend: Optional[str] = None,
+              thresholds: Optional[Tuple[float, float]] = None) -> bool:
+        """
+        Store a rule evaluation result.
+
+        Args:
+            result: Result to cache
+            data_df: Data the rule was evaluated against
+            responsible_party_column: Column identifying responsible parties
+            formula_backend: Formula backend that produced the results
+            thresholds: (gc_threshold, pc_threshold) of the ComplianceDeterminer
+                        that determined the result's compliance
+
+        Returns:
+            True if the result was stored
+        """
+        try:
+            key = self.make_key(result.rule, data_df, responsible_party_column, formula_backend, thresholds)
+            if key is None or len(result.evaluated_df) != len(data_df):
+                return False
+
+            result_columns = [c for c in (result.result_column, f"{result.result_column}_Error")
+                              if c in result.evaluated_df.columns]
+            payload = {
+                "result_column": result.result_column,
+                "columns": {c: result.evaluated_df[c].to_numpy() for c in result_columns},
+                "compliance_status": result.compliance_status,
+                "compliance_metrics": result.compliance_metrics,
+                "party_results": result.party_results,
+                "formula_backend": result.formula_backend
+            }
+
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_path, self._entry_path(key))
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Could not cache result for rule {result.rule.rule_id}: {str(e)}")
+            return False
+
+        self.stats["stores"] += 1
+        self._evict(keep=self._entry_path(key))
+        return True
+
+    def _evict(self, keep: Optional[Path] = None) -> None:
+        """
+        Remove least recently used entries until the cache fits its size limit.
+
+        Args:
+            keep: Entry that must not be evicted (the one just stored)
+        """
+        entries = []
+        total_size = 0
+        for path in self.cache_dir.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            total_size += stat.st_size
+            if path != keep:
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        entries.sort()
+        for _, size, path in entries:
+            if total_size <= self.max_size_bytes:
+                break
+            try:
+                path.unlink()
+                total_size -= size
+                self.stats["evictions"] += 1
+            except OSError as e:
+                logger.warning(f"Could not evict cache entry {path}: {str(e)}")
+
+    def clear(self) -> None:
+        """Delete all cache entries"""
+        for path in self.cache_dir.glob("*.pkl"):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics for the current run.
+
+        Returns:
+            Dictionary with hits, misses, stores, evictions, hit_rate and the
+            cache's entry count and size on disk
+        """
+        entries = list(self.cache_dir.glob("*.pkl")) if self.cache_dir.exists() else []
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": self.stats["hits"] / lookups if lookups else 0.0,
+            "entries": len(entries),
+            "size_bytes": sum(p.stat().st_size for p in entries if p.exists())
+        }
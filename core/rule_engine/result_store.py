@@ -0,0 +1,202 @@
+"""
+Memory-budgeted store for rule evaluation results.
+
+A RuleEvaluationResult needs only its result and error columns; the input
+columns are read from the shared source DataFrame. The store trims each result
+to those two columns and tracks the memory they use. When the total exceeds
+the budget, the oldest results are spilled to .npy files and re-opened as
+memory maps, so their data is paged in from disk only when it is read (e.g. by
+get_failing_items).
+
+Boolean results are memory-mapped as-is; object results holding only
+True/False/blank are stored as int8 codes. Error columns are stored sparsely,
+as the positions and messages of the rows that have an error.
+"""
+
+import logging
+import shutil
+import uuid
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+import pandas as pd
+
+from .rule_evaluator import RuleEvaluationResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPILL_DIR = "data/temp/result_store"
+
+# int8 code -> value for object result columns holding only True/False/blank
+_BOOL_CODES = np.array([None, False, True], dtype=object)
+
+
+class SpilledColumns:
+    """
+    Result and error columns of one rule result, stored in .npy files.
+    """
+
+    def __init__(self, directory: Path, result_column: str, index: pd.Index,
+                 results: np.ndarray, errors: Optional[np.ndarray]):
+        """
+        Write the columns to disk.
+
+        Args:
+            directory: Directory for this result's files (created)
+            result_column: Name of the result column
+            index: Index of the source rows (kept in memory, shared with the source)
+            results: Result values, one per row
+            errors: Error messages, one per row (None if the column is absent)
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self.result_column = result_column
+        self.index = index
+        self.has_errors = errors is not None
+
+        self.result_encoding = "raw"
+        if results.dtype == object:
+            is_true = np.fromiter((v is True or v is np.True_ for v in results), dtype=bool, count=len(results))
+            is_false = np.fromiter((v is False or v is np.False_ for v in results), dtype=bool,
+                                   count=len(results))
+            is_blank = pd.isna(results)
+            if (is_true | is_false | is_blank).all():
+                results = is_true.astype(np.int8) - is_blank.astype(np.int8) + 1
+                self.result_encoding = "bool_codes"
+            else:
+                self.result_encoding = "pickle"
+        np.save(directory / "results.npy", results, allow_pickle=self.result_encoding == "pickle")
+
+        if errors is not None:
+            positions = np.flatnonzero(~pd.isna(errors))
+            np.save(directory / "error_positions.npy", positions)
+            np.save(directory / "error_messages.npy", np.asarray(errors[positions], dtype=object),
+                    allow_pickle=True)
+
+    def load(self) -> pd.DataFrame:
+        """
+        Open the columns as a DataFrame on the source index.
+
+        Numeric and boolean results are memory-mapped, not read into memory.
+
+        Returns:
+            DataFrame with the result and error columns
+        """
+        if self.result_encoding == "pickle":
+            results = np.load(self.directory / "results.npy", allow_pickle=True)
+        else:
+            results = np.load(self.directory / "results.npy", mmap_mode="r")
+            if self.result_encoding == "bool_codes":
+                results = _BOOL_CODES[results]
+
+        columns = {self.result_column: results}
+        if self.has_errors:
+            errors = np.full(len(self.index), None, dtype=object)
+            positions = np.load(self.directory / "error_positions.npy")
+            errors[positions] = np.load(self.directory / "error_messages.npy", allow_pickle=True)
+            columns[f"{self.result_column}_Error"] = errors
+        return pd.DataFrame(columns, index=self.index, copy=False)
+
+    def remove(self) -> None:
+        """Delete the files"""
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class RuleResultStore:
+    """
+    Keeps rule results within a memory budget by spilling the oldest to disk.
+    """
+
+    def __init__(self, memory_budget_mb: Optional[float] = None, spill_dir: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            memory_budget_mb: Memory the resident result columns may use (None: never spill)
+            spill_dir: Directory for spilled columns (default: data/temp/result_store)
+        """
+        self.memory_budget_bytes = None if memory_budget_mb is None else int(memory_budget_mb * 1024 * 1024)
+        self.spill_dir = Path(spill_dir) if spill_dir else Path(DEFAULT_SPILL_DIR)
+        self._run_dir = self.spill_dir / uuid.uuid4().hex
+        # id(result) -> (weak reference, resident bytes), oldest first
+        self._resident: "OrderedDict[int, Any]" = OrderedDict()
+        self.resident_bytes = 0
+        self.stats = {"stored": 0, "spilled": 0, "spilled_bytes": 0}
+
+    def add(self, result: RuleEvaluationResult) -> None:
+        """
+        Trim a result to its result and error columns and account for its memory.
+
+        Results without a shared source DataFrame (or whose rows do not line up
+        with it) keep their full data and are not managed.
+
+        Args:
+            result: Result to store
+        """
+        evaluated = result.evaluated_df
+        if (result.source_df is None or result.is_spilled or id(result) in self._resident
+                or result.result_column not in evaluated.columns or len(evaluated) != len(result.source_df)):
+            return
+
+        own_columns = [c for c in (result.result_column, f"{result.result_column}_Error") if c in evaluated.columns]
+        if len(own_columns) < len(evaluated.columns):
+            # The input columns are read from the shared source instead
+            result.evaluated_df = evaluated = evaluated[own_columns]
+
+        # Object columns count their pointers; the values are mostly shared singletons
+        size = int(evaluated.memory_usage(index=False).sum())
+        key = id(result)
+        self._resident[key] = (weakref.ref(result, lambda _, key=key: self._forget(key)), size)
+        self.resident_bytes += size
+        self.stats["stored"] += 1
+        self._enforce_budget()
+
+    def add_all(self, results: Dict[str, RuleEvaluationResult]) -> None:
+        """Store every result of a run, in order"""
+        for result in results.values():
+            self.add(result)
+
+    def _forget(self, key: int) -> None:
+        """Stop accounting for a result that was garbage collected"""
+        entry = self._resident.pop(key, None)
+        if entry is not None:
+            self.resident_bytes -= entry[1]
+
+    def _enforce_budget(self) -> None:
+        """Spill the oldest resident results until the rest fit the budget"""
+        if self.memory_budget_bytes is None:
+            return
+        while self.resident_bytes > self.memory_budget_bytes and self._resident:
+            key, (ref, size) = self._resident.popitem(last=False)
+            self.resident_bytes -= size
+            result = ref()
+            if result is not None:
+                self.spill(result)
+                self.stats["spilled_bytes"] += size
+
+    def spill(self, result: RuleEvaluationResult) -> None:
+        """
+        Move a result's columns to memory-mapped files.
+
+        Args:
+            result: Result to spill
+        """
+        evaluated = result.evaluated_df
+        # Keep the failing-row index in memory so drill-downs only read the rows they return
+        result.failing_index
+        error_column = f"{result.result_column}_Error"
+        spilled = SpilledColumns(
+            self._run_dir / uuid.uuid4().hex,
+            result.result_column,
+            result.source_df.index,
+            evaluated[result.result_column].to_numpy(),
+            evaluated[error_column].to_numpy() if error_column in evaluated.columns else None
+        )
+        result.spill_to(spilled)
+        # The files go when the result does
+        weakref.finalize(result, spilled.remove)
+        self.stats["spilled"] += 1
+        logger.debug(f"Spilled results of rule {result.rule.rule_id} to {spilled.directory}")
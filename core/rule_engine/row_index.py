@@ -0,0 +1,225 @@
+"""
+Row indexes for drilling into rule results by responsible party.
+
+The responsible-party column is factorized once per dataset into integer codes
+and a label table (PartyCodes). Each rule result keeps the sorted positions of
+its failing rows (FailingRowIndex), grouped by party code on first use, so the
+failing rows of rule R for party L are found without scanning the data again:
+the cost of a lookup is proportional to the rows it returns.
+"""
+
+import threading
+import weakref
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Datasets whose party column factorization is kept, most recent last
+_CACHE_SIZE = 4
+
+
+def _position_dtype(row_count: int):
+    """Smallest integer type able to hold row positions"""
+    return np.int32 if row_count < np.iinfo(np.int32).max else np.int64
+
+
+class PartyCodes:
+    """
+    A responsible-party column as integer codes per row plus the label table.
+
+    Labels are sorted as groupby sorts its keys; blank parties have code -1.
+    """
+
+    def __init__(self, codes: np.ndarray, labels: List[Any], column: Optional[str] = None):
+        """
+        Initialize the factorized column.
+
+        Args:
+            codes: Code of each row's party (-1 for blank)
+            labels: Party label of each code
+            column: Name of the factorized column
+        """
+        self.codes = codes
+        self.labels = labels
+        self.column = column
+        self._code_of = {label: code for code, label in enumerate(labels)}
+        self._rows_by_party = None
+
+    @classmethod
+    def from_series(cls, series: pd.Series) -> "PartyCodes":
+        """
+        Factorize a party column.
+
+        Args:
+            series: Responsible-party values, one per row
+
+        Returns:
+            PartyCodes for the column
+        """
+        codes, labels = pd.factorize(series, sort=True, use_na_sentinel=True)
+        dtype = np.int16 if len(labels) < np.iinfo(np.int16).max else np.int32
+        return cls(codes.astype(dtype, copy=False), list(labels), column=series.name)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def code_of(self, label: Any) -> Optional[int]:
+        """Code of a party label, or None if the party has no rows"""
+        return self._code_of.get(label)
+
+    def rows_of(self, label: Any) -> np.ndarray:
+        """
+        Sorted positions of a party's rows.
+
+        Args:
+            label: Party label
+
+        Returns:
+            Row positions (empty if the party has no rows)
+        """
+        code = self.code_of(label)
+        if code is None:
+            return np.empty(0, dtype=_position_dtype(len(self.codes)))
+        if self._rows_by_party is None:
+            self._rows_by_party = _group_positions(
+                np.arange(len(self.codes), dtype=_position_dtype(len(self.codes))), self.codes, len(self.labels)
+            )
+        return self._rows_by_party[code]
+
+
+def _group_positions(positions: np.ndarray, codes: np.ndarray, label_count: int) -> List[np.ndarray]:
+    """Split sorted positions by their rows' party codes, keeping each group sorted"""
+    position_codes = codes[positions]
+    known = position_codes >= 0
+    positions, position_codes = positions[known], position_codes[known]
+    order = np.argsort(position_codes, kind="stable")
+    counts = np.bincount(position_codes, minlength=label_count)
+    return np.split(positions[order], np.cumsum(counts)[:-1]) if label_count else []
+
+
+class FailingRowIndex:
+    """
+    Sorted positions of one rule's failing rows, grouped by party on first use.
+    """
+
+    def __init__(self, positions: np.ndarray):
+        """
+        Initialize the index.
+
+        Args:
+            positions: Sorted positions of the failing rows
+        """
+        self.positions = positions
+        self._groups = None  # (PartyCodes, positions per party code)
+
+    @classmethod
+    def from_mask(cls, failing_mask: np.ndarray) -> "FailingRowIndex":
+        """
+        Index the failing rows of a boolean mask.
+
+        Args:
+            failing_mask: True for each failing row
+
+        Returns:
+            FailingRowIndex of the mask
+        """
+        return cls(np.flatnonzero(failing_mask).astype(_position_dtype(len(failing_mask)), copy=False))
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def _party_groups(self, party_codes: PartyCodes) -> List[np.ndarray]:
+        if self._groups is None or self._groups[0] is not party_codes:
+            self._groups = (party_codes, _group_positions(self.positions, party_codes.codes, len(party_codes.labels)))
+        return self._groups[1]
+
+    def for_party(self, party_codes: PartyCodes, label: Any) -> np.ndarray:
+        """
+        Sorted positions of the failing rows of one party.
+
+        Args:
+            party_codes: Factorized party column of the indexed rows
+            label: Party label
+
+        Returns:
+            Row positions (empty if the party has no failing rows)
+        """
+        code = party_codes.code_of(label)
+        if code is None:
+            return self.positions[:0]
+        return self._party_groups(party_codes)[code]
+
+    def counts_by_party(self, party_codes: PartyCodes) -> Dict[Any, int]:
+        """
+        Number of failing rows of each party that has any.
+
+        Args:
+            party_codes: Factorized party column of the indexed rows
+
+        Returns:
+            Dictionary mapping party labels to failing row counts, in label order
+        """
+        codes = party_codes.codes[self.positions]
+        counts = np.bincount(codes[codes >= 0], minlength=len(party_codes.labels))
+        return {party_codes.labels[code]: int(counts[code]) for code in np.flatnonzero(counts)}
+
+
+class PartyCodesCache:
+    """
+    Party column factorizations of the datasets of one validation run.
+
+    A validation run owns one cache, so its rules share one factorization per
+    dataset while other runs keep their own. Fingerprinting the party column
+    on every lookup would cost about as much as factorizing it again, so the
+    data is treated as read-only for the lifetime of the cache instead.
+    """
+
+    def __init__(self):
+        # (weak reference to the dataset, column, PartyCodes), most recent last
+        self._entries: List[Any] = []
+        self._lock = threading.Lock()
+
+    def factorize(self, data_df: pd.DataFrame, column: str) -> PartyCodes:
+        """
+        Factorize a dataset's party column, once per DataFrame and column.
+
+        Args:
+            data_df: Dataset
+            column: Responsible-party column
+
+        Returns:
+            PartyCodes of the column
+        """
+        with self._lock:
+            for ref, cached_column, party_codes in self._entries:
+                if ref() is data_df and cached_column == column and len(party_codes) == len(data_df):
+                    return party_codes
+
+        party_codes = PartyCodes.from_series(data_df[column])
+        with self._lock:
+            self._entries[:] = [entry for entry in self._entries if entry[0]() is not None][-(_CACHE_SIZE - 1):]
+            self._entries.append((weakref.ref(data_df), column, party_codes))
+        return party_codes
+
+
+# Used by evaluators outside a validation run
+_default_cache = PartyCodesCache()
+
+
+def factorize_parties(data_df: pd.DataFrame, column: str, cache: Optional[PartyCodesCache] = None) -> PartyCodes:
+    """
+    Factorize a dataset's party column, once per DataFrame and column.
+
+    The result is reused while the DataFrame is alive, so every rule of a run
+    shares one factorization. The data is treated as read-only during a run.
+
+    Args:
+        data_df: Dataset
+        column: Responsible-party column
+        cache: Cache of the current validation run (default: a process-wide cache)
+
+    Returns:
+        PartyCodes of the column
+    """
+    return (cache or _default_cache).factorize(data_df, column)
@@ -1,18 +1,77 @@
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
+import numpy as np
 import pandas as pd
 import logging
 import os
 from pathlib import Path
 import threading
+import time
 
 # Import our components
 from .rule_manager import ValidationRule, ValidationRuleManager
-from .compliance_determiner import ComplianceDeterminer, ComplianceStatus
-# Fix the import to use absolute imports instead of relative
-from core.formula_engine.excel_formula_processor import ExcelFormulaProcessor
+from .compliance_determiner import ComplianceDeterminer, ComplianceStatus, error_mask_from_column
+from core.formula_engine.backends import FormulaBackend, FormulaBackendRegistry, default_backend_registry
+from core.formula_engine.native_formula_processor import UnsupportedFormulaError
+from .rule_scheduler import estimate_formula_cost
+from .row_index import FailingRowIndex, PartyCodes, PartyCodesCache, factorize_parties
 
 logger = logging.getLogger(__name__)
 
+# Formula backends of the default registry understood by RuleEvaluator
+FORMULA_BACKENDS = ("auto", "excel", "native", "sqlite")
+
+
+def _normalize_result_value(val):
+    """Convert numeric and "TRUE"/"FALSE" formula results to booleans"""
+    if isinstance(val, bool):
+        return val
+    elif isinstance(val, (int, float)):
+        return bool(val)
+    elif isinstance(val, str):
+        if val.upper() == "TRUE":
+            return True
+        elif val.upper() == "FALSE":
+            return False
+    return val
+
+
+def _normalize_results(results: pd.Series, error_mask: Optional[np.ndarray] = None) -> pd.Series:
+    """
+    Apply _normalize_result_value to a whole result column.
+
+    Bool and numeric columns are converted with one NumPy operation. When the
+    processor's error rows are known, the other rows are converted as a column
+    of their own (error values are left as they are).
+
+    Args:
+        results: Formula results
+        error_mask: Rows holding Excel errors, if known
+
+    Returns:
+        Normalized results
+    """
+    if results.dtype.kind == "b":
+        return results
+    if results.dtype.kind in "iuf":
+        # As bool(value): NaN is truthy
+        return results != 0
+    if results.dtype != object:
+        return results.apply(_normalize_result_value)
+
+    if error_mask is not None and error_mask.any():
+        if error_mask.all():
+            return results
+        valid = ~error_mask
+        normalized = results.to_numpy(dtype=object).copy()
+        normalized[valid] = _normalize_results(results[valid]).to_numpy(dtype=object)
+        return pd.Series(normalized, index=results.index, name=results.name)
+
+    # Nulls stay null, so only columns without them are converted as typed columns
+    inferred = results.infer_objects()
+    if inferred.dtype.kind in "biuf" and not inferred.hasnans:
+        return _normalize_results(inferred)
+    return results.apply(_normalize_result_value)
+
 
 class RuleEvaluationResult:
     """Container for the results of a rule evaluation"""
@@ -23,7 +82,8 @@ class RuleEvaluationResult:
                  result_column: str,
                  compliance_status: ComplianceStatus,
                  compliance_metrics: Dict[str, Any],
-                 party_results: Optional[Dict[str, Dict[str, Any]]] = None):
+                 party_results: Optional[Dict[str, Dict[str, Any]]] = None,
+                 source_df: Optional[pd.DataFrame] = None):
         """
         Initialize evaluation result.
 
@@ -34,13 +94,80 @@ class RuleEvaluationResult:
             compliance_status: Overall compliance status
             compliance_metrics: Dictionary of compliance metrics
             party_results: Results grouped by responsible party
+            source_df: Full input data when result_df only holds the projected
+                       columns the rule was evaluated on (shared, not copied)
         """
         self.rule = rule
-        self.result_df = result_df
+        self._evaluated_df = result_df
+        self._spilled = None
+        self.source_df = source_df
         self.result_column = result_column
         self.compliance_status = compliance_status
         self.compliance_metrics = compliance_metrics
         self.party_results = party_results or {}
+        # Formula backend that produced the results (see RuleEvaluator routing)
+        self.formula_backend: Optional[str] = None
+        # Shared factorization of the responsible-party column, set by the evaluator
+        self.party_codes: Optional[PartyCodes] = None
+        # Status code (STATUS_GC/PC/DNC) of each party code, set with party_codes
+        self.party_statuses: Optional[np.ndarray] = None
+        self._failing_index: Optional[FailingRowIndex] = None
+
+    @property
+    def evaluated_df(self) -> pd.DataFrame:
+        """Evaluated rows: the result columns, plus the projected input columns unless stored"""
+        if self._spilled is not None:
+            # Re-opened from disk on each access; see RuleResultStore
+            return self._spilled.load()
+        return self._evaluated_df
+
+    @evaluated_df.setter
+    def evaluated_df(self, value: pd.DataFrame) -> None:
+        """Replace the evaluated columns of the same rows (the failing-row index is kept)"""
+        self._evaluated_df = value
+        self._spilled = None
+
+    @property
+    def is_spilled(self) -> bool:
+        """Whether the result columns have been moved to disk"""
+        return self._spilled is not None
+
+    def spill_to(self, spilled) -> None:
+        """
+        Release the in-memory result columns in favour of a spilled copy.
+
+        Args:
+            spilled: Object whose load() returns the result columns as a DataFrame
+        """
+        self._spilled = spilled
+        self._evaluated_df = None
+
+    @property
+    def result_df(self) -> pd.DataFrame:
+        """Input data with the rule's result columns, aligned to the original index"""
+        if self.source_df is None:
+            return self.evaluated_df
+        return self._combine_with_source(self.source_df, self.evaluated_df)
+
+    @result_df.setter
+    def result_df(self, value: pd.DataFrame) -> None:
+        """Replace the results with a complete DataFrame"""
+        self.evaluated_df = value
+        self.source_df = None
+        self._failing_index = None
+
+    def _combine_with_source(self, source: pd.DataFrame, evaluated: pd.DataFrame) -> pd.DataFrame:
+        """Join the result columns of (a subset of) evaluated rows onto the source rows"""
+        own_columns = (self.result_column, f"{self.result_column}_Error")
+        added = [c for c in evaluated.columns if c not in source.columns or c in own_columns]
+        base = source.drop(columns=[c for c in added if c in source.columns])
+        return pd.concat([base, evaluated[added]], axis=1)
+
+    def _has_column(self, column: str) -> bool:
+        """Whether a column is available in the (possibly projected) results"""
+        if column in self.evaluated_df.columns:
+            return True
+        return self.source_df is not None and column in self.source_df.columns
 
     @property
     def summary(self) -> Dict[str, Any]:
@@ -54,31 +181,119 @@ class RuleEvaluationResult:
             "gc_count": self.compliance_metrics.get("gc_count", 0),
             "pc_count": self.compliance_metrics.get("pc_count", 0),
             "dnc_count": self.compliance_metrics.get("dnc_count", 0),
-            "error_count": self.compliance_metrics.get("error_count", 0)
+            "error_count": self.compliance_metrics.get("error_count", 0),
+            "formula_backend": self.formula_backend
         }
 
-    def get_failing_items(self) -> pd.DataFrame:
-        """Get subset of results that did not comply with the rule"""
+    @staticmethod
+    def _failing_mask(result_col: pd.Series):
+        """Boolean array marking the results that did not comply"""
+        # If boolean column, return False values
+        if result_col.dtype == bool:
+            return (result_col == False).to_numpy()
+        # If compliance status column, return PC and DNC values
+        return result_col.isin(['PC', 'DNC', 'PARTIALLY_COMPLIANT', 'DOES_NOT_COMPLY']).to_numpy()
+
+    @property
+    def failing_index(self) -> FailingRowIndex:
+        """Sorted positions of the failing rows, built once from the result column"""
+        if self._failing_index is None:
+            evaluated = self.evaluated_df
+            if self.result_column in evaluated.columns:
+                self._failing_index = FailingRowIndex.from_mask(self._failing_mask(evaluated[self.result_column]))
+            else:
+                self._failing_index = FailingRowIndex.from_mask(np.zeros(len(evaluated), dtype=bool))
+        return self._failing_index
+
+    def _rows_at(self, positions: np.ndarray, evaluated: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+        """Evaluated rows at the given positions, joined onto the matching source rows"""
+        if evaluated is None:
+            evaluated = self.evaluated_df
+        # Only the requested rows are joined back onto the full input columns
+        if self.source_df is None:
+            return evaluated.iloc[positions]
+        return self._combine_with_source(self.source_df.iloc[positions], evaluated.iloc[positions])
+
+    def get_failing_items(self, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Get subset of results that did not comply with the rule.
+
+        Args:
+            limit: Return only the first this many failing rows
+
+        Returns:
+            DataFrame of failing rows with the input and result columns
+        """
         # Check if result column contains boolean or compliance values
-        if self.result_column in self.result_df.columns:
-            # Handle both boolean results and compliance status values
-            result_col = self.result_df[self.result_column]
-            
-            # If boolean column, return False values
-            if result_col.dtype == bool:
-                return self.result_df[result_col == False]
-            
-            # If compliance status column, return PC and DNC values
-            failing_mask = result_col.isin(['PC', 'DNC', 'PARTIALLY_COMPLIANT', 'DOES_NOT_COMPLY'])
-            return self.result_df[failing_mask]
-        
+        evaluated = self.evaluated_df
+        if self.result_column in evaluated.columns:
+            return self._rows_at(self.failing_index.positions[:limit], evaluated)
+
         # Fallback: return empty DataFrame
         return pd.DataFrame()
 
+    def iter_failing_items(self, chunk_rows: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Iterate over the failing rows in row order, one block of evaluated rows at a time.
+
+        Only one block's failing rows are joined onto the input columns at once,
+        so writers can stream large failure sets.
+
+        Args:
+            chunk_rows: Evaluated rows per block (default: all rows in one block)
+
+        Returns:
+            Iterator over non-empty DataFrames of failing rows
+        """
+        evaluated = self.evaluated_df
+        if self.result_column not in evaluated.columns:
+            return
+        positions = self.failing_index.positions
+        step = chunk_rows or max(len(evaluated), 1)
+        bounds = np.searchsorted(positions, np.arange(0, len(evaluated) + step, step))
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if end > start:
+                yield self._rows_at(positions[start:end], evaluated)
+
     def get_party_status(self, party: str) -> Optional[Dict[str, Any]]:
         """Get compliance status for a specific responsible party"""
         return self.party_results.get(party)
 
+    def _party_codes_for(self, party_column: str) -> Optional[PartyCodes]:
+        """Factorized party column of the evaluated rows (shared across rules of a dataset)"""
+        if self.party_codes is not None and self.party_codes.column == party_column:
+            return self.party_codes
+        data = self.source_df if self.source_df is not None else self.evaluated_df
+        if party_column not in data.columns:
+            return None
+        return factorize_parties(data, party_column)
+
+    def get_failing_items_for_party(self,
+                                    party: Any,
+                                    party_column: Optional[str] = None,
+                                    limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Get the failing items of one responsible party.
+
+        The rows are looked up in the failing-row index, so the cost is
+        proportional to the rows returned.
+
+        Args:
+            party: Responsible party
+            party_column: Optional column name for responsible party
+                         (defaults to rule's responsible_party_column metadata if not provided)
+            limit: Return only the first this many failing rows
+
+        Returns:
+            DataFrame with the party's failing items (empty if none)
+        """
+        if not party_column:
+            party_column = self.rule.metadata.get('responsible_party_column')
+        party_codes = self._party_codes_for(party_column) if party_column else None
+        if party_codes is None or self.result_column not in self.evaluated_df.columns:
+            return pd.DataFrame()
+        return self._rows_at(self.failing_index.for_party(party_codes, party)[:limit])
+
     def get_failing_items_by_party(self, party_column: Optional[str] = None) -> Dict[str, pd.DataFrame]:
         """
         Get failed items grouped by responsible party.
@@ -95,25 +310,20 @@ class RuleEvaluationResult:
             party_column = self.rule.metadata.get('responsible_party_column')
 
         # If no party column specified or not in DataFrame, return empty dict
-        if not party_column or party_column not in self.result_df.columns:
+        if not party_column or not self._has_column(party_column):
             return {}
 
-        # Get all failing items
-        failing_items = self.get_failing_items()
-
-        # If no failing items, return empty dict
-        if len(failing_items) == 0:
+        evaluated = self.evaluated_df
+        party_codes = self._party_codes_for(party_column)
+        if party_codes is None or self.result_column not in evaluated.columns:
             return {}
 
-        # Group by responsible party
+        # Each party's rows come straight from the failing-row index
         failing_by_party = {}
-        for party, party_df in failing_items.groupby(party_column):
+        for party in self.failing_index.counts_by_party(party_codes):
             # Convert party to string if it's a Timestamp to avoid dictionary key error
-            if pd.api.types.is_datetime64_any_dtype(type(party)):
-                party_key = str(party)
-            else:
-                party_key = party
-            failing_by_party[party_key] = party_df.copy()
+            party_key = str(party) if pd.api.types.is_datetime64_any_dtype(type(party)) else party
+            failing_by_party[party_key] = self._rows_at(self.failing_index.for_party(party_codes, party), evaluated)
 
         return failing_by_party
 
@@ -134,7 +344,7 @@ class RuleEvaluationResult:
 
         # If no party column specified or not in DataFrame, or no party_results
         # Return an empty DataFrame with the expected columns
-        if not party_column or party_column not in self.result_df.columns or not self.party_results:
+        if not party_column or not self._has_column(party_column) or not self.party_results:
             columns = [
                 'ResponsibleParty', 'Status', 'TotalItems', 'GC_Count',
                 'PC_Count', 'DNC_Count', 'Compliance_Rate', 'Error_Count'
@@ -174,13 +384,16 @@ class RuleEvaluationResult:
 
 class RuleEvaluator:
     """
-    Evaluates validation rules against data using the Excel formula processor.
+    Evaluates validation rules against data using a formula processor
+    (Excel over COM, or the native NumPy/pandas engine).
     """
 
     def __init__(self,
                  rule_manager: Optional[ValidationRuleManager] = None,
                  compliance_determiner: Optional[ComplianceDeterminer] = None,
-                 excel_visible: bool = False):
+                 excel_visible: bool = False,
+                 formula_backend: str = "auto",
+                 backend_registry: Optional[FormulaBackendRegistry] = None):
         """
         Initialize the rule evaluator.
 
@@ -188,10 +401,181 @@ class RuleEvaluator:
             rule_manager: ValidationRuleManager for rule access
             compliance_determiner: ComplianceDeterminer for compliance status
             excel_visible: Whether to make Excel visible during processing
+            formula_backend: "excel", "native", "sqlite" (out-of-core, disk-backed),
+                             or "auto" to route each rule to the fastest available
+                             backend that implements all of its functions, falling
+                             back to the next one if it turns the formula down
+            backend_registry: Formula backends to choose from (default: native,
+                              SQLite and Excel where COM is available)
         """
+        self.backend_registry = backend_registry or default_backend_registry()
+        if formula_backend != "auto" and formula_backend not in self.backend_registry.names:
+            raise ValueError(f"Unknown formula backend '{formula_backend}'. "
+                             f"Must be one of: {', '.join(['auto'] + self.backend_registry.names)}")
+
         self.rule_manager = rule_manager or ValidationRuleManager()
         self.compliance_determiner = compliance_determiner or ComplianceDeterminer()
         self.excel_visible = excel_visible
+        self.formula_backend = formula_backend
+        # Subexpression sharing summary of the most recent batch (native backend only)
+        self.last_batch_stats: Optional[Dict[str, Any]] = None
+        # Per-rule timings of the most recent evaluate_multiple_rules call
+        self.last_rule_timings: List[Dict[str, Any]] = []
+        # Party column factorizations of the current validation run (None: process-wide cache)
+        self.party_codes_cache: Optional[PartyCodesCache] = None
+
+    def uses_backend(self, name: str) -> bool:
+        """Whether rules may be evaluated on the named backend (e.g. to set up COM)"""
+        if self.formula_backend != "auto":
+            return self.formula_backend == name
+        return any(backend.name == name for backend in self.backend_registry.available_backends())
+
+    def _backend_candidates(self, rule_obj: ValidationRule) -> List[FormulaBackend]:
+        """
+        Backends to evaluate a rule on, in order: the routed backend, then its fallbacks.
+
+        Args:
+            rule_obj: Rule to route
+
+        Returns:
+            Non-empty list of backends
+        """
+        if self.formula_backend != "auto":
+            return [self.backend_registry.get(self.formula_backend)]
+        candidates = self.backend_registry.candidates(rule_obj.compiled_formula)
+        if not candidates:
+            # No backend implements every function: the fastest one reports the error
+            candidates = self.backend_registry.available_backends()[:1]
+            logger.warning(f"No available formula backend supports rule {rule_obj.rule_id}")
+        return candidates
+
+    def _create_formula_processor(self):
+        """
+        Create a formula processor for the configured backend
+        (the fastest available one when routing).
+
+        Returns:
+            Processor usable as a context manager, exposing process_formulas()
+        """
+        backend = (self.backend_registry.available_backends()[0] if self.formula_backend == "auto"
+                   else self.backend_registry.get(self.formula_backend))
+        # Processors are imported lazily so the evaluator can be used where COM is unavailable
+        return backend.create_processor(visible=self.excel_visible)
+
+    def _processor_for(self, backend: FormulaBackend):
+        """Processor for a routed backend; a fixed backend's comes from _create_formula_processor"""
+        if self.formula_backend == "auto":
+            return backend.create_processor(visible=self.excel_visible)
+        return self._create_formula_processor()
+
+    def _resolve_rule(self, rule: Union[str, ValidationRule]) -> ValidationRule:
+        """Get the rule object for a ValidationRule or rule_id"""
+        if isinstance(rule, str):
+            rule_obj = self.rule_manager.get_rule(rule)
+            if not rule_obj:
+                raise ValueError(f"Rule with ID {rule} not found")
+            return rule_obj
+        return rule
+
+    @staticmethod
+    def _formula_for_backend(rule_obj: ValidationRule, backend: FormulaBackend):
+        """Formula to hand to the processor (the native and SQLite engines reuse the compiled AST)"""
+        return backend.formula_for(rule_obj.compiled_formula, rule_obj.formula)
+
+    def _build_evaluation_result(self,
+                                 rule_obj: ValidationRule,
+                                 result_df: pd.DataFrame,
+                                 result_column: str,
+                                 responsible_party_column: Optional[str] = None,
+                                 source_df: Optional[pd.DataFrame] = None
+                                 ) -> Optional[RuleEvaluationResult]:
+        """
+        Normalize a rule's result column and determine its compliance.
+
+        Args:
+            rule_obj: The rule that was evaluated
+            result_df: Data with the rule's result column added
+            result_column: Column containing the rule's formula results
+            responsible_party_column: Column identifying responsible parties
+            source_df: Full input data when result_df holds projected columns only
+
+        Returns:
+            RuleEvaluationResult, or None if the result column is missing
+        """
+        if result_column not in result_df.columns:
+            return None
+
+        # Error rows as reported in the processor's error column
+        error_mask = error_mask_from_column(result_df.get(f"{result_column}_Error"))
+
+        # Convert string "TRUE"/"FALSE" values to boolean for proper handling
+        result_df[result_column] = _normalize_results(result_df[result_column], error_mask)
+
+        # Determine overall compliance
+        compliance_status, compliance_metrics = self.compliance_determiner.determine_overall_compliance(
+            result_df, result_column, rule_obj.threshold, error_mask=error_mask
+        )
+
+        # Group by responsible party if specified
+        party_results = None
+        party_codes = party_statuses = None
+        if responsible_party_column and responsible_party_column in result_df.columns:
+            # One factorization per dataset, shared by every rule's result
+            party_codes = factorize_parties(
+                source_df if source_df is not None else result_df, responsible_party_column,
+                self.party_codes_cache
+            )
+            party_counts = self.compliance_determiner.count_by_party(
+                result_df[result_column], party_codes, rule_obj.threshold, error_mask=error_mask
+            )
+            party_statuses = self.compliance_determiner.party_statuses(party_counts)
+            party_results = self.compliance_determiner.party_results_from_counts(party_counts, party_codes.labels)
+
+        result = RuleEvaluationResult(
+            rule=rule_obj,
+            result_df=result_df,
+            result_column=result_column,
+            compliance_status=compliance_status,
+            compliance_metrics=compliance_metrics,
+            party_results=party_results,
+            source_df=source_df
+        )
+        result.party_codes = party_codes
+        result.party_statuses = party_statuses
+        # Index the failing rows while the result column is at hand
+        result.failing_index
+        return result
+
+    @staticmethod
+    def _required_columns(rule_obj: ValidationRule, responsible_party_column: Optional[str] = None) -> List[str]:
+        """Columns a rule reads, plus the responsible party column"""
+        columns = rule_obj.get_required_columns()
+        if responsible_party_column:
+            columns.append(responsible_party_column)
+        return columns
+
+    @staticmethod
+    def _project_columns(data_df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """
+        Build the projected frame handed to the formula processor.
+
+        Only the referenced columns are selected, so memory use and the volume
+        sent to the backend scale with what the rules read rather than the
+        full extract width. The original index is kept so results align.
+        The projection is treated as read-only by the processors.
+
+        Args:
+            data_df: Full input data
+            columns: Columns needed for evaluation
+
+        Returns:
+            DataFrame with the requested columns on data_df's index
+        """
+        keep = [c for c in dict.fromkeys(columns) if c in data_df.columns]
+        if not keep and len(data_df.columns) > 0:
+            # Formulas without column references still need a non-empty sheet range
+            keep = [data_df.columns[0]]
+        return data_df.loc[:, keep]
 
     def evaluate_rule(self,
                       rule: Union[str, ValidationRule],
@@ -208,13 +592,7 @@ class RuleEvaluator:
         Returns:
             RuleEvaluationResult with evaluation details
         """
-        # Get rule object if rule_id was provided
-        if isinstance(rule, str):
-            rule_obj = self.rule_manager.get_rule(rule)
-            if not rule_obj:
-                raise ValueError(f"Rule with ID {rule} not found")
-        else:
-            rule_obj = rule
+        rule_obj = self._resolve_rule(rule)
 
         # Validate the rule with the DataFrame
         is_valid, error = rule_obj.validate_with_dataframe(data_df)
@@ -224,59 +602,181 @@ class RuleEvaluator:
         # Prepare result column name
         result_column = f"Result_{rule_obj.name}"
 
-        # Process the formula with our Excel processor - using context manager
-        formula_map = {result_column: rule_obj.formula}
-
         # Use context manager to ensure proper cleanup
         current_thread_id = threading.current_thread().ident
         logger.debug(f"Processing rule {rule_obj.rule_id} in thread {current_thread_id}")
 
-        with ExcelFormulaProcessor(visible=self.excel_visible, track_errors=True) as processor:
-            result_df = processor.process_formulas(data_df, formula_map)
-            result_df.index = data_df.index  # ✅ Fix: align result index to input
+        # Only the referenced columns are sent to the processor
+        projected_df = self._project_columns(data_df, self._required_columns(rule_obj, responsible_party_column))
 
-        # Convert string "TRUE"/"FALSE" values to boolean for proper handling
-        if result_column in result_df.columns:
-            def normalize_result(val):
-                if isinstance(val, bool):
-                    return val
-                elif isinstance(val, (int, float)):
-                    return bool(val)
-                elif isinstance(val, str):
-                    if val.upper() == "TRUE":
-                        return True
-                    elif val.upper() == "FALSE":
-                        return False
-                return val
-
-            result_df[result_column] = result_df[result_column].apply(normalize_result)
-
-            # Determine overall compliance
-            compliance_status, compliance_metrics = self.compliance_determiner.determine_overall_compliance(
-                result_df, result_column, rule_obj.threshold
+        # Try the routed backend first and fall back if it turns the formula down
+        candidates = self._backend_candidates(rule_obj)
+        for position, backend in enumerate(candidates):
+            formula_map = {result_column: self._formula_for_backend(rule_obj, backend)}
+            try:
+                with self._processor_for(backend) as processor:
+                    result_df = processor.process_formulas(projected_df, formula_map)
+                    result_df.index = data_df.index  # ✅ Fix: align result index to input
+            except UnsupportedFormulaError as e:
+                if position == len(candidates) - 1:
+                    raise
+                logger.info(f"Backend {backend.name} cannot evaluate rule {rule_obj.rule_id} ({str(e)}); "
+                            f"falling back to {candidates[position + 1].name}")
+                continue
+
+            result = self._build_evaluation_result(
+                rule_obj, result_df, result_column, responsible_party_column, source_df=data_df
             )
+            if result is not None:
+                result.formula_backend = backend.name
+            return result
+
+    def evaluate_rules_batch(self,
+                             rules: List[Union[str, ValidationRule]],
+                             data_df: pd.DataFrame,
+                             responsible_party_column: Optional[str] = None) -> Dict[str, RuleEvaluationResult]:
+        """
+        Evaluate several rules in as few formula processor sessions as possible.
 
-            # Group by responsible party if specified
-            party_results = None
-            if responsible_party_column and responsible_party_column in result_df.columns:
-                party_results = self.compliance_determiner.aggregate_by_responsible_party(
-                    result_df, result_column, responsible_party_column, rule_obj.threshold
+        Each rule is routed to its backend; the data is loaded into each backend's
+        processor once and all of that backend's formulas are evaluated in one
+        process_formulas call. The combined output is then split back into one
+        RuleEvaluationResult per rule.
+
+        Args:
+            rules: List of ValidationRules or rule_ids
+            data_df: Data to validate
+            responsible_party_column: Column identifying responsible parties
+
+        Returns:
+            Dictionary mapping rule_ids to RuleEvaluationResults
+        """
+        results = {}
+        self.last_rule_timings = []
+
+        # Resolve and validate every rule up front; invalid rules are skipped
+        batch: List[Tuple[ValidationRule, str, str]] = []  # (rule, result column, batch column)
+        formula_map = {}
+        # Routed backend name -> that backend's formulas, by batch column
+        backend_maps: Dict[str, Dict[str, Any]] = {}
+        for rule in rules:
+            try:
+                rule_obj = self._resolve_rule(rule)
+                is_valid, error = rule_obj.validate_with_dataframe(data_df)
+                if not is_valid:
+                    raise ValueError(f"Rule validation failed: {error}")
+            except Exception as e:
+                logger.error(f"Error evaluating rule {rule}: {str(e)}")
+                continue
+
+            result_column = f"Result_{rule_obj.name}"
+            # Rules sharing a name still need their own column within the batch
+            batch_column = result_column
+            if batch_column in formula_map:
+                batch_column = f"{result_column}__{len(batch)}"
+            backend = self._backend_candidates(rule_obj)[0]
+            formula_map[batch_column] = self._formula_for_backend(rule_obj, backend)
+            backend_maps.setdefault(backend.name, {})[batch_column] = formula_map[batch_column]
+            batch.append((rule_obj, result_column, batch_column))
+
+        if not batch:
+            return results
+
+        logger.debug(f"Processing {len(batch)} rules in one batch in thread {threading.current_thread().ident}")
+
+        # Send the processor only the union of the columns the batch reads
+        needed_columns = [c for rule_obj, _, _ in batch
+                          for c in self._required_columns(rule_obj, responsible_party_column)]
+        projected_df = self._project_columns(data_df, needed_columns)
+
+        self.last_batch_stats = None
+        batch_start, batch_cpu_start = time.perf_counter(), time.thread_time()
+        batch_outputs = set(formula_map) | {f"{c}_Error" for c in formula_map}
+        output_frames = []
+        routed_backends: Dict[str, str] = {}  # batch column -> backend name
+        for backend_name, backend_map in backend_maps.items():
+            try:
+                with self._processor_for(self.backend_registry.get(backend_name)) as processor:
+                    backend_df = processor.process_formulas(projected_df, backend_map)
+                    plan = getattr(processor, 'last_plan', None)
+                    if plan is not None:
+                        self.last_batch_stats = plan.to_dict()
+                        logger.info(f"Batch of {len(backend_map)} rules: {plan.deduplicated_nodes} of "
+                                    f"{plan.total_nodes} formula nodes deduplicated")
+            except Exception as e:
+                # One unsupported formula should not sink the whole batch
+                logger.warning(f"Batch evaluation on {backend_name} failed ({str(e)}), "
+                               f"evaluating its rules individually")
+                continue
+            output_frames.append(backend_df[[c for c in backend_df.columns
+                                             if c in batch_outputs and (c in backend_map or c[:-6] in backend_map)]])
+            routed_backends.update(dict.fromkeys(backend_map, backend_name))
+
+        batch_df = pd.concat(
+            [projected_df.drop(columns=[c for c in projected_df.columns if c in batch_outputs])] + output_frames,
+            axis=1
+        )
+        batch_df.index = data_df.index
+
+        # The shared processor calls are split across the batch by estimated formula cost
+        batch_seconds = time.perf_counter() - batch_start
+        batch_cpu_seconds = time.thread_time() - batch_cpu_start
+        costs = {rule_obj.rule_id: estimate_formula_cost(rule_obj) for rule_obj, _, batch_column in batch
+                 if batch_column in routed_backends}
+        total_cost = sum(costs.values())
+
+        # Projected input columns, without any stale result columns the processor replaced
+        data_columns = [c for c in projected_df.columns if c not in batch_outputs]
+        for rule_obj, result_column, batch_column in batch:
+            rule_start, rule_cpu_start = time.perf_counter(), time.thread_time()
+            if batch_column not in routed_backends:
+                # Its backend's batch failed: evaluate it alone, with fallback
+                try:
+                    results[rule_obj.rule_id] = self.evaluate_rule(rule_obj, data_df, responsible_party_column)
+                except Exception as rule_error:
+                    logger.error(f"Error evaluating rule {rule_obj.rule_id}: {str(rule_error)}")
+                    continue
+                self.last_rule_timings.append({
+                    "rule_id": rule_obj.rule_id,
+                    "rule_name": rule_obj.name,
+                    "seconds": time.perf_counter() - rule_start,
+                    "cpu_seconds": time.thread_time() - rule_cpu_start
+                })
+                continue
+
+            try:
+                rule_inputs = set(self._required_columns(rule_obj, responsible_party_column))
+                rule_outputs = (result_column, f"{result_column}_Error")
+                input_columns = [c for c in data_columns if c in rule_inputs and c not in rule_outputs]
+                output_columns = [c for c in (batch_column, f"{batch_column}_Error") if c in batch_df.columns]
+                result_df = batch_df[input_columns + output_columns].rename(columns={
+                    batch_column: result_column,
+                    f"{batch_column}_Error": f"{result_column}_Error"
+                })
+                result = self._build_evaluation_result(
+                    rule_obj, result_df, result_column, responsible_party_column, source_df=data_df
                 )
+                if result is not None:
+                    result.formula_backend = routed_backends[batch_column]
+                    results[rule_obj.rule_id] = result
+                    share = costs[rule_obj.rule_id] / total_cost
+                    self.last_rule_timings.append({
+                        "rule_id": rule_obj.rule_id,
+                        "rule_name": rule_obj.name,
+                        "seconds": batch_seconds * share + time.perf_counter() - rule_start,
+                        "cpu_seconds": batch_cpu_seconds * share + time.thread_time() - rule_cpu_start,
+                        "batched": True
+                    })
+            except Exception as e:
+                logger.error(f"Error evaluating rule {rule_obj.rule_id}: {str(e)}")
 
-            # Create and return result object
-            return RuleEvaluationResult(
-                rule=rule_obj,
-                result_df=result_df,
-                result_column=result_column,
-                compliance_status=compliance_status,
-                compliance_metrics=compliance_metrics,
-                party_results=party_results
-            )
+        return results
 
     def evaluate_multiple_rules(self,
                                 rules: List[Union[str, ValidationRule]],
                                 data_df: pd.DataFrame,
-                                responsible_party_column: Optional[str] = None) -> Dict[str, RuleEvaluationResult]:
+                                responsible_party_column: Optional[str] = None,
+                                batch: bool = True) -> Dict[str, RuleEvaluationResult]:
         """
         Evaluate multiple validation rules against a DataFrame.
 
@@ -284,10 +784,16 @@ class RuleEvaluator:
             rules: List of ValidationRules or rule_ids
             data_df: Data to validate
             responsible_party_column: Column identifying responsible parties
+            batch: Evaluate all rules in one processor session (see evaluate_rules_batch)
+                   instead of one session per rule
 
         Returns:
             Dictionary mapping rule_ids to RuleEvaluationResults
         """
+        self.last_rule_timings = []
+        if batch:
+            return self.evaluate_rules_batch(rules, data_df, responsible_party_column)
+
         results = {}
 
         for rule in rules:
@@ -296,10 +802,17 @@ class RuleEvaluator:
                 rule_id = rule if isinstance(rule, str) else rule.rule_id
 
                 # Evaluate the rule
+                rule_start, rule_cpu_start = time.perf_counter(), time.thread_time()
                 result = self.evaluate_rule(rule, data_df, responsible_party_column)
 
                 # Store the result
                 results[rule_id] = result
+                self.last_rule_timings.append({
+                    "rule_id": rule_id,
+                    "rule_name": result.rule.name,
+                    "seconds": time.perf_counter() - rule_start,
+                    "cpu_seconds": time.thread_time() - rule_cpu_start
+                })
 
             except Exception as e:
                 logger.error(f"Error evaluating rule {rule}: {str(e)}")
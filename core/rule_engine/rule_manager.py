@@ -7,7 +7,7 @@ import logging
 from pathlib import Path
 
 # Import our rule parser
-from .rule_parser import ValidationRuleParser
+from .rule_parser import ValidationRuleParser, CompiledFormula
 
 logger = logging.getLogger(__name__)
 
@@ -159,6 +159,11 @@ class ValidationRule:
         """
         return self.parser.extract_column_references(self.formula)
 
+    @property
+    def compiled_formula(self) -> Optional[CompiledFormula]:
+        """Get the compiled (parsed and cached) form of the rule's formula"""
+        return self.parser.compile(self.formula)
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert rule to dictionary format for serialization.
@@ -1,10 +1,125 @@
 import re
-from typing import Dict, List, Any, Optional, Tuple, Union
+import functools
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple, FrozenSet
 import pandas as pd
 import logging
 
+from core.formula_engine.formula_parser import (
+    ColumnReference, FormulaNode, FormulaSyntaxError, FunctionCall, Token,
+    iter_nodes, parse_formula, tokenize
+)
+
 logger = logging.getLogger(__name__)
 
+# Maximum number of compiled formulas kept per process
+COMPILED_FORMULA_CACHE_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class CompiledFormula:
+    """
+    A formula parsed once and shared by rule validation, column extraction
+    and the evaluation backends.
+    """
+    text: str  # Normalized formula text
+    ast: Optional[FormulaNode]
+    columns: Tuple[str, ...]  # Referenced columns in order of first appearance
+    functions: FrozenSet[str]  # Upper-case names of the functions used
+    error: Optional[str] = None  # Syntax error message, None if the formula parsed
+    missing_columns: Tuple[str, ...] = ()  # Columns absent from the schema it was compiled against
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether the formula parsed successfully"""
+        return self.error is None
+
+
+def _format_token(token: Token) -> str:
+    """Render a token back to canonical formula text"""
+    if token.kind == "STRING":
+        return '"' + token.value.replace('"', '""') + '"'
+    if token.kind == "COLUMN":
+        return f"[{token.value}]"
+    return token.value
+
+
+@functools.lru_cache(maxsize=COMPILED_FORMULA_CACHE_SIZE)
+def normalize_formula(formula: str) -> str:
+    """
+    Normalize formula text so that formatting differences (whitespace,
+    function name case) map to the same cache entry.
+
+    Args:
+        formula: Formula text
+
+    Returns:
+        Canonical formula text, or the stripped input if it cannot be tokenized
+    """
+    prefix = "=" if formula.lstrip().startswith("=") else ""
+    try:
+        return prefix + "".join(_format_token(token) for token in tokenize(formula))
+    except FormulaSyntaxError:
+        return formula.strip()
+
+
+@functools.lru_cache(maxsize=COMPILED_FORMULA_CACHE_SIZE)
+def _compile_normalized(text: str) -> CompiledFormula:
+    """Parse normalized formula text (cached per process)"""
+    if not text.startswith("="):
+        return CompiledFormula(text, None, (), frozenset(), "Formula must start with '='")
+
+    try:
+        ast = parse_formula(text)
+    except FormulaSyntaxError as e:
+        return CompiledFormula(text, None, (), frozenset(), str(e))
+
+    columns: Dict[str, None] = {}
+    functions = set()
+    for node in iter_nodes(ast):
+        if isinstance(node, ColumnReference):
+            columns.setdefault(node.name)
+        elif isinstance(node, FunctionCall):
+            functions.add(node.name)
+
+    return CompiledFormula(text, ast, tuple(columns), frozenset(functions))
+
+
+@functools.lru_cache(maxsize=COMPILED_FORMULA_CACHE_SIZE)
+def _compile_for_schema(text: str, schema: Tuple[Any, ...]) -> CompiledFormula:
+    """Compile formula text and check its column references against a schema"""
+    compiled = _compile_normalized(text)
+    available = set(schema)
+    missing = tuple(col for col in compiled.columns if col not in available)
+    if not missing:
+        return compiled
+    return CompiledFormula(compiled.text, compiled.ast, compiled.columns,
+                           compiled.functions, compiled.error, missing)
+
+
+def compile_formula(formula: str, columns: Optional[Tuple[Any, ...]] = None) -> CompiledFormula:
+    """
+    Compile a formula, reusing the process-wide LRU cache.
+
+    Args:
+        formula: Formula text
+        columns: Optional column schema to check references against
+
+    Returns:
+        CompiledFormula for the formula
+    """
+    text = normalize_formula(formula)
+    if columns is None:
+        return _compile_normalized(text)
+    return _compile_for_schema(text, tuple(columns))
+
+
+def clear_compiled_formula_cache() -> None:
+    """Drop all cached compiled formulas"""
+    normalize_formula.cache_clear()
+    _compile_normalized.cache_clear()
+    _compile_for_schema.cache_clear()
+
 
 class ValidationRuleParser:
     """
@@ -17,15 +132,30 @@ class ValidationRuleParser:
         self.excel_pattern = re.compile(r'^\s*=', re.IGNORECASE)  # Starts with "="
         self.column_ref_pattern = re.compile(r'\[([^\]]+)\]')  # Matches [ColumnName]
 
+    def compile(self, formula: str, columns: Optional[Tuple[Any, ...]] = None) -> Optional[CompiledFormula]:
+        """
+        Compile a formula into an AST, cached by normalized text and column schema.
+
+        Args:
+            formula: The formula string to compile
+            columns: Optional column schema to check references against
+
+        Returns:
+            CompiledFormula, or None if formula is not a string
+        """
+        if not isinstance(formula, str):
+            return None
+        return compile_formula(formula, columns)
+
     def is_valid_formula(self, formula: str) -> bool:
         """
-        Check if a string appears to be a valid Excel formula.
+        Check if a string is a syntactically valid Excel formula.
 
         Args:
             formula: The formula string to validate
 
         Returns:
-            True if the formula appears valid, False otherwise
+            True if the formula parses, False otherwise
         """
         if not isinstance(formula, str):
             return False
@@ -34,15 +164,7 @@ class ValidationRuleParser:
         if not self.excel_pattern.match(formula):
             return False
 
-        # Check for balanced parentheses
-        if not self._has_balanced_parentheses(formula):
-            return False
-
-        # Check for balanced brackets
-        if not self._has_balanced_brackets(formula):
-            return False
-
-        return True
+        return self.compile(formula).is_valid
 
     def extract_column_references(self, formula: str) -> List[str]:
         """
@@ -57,7 +179,11 @@ class ValidationRuleParser:
         if not isinstance(formula, str):
             return []
 
-        # Find all [ColumnName] patterns
+        compiled = self.compile(formula)
+        if compiled.is_valid:
+            return list(compiled.columns)
+
+        # Fall back to a plain scan so partially typed formulas still report columns
         return self.column_ref_pattern.findall(formula)
 
     def validate_formula_with_dataframe(self, formula: str, df: pd.DataFrame) -> Tuple[bool, Optional[str]]:
@@ -74,34 +200,8 @@ class ValidationRuleParser:
         if not self.is_valid_formula(formula):
             return False, "Invalid formula syntax"
 
-        column_refs = self.extract_column_references(formula)
-        missing_columns = [col for col in column_refs if col not in df.columns]
-
-        if missing_columns:
-            return False, f"Formula references non-existent columns: {', '.join(missing_columns)}"
+        compiled = self.compile(formula, tuple(df.columns))
+        if compiled.missing_columns:
+            return False, f"Formula references non-existent columns: {', '.join(compiled.missing_columns)}"
 
         return True, None
-
-    def _has_balanced_parentheses(self, formula: str) -> bool:
-        """Check if formula has balanced parentheses"""
-        count = 0
-        for char in formula:
-            if char == '(':
-                count += 1
-            elif char == ')':
-                count -= 1
-                if count < 0:
-                    return False
-        return count == 0
-
-    def _has_balanced_brackets(self, formula: str) -> bool:
-        """Check if formula has balanced brackets"""
-        count = 0
-        for char in formula:
-            if char == '[':
-                count += 1
-            elif char == ']':
-                count -= 1
-                if count < 0:
-                    return False
-        return count == 0
\ No newline at end of file
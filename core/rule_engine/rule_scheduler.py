@@ -0,0 +1,336 @@
+"""
+Cost-aware scheduling of rule evaluations across parallel workers.
+
+Each rule's cost is estimated from its formula AST (string functions and
+comparisons on text cost far more per row than NOT(ISBLANK())) and, once a
+rule has run, from its measured seconds per row. Rules are dealt to workers
+longest-first onto the least-loaded worker queue; a worker that runs out of
+work steals the cheapest queued rule from the most loaded queue, so one
+expensive rule never waits behind others while workers sit idle.
+"""
+
+import collections
+import concurrent.futures
+import logging
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from core.formula_engine.formula_parser import (
+    BinaryOperation, ColumnReference, FunctionCall, StringLiteral, UnaryOperation, iter_nodes
+)
+from .rule_manager import ValidationRule
+
+logger = logging.getLogger(__name__)
+
+# Relative per-row cost of formula elements
+FUNCTION_COSTS = {
+    "NOT": 1.0, "AND": 1.0, "OR": 1.0, "ISBLANK": 1.0, "ISNUMBER": 1.0, "ISTEXT": 1.0, "ABS": 1.0,
+    "IF": 2.0,
+    "LEN": 6.0, "UPPER": 6.0, "LOWER": 6.0, "TRIM": 8.0, "LEFT": 8.0, "RIGHT": 8.0,
+}
+DEFAULT_FUNCTION_COST = 10.0  # Functions without a vectorized implementation
+COLUMN_COST = 1.0
+OPERATOR_COST = 1.0
+TEXT_OPERATOR_COST = 4.0  # Comparisons and concatenation involving text
+
+# Seconds per cost unit per row before any rule has been timed
+DEFAULT_SECONDS_PER_UNIT = 2e-8
+
+# Weight of the newest measurement in a rule's seconds-per-row average
+HISTORY_WEIGHT = 0.5
+
+
+def estimate_formula_cost(rule: ValidationRule) -> float:
+    """
+    Estimate a rule's relative per-row evaluation cost from its formula AST.
+
+    Args:
+        rule: Rule to estimate
+
+    Returns:
+        Relative cost units per row (at least 1)
+    """
+    compiled = rule.compiled_formula
+    if compiled is None or compiled.ast is None:
+        return DEFAULT_FUNCTION_COST
+
+    cost = 0.0
+    for node in iter_nodes(compiled.ast):
+        if isinstance(node, FunctionCall):
+            cost += FUNCTION_COSTS.get(node.name, DEFAULT_FUNCTION_COST)
+        elif isinstance(node, ColumnReference):
+            cost += COLUMN_COST
+        elif isinstance(node, BinaryOperation):
+            text_operand = node.operator == "&" or any(
+                isinstance(side, StringLiteral) for side in (node.left, node.right)
+            )
+            cost += TEXT_OPERATOR_COST if text_operand else OPERATOR_COST
+        elif isinstance(node, UnaryOperation):
+            cost += OPERATOR_COST
+    return max(cost, 1.0)
+
+
+class RuleCostModel:
+    """
+    Predicts rule evaluation time from AST cost and measured runtimes.
+    """
+
+    def __init__(self, history: Optional[Dict[str, float]] = None):
+        """
+        Initialize the cost model.
+
+        Args:
+            history: Optional known seconds per row by rule ID
+        """
+        self.seconds_per_row: Dict[str, float] = dict(history or {})
+        self._unit_samples: Dict[str, float] = {}  # Seconds per cost unit per row, by rule ID
+        self._lock = threading.Lock()
+
+    def load_history(self, history: Dict[str, float]) -> None:
+        """
+        Add stored seconds-per-row figures for rules not yet timed in this process.
+
+        Args:
+            history: Seconds per row by rule ID (e.g. from RulePerformanceStore)
+        """
+        with self._lock:
+            for rule_id, seconds_per_row in history.items():
+                self.seconds_per_row.setdefault(rule_id, seconds_per_row)
+
+    def _seconds_per_unit(self) -> float:
+        """Calibrate AST cost units to seconds from the rules timed in this process"""
+        if not self._unit_samples:
+            return DEFAULT_SECONDS_PER_UNIT
+        return statistics.median(self._unit_samples.values())
+
+    def estimate(self, rule: ValidationRule, num_rows: int) -> float:
+        """
+        Estimate a rule's evaluation time.
+
+        Args:
+            rule: Rule to estimate
+            num_rows: Number of rows it is evaluated on
+
+        Returns:
+            Estimated seconds
+        """
+        rows = max(num_rows, 1)
+        measured = self.seconds_per_row.get(rule.rule_id)
+        if measured is not None:
+            return measured * rows
+        return estimate_formula_cost(rule) * self._seconds_per_unit() * rows
+
+    def record(self, rule: ValidationRule, seconds: float, num_rows: int) -> None:
+        """
+        Record a measured evaluation time.
+
+        Args:
+            rule: Rule that was evaluated
+            seconds: Wall-clock evaluation time
+            num_rows: Number of rows evaluated
+        """
+        if num_rows <= 0:
+            return
+        observed = seconds / num_rows
+        with self._lock:
+            previous = self.seconds_per_row.get(rule.rule_id)
+            self.seconds_per_row[rule.rule_id] = observed if previous is None else \
+                HISTORY_WEIGHT * observed + (1 - HISTORY_WEIGHT) * previous
+            self._unit_samples[rule.rule_id] = self.seconds_per_row[rule.rule_id] / estimate_formula_cost(rule)
+
+
+@dataclass
+class ScheduledRule:
+    """A rule queued on a worker, with its estimated cost"""
+    rule: ValidationRule
+    estimated_seconds: float
+
+
+class WorkStealingScheduler:
+    """
+    Runs rule evaluations on a fixed number of workers, longest job first,
+    with idle workers stealing queued work.
+    """
+
+    def __init__(self, num_workers: int, cost_model: Optional[RuleCostModel] = None):
+        """
+        Initialize the scheduler.
+
+        Args:
+            num_workers: Number of concurrent workers
+            cost_model: Cost model for ordering (default: AST estimates only)
+        """
+        self.num_workers = max(1, num_workers)
+        self.cost_model = cost_model or RuleCostModel()
+        self.last_run_stats: Optional[Dict[str, Any]] = None
+
+    def plan(self, rules: List[ValidationRule], num_rows: int) -> List[Deque[ScheduledRule]]:
+        """
+        Deal rules longest-first onto the least-loaded worker queue.
+
+        Args:
+            rules: Rules to schedule
+            num_rows: Number of rows each rule is evaluated on
+
+        Returns:
+            One queue per worker, most expensive rule first
+        """
+        scheduled = sorted(
+            (ScheduledRule(rule, self.cost_model.estimate(rule, num_rows)) for rule in rules),
+            key=lambda item: item.estimated_seconds,
+            reverse=True
+        )
+        num_queues = min(self.num_workers, len(scheduled)) or 1
+        queues: List[Deque[ScheduledRule]] = [collections.deque() for _ in range(num_queues)]
+        loads = [0.0] * num_queues
+        for item in scheduled:
+            target = loads.index(min(loads))
+            queues[target].append(item)
+            loads[target] += item.estimated_seconds
+        return queues
+
+    def run(self,
+            rules: List[ValidationRule],
+            num_rows: int,
+            execute: Callable[[ValidationRule], Any]) -> Dict[str, Any]:
+        """
+        Evaluate rules on worker threads.
+
+        Each worker runs its own queue front to back; when it is empty, the
+        worker steals the last (cheapest) rule from the queue with the most
+        estimated work left. Measured times are fed back to the cost model.
+
+        Args:
+            rules: Rules to evaluate
+            num_rows: Number of rows each rule is evaluated on
+            execute: Function evaluating one rule; it may block on another
+                     executor (such as a process pool)
+
+        Returns:
+            Dictionary mapping rule IDs to execute's return values (None if it raised)
+        """
+        return self.run_batches(rules, num_rows, lambda batch: execute(batch[0]), batch_size=1)
+
+    def run_batches(self,
+                    rules: List[ValidationRule],
+                    num_rows: int,
+                    execute_batch: Callable[[List[ValidationRule]], Any],
+                    batch_size: int) -> Dict[str, Any]:
+        """
+        Evaluate rules on worker threads, up to batch_size rules per call.
+
+        As in run, but each worker takes up to batch_size rules from the front
+        of its queue at a time. A worker that steals takes up to batch_size of
+        the cheapest rules, leaving at least half of the victim's queue. Each
+        rule of a batch is credited a share of the batch's time in proportion
+        to its estimate.
+
+        Args:
+            rules: Rules to evaluate
+            num_rows: Number of rows each rule is evaluated on
+            execute_batch: Function evaluating a list of rules; it may block on
+                           another executor (such as a process pool)
+            batch_size: Maximum number of rules per execute_batch call
+
+        Returns:
+            Dictionary mapping each rule ID to the return value of its batch's
+            execute_batch call (None if it raised)
+        """
+        batch_size = max(1, batch_size)
+        queues = self.plan(rules, num_rows)
+        planned_makespan = max((sum(item.estimated_seconds for item in queue) for queue in queues), default=0.0)
+        lock = threading.Lock()
+        results: Dict[str, Any] = {}
+        timings: List[Dict[str, Any]] = []
+
+        def next_batch(worker: int):
+            with lock:
+                if queues[worker]:
+                    count = min(batch_size, len(queues[worker]))
+                    return [queues[worker].popleft() for _ in range(count)], False
+                victim = max(range(len(queues)),
+                             key=lambda i: sum(item.estimated_seconds for item in queues[i]))
+                if queues[victim]:
+                    count = min(batch_size, (len(queues[victim]) + 1) // 2)
+                    return [queues[victim].pop() for _ in range(count)], True
+                return [], False
+
+        def work(worker: int) -> None:
+            while True:
+                batch, stolen = next_batch(worker)
+                if not batch:
+                    return
+                start, cpu_start = time.perf_counter(), time.thread_time()
+                try:
+                    result = execute_batch([item.rule for item in batch])
+                except Exception as e:
+                    rule_ids = ", ".join(item.rule.rule_id for item in batch)
+                    logger.error(f"Error evaluating rules {rule_ids}: {str(e)}")
+                    result = None
+                end = time.perf_counter()
+                cpu_seconds = time.thread_time() - cpu_start
+
+                # Split the batch's time into consecutive per-rule spans by estimate
+                total_estimate = sum(item.estimated_seconds for item in batch)
+                rule_start = start
+                for item in batch:
+                    share = item.estimated_seconds / total_estimate if total_estimate > 0 else 1 / len(batch)
+                    rule_end = rule_start + (end - start) * share
+                    if result is not None:
+                        self.cost_model.record(item.rule, rule_end - rule_start, num_rows)
+                    with lock:
+                        results[item.rule.rule_id] = result
+                        timings.append({
+                            "rule_id": item.rule.rule_id,
+                            "worker": worker,
+                            "start": rule_start,
+                            "end": rule_end,
+                            "cpu_seconds": cpu_seconds * share,
+                            "estimated_seconds": item.estimated_seconds,
+                            "stolen": stolen,
+                            "batched": len(batch) > 1
+                        })
+                    rule_start = rule_end
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(queues)) as executor:
+            list(executor.map(work, range(len(queues))))
+
+        self.last_run_stats = self._summarize(timings, len(queues), planned_makespan)
+        return results
+
+    @staticmethod
+    def _summarize(timings: List[Dict[str, Any]], num_workers: int, planned_makespan: float) -> Dict[str, Any]:
+        """Makespan and per-worker utilization of a run"""
+        if not timings:
+            return {"workers": num_workers, "makespan_seconds": 0.0, "planned_makespan_seconds": planned_makespan,
+                    "mean_utilization": 0.0, "steals": 0, "worker_stats": []}
+
+        run_start = min(t["start"] for t in timings)
+        makespan = max(t["end"] for t in timings) - run_start
+        worker_stats = []
+        for worker in range(num_workers):
+            own = [t for t in timings if t["worker"] == worker]
+            busy = sum(t["end"] - t["start"] for t in own)
+            worker_stats.append({
+                "worker": worker,
+                "rules": len(own),
+                "stolen": sum(1 for t in own if t["stolen"]),
+                "busy_seconds": busy,
+                "utilization": busy / makespan if makespan > 0 else 1.0
+            })
+
+        return {
+            "workers": num_workers,
+            "makespan_seconds": makespan,
+            "planned_makespan_seconds": planned_makespan,
+            "mean_utilization": statistics.fmean(w["utilization"] for w in worker_stats),
+            "steals": sum(w["stolen"] for w in worker_stats),
+            "worker_stats": worker_stats,
+            "order": [t["rule_id"] for t in sorted(timings, key=lambda t: t["start"])],
+            "rule_seconds": {t["rule_id"]: t["end"] - t["start"] for t in timings},
+            "rule_cpu_seconds": {t["rule_id"]: t["cpu_seconds"] for t in timings},
+            "batched_rules": [t["rule_id"] for t in timings if t["batched"]]
+        }
@@ -0,0 +1,277 @@
+"""
+Chunked (streaming) rule evaluation for data sources larger than memory.
+
+Every selected rule is evaluated on one chunk at a time. Compliance counts,
+overall and per responsible party, are summed across chunks and turned into
+metrics at the end, and each chunk's failing rows are spilled to disk. Peak
+memory is therefore bounded by the chunk size rather than the source size.
+The spill files are deleted along with the result that reads them.
+"""
+
+import datetime
+import logging
+import pickle
+import uuid
+import weakref
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .compliance_determiner import ComplianceDeterminer
+from .rule_manager import ValidationRule
+from .rule_evaluator import RuleEvaluationResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SPILL_DIR = "data/temp/streaming"
+
+# Order of the count vectors accumulated per rule and per party
+_COUNT_KEYS = ("gc_count", "pc_count", "dnc_count", "error_count", "total_count")
+
+
+def remove_spill_files(paths: Iterable[Path]) -> None:
+    """
+    Delete spill files, then their rule and run directories once empty.
+
+    Args:
+        paths: Spill files to delete
+    """
+    directories = set()
+    for path in paths:
+        path = Path(path)
+        path.unlink(missing_ok=True)
+        directories.update((path.parent, path.parent.parent))
+    # Deepest first, so a run directory is tried after its rule directories
+    for directory in sorted(directories, key=lambda d: len(d.parts), reverse=True):
+        try:
+            directory.rmdir()
+        except OSError:
+            pass  # Still holds other rules' files, or already gone
+
+
+class StreamedRuleResult(RuleEvaluationResult):
+    """
+    Result of a rule evaluated chunk by chunk.
+
+    Only the failing rows are retained, in spill files on disk; they are read
+    back when requested.
+    """
+
+    def __init__(self,
+                 rule: ValidationRule,
+                 result_column: str,
+                 compliance_status: str,
+                 compliance_metrics: Dict[str, Any],
+                 party_results: Optional[Dict[str, Dict[str, Any]]] = None,
+                 spill_paths: Optional[List[Path]] = None,
+                 columns: Optional[List[Any]] = None):
+        """
+        Initialize a streamed result.
+
+        Args:
+            rule: The rule that was evaluated
+            result_column: Column name containing the results
+            compliance_status: Overall compliance status
+            compliance_metrics: Dictionary of compliance metrics
+            party_results: Results grouped by responsible party
+            spill_paths: Files holding the failing rows, one per chunk with failures
+            columns: Columns of the failing rows (input columns plus result columns)
+        """
+        self.columns = list(columns or [])
+        self.spill_paths = list(spill_paths or [])
+        super().__init__(rule, pd.DataFrame(columns=self.columns), result_column,
+                         compliance_status, compliance_metrics, party_results)
+        # The files go when the result does
+        if self.spill_paths:
+            weakref.finalize(self, remove_spill_files, list(self.spill_paths))
+
+    @property
+    def result_df(self) -> pd.DataFrame:
+        """Failing rows with their result columns (passing rows are not retained)"""
+        return self.get_failing_items()
+
+    def _has_column(self, column: str) -> bool:
+        return column in self.columns
+
+    def iter_failing_items(self, chunk_rows: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Read the failing rows back one spilled chunk at a time.
+
+        Args:
+            chunk_rows: Ignored; the blocks are the chunks the rows were spilled in
+
+        Returns:
+            Iterator over DataFrames of failing rows
+        """
+        for path in self.spill_paths:
+            with open(path, "rb") as f:
+                yield pickle.load(f)
+
+    def get_failing_items(self, limit: Optional[int] = None) -> pd.DataFrame:
+        """
+        Get the failing rows, read back from the spill files.
+
+        Args:
+            limit: Read only until this many failing rows are found
+
+        Returns:
+            DataFrame of failing rows
+        """
+        parts = []
+        row_count = 0
+        for part in self.iter_failing_items():
+            parts.append(part)
+            row_count += len(part)
+            if limit is not None and row_count >= limit:
+                break
+        if not parts:
+            return pd.DataFrame(columns=self.columns)
+        return pd.concat(parts).iloc[:limit]
+
+    def get_failing_items_for_party(self,
+                                    party: Any,
+                                    party_column: Optional[str] = None,
+                                    limit: Optional[int] = None) -> pd.DataFrame:
+        """Failing rows of one responsible party, filtered from the spill files"""
+        party_column = party_column or self.rule.metadata.get('responsible_party_column')
+        if not party_column or party_column not in self.columns:
+            return pd.DataFrame()
+        failing = self.get_failing_items()
+        return failing[failing[party_column] == party].iloc[:limit]
+
+    def get_failing_items_by_party(self, party_column: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """Failing rows read back from the spill files, grouped by responsible party"""
+        party_column = party_column or self.rule.metadata.get('responsible_party_column')
+        if not party_column or party_column not in self.columns:
+            return {}
+        return {party: rows for party, rows in self.get_failing_items().groupby(party_column)}
+
+
+class StreamingValidator:
+    """
+    Evaluates rules over an iterator of DataFrame chunks, accumulating
+    compliance counts and spilling failing rows to disk.
+    """
+
+    def __init__(self,
+                 evaluator,
+                 compliance_determiner: Optional[ComplianceDeterminer] = None,
+                 spill_dir: Optional[str] = None):
+        """
+        Initialize the streaming validator.
+
+        Args:
+            evaluator: RuleEvaluator (or wrapper) used to evaluate each chunk
+            compliance_determiner: Determiner applying the GC/PC thresholds to the
+                                   accumulated counts (default: the evaluator's)
+            spill_dir: Directory for failing-row spill files (default: data/temp/streaming)
+        """
+        self.evaluator = evaluator
+        self.compliance_determiner = (compliance_determiner
+                                      or getattr(evaluator, 'compliance_determiner', None)
+                                      or ComplianceDeterminer())
+        self.spill_dir = Path(spill_dir) if spill_dir else Path(DEFAULT_SPILL_DIR)
+
+    def validate(self,
+                 chunks: Iterable[pd.DataFrame],
+                 rules: List[ValidationRule],
+                 responsible_party_column: Optional[str] = None) -> Tuple[Dict[str, StreamedRuleResult], Dict[str, Any]]:
+        """
+        Evaluate rules on every chunk and combine the per-chunk results.
+
+        A rule that fails to evaluate on any chunk is left out of the results,
+        since its counts would be incomplete.
+
+        Args:
+            chunks: DataFrame chunks of the data source
+            rules: Rules to evaluate
+            responsible_party_column: Column identifying responsible parties
+
+        Returns:
+            Tuple of (rule_id -> StreamedRuleResult, streaming run statistics).
+            Each result's spill files are deleted when the result is.
+        """
+        run_dir = self.spill_dir / f"{datetime.datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}"
+        counts = {rule.rule_id: np.zeros(len(_COUNT_KEYS), dtype=np.int64) for rule in rules}
+        party_counts: Dict[str, Dict[Any, np.ndarray]] = {rule.rule_id: {} for rule in rules}
+        spill_paths: Dict[str, List[Path]] = {rule.rule_id: [] for rule in rules}
+        result_columns: Dict[str, str] = {}
+        failing_columns: Dict[str, List[Any]] = {}
+        failed_rules = set()
+        stats = {'chunks': 0, 'rows': 0, 'max_chunk_rows': 0, 'failing_rows': 0, 'spill_dir': str(run_dir)}
+
+        for chunk_index, chunk in enumerate(chunks):
+            stats['chunks'] += 1
+            stats['rows'] += len(chunk)
+            stats['max_chunk_rows'] = max(stats['max_chunk_rows'], len(chunk))
+
+            active_rules = [rule for rule in rules if rule.rule_id not in failed_rules]
+            chunk_results = self.evaluator.evaluate_multiple_rules(active_rules, chunk, responsible_party_column)
+
+            for rule in active_rules:
+                result = chunk_results.get(rule.rule_id)
+                if result is None:
+                    logger.error(f"Rule {rule.rule_id} failed on chunk {chunk_index}; "
+                                 f"leaving it out of the streamed results")
+                    failed_rules.add(rule.rule_id)
+                    continue
+
+                result_columns[rule.rule_id] = result.result_column
+                counts[rule.rule_id] += [result.compliance_metrics.get(key, 0) for key in _COUNT_KEYS]
+                for party, party_result in result.party_results.items():
+                    party_total = party_counts[rule.rule_id].setdefault(
+                        party, np.zeros(len(_COUNT_KEYS), dtype=np.int64)
+                    )
+                    party_total += [party_result['metrics'].get(key, 0) for key in _COUNT_KEYS]
+
+                failing = result.get_failing_items()
+                if rule.rule_id not in failing_columns:
+                    failing_columns[rule.rule_id] = list(failing.columns)
+                if len(failing) > 0:
+                    spill_paths[rule.rule_id].append(self._spill(run_dir, rule, chunk_index, failing))
+                    stats['failing_rows'] += len(failing)
+
+            # Drop this chunk's results before the next chunk is read
+            del chunk_results
+
+        results = {}
+        for rule in rules:
+            if rule.rule_id in failed_rules or rule.rule_id not in result_columns:
+                # Failing rows spilled before the rule failed are not read by any result
+                remove_spill_files(spill_paths[rule.rule_id])
+                continue
+            status, metrics = self.compliance_determiner._metrics_from_counts(
+                *(int(value) for value in counts[rule.rule_id])
+            )
+            party_results = {}
+            for party, party_total in party_counts[rule.rule_id].items():
+                party_status, party_metrics = self.compliance_determiner._metrics_from_counts(
+                    *(int(value) for value in party_total)
+                )
+                party_results[party] = {"status": party_status, "metrics": party_metrics}
+
+            results[rule.rule_id] = StreamedRuleResult(
+                rule=rule,
+                result_column=result_columns[rule.rule_id],
+                compliance_status=status,
+                compliance_metrics=metrics,
+                party_results=party_results,
+                spill_paths=spill_paths[rule.rule_id],
+                columns=failing_columns.get(rule.rule_id)
+            )
+
+        logger.info(f"Streamed {stats['rows']} rows in {stats['chunks']} chunks; "
+                    f"spilled {stats['failing_rows']} failing rows to {run_dir}")
+        return results, stats
+
+    @staticmethod
+    def _spill(run_dir: Path, rule: ValidationRule, chunk_index: int, failing: pd.DataFrame) -> Path:
+        """Write one chunk's failing rows for a rule to disk"""
+        safe_rule = "".join(c if c.isalnum() or c in "-_" else "_" for c in str(rule.rule_id))
+        path = run_dir / safe_rule / f"part-{chunk_index:05d}.pkl"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(failing, f, protocol=pickle.HIGHEST_PROTOCOL)
+        return path
@@ -19,6 +19,10 @@ from typing import Dict, List, Tuple, Union, Optional
 from dataclasses import dataclass
 import logging
 
+import numpy as np
+
+from core.rule_engine.compliance_determiner import status_counts_by_party
+
 logger = logging.getLogger(__name__)
 
 
@@ -139,6 +143,11 @@ class IAGScoringCalculator:
             else:  # N/A or other
                 na_count += 1
         
+        return self._score_from_counts(gc_count, pc_count, dnc_count, na_count)
+    
+    def _score_from_counts(self, gc_count: int, pc_count: int,
+                           dnc_count: int, na_count: int) -> IAGScoringResult:
+        """Build an IAGScoringResult from rating counts"""
         # Calculate total applicable (excluding N/A)
         total_applicable = gc_count + pc_count + dnc_count
         
@@ -188,29 +197,48 @@ class IAGScoringCalculator:
             total_dnc += leader_score.dnc_count
             total_na += leader_score.na_count
         
-        # Calculate overall IAG score
-        total_applicable = total_gc + total_pc + total_dnc
-        overall_weighted_score = self.calculate_iag_weighted_score(
-            total_gc, total_pc, total_dnc, total_applicable
-        )
-        overall_rating = self.assign_iag_rating(overall_weighted_score)
-        
         # Add overall score to results
-        leader_scores['overall'] = IAGScoringResult(
-            gc_count=total_gc,
-            pc_count=total_pc,
-            dnc_count=total_dnc,
-            na_count=total_na,
-            total_applicable=total_applicable,
-            weighted_score=overall_weighted_score,
-            rating=overall_rating
-        )
+        leader_scores['overall'] = self._score_from_counts(total_gc, total_pc, total_dnc, total_na)
         
         logger.info(f"Calculated IAG scores for {len(all_rule_results)} leaders "
                    f"grouped by {responsible_party_column}")
         
         return leader_scores
     
+    def calculate_scores_from_status_codes(self, statuses: np.ndarray, leaders: List[str],
+                                           responsible_party_column: str) -> Dict[str, IAGScoringResult]:
+        """
+        Calculate leader and overall IAG scores from a rule x leader status code matrix.
+        
+        Equivalent to calculate_overall_iag_score, counting the ratings of all
+        leaders in one pass instead of per result dict.
+        
+        Args:
+            statuses: Array of shape (rules, leaders) with STATUS_GC/STATUS_PC/STATUS_DNC
+                      codes; any other code (e.g. -1) counts as N/A
+            leaders: Leader label of each column
+            responsible_party_column: Column name used for grouping (for logging)
+            
+        Returns:
+            Dictionary with 'overall' key containing aggregate IAGScoringResult,
+            plus individual leader scores
+        """
+        counts = status_counts_by_party(statuses)
+        na_counts = statuses.shape[0] - counts.sum(axis=1)
+        
+        leader_scores = {
+            leader: self._score_from_counts(gc_count, pc_count, dnc_count, na_count)
+            for leader, (gc_count, pc_count, dnc_count), na_count
+            in zip(leaders, counts.tolist(), na_counts.tolist())
+        }
+        total_gc, total_pc, total_dnc = (int(total) for total in counts.sum(axis=0))
+        leader_scores['overall'] = self._score_from_counts(total_gc, total_pc, total_dnc, int(na_counts.sum()))
+        
+        logger.info(f"Calculated IAG scores for {len(leaders)} leaders "
+                   f"grouped by {responsible_party_column}")
+        
+        return leader_scores
+    
     def get_detailed_metrics_by_leader(self, rule_results: Dict[str, Dict], 
                                      responsible_party_column: str) -> Dict[str, Dict]:
         """
@@ -1,7 +1,7 @@
 # data_integration/connectors/base_connector.py
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, Optional
 import pandas as pd
 import logging
 
@@ -80,6 +80,29 @@ class BaseConnector(ABC):
         """
         pass
 
+    def iter_chunks(self,
+                    chunk_size: int,
+                    query: Optional[str] = None,
+                    params: Optional[Dict[str, Any]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Retrieve data from the source in chunks of at most chunk_size rows.
+
+        Chunk indexes continue from one chunk to the next, so row labels match
+        those of a full load. This default loads the data with get_data and
+        slices it; connectors that can read incrementally override it.
+
+        Args:
+            chunk_size: Maximum number of rows per chunk
+            query: Query string or identifier for the data to retrieve
+            params: Additional parameters to control the data retrieval
+
+        Returns:
+            Iterator over DataFrame chunks
+        """
+        df = self.get_data(query, params)
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size]
+
     @abstractmethod
     def test_connection(self) -> bool:
         """
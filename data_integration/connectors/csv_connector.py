@@ -3,7 +3,7 @@
 import os
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterator, Optional, List
 import logging
 from pathlib import Path
 
@@ -135,37 +135,10 @@ class CSVConnector(BaseConnector):
             self.handle_connection_error(ConnectionError(error_msg))
             return pd.DataFrame()  # Return empty DataFrame to maintain interface
 
-        # Merge parameters from initialization with those provided in the call
-        all_params = {}
-
-        # Start with the initialization parameters
-        if self.delimiter is not None:
-            all_params['delimiter'] = self.delimiter
-        if self.encoding is not None:
-            all_params['encoding'] = self.encoding
-        if self.header_row is not None:
-            all_params['header'] = self.header_row
-        if self.skiprows is not None:
-            all_params['skiprows'] = self.skiprows
-        if self.na_values is not None:
-            all_params['na_values'] = self.na_values
-        if self.low_memory is not None:
-            all_params['low_memory'] = self.low_memory
-        if self.dtype is not None:
-            all_params['dtype'] = self.dtype
-
-        # Override with parameters from this call
-        if params:
-            all_params.update(params)
+        all_params = self._build_read_params(params)
 
         try:
-            # Auto-detect delimiter if not specified
-            if 'delimiter' not in all_params or not all_params['delimiter']:
-                all_params['delimiter'] = self._detect_delimiter()
-
-            # Auto-detect encoding if not specified
-            if 'encoding' not in all_params or not all_params['encoding']:
-                all_params['encoding'] = self._detect_encoding()
+            self._detect_format(all_params)
 
             # Use retry for robustness against transient errors
             def load_csv():
@@ -201,6 +174,84 @@ class CSVConnector(BaseConnector):
             self.handle_data_load_error(e, None, all_params)
             raise
 
+    def iter_chunks(self,
+                    chunk_size: int,
+                    query: Optional[str] = None,
+                    params: Optional[Dict[str, Any]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Read the CSV file in chunks of at most chunk_size rows.
+
+        Only one chunk is held in memory at a time. Each chunk is post-processed
+        like a full load; type detection therefore runs per chunk.
+
+        Args:
+            chunk_size: Maximum number of rows per chunk
+            query: Not used for CSV connector but maintained for interface consistency
+            params: Additional parameters, can include any parameter accepted by pd.read_csv()
+
+        Returns:
+            Iterator over DataFrame chunks with a continuous RangeIndex
+        """
+        if not self._is_connected and not self.connect():
+            raise ConnectionError(f"Cannot connect to CSV file: {self.file_path}")
+
+        all_params = self._build_read_params(params)
+        try:
+            self._detect_format(all_params)
+            reader = pd.read_csv(self.file_path, chunksize=chunk_size, **all_params)
+        except Exception as e:
+            logger.error(f"Error opening CSV file {self.file_path}: {str(e)}")
+            self.handle_data_load_error(e, None, all_params)
+            raise
+
+        with reader:
+            for chunk in reader:
+                yield self._post_process_dataframe(chunk)
+
+    def _build_read_params(self, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Merge parameters from initialization with those provided in the call.
+
+        Args:
+            params: Parameters for this read, overriding the initialization ones
+
+        Returns:
+            Keyword arguments for pd.read_csv()
+        """
+        all_params = {}
+
+        # Start with the initialization parameters
+        if self.delimiter is not None:
+            all_params['delimiter'] = self.delimiter
+        if self.encoding is not None:
+            all_params['encoding'] = self.encoding
+        if self.header_row is not None:
+            all_params['header'] = self.header_row
+        if self.skiprows is not None:
+            all_params['skiprows'] = self.skiprows
+        if self.na_values is not None:
+            all_params['na_values'] = self.na_values
+        if self.low_memory is not None:
+            all_params['low_memory'] = self.low_memory
+        if self.dtype is not None:
+            all_params['dtype'] = self.dtype
+
+        # Override with parameters from this call
+        if params:
+            all_params.update(params)
+
+        return all_params
+
+    def _detect_format(self, all_params: Dict[str, Any]) -> None:
+        """Fill in the delimiter and encoding if they are not specified"""
+        # Auto-detect delimiter if not specified
+        if 'delimiter' not in all_params or not all_params['delimiter']:
+            all_params['delimiter'] = self._detect_delimiter()
+
+        # Auto-detect encoding if not specified
+        if 'encoding' not in all_params or not all_params['encoding']:
+            all_params['encoding'] = self._detect_encoding()
+
     def get_file_info(self) -> Dict[str, Any]:
         """
         Get information about the CSV file.
@@ -3,7 +3,7 @@
 import os
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Iterator, Optional, List, Union
 import logging
 from pathlib import Path
 
@@ -608,6 +608,86 @@ class ExcelConnector(BaseConnector):
             self.handle_data_load_error(e)
             raise
 
+    def iter_chunks(self,
+                    chunk_size: int,
+                    query: Optional[str] = None,
+                    params: Optional[Dict[str, Any]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Read a worksheet in chunks of at most chunk_size rows.
+
+        .xlsx/.xlsm sheets are streamed row by row with openpyxl's read-only
+        mode, so only one chunk is held in memory at a time. Other formats,
+        cell ranges and extra read parameters fall back to a full load.
+
+        Args:
+            chunk_size: Maximum number of rows per chunk
+            query: Sheet name or index (overrides init parameter if provided)
+            params: Additional parameters (see get_data)
+
+        Returns:
+            Iterator over DataFrame chunks with a continuous RangeIndex
+        """
+        if not self._is_connected and not self.connect():
+            raise ConnectionError(f"Cannot connect to Excel file: {self.file_path}")
+
+        streamable = (
+            str(self.file_path).lower().endswith(('.xlsx', '.xlsm'))
+            and self.engine in (None, 'openpyxl')
+            and not self.cell_range
+            and not self.password
+            and not params
+        )
+        if not streamable:
+            yield from super().iter_chunks(chunk_size, query, params)
+            return
+
+        sheet = query if query is not None else self.sheet_name
+        try:
+            from openpyxl import load_workbook
+            workbook = load_workbook(self.file_path, read_only=True, data_only=True)
+        except Exception as e:
+            logger.error(f"Error opening Excel file {self.file_path}: {str(e)}")
+            self.handle_data_load_error(e, query)
+            raise
+
+        try:
+            worksheet = workbook[sheet] if isinstance(sheet, str) else workbook.worksheets[sheet or 0]
+            rows = worksheet.iter_rows(values_only=True)
+
+            # Skip to the header row, then name unnamed columns the way pandas does
+            header = None
+            for _ in range((self.header_row or 0) + 1):
+                header = next(rows, None)
+            if header is None:
+                return
+            columns = [str(name) if name is not None else f"Unnamed: {i}" for i, name in enumerate(header)]
+            width = len(columns)
+
+            start = 0
+            buffer = []
+            for row in rows:
+                if all(value is None for value in row):
+                    continue  # Blank rows are dropped, as in a full load
+                buffer.append(row[:width])
+                if len(buffer) >= chunk_size:
+                    yield self._rows_to_dataframe(buffer, columns, start)
+                    start += len(buffer)
+                    buffer = []
+            if buffer:
+                yield self._rows_to_dataframe(buffer, columns, start)
+        finally:
+            workbook.close()
+
+    def _rows_to_dataframe(self, rows: List[tuple], columns: List[str], start: int) -> pd.DataFrame:
+        """Build a post-processed chunk from worksheet row values"""
+        df = pd.DataFrame.from_records(rows, columns=columns,
+                                       index=pd.RangeIndex(start, start + len(rows)))
+        # Apply the na_values a full load passes to read_excel
+        for col in df.columns:
+            if df[col].dtype == 'object':
+                df[col] = df[col].replace(self.na_values, np.nan)
+        return self._post_process_dataframe(df.infer_objects())
+
     def _post_process_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Perform post-processing on the loaded DataFrame.
@@ -0,0 +1,273 @@
+# data_integration/io/columnar_export.py
+
+"""
+Columnar (Parquet/Feather) export of validation results.
+
+A validation run is written as two tables:
+
+- metrics: one row per rule for the whole population (party is null) and one
+  row per rule and responsible party, with the GC/PC/DNC/error counts;
+- failing rows: every row that failed a rule, with the rule's result and error
+  and the row's input columns, keyed by rule_id, party and row (the row's
+  index label in the validated data).
+
+rule_id and party are categorical, so they are stored dictionary-encoded and a
+dashboard can filter on them without decoding strings. Both tables are built in
+one pass over the evaluation results. Writing and reading need pyarrow.
+"""
+
+import logging
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Output format name -> file extension
+COLUMNAR_FORMATS = {'parquet': '.parquet', 'feather': '.feather'}
+
+METRICS_COLUMNS = [
+    'analytic_id', 'run_timestamp', 'run_status', 'rule_id', 'rule_name', 'category', 'severity',
+    'party', 'status', 'total_count', 'gc_count', 'pc_count', 'dnc_count', 'error_count',
+    'compliance_rate'
+]
+
+# Key columns leading every failing row; input columns with these names are suffixed
+FAILING_ROW_KEYS = ['rule_id', 'party', 'row', 'result', 'error']
+
+_COUNT_KEYS = ('total_count', 'gc_count', 'pc_count', 'dnc_count', 'error_count')
+
+
+def _require_pyarrow() -> None:
+    """Fail with an actionable message if pyarrow is not installed"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        raise ImportError("Parquet and Feather output need pyarrow (pip install pyarrow)") from e
+
+
+def _metrics_row(base: Dict[str, Any], party: Optional[str], status: str,
+                 metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """One metrics record for a rule, overall (party None) or for one party"""
+    row = dict(base, party=party, status=status)
+    for key in _COUNT_KEYS:
+        row[key] = int(metrics.get(key, 0) or 0)
+    row['compliance_rate'] = 1.0 - metrics.get('dnc_rate', 0)
+    return row
+
+
+def _failing_rows(result, rule_id: str, party_column: Optional[str]) -> Optional[pd.DataFrame]:
+    """A rule's failing rows with the key columns in front, or None if none failed"""
+    failing = result.get_failing_items()
+    if failing.empty:
+        return None
+
+    error_column = f"{result.result_column}_Error"
+    data = failing.drop(columns=[c for c in (result.result_column, error_column) if c in failing.columns])
+    data = data.rename(columns=lambda c: f"{c} (data)" if c in FAILING_ROW_KEYS else str(c))
+
+    party = None
+    if party_column in failing.columns:
+        party = failing[party_column].astype(str).where(failing[party_column].notna(), None).to_numpy()
+
+    keys = pd.DataFrame({
+        'rule_id': rule_id,
+        'party': party,
+        'row': failing.index.to_numpy(),
+        'result': failing[result.result_column].to_numpy() if result.result_column in failing.columns else None,
+        'error': failing[error_column].to_numpy() if error_column in failing.columns else None
+    }, index=failing.index)
+    return pd.concat([keys, data], axis=1).reset_index(drop=True)
+
+
+def _categorical(values, categories=None) -> pd.Categorical:
+    """Categorical with string categories, so Arrow writes a string dictionary even when empty"""
+    if categories is None:
+        categories = pd.unique(pd.Series(values).dropna())
+    return pd.Categorical(values, categories=pd.Index(categories, dtype='string'))
+
+
+def _arrow_safe(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert object columns holding mixed types (e.g. Excel cells) to strings"""
+    for column in df.columns:
+        if df[column].dtype == object:
+            if pd.api.types.infer_dtype(df[column], skipna=True) in ('mixed', 'mixed-integer'):
+                df[column] = df[column].map(lambda v: v if pd.isna(v) else str(v)).astype(object)
+    return df
+
+
+def build_columnar_tables(results: Dict[str, Any],
+                          rule_results: Dict[str, Any],
+                          responsible_party_column: Optional[str] = None) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Build the metrics and failing-rows tables from one pass over the results.
+
+    Args:
+        results: Validation results (analytic_id, timestamp and status are copied)
+        rule_results: Rule evaluation results by rule ID
+        responsible_party_column: Column identifying responsible parties
+
+    Returns:
+        Tuple of (metrics DataFrame, failing rows DataFrame)
+    """
+    run = {
+        'analytic_id': results.get('analytic_id'),
+        'run_timestamp': str(results.get('timestamp', '')),
+        'run_status': results.get('status')
+    }
+
+    metric_rows = []
+    failing_parts = []
+    for rule_id, result in rule_results.items():
+        rule = result.rule
+        base = dict(run, rule_id=rule_id, rule_name=rule.name,
+                    category=getattr(rule, 'category', None), severity=getattr(rule, 'severity', None))
+        metric_rows.append(_metrics_row(base, None, result.compliance_status, result.compliance_metrics))
+        for party, party_result in result.party_results.items():
+            metric_rows.append(_metrics_row(base, str(party), party_result['status'], party_result['metrics']))
+
+        failing = _failing_rows(result, rule_id, responsible_party_column)
+        if failing is not None:
+            failing_parts.append(failing)
+
+    rule_ids = list(rule_results)
+    metrics_df = pd.DataFrame(metric_rows, columns=METRICS_COLUMNS)
+    metrics_df['rule_id'] = _categorical(metrics_df['rule_id'], rule_ids)
+    metrics_df['party'] = _categorical(metrics_df['party'])
+
+    if failing_parts:
+        failing_df = pd.concat(failing_parts, ignore_index=True)
+    else:
+        failing_df = pd.DataFrame(columns=FAILING_ROW_KEYS)
+    failing_df['rule_id'] = _categorical(failing_df['rule_id'], rule_ids)
+    failing_df['party'] = _categorical(failing_df['party'])
+
+    return metrics_df, _arrow_safe(failing_df)
+
+
+def _write_table(df: pd.DataFrame, path: Path, fmt: str) -> None:
+    """Write a table in the given columnar format"""
+    if fmt == 'parquet':
+        df.to_parquet(path, index=False)
+    else:
+        df.to_feather(path)
+
+
+def write_columnar_results(results: Dict[str, Any],
+                           rule_results: Dict[str, Any],
+                           output_dir: Path,
+                           file_stem: str,
+                           fmt: str = 'parquet',
+                           responsible_party_column: Optional[str] = None) -> List[str]:
+    """
+    Write the metrics and failing-rows tables of a validation run.
+
+    Args:
+        results: Validation results
+        rule_results: Rule evaluation results by rule ID
+        output_dir: Directory for the files
+        file_stem: File name prefix (e.g. "<analytic_id>_<timestamp>")
+        fmt: 'parquet' or 'feather'
+        responsible_party_column: Column identifying responsible parties
+
+    Returns:
+        Paths of the metrics file and the failing-rows file
+    """
+    fmt = fmt.lower()
+    if fmt not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported columnar format: {fmt}")
+    _require_pyarrow()
+
+    metrics_df, failing_df = build_columnar_tables(results, rule_results, responsible_party_column)
+
+    extension = COLUMNAR_FORMATS[fmt]
+    metrics_path = Path(output_dir) / f"{file_stem}_metrics{extension}"
+    failing_path = Path(output_dir) / f"{file_stem}_failing_rows{extension}"
+    _write_table(metrics_df, metrics_path, fmt)
+    _write_table(failing_df, failing_path, fmt)
+    logger.info(f"Wrote {len(metrics_df)} metric rows and {len(failing_df)} failing rows as {fmt}")
+    return [str(metrics_path), str(failing_path)]
+
+
+def is_columnar_path(path: str) -> bool:
+    """Whether a file is a columnar results file, by extension"""
+    return Path(path).suffix.lower() in COLUMNAR_FORMATS.values()
+
+
+def read_columnar_table(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a metrics or failing-rows file.
+
+    Args:
+        path: Parquet or Feather file
+        columns: Columns to read (default: all)
+
+    Returns:
+        DataFrame with rule_id and party as categoricals
+    """
+    _require_pyarrow()
+    if Path(path).suffix.lower() == COLUMNAR_FORMATS['feather']:
+        return pd.read_feather(path, columns=columns)
+    return pd.read_parquet(path, columns=columns)
+
+
+def results_from_metrics(metrics_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Rebuild validation result dictionaries from a metrics table.
+
+    The dictionaries have the rule_results (with party_results) and
+    grouped_summary that the analytics aggregator reads. A table holding
+    several runs (e.g. concatenated files) gives one dictionary per run.
+
+    Args:
+        metrics_df: Table written by write_columnar_results
+
+    Returns:
+        One result dictionary per (analytic_id, run_timestamp)
+    """
+    result_dicts = []
+    run_keys = ['analytic_id', 'run_timestamp']
+    for (analytic_id, run_timestamp), run_df in metrics_df.groupby(run_keys, sort=False, dropna=False,
+                                                                   observed=True):
+        rule_results: Dict[str, Dict[str, Any]] = {}
+        grouped = defaultdict(lambda: {'total_rules': 0, 'GC': 0, 'PC': 0, 'DNC': 0})
+
+        for row in run_df.to_dict('records'):
+            rule_id = str(row['rule_id'])
+            counts = {key: int(row[key]) for key in _COUNT_KEYS}
+            if pd.isna(row['party']):
+                rule_results.setdefault(rule_id, {'party_results': {}}).update({
+                    'rule_id': rule_id,
+                    'rule_name': row['rule_name'],
+                    'category': row['category'],
+                    'severity': row['severity'],
+                    'compliance_status': row['status'],
+                    'compliance_rate': row['compliance_rate'],
+                    'total_items': counts['total_count'],
+                    'gc_count': counts['gc_count'],
+                    'pc_count': counts['pc_count'],
+                    'dnc_count': counts['dnc_count'],
+                    'error_count': counts['error_count']
+                })
+            else:
+                party = str(row['party'])
+                rule_results.setdefault(rule_id, {'party_results': {}})['party_results'][party] = {
+                    'status': row['status'],
+                    'metrics': dict(counts, dnc_rate=1.0 - row['compliance_rate'])
+                }
+                grouped[party]['total_rules'] += 1
+                grouped[party][row['status']] = grouped[party].get(row['status'], 0) + 1
+
+        for stats in grouped.values():
+            stats['compliance_rate'] = stats['GC'] / stats['total_rules']
+
+        result_dicts.append({
+            'analytic_id': None if pd.isna(analytic_id) else analytic_id,
+            'timestamp': run_timestamp,
+            'status': run_df['run_status'].iloc[0],
+            'rule_results': rule_results,
+            'grouped_summary': dict(grouped)
+        })
+    return result_dicts
@@ -150,7 +150,8 @@ class DateDetector:
     def convert_date_columns(self, 
                            df: pd.DataFrame, 
                            columns: Optional[List[str]] = None,
-                           errors: str = 'coerce') -> Tuple[pd.DataFrame, Dict[str, Dict[str, Any]]]:
+                           errors: str = 'coerce',
+                           formats: Optional[Dict[str, str]] = None) -> Tuple[pd.DataFrame, Dict[str, Dict[str, Any]]]:
         """
         Convert specified columns to datetime format.
         
@@ -158,6 +159,8 @@ class DateDetector:
             df: Input DataFrame
             columns: List of columns to convert (if None, auto-detect)
             errors: How to handle parsing errors ('raise', 'coerce', 'ignore')
+            formats: Date format to use per column instead of detecting one
+                     (e.g. the formats reported for an earlier chunk of the same file)
             
         Returns:
             Tuple of (converted DataFrame, conversion report)
@@ -177,7 +180,7 @@ class DateDetector:
                 continue
                 
             # Get the detected format or try to detect it
-            date_format = self._format_cache.get(col)
+            date_format = (formats or {}).get(col) or self._format_cache.get(col)
             if not date_format:
                 sample_data = self._get_sample_data(df[col])
                 date_format, _ = self._detect_date_format(sample_data)
@@ -4,13 +4,14 @@ import pandas as pd
 import os
 import logging
 import datetime
-from typing import Dict, List, Any, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Any, Optional, Tuple, Union
 from pathlib import Path
 
 # Import our connectors
 from ..connectors import get_connector_for_file
 from .data_validator import DataValidator, DataValidationError
 from .date_detector import DateDetector
+from utils.tracing import NULL_TRACER, Tracer
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,7 @@ class DataImporter:
                   detect_dates: bool = True,
                   date_columns: Optional[List[str]] = None,
                   date_formats: Optional[List[str]] = None,
+                  tracer: Optional[Tracer] = None,
                   **kwargs) -> Union[pd.DataFrame, Tuple[pd.DataFrame, Dict[str, Any]]]:
         """
         Load data from a file into a DataFrame using the appropriate connector.
@@ -43,11 +45,13 @@ class DataImporter:
             detect_dates: Whether to auto-detect and convert date columns (default: True)
             date_columns: Specific columns to convert to dates (if None, auto-detect)
             date_formats: Additional date formats to try during detection
+            tracer: Optional tracer timing the read and date detection steps
             **kwargs: Additional parameters specific to the file type
 
         Returns:
             DataFrame or tuple of (DataFrame, validation_results) if validate is provided
         """
+        tracer = tracer or NULL_TRACER
         try:
             # Get appropriate connector for file type
             connector = get_connector_for_file(file_path, **kwargs)
@@ -63,7 +67,9 @@ class DataImporter:
                 params['range'] = range
 
             # Load data
-            df = connector.get_data(query, params)
+            with tracer.span("read") as read_span:
+                df = connector.get_data(query, params)
+                read_span.set_rows(len(df))
 
             # Close connection
             connector.disconnect()
@@ -76,10 +82,12 @@ class DataImporter:
                 detector = DateDetector(additional_formats=date_formats)
                 
                 # Convert date columns
-                df, conversion_report = detector.convert_date_columns(
-                    df, 
-                    columns=date_columns  # None means auto-detect
-                )
+                with tracer.span("date_detection", rows=len(df)) as date_span:
+                    df, conversion_report = detector.convert_date_columns(
+                        df, 
+                        columns=date_columns  # None means auto-detect
+                    )
+                    date_span.set(converted_columns=len(conversion_report))
                 
                 # Log conversion results
                 for col, report in conversion_report.items():
@@ -111,6 +119,57 @@ class DataImporter:
             logger.error(f"Error loading file {file_path}: {str(e)}")
             raise
 
+    @staticmethod
+    def iter_file_chunks(file_path: str,
+                         chunk_size: int,
+                         sheet_name: Optional[str] = None,
+                         range: Optional[str] = None,
+                         detect_dates: bool = True,
+                         date_columns: Optional[List[str]] = None,
+                         date_formats: Optional[List[str]] = None,
+                         **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        Load a data file in chunks using the appropriate connector.
+
+        Date columns and their formats are detected on the first chunk, and
+        every later chunk converts the same columns with the same formats, so
+        all chunks share dtypes and parse a column alike.
+
+        Args:
+            file_path: Path to the data file
+            chunk_size: Maximum number of rows per chunk
+            sheet_name: Name of sheet to load (for Excel files)
+            range: Cell range to load (for Excel files)
+            detect_dates: Whether to auto-detect and convert date columns (default: True)
+            date_columns: Specific columns to convert to dates (if None, auto-detect)
+            date_formats: Additional date formats to try during detection
+            **kwargs: Additional parameters specific to the file type
+
+        Returns:
+            Iterator over DataFrame chunks
+        """
+        connector = get_connector_for_file(file_path, **kwargs)
+        if not connector.connect():
+            raise ConnectionError(f"Failed to connect to file: {file_path}")
+
+        params = {'range': range} if range else None
+        detector = DateDetector(additional_formats=date_formats) if (detect_dates or date_columns) else None
+        column_formats = None
+        try:
+            for chunk in connector.iter_chunks(chunk_size, sheet_name, params):
+                if detector is not None:
+                    chunk, conversion_report = detector.convert_date_columns(
+                        chunk, columns=date_columns, formats=column_formats
+                    )
+                    if column_formats is None:
+                        # Later chunks convert exactly the columns and formats found in the first one
+                        column_formats = {col: report['format'] for col, report in conversion_report.items()}
+                        if date_columns is None:
+                            date_columns = list(column_formats)
+                yield chunk
+        finally:
+            connector.disconnect()
+
     # Other existing methods...
 
     # data_integration/io/importer.py - update the validate_dataframe method
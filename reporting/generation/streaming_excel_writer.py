@@ -0,0 +1,220 @@
+# reporting/generation/streaming_excel_writer.py
+
+"""
+Constant-memory writer for the detailed Excel report.
+
+Rows are written straight from the validation results to xlsxwriter in
+constant_memory mode, which flushes each row to disk as soon as the next one
+starts, so the workbook is never held in memory. Failing rows are read a block
+at a time, sized to stay under a memory ceiling.
+
+Sheets: Summary, Rules, Data Sample, By Category, By Severity,
+By Responsible Party and one Rule_<id> sheet per rule with failures.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+import xlsxwriter
+
+from utils.memory_profiler import frame_memory
+
+logger = logging.getLogger(__name__)
+
+# Memory the failing-row blocks of one rule may occupy at a time
+DEFAULT_MEMORY_LIMIT_MB = 64
+
+# Failing rows written per rule sheet (None writes them all)
+MAX_FAILURES_PER_RULE = 1000
+
+# Rows of the input written to the Data Sample sheet
+DATA_SAMPLE_ROWS = 100
+
+# Rows used to estimate the in-memory size of a failing row
+_SIZE_SAMPLE_ROWS = 1000
+
+# Last worksheet row xlsxwriter accepts (zero-based)
+_EXCEL_MAX_ROW = 1048575
+
+# Status highlighting on the Rules sheet: (text, background, font)
+_STATUS_COLORS = [('GC', '#C6EFCE', '#006100'), ('PC', '#FFEB9C', '#9C6500'), ('DNC', '#FFC7CE', '#9C0006')]
+
+
+def _cell_values(df: pd.DataFrame) -> Iterable[tuple]:
+    """Rows of a DataFrame as tuples of values xlsxwriter can write (missing values as None)"""
+    values = df.astype(object)
+    for column in values.columns:
+        kind = pd.api.types.infer_dtype(values[column], skipna=True)
+        if kind in ('mixed', 'mixed-integer', 'period', 'interval', 'unknown-array'):
+            # Lists, dicts and other objects are written as their text
+            values[column] = values[column].map(
+                lambda v: v if v is None or isinstance(v, (str, int, float, bool)) else str(v)
+            )
+    values = values.where(df.notna(), None)
+    return values.itertuples(index=False, name=None)
+
+
+class StreamingExcelReportWriter:
+    """
+    Writes the detailed validation report with bounded memory.
+    """
+
+    def __init__(self,
+                 output_path: str,
+                 memory_limit_mb: float = DEFAULT_MEMORY_LIMIT_MB,
+                 max_failures_per_rule: Optional[int] = MAX_FAILURES_PER_RULE):
+        """
+        Initialize the writer.
+
+        Args:
+            output_path: Path of the .xlsx file to write
+            memory_limit_mb: Memory ceiling for the failing rows read at once
+            max_failures_per_rule: Failing rows written per rule sheet (None for all)
+        """
+        self.output_path = str(output_path)
+        self.memory_limit_bytes = int(memory_limit_mb * 1024 * 1024)
+        self.max_failures_per_rule = max_failures_per_rule
+        self._workbook = None
+        self._formats: Dict[str, Any] = {}
+
+    def write(self,
+              results: Dict[str, Any],
+              rule_results: Dict[str, Any],
+              data_df: pd.DataFrame,
+              execution_time: float) -> str:
+        """
+        Write the report.
+
+        Args:
+            results: Validation results
+            rule_results: Rule evaluation results by rule ID
+            data_df: Input DataFrame (the first rows are written as a sample)
+            execution_time: Run time reported on the Summary sheet, in seconds
+
+        Returns:
+            Path of the written report
+        """
+        self._workbook = xlsxwriter.Workbook(self.output_path, {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+            'nan_inf_to_errors': True,
+            'remove_timezone': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+        })
+        self._formats = {}
+        try:
+            self._write_summary(results, execution_time)
+            self._write_rules(results)
+            self._write_frame('Data Sample', data_df.head(DATA_SAMPLE_ROWS))
+            self._write_breakdowns(results)
+            for rule_id, result in rule_results.items():
+                # Excel sheet names have 31 char limit
+                sheet_name = f"Rule_{rule_id[-20:]}" if len(rule_id) > 20 else f"Rule_{rule_id}"
+                self._write_failures(sheet_name, result)
+        finally:
+            self._workbook.close()
+            self._workbook = None
+        return self.output_path
+
+    def _format(self, name: str):
+        """Workbook format by name, created once per workbook"""
+        if name not in self._formats:
+            if name == 'header':
+                properties = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+            else:
+                _, background, font = next(c for c in _STATUS_COLORS if c[0] == name)
+                properties = {'bg_color': background, 'font_color': font}
+            self._formats[name] = self._workbook.add_format(properties)
+        return self._formats[name]
+
+    def _write_table(self, sheet_name: str, columns: List[str], rows: Iterable[Iterable[Any]]):
+        """Write a header and rows to a new sheet, in row order"""
+        worksheet = self._workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, [str(c) for c in columns], self._format('header'))
+        row_number = 0
+        for row_number, row in enumerate(rows, start=1):
+            worksheet.write_row(row_number, 0, row)
+        return worksheet, row_number
+
+    def _write_frame(self, sheet_name: str, df: pd.DataFrame) -> None:
+        """Write a small DataFrame to a new sheet"""
+        self._write_table(sheet_name, list(df.columns), _cell_values(df))
+
+    def _write_summary(self, results: Dict[str, Any], execution_time: float) -> None:
+        summary = results['summary']
+        counts = summary['compliance_counts']
+        self._write_table('Summary', ['Metric', 'Value'], [
+            ('Status', results['status']),
+            ('Total Rules', summary['total_rules']),
+            ('GC Count', counts['GC']),
+            ('PC Count', counts['PC']),
+            ('DNC Count', counts['DNC']),
+            ('Compliance Rate', f"{summary['compliance_rate']:.2%}"),
+            ('Execution Time', f"{execution_time:.2f} seconds")
+        ])
+
+    def _write_rules(self, results: Dict[str, Any]) -> None:
+        if not results['rule_results']:
+            return
+        worksheet, last_row = self._write_table(
+            'Rules',
+            ['Rule ID', 'Rule Name', 'Status', 'Total Items', 'GC Count', 'PC Count', 'DNC Count',
+             'Compliance Rate'],
+            ((rule_id, rule['rule_name'], rule['compliance_status'], rule['total_items'], rule['gc_count'],
+              rule['pc_count'], rule['dnc_count'], rule['compliance_rate'])
+             for rule_id, rule in results['rule_results'].items())
+        )
+        status_range = f"C2:C{max(last_row + 1, 1000)}"
+        for status, _, _ in _STATUS_COLORS:
+            worksheet.conditional_format(status_range, {'type': 'text', 'criteria': 'containing',
+                                                        'value': status, 'format': self._format(status)})
+
+    def _write_breakdowns(self, results: Dict[str, Any]) -> None:
+        """By Category, By Severity and By Responsible Party sheets"""
+        rule_stats = results['summary'].get('rule_stats')
+        if rule_stats:
+            for sheet_name, label, key in [('By Category', 'Category', 'by_category'),
+                                           ('By Severity', 'Severity', 'by_severity')]:
+                if rule_stats[key]:
+                    self._write_table(sheet_name, [label, 'Total Rules', 'GC', 'PC', 'DNC', 'Compliance Rate'], (
+                        (name, stats['count'], stats['GC'], stats['PC'], stats['DNC'],
+                         stats['GC'] / stats['count'] if stats['count'] > 0 else 0)
+                        for name, stats in rule_stats[key].items()
+                    ))
+
+        if results.get('grouped_summary'):
+            self._write_table(
+                'By Responsible Party',
+                ['Responsible Party', 'Total Rules', 'GC', 'PC', 'DNC', 'Compliance Rate'],
+                ((party, stats['total_rules'], stats['GC'], stats['PC'], stats['DNC'], stats['compliance_rate'])
+                 for party, stats in results['grouped_summary'].items())
+            )
+
+    def _block_rows(self, result) -> int:
+        """Evaluated rows per block so one block of failing rows fits the memory ceiling"""
+        sample = result.evaluated_df.head(_SIZE_SAMPLE_ROWS)
+        if result.source_df is not None:
+            sample = pd.concat([result.source_df.head(_SIZE_SAMPLE_ROWS), sample], axis=1)
+        row_bytes = frame_memory(sample) / max(len(sample), 1)
+        return max(1, int(self.memory_limit_bytes / max(row_bytes, 1.0)))
+
+    def _write_failures(self, sheet_name: str, result) -> None:
+        """Stream a rule's failing rows to its sheet; rules without failures get no sheet"""
+        limit = _EXCEL_MAX_ROW if self.max_failures_per_rule is None else self.max_failures_per_rule
+        worksheet = None
+        columns = None
+        written = 0
+        for block in result.iter_failing_items(self._block_rows(result)):
+            if worksheet is None:
+                columns = list(block.columns)
+                worksheet, _ = self._write_table(sheet_name, columns, [])
+            block = block.reindex(columns=columns).head(limit - written)
+            for row in _cell_values(block):
+                written += 1
+                worksheet.write_row(written, 0, row)
+            if written >= limit:
+                break
+        if written:
+            logger.debug(f"Wrote {written} failing rows to {sheet_name}")
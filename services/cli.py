@@ -0,0 +1,183 @@
+# services/cli.py
+
+"""
+Headless command-line entry point for the validation pipeline.
+
+Runs one or more analytics against one or more data files and writes the
+requested outputs, without Qt. Excel COM, openpyxl and xlsxwriter are only
+loaded if the chosen backend or output format needs them.
+
+Example:
+    python -m services.cli data/extract.xlsx --analytic QA-101 --analytic QA-102 \\
+        --party-column "Audit Leader" --format json excel --backend native
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS = ("json", "excel", "excel_template", "html", "csv", "parquet", "feather")
+
+# Run statuses that mean the analytic could not be evaluated
+FAILED_STATUSES = ("ERROR", "SCHEMA_VALIDATION_FAILED", "PRE_VALIDATION_FAILED", "NO_RULES_FOUND")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Command-line arguments of the batch runner"""
+    parser = argparse.ArgumentParser(
+        prog="python -m services.cli",
+        description="Run validation analytics against data files without the desktop application."
+    )
+    parser.add_argument("data_files", nargs="+", help="Excel or CSV files to validate")
+    parser.add_argument("--analytic", dest="analytics", action="append", default=[],
+                        help="Analytic ID to run (repeatable; default: all rules in one run)")
+    parser.add_argument("--rule-id", dest="rule_ids", action="append", default=[],
+                        help="Run only this rule (repeatable)")
+    parser.add_argument("--rules-dir", default="./data/rules", help="Directory of saved rules")
+    parser.add_argument("--rule-config", dest="rule_configs", action="append", default=[],
+                        help="YAML rule configuration file to load (repeatable)")
+    parser.add_argument("--sheet", help="Worksheet to read from Excel files")
+    parser.add_argument("--party-column", help="Column identifying responsible parties")
+    parser.add_argument("--format", dest="formats", nargs="+", choices=OUTPUT_FORMATS, default=["json"],
+                        help="Output formats to write (default: json)")
+    parser.add_argument("--output-dir", default="./output", help="Directory for output files")
+    parser.add_argument("--backend", choices=("auto", "native", "excel", "sqlite"), default="native",
+                        help="Formula backend (default: native, which needs no Excel; sqlite evaluates out of core)")
+    parser.add_argument("--parallel", choices=("thread", "process"),
+                        help="Evaluate rules in parallel with threads or processes")
+    parser.add_argument("--workers", type=int, default=4, help="Maximum parallel workers")
+    parser.add_argument("--chunk-size", type=int, help="Stream files in chunks of this many rows")
+    parser.add_argument("--excel-memory-mb", type=float,
+                        help="Memory ceiling for failing rows read at once by the Excel export")
+    parser.add_argument("--result-memory-mb", type=float,
+                        help="Memory budget for kept rule results before the oldest spill to disk")
+    parser.add_argument("--no-cache", action="store_true", help="Do not reuse cached rule results")
+    parser.add_argument("--profile-memory", action="store_true",
+                        help="Record per-stage memory use in the results")
+    parser.add_argument("--summary", help="Write a JSON summary of all runs to this file")
+    parser.add_argument("--log-level", default="WARNING",
+                        choices=("DEBUG", "INFO", "WARNING", "ERROR"), help="Logging level")
+    return parser
+
+
+def summarize_run(data_file: str, analytic_id: Optional[str], results: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Condense a validation run's results for the batch summary.
+
+    Args:
+        data_file: Data file that was validated
+        analytic_id: Analytic that was run (None for all rules)
+        results: Results from ValidationPipeline.validate_data_source
+
+    Returns:
+        Dictionary with the run's status, rule counts, timing and output files
+    """
+    summary = results.get('summary', {})
+    return {
+        'data_file': data_file,
+        'analytic_id': analytic_id,
+        'status': results.get('status'),
+        'valid': results.get('valid'),
+        'total_rules': summary.get('total_rules', 0),
+        'compliance_counts': summary.get('compliance_counts', {}),
+        'row_count': results.get('data_metrics', {}).get('row_count'),
+        'execution_time': results.get('execution_time'),
+        'output_files': results.get('output_files', []),
+        'error': results.get('error')
+    }
+
+
+def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """
+    Run every requested analytic against every data file.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        One summary per run, in the order they ran
+    """
+    # The pipeline is imported here so --help stays instant
+    from core.rule_engine.rule_evaluator import RuleEvaluator
+    from core.rule_engine.rule_manager import ValidationRuleManager
+    from services.validation_service import ValidationPipeline
+
+    rule_manager = ValidationRuleManager(rules_directory=args.rules_dir)
+    pipeline = ValidationPipeline(
+        rule_manager=rule_manager,
+        evaluator=RuleEvaluator(rule_manager=rule_manager, formula_backend=args.backend),
+        output_dir=args.output_dir,
+        max_workers=args.workers,
+        rule_config_paths=args.rule_configs or None,
+        parallel_mode=args.parallel or "thread",
+        excel_memory_limit_mb=args.excel_memory_mb,
+        result_memory_budget_mb=args.result_memory_mb
+    )
+
+    data_source_params = {'sheet_name': args.sheet} if args.sheet else None
+    runs = []
+    for data_file in args.data_files:
+        for analytic_id in args.analytics or [None]:
+            logger.info(f"Validating {data_file} (analytic: {analytic_id or 'all rules'})")
+            results = pipeline.validate_data_source(
+                data_source=data_file,
+                rule_ids=args.rule_ids or None,
+                analytic_id=analytic_id,
+                responsible_party_column=args.party_column,
+                data_source_params=data_source_params,
+                output_formats=args.formats,
+                use_parallel=args.parallel is not None,
+                use_all_rules=analytic_id is None and not args.rule_ids,
+                use_cache=not args.no_cache,
+                chunk_size=args.chunk_size,
+                profile_memory=args.profile_memory
+            )
+            runs.append(summarize_run(data_file, analytic_id, results))
+    return runs
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Run the batch validation command.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code: 0 if every analytic ran, 1 if any could not be evaluated
+    """
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=getattr(logging, args.log_level),
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+    missing = [f for f in args.data_files if not Path(f).exists()]
+    if missing:
+        print(f"Data file not found: {', '.join(missing)}", file=sys.stderr)
+        return 1
+
+    runs = run(args)
+    for summary in runs:
+        counts = summary['compliance_counts']
+        line = (f"{summary['data_file']} [{summary['analytic_id'] or 'all rules'}]: {summary['status']} - "
+                f"{summary['total_rules']} rules (GC {counts.get('GC', 0)}, PC {counts.get('PC', 0)}, "
+                f"DNC {counts.get('DNC', 0)})")
+        if summary['error']:
+            line += f" - {summary['error']}"
+        print(line)
+        for output_file in summary['output_files']:
+            print(f"  {output_file}")
+
+    if args.summary:
+        with open(args.summary, 'w') as f:
+            json.dump(runs, f, indent=2, default=str)
+
+    return 1 if any(summary['status'] in FAILED_STATUSES for summary in runs) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
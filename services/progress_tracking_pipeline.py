@@ -13,6 +13,7 @@ import pandas as pd
 from services.validation_service import ValidationPipeline
 from core.rule_engine.rule_manager import ValidationRule
 from core.rule_engine.rule_evaluator import RuleEvaluationResult
+from core.rule_engine.rule_scheduler import RuleCostModel
 
 logger = logging.getLogger(__name__)
 
@@ -22,9 +23,11 @@ class ProgressTrackingEvaluator:
     Wrapper for RuleEvaluator that tracks progress during rule evaluation.
     """
     
-    def __init__(self, base_evaluator, progress_callback: Optional[Callable] = None):
+    def __init__(self, base_evaluator, progress_callback: Optional[Callable] = None, performance_store=None):
         self.base_evaluator = base_evaluator
         self.progress_callback = progress_callback
+        self.performance_store = performance_store
+        self.last_rule_timings: List[Dict[str, Any]] = []
         self._total_rules = 0
         self._completed_rules = 0
         self._current_rule_name = ""
@@ -34,7 +37,19 @@ class ProgressTrackingEvaluator:
     def cancel(self):
         """Request cancellation."""
         self._cancel_requested.set()
-        
+
+    def _predict_rule_seconds(self, rule_objs: List[Optional[ValidationRule]], num_rows: int) -> List[float]:
+        """
+        Predict each rule's evaluation time from its performance history and formula.
+
+        Rules that cannot be resolved get a nominal weight of one second.
+        """
+        known_ids = [rule_obj.rule_id for rule_obj in rule_objs if rule_obj is not None]
+        history = self.performance_store.seconds_per_row(known_ids) if self.performance_store else {}
+        cost_model = RuleCostModel(history)
+        return [cost_model.estimate(rule_obj, num_rows) if rule_obj is not None else 1.0
+                for rule_obj in rule_objs]
+
     def evaluate_multiple_rules(
         self,
         rules: List[Union[str, ValidationRule]],
@@ -47,6 +62,12 @@ class ProgressTrackingEvaluator:
         results = {}
         self._total_rules = len(rules)
         self._completed_rules = 0
+        self._start_time = time.time()
+        self.last_rule_timings = []
+
+        rule_objs = [self.base_evaluator.rule_manager.get_rule(rule) if isinstance(rule, str) else rule
+                     for rule in rules]
+        predicted = self._predict_rule_seconds(rule_objs, len(data_df))
         
         for i, rule in enumerate(rules):
             # Check cancellation
@@ -55,8 +76,8 @@ class ProgressTrackingEvaluator:
                 break
                 
             # Get rule details
+            rule_obj = rule_objs[i]
             if isinstance(rule, str):
-                rule_obj = self.base_evaluator.rule_manager.get_rule(rule)
                 rule_id = rule
                 rule_name = rule_obj.name if rule_obj else f"Rule {rule}"
             else:
@@ -70,11 +91,11 @@ class ProgressTrackingEvaluator:
                 progress = int((i / self._total_rules) * 100)
                 elapsed = time.time() - self._start_time
                 
-                # Estimate time remaining
-                if i > 0:
-                    avg_time_per_rule = elapsed / i
-                    remaining_rules = self._total_rules - i
-                    eta_seconds = avg_time_per_rule * remaining_rules
+                # Estimate time remaining, weighting rules by their predicted cost
+                # and scaling the predictions by how the finished rules compared
+                predicted_done = sum(predicted[:i])
+                if i > 0 and predicted_done > 0:
+                    eta_seconds = elapsed / predicted_done * sum(predicted[i:])
                     eta_str = f" (ETA: {int(eta_seconds)}s)" if eta_seconds < 300 else ""
                 else:
                     eta_str = ""
@@ -84,8 +105,15 @@ class ProgressTrackingEvaluator:
                 
             try:
                 # Evaluate the rule using base evaluator
+                rule_start, rule_cpu_start = time.perf_counter(), time.thread_time()
                 result = self.base_evaluator.evaluate_rule(rule, data_df, responsible_party_column)
                 results[rule_id] = result
+                self.last_rule_timings.append({
+                    'rule_id': rule_id,
+                    'rule_name': rule_name,
+                    'seconds': time.perf_counter() - rule_start,
+                    'cpu_seconds': time.thread_time() - rule_cpu_start
+                })
                 
             except Exception as e:
                 logger.error(f"Error evaluating rule {rule_id}: {str(e)}")
@@ -172,7 +200,8 @@ class ProgressTrackingPipeline:
             # Create progress tracking evaluator
             self._progress_evaluator = ProgressTrackingEvaluator(
                 original_evaluator, 
-                progress_callback
+                progress_callback,
+                performance_store=getattr(self.pipeline, 'performance_store', None)
             )
             
             # Temporarily replace the pipeline's evaluator
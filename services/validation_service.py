@@ -9,22 +9,38 @@ import os
 import shutil
 from pathlib import Path
 import datetime
-import concurrent.futures
-import pythoncom
+import contextlib
 from collections import defaultdict
 
 # Import our components
-from core.formula_engine.excel_formula_processor import ExcelFormulaProcessor
 from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
 from core.rule_engine.rule_evaluator import RuleEvaluator, RuleEvaluationResult
-from core.rule_engine.compliance_determiner import ComplianceDeterminer
+from core.rule_engine.compliance_determiner import ComplianceDeterminer, party_status_matrix, status_counts_by_party
+from core.rule_engine.result_cache import RuleResultCache
+from core.rule_engine.incremental_store import IncrementalResultStore
+from core.rule_engine.streaming_validator import StreamingValidator
+from core.rule_engine.process_pool_evaluator import ProcessPoolRuleEvaluator
+from core.rule_engine.rule_scheduler import RuleCostModel, WorkStealingScheduler
+from core.rule_engine.performance_store import RulePerformanceStore
+from core.rule_engine.result_store import RuleResultStore
+from core.rule_engine.row_index import PartyCodesCache
+from utils.tracing import NULL_TRACER, Tracer
+from utils.memory_profiler import NULL_MEMORY_PROFILER, MemoryProfiler
 from data_integration.io.importer import DataImporter
 from data_integration.io.data_validator import DataValidator
-from reporting.generation.report_generator import ReportGenerator  # Assuming this will be implemented
+from data_integration.io.columnar_export import (
+    COLUMNAR_FORMATS, is_columnar_path, read_columnar_table, results_from_metrics, write_columnar_results
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _create_report_generator(*args, **kwargs):
+    """Create a ReportGenerator, importing it (and its Excel libraries) only when a report is needed"""
+    from reporting.generation.report_generator import ReportGenerator
+    return ReportGenerator(*args, **kwargs)
+
+
 class ValidationPipeline:
     """
     Orchestrates the validation process by connecting data sources,
@@ -39,7 +55,13 @@ class ValidationPipeline:
                  archive_dir: Optional[str] = None,
                  max_workers: int = 4,
                  rule_config_paths: Optional[List[str]] = None,
-                 report_config_path: Optional[str] = None):
+                 report_config_path: Optional[str] = None,
+                 result_cache: Optional[RuleResultCache] = None,
+                 incremental_store: Optional[IncrementalResultStore] = None,
+                 parallel_mode: str = "thread",
+                 performance_store: Optional[RulePerformanceStore] = None,
+                 excel_memory_limit_mb: Optional[float] = None,
+                 result_memory_budget_mb: Optional[float] = None):
         """
         Initialize the validation pipeline.
 
@@ -53,11 +75,22 @@ class ValidationPipeline:
             max_workers: Maximum number of worker threads for parallel processing
             rule_config_paths: List of paths to YAML rule configuration files
             report_config_path: Path to YAML report configuration file
+            result_cache: Cache of rule results (default: under data/temp)
+            incremental_store: Per-source row results for incremental runs (default: under data/temp)
+            parallel_mode: How use_parallel evaluates rules: "thread" (thread pool, capped at
+                           4 workers for Excel COM) or "process" (process pool over
+                           shared-memory columns, native backend only)
+            performance_store: History of per-rule evaluation times (default: SQLite under data/)
+            excel_memory_limit_mb: Memory ceiling for the failing rows the basic Excel export
+                                   reads at once (default: 64 MB)
+            result_memory_budget_mb: Memory the result columns of kept rule results may use
+                                     before the oldest are spilled to memory-mapped files
+                                     (default: no limit)
         """
         self.rule_manager = rule_manager or ValidationRuleManager()
         self.evaluator = evaluator or RuleEvaluator(rule_manager=self.rule_manager)
         self.data_importer = data_importer or DataImporter()
-        self.report_generator = ReportGenerator()
+        self._report_generator = None
 
         # Set output directory
         self.output_dir = Path(output_dir) if output_dir else Path("./output")
@@ -73,6 +106,28 @@ class ValidationPipeline:
 
         # Set maximum worker threads for parallel processing
         self.max_workers = max_workers
+        self.parallel_mode = parallel_mode
+        self.last_parallel_stats = None
+
+        # Rule cost estimates for parallel scheduling, refined by measured runtimes
+        self.cost_model = RuleCostModel()
+        self.performance_store = performance_store or RulePerformanceStore()
+
+        # Timing spans and (opt-in) memory profile of the current validation run
+        self.tracer = NULL_TRACER
+        self.memory_profiler = NULL_MEMORY_PROFILER
+
+        # Reuse results of rules whose formula and referenced data are unchanged
+        self.result_cache = result_cache or RuleResultCache()
+
+        # Re-evaluate only new or changed rows of registered data sources
+        self.incremental_store = incremental_store or IncrementalResultStore()
+
+        # Rule results keep only their result columns; the oldest spill to disk over budget
+        self.result_store = RuleResultStore(memory_budget_mb=result_memory_budget_mb)
+
+        # Memory ceiling of the streaming Excel export (None uses the writer's default)
+        self.excel_memory_limit_mb = excel_memory_limit_mb
 
         # Store rule configuration paths
         self.rule_config_paths = rule_config_paths or []
@@ -81,23 +136,35 @@ class ValidationPipeline:
         if self.rule_config_paths:
             self._load_rule_configurations()
 
-        # Initialize report generator with proper error handling
+        # Configure the report generator; it is created on first use
         # Look for template file for individual rule tabs
         template_path = None
         if self.output_dir.parent / "templates" / "qa_report_template.xlsx":
             template_path = str(self.output_dir.parent / "templates" / "qa_report_template.xlsx")
+        self._report_template_path = template_path
+        self._report_config_path = None
         
         if report_config_path:
             if os.path.exists(report_config_path):
-                logger.info(f"Initializing report generator with configuration: {report_config_path}")
-                self.report_generator = ReportGenerator(report_config_path, template_path=template_path)
+                logger.info(f"Using report configuration: {report_config_path}")
+                self._report_config_path = report_config_path
             else:
                 logger.warning(f"Report configuration file not found: {report_config_path}")
                 logger.info("Using default report configuration")
-                self.report_generator = ReportGenerator(template_path=template_path)
         else:
-            logger.info("Initializing report generator with default configuration")
-            self.report_generator = ReportGenerator(template_path=template_path)
+            logger.info("Using default report configuration")
+
+    @property
+    def report_generator(self):
+        """Report generator, created on first use so headless runs without reports never load it"""
+        if self._report_generator is None:
+            args = (self._report_config_path,) if self._report_config_path else ()
+            self._report_generator = _create_report_generator(*args, template_path=self._report_template_path)
+        return self._report_generator
+
+    @report_generator.setter
+    def report_generator(self, report_generator) -> None:
+        self._report_generator = report_generator
 
     def validate_data_source(self,
                              data_source: Union[str, pd.DataFrame],
@@ -113,7 +180,12 @@ class ValidationPipeline:
                              use_parallel: bool = False,
                              report_config: Optional[str] = None,
                              use_all_rules: bool = False,
-                             analytic_title: Optional[str] = None) -> Dict[str, Any]:
+                             analytic_title: Optional[str] = None,
+                             use_cache: bool = True,
+                             source_id: Optional[str] = None,
+                             chunk_size: Optional[int] = None,
+                             trace: bool = True,
+                             profile_memory: bool = False) -> Dict[str, Any]:
         """
         Run validation process on a data source.
 
@@ -124,7 +196,7 @@ class ValidationPipeline:
             responsible_party_column: Column identifying responsible parties
             data_source_params: Parameters for data source loading
             pre_validation: Optional validation rules to apply before main validation
-            output_formats: Output formats to generate ('json', 'excel', 'html', etc.)
+            output_formats: Output formats to generate ('json', 'excel', 'html', 'parquet', etc.)
             min_severity: Minimum severity level to include (e.g., 'critical', 'high')
             exclude_rule_types: List of rule types/categories to exclude
             expected_schema: Expected column list or path to schema file
@@ -132,13 +204,24 @@ class ValidationPipeline:
             report_config: Optional path to report configuration YAML file
             use_all_rules: If True, use all available rules regardless of analytic_id
             analytic_title: Optional title for the analytic report (used in template reports)
+            use_cache: Reuse cached results for rules whose formula and referenced
+                       columns are unchanged since a previous run
+            source_id: Registered data source ID; when set, only rows that are new
+                       or changed since the previous run of the source are evaluated
+            chunk_size: Stream a file source in chunks of this many rows instead of
+                        loading it whole; failing rows are spilled to disk
+            trace: Record nested wall/CPU timing spans for each stage and rule
+                   in results['timings']
+            profile_memory: Record peak RSS, traced Python allocations and DataFrame
+                            sizes per stage and per rule in results['memory_profile'];
+                            rules are then evaluated one at a time
 
         Returns:
             Dictionary with validation results
         """
         # If report_config specified, update the ReportGenerator
         if report_config:
-            self.report_generator = ReportGenerator(report_config)
+            self.report_generator = _create_report_generator(report_config)
 
         # If responsible_party_column specified, set it in metadata for all rules
         if responsible_party_column:
@@ -147,6 +230,16 @@ class ValidationPipeline:
 
         # Track timing for performance analysis
         start_time = datetime.datetime.now()
+        self.tracer = Tracer(enabled=trace)
+        tracer = self.tracer
+        self.memory_profiler = MemoryProfiler() if profile_memory else NULL_MEMORY_PROFILER
+        memory_profiler = self.memory_profiler
+        memory_profiler.start()
+        # The rules of this run share one factorization per party column; columns
+        # changed since the last run are factorized afresh
+        base_evaluator = self._get_base_evaluator()
+        if base_evaluator is not None:
+            base_evaluator.party_codes_cache = PartyCodesCache()
 
         # Initialize results structure
         results = {
@@ -160,8 +253,27 @@ class ValidationPipeline:
         }
 
         try:
+            if chunk_size and isinstance(data_source, str):
+                # Streaming mode never holds the whole source in memory
+                return self._validate_streaming(
+                    results, data_source, chunk_size, start_time,
+                    rule_ids=rule_ids,
+                    analytic_id=analytic_id if not use_all_rules else None,
+                    responsible_party_column=responsible_party_column,
+                    data_source_params=data_source_params,
+                    pre_validation=pre_validation,
+                    output_formats=output_formats,
+                    min_severity=min_severity,
+                    exclude_rule_types=exclude_rule_types,
+                    expected_schema=expected_schema,
+                    analytic_title=analytic_title
+                )
+
             # Load data if string path provided
-            data_df = self._load_data(data_source, data_source_params)
+            with self._stage('load') as load_span:
+                data_df = self._load_data(data_source, data_source_params)
+                load_span.set_rows(len(data_df))
+            memory_profiler.record_frame('input', data_df)
 
             # Add basic data metrics to results
             results['data_metrics'] = {
@@ -172,7 +284,8 @@ class ValidationPipeline:
 
             # Validate schema if provided
             if expected_schema:
-                schema_valid, schema_errors = self._validate_schema(data_df, expected_schema)
+                with self._stage('schema_validation'):
+                    schema_valid, schema_errors = self._validate_schema(data_df, expected_schema)
                 results['schema_validation'] = {
                     'valid': schema_valid,
                     'errors': schema_errors
@@ -186,9 +299,10 @@ class ValidationPipeline:
 
             # Perform pre-validation if specified
             if pre_validation:
-                pre_validation_results = self.data_validator.validate(
-                    data_df, pre_validation, raise_exception=False
-                )
+                with self._stage('pre_validation', rows=len(data_df)):
+                    pre_validation_results = self.data_validator.validate(
+                        data_df, pre_validation, raise_exception=False
+                    )
                 results['pre_validation'] = pre_validation_results
 
                 # Exit if pre-validation failed
@@ -199,12 +313,14 @@ class ValidationPipeline:
 
             # Get rules to apply with filtering
             # If use_all_rules is True, don't filter by analytic_id
-            rules = self._get_rules_to_apply(
-                rule_ids,
-                analytic_id if not use_all_rules else None,
-                min_severity=min_severity,
-                exclude_rule_types=exclude_rule_types
-            )
+            with self._stage('rule_selection') as selection_span:
+                rules = self._get_rules_to_apply(
+                    rule_ids,
+                    analytic_id if not use_all_rules else None,
+                    min_severity=min_severity,
+                    exclude_rule_types=exclude_rule_types
+                )
+                selection_span.set(rules=len(rules))
             
             logger.info(f"Found {len(rules)} rules to apply")
             if rules:
@@ -219,26 +335,100 @@ class ValidationPipeline:
             # Add rule metadata to results
             results['rules_applied'] = [rule.rule_id for rule in rules]
 
+            # Reuse cached results for unchanged rules
+            cached_results = {}
+            rules_to_evaluate = rules
+            formula_backend = self._get_formula_backend()
+            compliance_thresholds = self._compliance_thresholds()
+            if use_cache and self.result_cache:
+                with self._stage('cache_lookup', rows=len(data_df)) as lookup_span:
+                    self.result_cache.begin_run()
+                    rules_to_evaluate = []
+                    for rule in rules:
+                        cached = self.result_cache.lookup(rule, data_df, responsible_party_column, formula_backend,
+                                                          compliance_thresholds)
+                        if cached is not None:
+                            cached_results[rule.rule_id] = cached
+                        else:
+                            rules_to_evaluate.append(rule)
+                    lookup_span.set(hits=len(cached_results))
+                logger.info(f"Reusing cached results for {len(cached_results)} of {len(rules)} rules")
+
             # Evaluate rules (serially or in parallel)
-            if use_parallel and len(rules) > 1:
-                rule_results = self._evaluate_rules_parallel(rules, data_df, responsible_party_column)
-            else:
-                rule_results = self.evaluator.evaluate_multiple_rules(
-                    rules, data_df, responsible_party_column
-                )
+            evaluated_results = {}
+            with self._stage('evaluation', rows=len(data_df), rules=len(rules_to_evaluate)) as evaluation_span:
+                if source_id and self.incremental_store and rules_to_evaluate:
+                    evaluated_results, results['incremental'] = self.incremental_store.evaluate(
+                        source_id, rules_to_evaluate, data_df, self._get_base_evaluator(), responsible_party_column
+                    )
+                    evaluation_span.set(mode='incremental')
+                elif use_parallel and len(rules_to_evaluate) > 1:
+                    evaluated_results = self._evaluate_rules_parallel(
+                        rules_to_evaluate, data_df, responsible_party_column
+                    )
+                    if self.last_parallel_stats:
+                        results['parallel_stats'] = self.last_parallel_stats
+                    rule_timings = self._collect_rule_timings(evaluated_results, parallel=True)
+                    self._record_rule_performance(rule_timings, len(data_df), parallel=True)
+                    self._trace_rule_timings(rule_timings, len(data_df), evaluation_span)
+                    evaluation_span.set(mode=self.parallel_mode)
+                elif rules_to_evaluate and memory_profiler.enabled:
+                    evaluated_results, rule_timings = self._evaluate_rules_profiled(
+                        rules_to_evaluate, data_df, responsible_party_column
+                    )
+                    self._record_rule_performance(rule_timings, len(data_df), parallel=False)
+                    self._trace_rule_timings(rule_timings, len(data_df), evaluation_span)
+                    evaluation_span.set(mode='profiled')
+                elif rules_to_evaluate:
+                    evaluated_results = self.evaluator.evaluate_multiple_rules(
+                        rules_to_evaluate, data_df, responsible_party_column
+                    )
+                    # Report how much work shared subexpressions saved
+                    batch_stats = getattr(self.evaluator, 'last_batch_stats', None)
+                    if batch_stats:
+                        results['formula_optimization'] = batch_stats
+                    rule_timings = self._collect_rule_timings(evaluated_results, parallel=False)
+                    self._record_rule_performance(rule_timings, len(data_df), parallel=False)
+                    self._trace_rule_timings(rule_timings, len(data_df), evaluation_span)
+                    evaluation_span.set(mode='serial')
+
+            if use_cache and self.result_cache:
+                with self._stage('cache_store'):
+                    for result in evaluated_results.values():
+                        self.result_cache.store(result, data_df, responsible_party_column, formula_backend,
+                                                compliance_thresholds)
+                results['cache_stats'] = self.result_cache.get_stats()
+
+            if source_id and self.incremental_store:
+                # Keep the source's row state current for rules answered by the cache
+                for result in cached_results.values():
+                    self.incremental_store.record(source_id, result, data_df, formula_backend)
+
+            # Keep results in rule order
+            rule_results = {}
+            for rule in rules:
+                result = cached_results.get(rule.rule_id) or evaluated_results.get(rule.rule_id)
+                if result is not None:
+                    rule_results[rule.rule_id] = result
+            self.result_store.add_all(rule_results)
+            if self.result_store.memory_budget_bytes is not None:
+                results['result_store_stats'] = dict(self.result_store.stats)
 
             # Process evaluation results including grouping by responsible party
-            self._process_evaluation_results(rule_results, results, responsible_party_column)
+            with self._stage('compliance', rows=len(data_df), rules=len(rule_results)):
+                self._process_evaluation_results(rule_results, results, responsible_party_column)
 
             # Generate outputs in requested formats
             if output_formats:
-                output_paths = self._generate_outputs(results, rule_results, data_df, output_formats, 
-                                                     analytic_title, responsible_party_column)
+                with self._stage('outputs'):
+                    output_paths = self._generate_outputs(results, rule_results, data_df, output_formats, 
+                                                         analytic_title, responsible_party_column)
                 results['output_files'].extend(output_paths)
 
                 # Archive outputs if archive directory is configured
                 if self.archive_dir:
-                    archive_paths = self._archive_outputs(output_paths)
+                    with self._stage('archive'):
+                        archive_paths = self._archive_outputs(output_paths)
                     results['archived_files'] = archive_paths
                     
             # Store rule_results for potential leader pack generation
@@ -262,6 +452,133 @@ class ValidationPipeline:
 
             return results
 
+        finally:
+            if tracer.enabled:
+                results['timings'] = tracer.to_dict()
+            if memory_profiler.enabled:
+                memory_profiler.stop()
+                for result in results.get('_rule_evaluation_results', {}).values():
+                    memory_profiler.record_frame(f"rule:{result.rule.name}", result.evaluated_df)
+                results['memory_profile'] = memory_profiler.to_dict()
+
+    def _validate_streaming(self,
+                            results: Dict[str, Any],
+                            data_source: str,
+                            chunk_size: int,
+                            start_time: datetime.datetime,
+                            rule_ids: Optional[List[str]] = None,
+                            analytic_id: Optional[str] = None,
+                            responsible_party_column: Optional[str] = None,
+                            data_source_params: Optional[Dict[str, Any]] = None,
+                            pre_validation: Optional[Dict[str, Any]] = None,
+                            output_formats: Optional[List[str]] = None,
+                            min_severity: Optional[str] = None,
+                            exclude_rule_types: Optional[List[str]] = None,
+                            expected_schema: Optional[Union[List[str], str]] = None,
+                            analytic_title: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Validate a file source chunk by chunk.
+
+        The schema is checked on the first chunk and pre-validation runs on every
+        chunk. Result caching and incremental re-validation are not used, since
+        both fingerprint the whole source.
+
+        Args:
+            results: Results dictionary to fill in
+            data_source: Path to data file
+            chunk_size: Maximum number of rows per chunk
+            start_time: Start of the validation run
+            (remaining arguments as for validate_data_source)
+
+        Returns:
+            Dictionary with validation results
+        """
+        rules = self._get_rules_to_apply(
+            rule_ids, analytic_id, min_severity=min_severity, exclude_rule_types=exclude_rule_types
+        )
+        logger.info(f"Found {len(rules)} rules to apply (streaming, {chunk_size} rows per chunk)")
+        if not rules:
+            results['valid'] = False
+            results['status'] = 'NO_RULES_FOUND'
+            logger.warning(f"No rules found. rule_ids={rule_ids}, analytic_id={analytic_id}")
+            return results
+        results['rules_applied'] = [rule.rule_id for rule in rules]
+
+        chunks = self.data_importer.iter_file_chunks(data_source, chunk_size, **(data_source_params or {}))
+        first_chunk = next(chunks, None)
+        if first_chunk is None:
+            first_chunk = pd.DataFrame()
+        columns = list(first_chunk.columns)
+        # A small sample stands in for the full data in the output generators
+        data_sample = first_chunk.head(100)
+
+        if expected_schema:
+            schema_valid, schema_errors = self._validate_schema(first_chunk, expected_schema)
+            results['schema_validation'] = {
+                'valid': schema_valid,
+                'errors': schema_errors
+            }
+            if not schema_valid:
+                results['valid'] = False
+                results['status'] = 'SCHEMA_VALIDATION_FAILED'
+                return results
+
+        def checked_chunks():
+            chunk = first_chunk
+            chunk_index = 0
+            while chunk is not None:
+                if pre_validation:
+                    pre_validation_results = self.data_validator.validate(
+                        chunk, pre_validation, raise_exception=False
+                    )
+                    if not pre_validation_results['valid']:
+                        results['pre_validation'] = {**pre_validation_results, 'chunk': chunk_index}
+                        return
+                yield chunk
+                chunk = next(chunks, None)
+                chunk_index += 1
+
+        base_evaluator = self._get_base_evaluator()
+        streaming_validator = StreamingValidator(
+            self.evaluator, getattr(base_evaluator, 'compliance_determiner', None)
+        )
+        # Chunks are read lazily, so this span includes loading the source
+        with self._stage('streaming_evaluation', rules=len(rules)) as evaluation_span:
+            rule_results, stream_stats = streaming_validator.validate(
+                checked_chunks(), rules, responsible_party_column
+            )
+            chunks.close()
+            evaluation_span.set_rows(stream_stats['rows'])
+            evaluation_span.set(chunks=stream_stats['chunks'])
+
+        if 'pre_validation' in results:
+            results['valid'] = False
+            results['status'] = 'PRE_VALIDATION_FAILED'
+            return results
+
+        results['data_metrics'] = {
+            'row_count': stream_stats['rows'],
+            'column_count': len(columns),
+            'columns': columns
+        }
+        results['streaming'] = {**stream_stats, 'chunk_size': chunk_size}
+
+        with self._stage('compliance', rows=stream_stats['rows'], rules=len(rule_results)):
+            self._process_evaluation_results(rule_results, results, responsible_party_column)
+
+        if output_formats:
+            with self._stage('outputs'):
+                output_paths = self._generate_outputs(results, rule_results, data_sample, output_formats,
+                                                      analytic_title, responsible_party_column)
+            results['output_files'].extend(output_paths)
+            if self.archive_dir:
+                with self._stage('archive'):
+                    results['archived_files'] = self._archive_outputs(output_paths)
+
+        results['_rule_evaluation_results'] = rule_results
+        results['execution_time'] = (datetime.datetime.now() - start_time).total_seconds()
+        return results
+
     def _load_data(self,
                    data_source: Union[str, pd.DataFrame],
                    params: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
@@ -279,7 +596,7 @@ class ValidationPipeline:
             return data_source
 
         # Use data importer to load file
-        return self.data_importer.load_file(data_source, **(params or {}))
+        return self.data_importer.load_file(data_source, tracer=self.tracer, **(params or {}))
 
     def _validate_schema(self,
                          df: pd.DataFrame,
@@ -733,37 +1050,101 @@ class ValidationPipeline:
             'duration_seconds': duration
         }
 
+    @contextlib.contextmanager
+    def _stage(self, name: str, rows: Optional[int] = None, **attributes):
+        """
+        Time a pipeline stage and, when profiling, measure its memory.
+
+        Args:
+            name: Stage name
+            rows: Number of rows the stage processes, if known
+            **attributes: Extra values reported with the stage's span
+
+        Yields:
+            The stage's span
+        """
+        with self.tracer.span(name, rows=rows, **attributes) as span, self.memory_profiler.section(name):
+            yield span
+
+    def _evaluate_rules_profiled(self,
+                                 rules: List[ValidationRule],
+                                 data_df: pd.DataFrame,
+                                 responsible_party_column: Optional[str]
+                                 ) -> Tuple[Dict[str, RuleEvaluationResult], List[Dict[str, Any]]]:
+        """
+        Evaluate rules one at a time, measuring the memory each one uses.
+
+        Batching is given up so allocations can be attributed to single rules.
+
+        Args:
+            rules: Rules to evaluate
+            data_df: Data to evaluate against
+            responsible_party_column: Column identifying responsible parties
+
+        Returns:
+            Tuple of (results by rule ID, per-rule timings)
+        """
+        results = {}
+        rule_timings = []
+        for rule in rules:
+            with self.memory_profiler.section(f"rule:{rule.name}", rule_id=rule.rule_id):
+                rule_results = self.evaluator.evaluate_multiple_rules([rule], data_df, responsible_party_column)
+            results.update(rule_results)
+            rule_timings.extend(self._collect_rule_timings(rule_results, parallel=False))
+        return results, rule_timings
+
+    def _get_base_evaluator(self) -> Optional[RuleEvaluator]:
+        """RuleEvaluator behind any progress-tracking wrappers"""
+        evaluator = self.evaluator
+        while evaluator is not None and not hasattr(evaluator, 'formula_backend'):
+            evaluator = getattr(evaluator, 'base_evaluator', None)
+        return evaluator
+
+    def _get_formula_backend(self) -> Optional[str]:
+        """Formula backend of the evaluator (looking through progress-tracking wrappers)"""
+        return getattr(self._get_base_evaluator(), 'formula_backend', None)
+
+    def _compliance_thresholds(self) -> Optional[Tuple[float, float]]:
+        """(gc_threshold, pc_threshold) of the evaluator's ComplianceDeterminer"""
+        determiner = getattr(self._get_base_evaluator(), 'compliance_determiner', None)
+        if determiner is None:
+            return None
+        return determiner.gc_threshold, determiner.pc_threshold
+
     def _evaluate_rules_parallel(self,
                                  rules: List[ValidationRule],
                                  data_df: pd.DataFrame,
                                  responsible_party_column: Optional[str] = None) -> Dict[str, RuleEvaluationResult]:
         """
         Evaluate rules in parallel using thread pool, with COM safety measures.
+
+        In "process" parallel mode with the native backend, rules are evaluated
+        in a process pool instead (see _evaluate_rules_in_processes).
         """
-        results = {}
+        self.last_parallel_stats = None
+        if self.performance_store:
+            # Order rules by their runtimes in earlier runs, where known
+            self.cost_model.load_history(self.performance_store.seconds_per_row([rule.rule_id for rule in rules]))
+
+        if self.parallel_mode == "process":
+            if self._get_formula_backend() == "native":
+                return self._evaluate_rules_in_processes(rules, data_df, responsible_party_column)
+            logger.warning("Process-pool evaluation requires the native formula backend; using threads")
 
         # Limit the number of worker threads to avoid Excel instance explosion
         max_workers = min(self.max_workers, 4)  # Cap at 4 workers regardless of setting
 
         logger.info(f"Evaluating {len(rules)} rules with {max_workers} worker threads")
 
-        # Use thread pool to evaluate rules in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit tasks but keep track of future objects
-            futures = []
-            for rule in rules:
-                # Create a copy of the DataFrame for each rule to avoid threading issues
-                rule_df = data_df.copy()
-                futures.append(executor.submit(self._evaluate_single_rule, rule, rule_df, responsible_party_column))
-
-            # Process futures as they complete
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    rule_id, result = future.result()
-                    if result:
-                        results[rule_id] = result
-                except Exception as e:
-                    logger.error(f"Exception in thread pool task: {str(e)}")
+        # Run the most expensive rules first and let idle threads steal queued rules.
+        # Workers only read the data; the evaluator projects the columns each rule needs
+        scheduler = WorkStealingScheduler(max_workers, self.cost_model)
+        outputs = scheduler.run(
+            rules, len(data_df),
+            lambda rule: self._evaluate_single_rule(rule, data_df, responsible_party_column)[1]
+        )
+        results = {rule.rule_id: outputs[rule.rule_id] for rule in rules if outputs.get(rule.rule_id)}
+        self.last_parallel_stats = {'mode': 'thread', 'schedule': scheduler.last_run_stats}
 
         # Force garbage collection after all threads complete
         try:
@@ -774,33 +1155,122 @@ class ValidationPipeline:
 
         return results
 
+    def _collect_rule_timings(self,
+                              evaluated_results: Dict[str, RuleEvaluationResult],
+                              parallel: bool) -> List[Dict[str, Any]]:
+        """
+        Gather the per-rule evaluation times of this run.
+
+        Args:
+            evaluated_results: Results of the rules evaluated in this run
+            parallel: Whether the rules were evaluated by the parallel scheduler
+
+        Returns:
+            List of dicts with rule_id, rule_name, seconds and, where known,
+            cpu_seconds and batched
+        """
+        if not parallel:
+            return [timing for timing in getattr(self.evaluator, 'last_rule_timings', None) or []
+                    if timing['rule_id'] in evaluated_results]
+
+        stats = self.last_parallel_stats or {}
+        schedule = stats.get('schedule') or {}
+        rule_seconds = schedule.get('rule_seconds', {})
+        # Process workers report their own CPU time; threads are timed by the scheduler
+        rule_cpu_seconds = stats.get('rule_cpu_seconds') or schedule.get('rule_cpu_seconds', {})
+        # Rules evaluated in a group are credited a share of the group's time
+        batched_rules = set(schedule.get('batched_rules', []))
+        return [{'rule_id': rule_id,
+                 'rule_name': result.rule.name,
+                 'seconds': rule_seconds[rule_id],
+                 'cpu_seconds': rule_cpu_seconds.get(rule_id),
+                 'batched': rule_id in batched_rules}
+                for rule_id, result in evaluated_results.items() if rule_id in rule_seconds]
+
+    def _record_rule_performance(self,
+                                 rule_timings: List[Dict[str, Any]],
+                                 row_count: int,
+                                 parallel: bool) -> None:
+        """
+        Save the per-rule evaluation times of this run to the performance store.
+
+        Args:
+            rule_timings: Per-rule timings from _collect_rule_timings
+            row_count: Number of rows the rules were evaluated on
+            parallel: Whether the rules were evaluated by the parallel scheduler
+        """
+        if not self.performance_store or not rule_timings:
+            return
+
+        workers = ((self.last_parallel_stats or {}).get('schedule') or {}).get('workers', 1) if parallel else 1
+        self.performance_store.record_run(rule_timings, row_count, self._get_formula_backend(), workers)
+
+    def _trace_rule_timings(self, rule_timings: List[Dict[str, Any]], row_count: int, parent) -> None:
+        """Add a span per evaluated rule under the evaluation span"""
+        if not self.tracer.enabled:
+            return
+        for timing in rule_timings:
+            attributes = {'rule_id': timing['rule_id']}
+            if timing.get('batched'):
+                attributes['batched'] = True
+            self.tracer.record(f"rule:{timing.get('rule_name') or timing['rule_id']}",
+                               timing['seconds'], timing.get('cpu_seconds'), rows=row_count,
+                               parent=parent, **attributes)
+
+    def _evaluate_rules_in_processes(self,
+                                     rules: List[ValidationRule],
+                                     data_df: pd.DataFrame,
+                                     responsible_party_column: Optional[str] = None) -> Dict[str, RuleEvaluationResult]:
+        """
+        Evaluate rules in a process pool over shared-memory copies of the referenced columns.
+
+        Unlike the thread pool, the number of workers is not capped at 4, since
+        no Excel instances are involved.
+        """
+        base_evaluator = self._get_base_evaluator()
+        process_evaluator = ProcessPoolRuleEvaluator(
+            max_workers=self.max_workers,
+            compliance_determiner=getattr(base_evaluator, 'compliance_determiner', None),
+            cost_model=self.cost_model
+        )
+        results = process_evaluator.evaluate_rules(rules, data_df, responsible_party_column)
+        self.last_parallel_stats = {'mode': 'process', **(process_evaluator.last_run_stats or {})}
+        return results
+
     def _evaluate_single_rule(self, rule, data_df, responsible_party_column):
         """
         Worker function to evaluate a single rule with thread isolation.
 
-        This isolates all COM operations to a single thread context.
+        With the Excel backend this isolates all COM operations to a single
+        thread context; COM is only loaded when that backend is in use.
         """
+        base_evaluator = self._get_base_evaluator()
+        pythoncom = None
         try:
-            # Initialize COM for this thread
-            pythoncom.CoInitialize()
-            logger.debug(f"COM initialized in thread {threading.current_thread().ident} for rule {rule.rule_id}")
-
-            # Use with statement to ensure proper cleanup
-            with ExcelFormulaProcessor(visible=False) as processor:
-                # Create a dedicated evaluator for this thread
-                thread_evaluator = RuleEvaluator(
-                    rule_manager=self.rule_manager,
-                    compliance_determiner=ComplianceDeterminer(),
-                    excel_visible=False
-                )
-
-                # Evaluate the rule
-                result = thread_evaluator.evaluate_rule(
-                    rule, data_df, responsible_party_column
-                )
+            # Create a dedicated evaluator for this thread
+            thread_evaluator = RuleEvaluator(
+                rule_manager=self.rule_manager,
+                compliance_determiner=getattr(base_evaluator, 'compliance_determiner', None) or ComplianceDeterminer(),
+                excel_visible=False,
+                formula_backend=self._get_formula_backend() or "auto",
+                backend_registry=getattr(base_evaluator, 'backend_registry', None)
+            )
+            # Share the run's party factorizations across threads
+            thread_evaluator.party_codes_cache = getattr(base_evaluator, 'party_codes_cache', None)
+
+            if thread_evaluator.uses_backend("excel"):
+                # Initialize COM for this thread
+                import pythoncom
+                pythoncom.CoInitialize()
+                logger.debug(f"COM initialized in thread {threading.current_thread().ident} for rule {rule.rule_id}")
+
+            # Evaluate the rule
+            result = thread_evaluator.evaluate_rule(
+                rule, data_df, responsible_party_column
+            )
 
-                # Return the result
-                return rule.rule_id, result
+            # Return the result
+            return rule.rule_id, result
 
         except Exception as e:
             logger.error(f"Error evaluating rule {rule.rule_id}: {str(e)}")
@@ -808,11 +1278,12 @@ class ValidationPipeline:
 
         finally:
             # Clean up COM in this thread
-            try:
-                pythoncom.CoUninitialize()
-                logger.debug(f"COM uninitialized in thread {threading.current_thread().ident} for rule {rule.rule_id}")
-            except Exception as e:
-                logger.error(f"Error uninitializing COM in thread {threading.current_thread().ident}: {str(e)}")
+            if pythoncom is not None:
+                try:
+                    pythoncom.CoUninitialize()
+                    logger.debug(f"COM uninitialized in thread {threading.current_thread().ident} for rule {rule.rule_id}")
+                except Exception as e:
+                    logger.error(f"Error uninitializing COM in thread {threading.current_thread().ident}: {str(e)}")
 
     def _process_evaluation_results(self,
                                     rule_results: Dict[str, RuleEvaluationResult],
@@ -842,6 +1313,10 @@ class ValidationPipeline:
 
         # Group results by responsible party if specified
         grouped_summary = defaultdict(lambda: {'count': 0, 'GC': 0, 'PC': 0, 'DNC': 0})
+        # Rules per formula backend, to find the rules kept on a slow path
+        backend_counts = defaultdict(int)
+        # Rules evaluated on one dataset share its party codes: count their statuses in one pass
+        status_matrix = party_status_matrix(list(rule_results.values())) if responsible_party_column else None
 
         # Process each rule result
         for rule_id, result in rule_results.items():
@@ -865,23 +1340,33 @@ class ValidationPipeline:
             rule_stats['by_severity'][severity]['count'] += 1
             rule_stats['by_severity'][severity][compliance_status] += 1
 
+            backend_counts[getattr(result, 'formula_backend', None) or 'unrecorded'] += 1
+
             # Update overall validity (valid only if all rules are GC)
             if compliance_status != 'GC':
                 overall_valid = False
 
             # Process group results if responsible party column specified
-            if responsible_party_column and hasattr(result, 'party_results'):
+            if responsible_party_column and status_matrix is None and hasattr(result, 'party_results'):
                 for party, party_result in result.party_results.items():
                     grouped_summary[party]['count'] += 1
                     grouped_summary[party][party_result['status']] += 1
 
+        if status_matrix is not None:
+            statuses, _ = status_matrix
+            party_keys = next(result.party_results for result in rule_results.values()
+                              if getattr(result, 'party_results', None)).keys()
+            for party, (gc_count, pc_count, dnc_count) in zip(party_keys, status_counts_by_party(statuses).tolist()):
+                grouped_summary[party] = {'count': len(statuses), 'GC': gc_count, 'PC': pc_count, 'DNC': dnc_count}
+
         # Update summary information
         results['valid'] = overall_valid
         results['summary'] = {
             'total_rules': len(rule_results),
             'compliance_counts': compliance_counts,
             'compliance_rate': compliance_counts['GC'] / len(rule_results) if rule_results else 0,
-            'rule_stats': rule_stats
+            'rule_stats': rule_stats,
+            'formula_backends': dict(backend_counts)
         }
 
         # Add grouped summary if present
@@ -929,125 +1414,143 @@ class ValidationPipeline:
         """
         # Create timestamp string for filenames
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        analytic_id = results.get('analytic_id', 'validation')
+        analytic_id = results.get('analytic_id') or 'validation'
 
         output_paths = []
 
         # Generate outputs in each requested format
         for format in output_formats:
-            if format.lower() == 'excel_template':
-                # Generate using template-based report generator
-                excel_path = self.output_dir / f"{analytic_id}_{timestamp}_template_report.xlsx"
+            with self._stage(f"output:{format.lower()}"):
+                if format.lower() == 'excel_template':
+                    # Generate using template-based report generator
+                    excel_path = self.output_dir / f"{analytic_id}_{timestamp}_template_report.xlsx"
                 
-                try:
-                    # Initialize template generator if not already done
-                    if not hasattr(self, 'template_report_generator'):
-                        from reporting.generation.template_report_generator import TemplateBasedReportGenerator
-                        template_path = self.output_dir.parent / "templates" / "qa_report_template.xlsx"
-                        self.template_report_generator = TemplateBasedReportGenerator(template_path)
+                    try:
+                        # Initialize template generator if not already done
+                        if not hasattr(self, 'template_report_generator'):
+                            from reporting.generation.template_report_generator import TemplateBasedReportGenerator
+                            template_path = self.output_dir.parent / "templates" / "qa_report_template.xlsx"
+                            self.template_report_generator = TemplateBasedReportGenerator(template_path)
                     
-                    # Use responsible_party_column if provided, otherwise try to detect
-                    group_by = responsible_party_column
-                    if not group_by:
-                        # Try to get from rule metadata
-                        for result in rule_results.values():
-                            if hasattr(result.rule, 'metadata') and 'responsible_party_column' in result.rule.metadata:
-                                group_by = result.rule.metadata['responsible_party_column']
-                                break
+                        # Use responsible_party_column if provided, otherwise try to detect
+                        group_by = responsible_party_column
+                        if not group_by:
+                            # Try to get from rule metadata
+                            for result in rule_results.values():
+                                if hasattr(result.rule, 'metadata') and 'responsible_party_column' in result.rule.metadata:
+                                    group_by = result.rule.metadata['responsible_party_column']
+                                    break
                     
-                    logger.info(f"Generating template-based Excel report: {excel_path}")
-                    report_path = self.template_report_generator.generate_excel_from_template(
-                        results=results,
-                        rule_results=rule_results,
-                        output_path=str(excel_path),
-                        analytic_id=analytic_id,
-                        analytic_title=analytic_title,
-                        group_by=group_by
-                    )
-                    output_paths.append(report_path)
-                    logger.info(f"Template-based Excel report generated successfully")
+                        logger.info(f"Generating template-based Excel report: {excel_path}")
+                        report_path = self.template_report_generator.generate_excel_from_template(
+                            results=results,
+                            rule_results=rule_results,
+                            output_path=str(excel_path),
+                            analytic_id=analytic_id,
+                            analytic_title=analytic_title,
+                            group_by=group_by
+                        )
+                        output_paths.append(report_path)
+                        logger.info(f"Template-based Excel report generated successfully")
                     
-                except Exception as e:
-                    logger.error(f"Error generating template report: {str(e)}", exc_info=True)
-                    # Fall back to regular Excel generation
-                    logger.info("Falling back to standard Excel report")
-                    format = 'excel'  # Process as regular Excel
+                    except Exception as e:
+                        logger.error(f"Error generating template report: {str(e)}", exc_info=True)
+                        # Fall back to regular Excel generation
+                        logger.info("Falling back to standard Excel report")
+                        format = 'excel'  # Process as regular Excel
                     
-            if format.lower() == 'json':
-                # Export results to JSON
-                json_path = self.output_dir / f"{analytic_id}_{timestamp}_results.json"
-                with open(json_path, 'w') as f:
-                    json.dump(results, f, indent=2, default=str)
-                output_paths.append(str(json_path))
-
-            elif format.lower() == 'excel':
-                # Generate standard Excel report
-                excel_path = self.output_dir / f"{analytic_id}_{timestamp}_detailed_report.xlsx"
-
-                # Determine group_by column for responsible party aggregation
-                group_by = None
-                # Look for responsible_party_column in rule metadata
-                for result in rule_results.values():
-                    if hasattr(result.rule, 'metadata') and 'responsible_party_column' in result.rule.metadata:
-                        group_by = result.rule.metadata['responsible_party_column']
-                        break
-
-                # If no metadata found, check 'grouped_summary' in results
-                if not group_by and 'grouped_summary' in results:
-                    # The presence of grouped_summary implies grouping was done
-                    # Try to determine the column name from context
-                    for rule_id, result in rule_results.items():
-                        party_results = getattr(result, 'party_results', None)
-                        if party_results:
-                            for party_col in data_df.columns:
-                                if any(party in data_df[party_col].values for party in party_results.keys()):
-                                    group_by = party_col
-                                    break
-                        if group_by:
+                if format.lower() == 'json':
+                    # Export results to JSON
+                    json_path = self.output_dir / f"{analytic_id}_{timestamp}_results.json"
+                    if self.tracer.enabled:
+                        # Timings so far; the output stage is still in progress
+                        results['timings'] = self.tracer.to_dict()
+                    with open(json_path, 'w') as f:
+                        json.dump(results, f, indent=2, default=str)
+                    output_paths.append(str(json_path))
+
+                elif format.lower() == 'excel':
+                    # Generate standard Excel report
+                    excel_path = self.output_dir / f"{analytic_id}_{timestamp}_detailed_report.xlsx"
+
+                    # Determine group_by column for responsible party aggregation
+                    group_by = None
+                    # Look for responsible_party_column in rule metadata
+                    for result in rule_results.values():
+                        if hasattr(result.rule, 'metadata') and 'responsible_party_column' in result.rule.metadata:
+                            group_by = result.rule.metadata['responsible_party_column']
                             break
 
-                # Generate the report using ReportGenerator
-                try:
-                    logger.info(f"Generating detailed Excel report: {excel_path}")
-                    report_path = self.report_generator.generate_excel(
-                        results,
-                        rule_results,
-                        str(excel_path),
-                        group_by=group_by
-                    )
-                    output_paths.append(report_path)
-                    logger.info(f"Excel report generated successfully")
-                except Exception as e:
-                    logger.error(f"Error generating detailed Excel report: {str(e)}")
-                    # Fall back to simple Excel export
-                    logger.info(f"Falling back to basic Excel export")
-                    self._export_to_excel(results, rule_results, data_df, excel_path)
-                    output_paths.append(str(excel_path))
+                    # If no metadata found, check 'grouped_summary' in results
+                    if not group_by and 'grouped_summary' in results:
+                        # The presence of grouped_summary implies grouping was done
+                        # Try to determine the column name from context
+                        for rule_id, result in rule_results.items():
+                            party_results = getattr(result, 'party_results', None)
+                            if party_results:
+                                for party_col in data_df.columns:
+                                    if any(party in data_df[party_col].values for party in party_results.keys()):
+                                        group_by = party_col
+                                        break
+                            if group_by:
+                                break
 
-            elif format.lower() == 'html':
-                # Create filename for HTML report
-                html_path = self.output_dir / f"{analytic_id}_{timestamp}_report.html"
+                    # Generate the report using ReportGenerator
+                    try:
+                        logger.info(f"Generating detailed Excel report: {excel_path}")
+                        report_path = self.report_generator.generate_excel(
+                            results,
+                            rule_results,
+                            str(excel_path),
+                            group_by=group_by
+                        )
+                        output_paths.append(report_path)
+                        logger.info(f"Excel report generated successfully")
+                    except Exception as e:
+                        logger.error(f"Error generating detailed Excel report: {str(e)}")
+                        # Fall back to simple Excel export
+                        logger.info(f"Falling back to basic Excel export")
+                        self._export_to_excel(results, rule_results, data_df, excel_path)
+                        output_paths.append(str(excel_path))
 
-                # Generate HTML report using ReportGenerator
-                try:
-                    logger.info(f"Generating HTML report: {html_path}")
-                    report_path = self.report_generator.generate_html(
-                        results,
-                        rule_results,
-                        str(html_path),
-                        max_failures=1000  # Limit failures for performance
-                    )
-                    output_paths.append(report_path)
-                    logger.info(f"HTML report generated successfully")
-                except Exception as e:
-                    logger.error(f"Error generating HTML report: {str(e)}")
-                    # No fallback for HTML - just log the error
+                elif format.lower() == 'html':
+                    # Create filename for HTML report
+                    html_path = self.output_dir / f"{analytic_id}_{timestamp}_report.html"
+
+                    # Generate HTML report using ReportGenerator
+                    try:
+                        logger.info(f"Generating HTML report: {html_path}")
+                        report_path = self.report_generator.generate_html(
+                            results,
+                            rule_results,
+                            str(html_path),
+                            max_failures=1000  # Limit failures for performance
+                        )
+                        output_paths.append(report_path)
+                        logger.info(f"HTML report generated successfully")
+                    except Exception as e:
+                        logger.error(f"Error generating HTML report: {str(e)}")
+                        # No fallback for HTML - just log the error
 
-            elif format.lower() == 'csv':
-                # Export summary results to CSV
-                csv_path = self.output_dir / f"{analytic_id}_{timestamp}_summary.csv"
-                self._export_to_csv(results, csv_path)
-                output_paths.append(str(csv_path))
+                elif format.lower() == 'csv':
+                    # Export summary results to CSV
+                    csv_path = self.output_dir / f"{analytic_id}_{timestamp}_summary.csv"
+                    self._export_to_csv(results, csv_path)
+                    output_paths.append(str(csv_path))
+
+                elif format.lower() in COLUMNAR_FORMATS:
+                    # Per-rule/per-party metrics and failing rows as columnar tables
+                    try:
+                        output_paths.extend(write_columnar_results(
+                            results,
+                            rule_results,
+                            self.output_dir,
+                            f"{analytic_id}_{timestamp}",
+                            fmt=format.lower(),
+                            responsible_party_column=responsible_party_column
+                        ))
+                    except Exception as e:
+                        logger.error(f"Error exporting results to {format}: {str(e)}")
 
         return output_paths
 
@@ -1089,142 +1592,29 @@ class ValidationPipeline:
         """
         Export detailed results to Excel file.
 
+        Rows are streamed to xlsxwriter in constant-memory mode, reading each
+        rule's failing rows in blocks that fit excel_memory_limit_mb.
+
         Args:
             results: Validation results
             rule_results: Rule evaluation results
             data_df: Input DataFrame
             output_path: Path for Excel output file
         """
+        from reporting.generation.streaming_excel_writer import StreamingExcelReportWriter
+
         try:
-            # Create Excel writer
-            with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
-                # Create summary sheet
-                summary_data = {
-                    'Metric': ['Status', 'Total Rules', 'GC Count', 'PC Count', 'DNC Count',
-                               'Compliance Rate', 'Execution Time'],
-                    'Value': [
-                        results['status'],
-                        results['summary']['total_rules'],
-                        results['summary']['compliance_counts']['GC'],
-                        results['summary']['compliance_counts']['PC'],
-                        results['summary']['compliance_counts']['DNC'],
-                        f"{results['summary']['compliance_rate']:.2%}",
-                        f"{results['execution_time']:.2f} seconds"
-                    ]
-                }
-                summary_df = pd.DataFrame(summary_data)
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
-
-                # Create Rules sheet with detailed rule results
-                rules_data = []
-                for rule_id, rule_result in results['rule_results'].items():
-                    rules_data.append({
-                        'Rule ID': rule_id,
-                        'Rule Name': rule_result['rule_name'],
-                        'Status': rule_result['compliance_status'],
-                        'Total Items': rule_result['total_items'],
-                        'GC Count': rule_result['gc_count'],
-                        'PC Count': rule_result['pc_count'],
-                        'DNC Count': rule_result['dnc_count'],
-                        'Compliance Rate': rule_result['compliance_rate']
-                    })
-
-                if rules_data:
-                    rules_df = pd.DataFrame(rules_data)
-                    rules_df.to_excel(writer, sheet_name='Rules', index=False)
-
-                # Export a sample of the input data
-                data_sample = data_df.head(100)  # Just first 100 rows as sample
-                data_sample.to_excel(writer, sheet_name='Data Sample', index=False)
-
-                # Create Compliance Breakdown by Category
-                if 'rule_stats' in results['summary']:
-                    # By Category
-                    category_data = []
-                    for category, stats in results['summary']['rule_stats']['by_category'].items():
-                        compliance_rate = stats['GC'] / stats['count'] if stats['count'] > 0 else 0
-                        category_data.append({
-                            'Category': category,
-                            'Total Rules': stats['count'],
-                            'GC': stats['GC'],
-                            'PC': stats['PC'],
-                            'DNC': stats['DNC'],
-                            'Compliance Rate': compliance_rate
-                        })
-
-                    if category_data:
-                        category_df = pd.DataFrame(category_data)
-                        category_df.to_excel(writer, sheet_name='By Category', index=False)
-
-                    # By Severity
-                    severity_data = []
-                    for severity, stats in results['summary']['rule_stats']['by_severity'].items():
-                        compliance_rate = stats['GC'] / stats['count'] if stats['count'] > 0 else 0
-                        severity_data.append({
-                            'Severity': severity,
-                            'Total Rules': stats['count'],
-                            'GC': stats['GC'],
-                            'PC': stats['PC'],
-                            'DNC': stats['DNC'],
-                            'Compliance Rate': compliance_rate
-                        })
-
-                    if severity_data:
-                        severity_df = pd.DataFrame(severity_data)
-                        severity_df.to_excel(writer, sheet_name='By Severity', index=False)
-
-                # Add Responsible Party breakdown if available
-                if 'grouped_summary' in results and results['grouped_summary']:
-                    party_data = []
-                    for party, stats in results['grouped_summary'].items():
-                        party_data.append({
-                            'Responsible Party': party,
-                            'Total Rules': stats['total_rules'],
-                            'GC': stats['GC'],
-                            'PC': stats['PC'],
-                            'DNC': stats['DNC'],
-                            'Compliance Rate': stats['compliance_rate']
-                        })
-
-                    if party_data:
-                        party_df = pd.DataFrame(party_data)
-                        party_df.to_excel(writer, sheet_name='By Responsible Party', index=False)
-
-                # Export detailed results for each rule
-                for rule_id, result in rule_results.items():
-                    # Get failures only
-                    failure_df = result.get_failing_items()
-                    if not failure_df.empty:
-                        # Limit to first 1000 rows if very large
-                        if len(failure_df) > 1000:
-                            failure_df = failure_df.head(1000)
-
-                        # Excel sheet names have 31 char limit
-                        sheet_name = f"Rule_{rule_id[-20:]}" if len(rule_id) > 20 else f"Rule_{rule_id}"
-                        failure_df.to_excel(writer, sheet_name=sheet_name, index=False)
-
-                # Add styling to make the report more readable
-                workbook = writer.book
-                # Add formats for different compliance statuses
-                gc_format = workbook.add_format({'bg_color': '#C6EFCE', 'font_color': '#006100'})
-                pc_format = workbook.add_format({'bg_color': '#FFEB9C', 'font_color': '#9C6500'})
-                dnc_format = workbook.add_format({'bg_color': '#FFC7CE', 'font_color': '#9C0006'})
-
-                # Apply conditional formatting to Rules sheet
-                if rules_data:
-                    rules_sheet = writer.sheets['Rules']
-                    rules_sheet.conditional_format('C2:C1000', {'type': 'text',
-                                                                'criteria': 'containing',
-                                                                'value': 'GC',
-                                                                'format': gc_format})
-                    rules_sheet.conditional_format('C2:C1000', {'type': 'text',
-                                                                'criteria': 'containing',
-                                                                'value': 'PC',
-                                                                'format': pc_format})
-                    rules_sheet.conditional_format('C2:C1000', {'type': 'text',
-                                                                'criteria': 'containing',
-                                                                'value': 'DNC',
-                                                                'format': dnc_format})
+            # Outputs are written before the run finishes, so report the time so far
+            execution_time = results.get('execution_time') or (
+                datetime.datetime.now() - datetime.datetime.fromisoformat(results['timestamp'])
+            ).total_seconds()
+
+            writer_options = {}
+            if self.excel_memory_limit_mb is not None:
+                writer_options['memory_limit_mb'] = self.excel_memory_limit_mb
+            StreamingExcelReportWriter(str(output_path), **writer_options).write(
+                results, rule_results, data_df, execution_time
+            )
 
         except Exception as e:
             logger.error(f"Error exporting results to Excel: {str(e)}")
@@ -1277,7 +1667,8 @@ class ValidationPipeline:
         Aggregate results from multiple analytics runs.
 
         Args:
-            result_paths: Paths to JSON result files from previous validation runs
+            result_paths: Paths to JSON result files, or Parquet/Feather metrics files,
+                          from previous validation runs
             output_formats: Output formats to generate ('json', 'excel', etc.)
             weights_config: Path to weights configuration file
             output_dir: Directory for output files (defaults to self.output_dir)
@@ -1300,10 +1691,13 @@ class ValidationPipeline:
         result_dicts = []
         for path in result_paths:
             try:
-                with open(path, 'r') as f:
-                    result = json.load(f)
-                    result_dicts.append(result)
-                    logger.debug(f"Successfully loaded results from {path}")
+                if is_columnar_path(path):
+                    # Metrics tables rebuild the result structure without parsing JSON
+                    result_dicts.extend(results_from_metrics(read_columnar_table(path)))
+                else:
+                    with open(path, 'r') as f:
+                        result_dicts.append(json.load(f))
+                logger.debug(f"Successfully loaded results from {path}")
             except Exception as e:
                 logger.error(f"Error loading results from {path}: {str(e)}")
 
@@ -1359,11 +1753,11 @@ class ValidationPipeline:
                         # Explicit exception handling for ReportGenerator
                         if not hasattr(self, 'report_generator') or self.report_generator is None:
                             if report_config:
-                                self.report_generator = ReportGenerator(report_config)
+                                self.report_generator = _create_report_generator(report_config)
                             else:
-                                self.report_generator = ReportGenerator()  # Default to empty config
+                                self.report_generator = _create_report_generator()  # Default to empty config
                         elif report_config:  # Update existing report generator with new config
-                            self.report_generator = ReportGenerator(report_config)
+                            self.report_generator = _create_report_generator(report_config)
 
                         # This would need to be implemented in ReportGenerator
                         report_path = self.report_generator.generate_aggregate_excel(
@@ -1483,7 +1877,7 @@ class ValidationPipeline:
         # Check if report_generator is available
         if not hasattr(self, 'report_generator'):
             # Initialize with default settings
-            self.report_generator = ReportGenerator()
+            self.report_generator = _create_report_generator()
 
         # Call the report generator to create leader packs
         return self.report_generator.generate_leader_packs(
@@ -1539,7 +1933,7 @@ class ValidationPipeline:
             
             # Check if report_generator is available
             if not hasattr(self, 'report_generator'):
-                self.report_generator = ReportGenerator()
+                self.report_generator = _create_report_generator()
             
             # Generate the IAG summary report
             report_path = self.report_generator.generate_iag_summary_excel(
@@ -1616,7 +2010,7 @@ class ValidationPipeline:
             
             # Check if report_generator is available
             if not hasattr(self, 'report_generator'):
-                self.report_generator = ReportGenerator()
+                self.report_generator = _create_report_generator()
             
             # Generate the comprehensive report
             report_path = self.report_generator.generate_comprehensive_iag_workbook(
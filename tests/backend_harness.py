@@ -0,0 +1,351 @@
+# tests/backend_harness.py
+"""
+Differential correctness and speed harness for formula backends.
+
+Golden files in tests/golden/formula_backends hold a dataset and formulas
+with the values Excel returns for them. Every registered backend that can
+run here is checked against them, and mismatches are reported per function
+and edge case (blanks, error values, type coercion, date serials). Each
+backend is then timed on the golden datasets scaled up to 10k, 100k and 1M
+rows.
+
+Run from the project root:
+
+    python -m tests.backend_harness
+    python -m tests.backend_harness --backends native sqlite --sizes 10000 100000
+
+Exits with status 1 when any backend returns a value that differs from
+Excel. ``--record excel`` rewrites the expected values of the golden files
+from a backend (Excel on a machine with pywin32) after adding cases.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.formula_engine.backends import FormulaBackend, FormulaBackendRegistry, default_backend_registry
+from core.formula_engine.native_formula_processor import NativeFormulaProcessor, UnsupportedFormulaError
+from core.rule_engine.rule_parser import compile_formula
+
+GOLDEN_DIR = os.path.join(os.path.dirname(__file__), 'golden', 'formula_backends')
+
+EDGE_CASES = ("baseline", "blanks", "error values", "type coercion", "date serials")
+
+BENCHMARK_SIZES = (10_000, 100_000, 1_000_000)
+
+# Processor error representations back to the values Excel shows
+_EXCEL_ERROR_VALUES = {code: error for error, code in NativeFormulaProcessor.EXCEL_ERRORS.items()}
+
+
+@dataclass
+class GoldenFormula:
+    formula: str
+    function: str  # Function or operator under test
+    edge_case: str
+    expected: List[Any]
+
+
+@dataclass
+class GoldenCase:
+    name: str
+    description: str
+    data: pd.DataFrame
+    formulas: List[GoldenFormula]
+    path: str
+
+
+def _column_from_spec(spec: Dict[str, Any]) -> pd.Series:
+    """Build a typed column from its golden-file description"""
+    values = spec["values"]
+    kind = spec["type"]
+    if kind == "number":
+        return pd.Series([np.nan if v is None else v for v in values], dtype=np.float64)
+    if kind == "date":
+        return pd.Series(pd.to_datetime(values))
+    if kind == "bool" and None not in values:
+        return pd.Series(values, dtype=bool)
+    if kind in ("text", "bool", "mixed"):
+        return pd.Series(values, dtype=object)
+    raise ValueError(f"Unknown column type '{kind}'")
+
+
+def load_golden_cases(directory: str = GOLDEN_DIR) -> List[GoldenCase]:
+    """
+    Load the golden files of a directory.
+
+    Args:
+        directory: Directory of *.json golden files
+
+    Returns:
+        Golden cases, sorted by file name
+
+    Raises:
+        ValueError: If a file has an unknown edge case or a wrong number of expected values
+    """
+    cases = []
+    for file_name in sorted(f for f in os.listdir(directory) if f.endswith('.json')):
+        path = os.path.join(directory, file_name)
+        with open(path, 'r', encoding='utf-8') as f:
+            spec = json.load(f)
+
+        data = pd.DataFrame({name: _column_from_spec(column) for name, column in spec["columns"].items()})
+        formulas = [GoldenFormula(**entry) for entry in spec["formulas"]]
+        for entry in formulas:
+            if entry.edge_case not in EDGE_CASES:
+                raise ValueError(f"{file_name}: unknown edge case '{entry.edge_case}' for {entry.formula}")
+            if len(entry.expected) != len(data):
+                raise ValueError(f"{file_name}: {entry.formula} has {len(entry.expected)} expected values "
+                                 f"for {len(data)} rows")
+        cases.append(GoldenCase(os.path.splitext(file_name)[0], spec.get("description", ""), data, formulas, path))
+    return cases
+
+
+def normalize_value(value: Any) -> Any:
+    """
+    Put a processor output value in the form golden files record.
+
+    Logicals stay bool, numbers become float, errors become the value
+    Excel shows (e.g. "#DIV/0!") and text stays text.
+    """
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, float, np.number)):
+        return float(value)
+    if isinstance(value, str):
+        return _EXCEL_ERROR_VALUES.get(value, value)
+    if value is None or pd.isna(value):
+        return None
+    return value
+
+
+def _same_value(expected: Any, actual: Any) -> bool:
+    """Exact comparison that keeps logicals and numbers apart"""
+    expected = normalize_value(expected)
+    return type(expected) is type(actual) and expected == actual
+
+
+def _evaluate(backend: FormulaBackend, processor, data: pd.DataFrame, formulas: Dict[str, str]) -> pd.DataFrame:
+    """Run formulas through a processor in the form its backend takes"""
+    formula_map = {
+        output: backend.formula_for(compile_formula(formula), formula) for output, formula in formulas.items()
+    }
+    return processor.process_formulas(data, formula_map)
+
+
+def check_backend(backend: FormulaBackend, cases: List[GoldenCase]) -> pd.DataFrame:
+    """
+    Evaluate every golden formula with a backend and compare with Excel.
+
+    Args:
+        backend: Backend to check
+        cases: Golden cases
+
+    Returns:
+        DataFrame with one row per formula: backend, case, function, edge_case,
+        formula, status ("match", "mismatch", "unsupported" or "failed"),
+        mismatched_rows and detail (the first differing row)
+    """
+    rows = []
+    with backend.create_processor(visible=False) as processor:
+        for case in cases:
+            for entry in case.formulas:
+                record = {
+                    "backend": backend.name, "case": case.name, "function": entry.function,
+                    "edge_case": entry.edge_case, "formula": entry.formula,
+                    "status": "match", "mismatched_rows": 0, "detail": ""
+                }
+                rows.append(record)
+                if not backend.supports(compile_formula(entry.formula)):
+                    record["status"] = "unsupported"
+                    continue
+                try:
+                    result = _evaluate(backend, processor, case.data, {"Result": entry.formula})["Result"]
+                except UnsupportedFormulaError as e:
+                    record.update(status="unsupported", detail=str(e))
+                    continue
+                except Exception as e:
+                    record.update(status="failed", detail=f"{type(e).__name__}: {e}")
+                    continue
+
+                actual = [normalize_value(value) for value in result]
+                differing = [row for row, (expected, value) in enumerate(zip(entry.expected, actual))
+                             if not _same_value(expected, value)]
+                if differing:
+                    row = differing[0]
+                    record.update(status="mismatch", mismatched_rows=len(differing),
+                                  detail=f"row {row}: expected {entry.expected[row]!r}, got {actual[row]!r}")
+    return pd.DataFrame(rows)
+
+
+def summarize_report(report: pd.DataFrame) -> pd.DataFrame:
+    """
+    Count formula outcomes per backend, function and edge case.
+
+    Args:
+        report: Concatenated check_backend results
+
+    Returns:
+        DataFrame indexed by (backend, function, edge_case) with one count
+        column per status
+    """
+    summary = report.groupby(["backend", "function", "edge_case", "status"]).size().unstack("status", fill_value=0)
+    for status in ("match", "mismatch", "unsupported", "failed"):
+        if status not in summary.columns:
+            summary[status] = 0
+    return summary[["match", "mismatch", "unsupported", "failed"]]
+
+
+def _scaled_data(data: pd.DataFrame, rows: int) -> pd.DataFrame:
+    """Repeat a golden dataset's rows up to a given size"""
+    positions = np.resize(np.arange(len(data)), rows)
+    return data.iloc[positions].reset_index(drop=True)
+
+
+def benchmark_backends(backends: List[FormulaBackend], cases: List[GoldenCase], report: pd.DataFrame,
+                       sizes=BENCHMARK_SIZES, repeats: int = 1) -> pd.DataFrame:
+    """
+    Time backends on the golden formulas every one of them evaluates.
+
+    Each golden dataset is scaled to every size and all its common formulas
+    are evaluated in one process_formulas call, the way the rule evaluator
+    batches rules; loading the data into the backend is part of the time.
+
+    Args:
+        backends: Backends to time
+        cases: Golden cases supplying data and formulas
+        report: check_backend results of the same backends, which decide the
+                formulas all of them evaluate
+        sizes: Row counts to time
+        repeats: Runs per measurement; the fastest is kept
+
+    Returns:
+        DataFrame with backend, rows, formulas, seconds, rows_per_second and
+        speedup (relative to the slowest backend at the same size)
+    """
+    evaluated = report[report["status"].isin(["match", "mismatch"])
+                       & report["backend"].isin([b.name for b in backends])]
+    common = evaluated.groupby(["case", "formula"]).size() == len(backends)
+    common = set(common[common].index)
+
+    rows = []
+    for size in sizes:
+        for backend in backends:
+            seconds = 0.0
+            formula_count = 0
+            for case in cases:
+                formulas = {
+                    f"Result_{i}": entry.formula for i, entry in enumerate(case.formulas)
+                    if (case.name, entry.formula) in common
+                }
+                if not formulas:
+                    continue
+                data = _scaled_data(case.data, size)
+                best = None
+                for _ in range(repeats):
+                    with backend.create_processor(visible=False) as processor:
+                        started = time.perf_counter()
+                        _evaluate(backend, processor, data, formulas)
+                        elapsed = time.perf_counter() - started
+                    best = elapsed if best is None else min(best, elapsed)
+                seconds += best
+                formula_count += len(formulas)
+            rows.append({"backend": backend.name, "rows": size, "formulas": formula_count, "seconds": seconds})
+
+    timings = pd.DataFrame(rows)
+    timings["rows_per_second"] = timings["rows"] / timings["seconds"]
+    slowest = timings.groupby("rows")["seconds"].transform("max")
+    timings["speedup"] = slowest / timings["seconds"]
+    return timings
+
+
+def record_expected(backend: FormulaBackend, cases: List[GoldenCase]) -> None:
+    """
+    Rewrite the expected values of golden files from a backend's results.
+
+    Args:
+        backend: Reference backend, normally Excel
+        cases: Golden cases to record
+    """
+    with backend.create_processor(visible=False) as processor:
+        for case in cases:
+            with open(case.path, 'r', encoding='utf-8') as f:
+                spec = json.load(f)
+            formulas = {f"Result_{i}": entry["formula"] for i, entry in enumerate(spec["formulas"])}
+            result = _evaluate(backend, processor, case.data, formulas)
+            for i, entry in enumerate(spec["formulas"]):
+                entry["expected"] = [normalize_value(value) for value in result[f"Result_{i}"]]
+            with open(case.path, 'w', encoding='utf-8') as f:
+                json.dump(spec, f, indent=2)
+                f.write("\n")
+
+
+def run(backend_names: Optional[List[str]] = None, sizes=BENCHMARK_SIZES,
+        registry: Optional[FormulaBackendRegistry] = None, directory: str = GOLDEN_DIR):
+    """
+    Check and time backends.
+
+    Args:
+        backend_names: Backends to run (default: every available one)
+        sizes: Row counts to time; empty to skip timing
+        registry: Backend registry (default: the bundled backends)
+        directory: Golden file directory
+
+    Returns:
+        Tuple of (per-formula report, summary per function and edge case, timings or None)
+    """
+    registry = registry or default_backend_registry()
+    backends = ([registry.get(name) for name in backend_names] if backend_names
+                else registry.available_backends())
+    cases = load_golden_cases(directory)
+
+    report = pd.concat([check_backend(backend, cases) for backend in backends], ignore_index=True)
+    timings = benchmark_backends(backends, cases, report, sizes) if sizes else None
+    return report, summarize_report(report), timings
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare formula backends with golden Excel results")
+    parser.add_argument("--backends", nargs="+", help="Backends to run (default: every available backend)")
+    parser.add_argument("--sizes", nargs="*", type=int, default=list(BENCHMARK_SIZES),
+                        help="Row counts to time; pass no value to skip timing")
+    parser.add_argument("--golden-dir", default=GOLDEN_DIR, help="Directory of golden files")
+    parser.add_argument("--record", metavar="BACKEND",
+                        help="Rewrite the golden files' expected values from this backend and exit")
+    args = parser.parse_args(argv)
+
+    if args.record:
+        record_expected(default_backend_registry().get(args.record), load_golden_cases(args.golden_dir))
+        print(f"Recorded expected values from {args.record} in {args.golden_dir}")
+        return 0
+
+    report, summary, timings = run(args.backends, args.sizes, directory=args.golden_dir)
+
+    with pd.option_context("display.width", 160, "display.max_rows", None, "display.max_colwidth", 80):
+        print("Results per function and edge case:")
+        print(summary.to_string())
+        problems = report[report["status"].isin(["mismatch", "failed"])]
+        if not problems.empty:
+            print("\nMismatches:")
+            print(problems[["backend", "function", "edge_case", "formula", "mismatched_rows", "detail"]]
+                  .to_string(index=False))
+        if timings is not None:
+            print("\nTimings:")
+            print(timings.to_string(index=False, float_format=lambda v: f"{v:,.3f}"))
+
+    print(f"\n{len(problems)} formula(s) differ from Excel" if not problems.empty
+          else "\nAll supported formulas match Excel")
+    return 1 if not problems.empty else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
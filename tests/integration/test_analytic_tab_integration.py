@@ -16,6 +16,9 @@ from datetime import datetime
 from openpyxl import load_workbook
 
 from services.validation_service import ValidationPipeline
+from core.rule_engine.incremental_store import IncrementalResultStore
+from core.rule_engine.performance_store import RulePerformanceStore
+from core.rule_engine.result_cache import RuleResultCache
 from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
 from reporting.generation.report_generator import ReportGenerator
 
@@ -70,7 +73,10 @@ class TestAnalyticTabIntegration(unittest.TestCase):
         
         # Initialize pipeline
         self.pipeline = ValidationPipeline(
-            output_dir=str(self.output_dir)
+            output_dir=str(self.output_dir),
+            result_cache=RuleResultCache(str(Path(self.temp_dir) / "cache")),
+            incremental_store=IncrementalResultStore(str(Path(self.temp_dir) / "incremental")),
+            performance_store=RulePerformanceStore(str(Path(self.temp_dir) / "performance.db"))
         )
         
         # Add rule to rule manager
@@ -19,6 +19,9 @@ logger = logging.getLogger("ValidationPipelineTest")
 
 # Import our components
 from services.validation_service import ValidationPipeline
+from core.rule_engine.incremental_store import IncrementalResultStore
+from core.rule_engine.performance_store import RulePerformanceStore
+from core.rule_engine.result_cache import RuleResultCache
 from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
 from core.rule_engine.rule_evaluator import RuleEvaluator
 
@@ -239,7 +242,10 @@ def test_validation_pipeline():
         pipeline = ValidationPipeline(
             rule_manager=rule_manager,
             output_dir=output_dir,
-            archive_dir=archive_dir
+            archive_dir=archive_dir,
+            result_cache=RuleResultCache(os.path.join(temp_dir, 'cache')),
+            incremental_store=IncrementalResultStore(os.path.join(temp_dir, 'incremental')),
+            performance_store=RulePerformanceStore(os.path.join(temp_dir, 'performance.db'))
         )
 
         print(f"Initialized ValidationPipeline with output_dir={output_dir}")
@@ -0,0 +1,62 @@
+# tests/test_backend_harness.py
+
+import json
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.formula_engine.backends import default_backend_registry
+from tests.backend_harness import (
+    EDGE_CASES, GOLDEN_DIR, benchmark_backends, check_backend, load_golden_cases, main, summarize_report
+)
+
+AVAILABLE_BACKENDS = [backend.name for backend in default_backend_registry().available_backends()]
+
+
+@pytest.fixture(scope='module')
+def cases():
+    return load_golden_cases()
+
+
+@pytest.mark.parametrize('backend_name', AVAILABLE_BACKENDS)
+def test_backend_matches_golden_results(cases, backend_name):
+    report = check_backend(default_backend_registry().get(backend_name), cases)
+    assert len(report) == sum(len(case.formulas) for case in cases)
+    # Every edge case is covered by the golden files
+    assert set(report['edge_case']) == set(EDGE_CASES)
+
+    problems = report[report['status'].isin(['mismatch', 'failed'])]
+    assert problems.empty, problems[['formula', 'detail']].to_string()
+    if backend_name == 'native':
+        assert (report['status'] == 'match').all()
+
+
+def test_harness_reports_mismatches_and_timings(cases, tmp_path, capsys):
+    # A golden file with one wrong expected value
+    with open(os.path.join(GOLDEN_DIR, 'operators.json'), encoding='utf-8') as f:
+        spec = json.load(f)
+    spec['formulas'][0]['expected'][2] = 2
+    with open(tmp_path / 'operators.json', 'w', encoding='utf-8') as f:
+        json.dump(spec, f)
+
+    # One command checks and times, and fails on the mismatch
+    assert main(['--backends', 'native', '--sizes', '100', '--golden-dir', str(tmp_path)]) == 1
+    output = capsys.readouterr().out
+    assert 'row 2: expected 2, got 1.0' in output and '1 formula(s) differ from Excel' in output
+
+    registry = default_backend_registry()
+    backends = [registry.get('native'), registry.get('sqlite')]
+    report = pd.concat([check_backend(backend, cases) for backend in backends], ignore_index=True)
+    summary = summarize_report(report)
+    assert summary.loc[('sqlite', 'UPPER', 'baseline'), 'unsupported'] == 1
+
+    # Both backends are timed on the same formulas
+    timings = benchmark_backends(backends, cases, report, sizes=(50, 200))
+    assert list(timings['rows']) == [50, 50, 200, 200]
+    assert (timings['formulas'] > 0).all() and timings['formulas'].nunique() == 1
+    assert (timings.groupby('rows')['speedup'].min() == 1.0).all()
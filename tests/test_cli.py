@@ -0,0 +1,65 @@
+# tests/test_cli.py
+
+import json
+import os
+import subprocess
+import sys
+
+import pandas as pd
+
+# Add the project root to path for imports
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, PROJECT_ROOT)
+
+from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
+from services import cli
+
+# Modules that must only load when a backend or output format needs them
+HEAVY_MODULES = ['PySide6', 'win32com', 'pythoncom', 'openpyxl', 'xlsxwriter']
+
+IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import services.cli
+import services.validation_service
+seconds = time.perf_counter() - start
+print(json.dumps({'seconds': seconds, 'loaded': [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+
+def test_cold_start_stays_light():
+    """Importing the headless entry point and the pipeline loads no GUI, COM or Excel libraries"""
+    output = subprocess.run([sys.executable, '-c', IMPORT_PROBE], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True)
+    probe = json.loads(output.stdout.strip().splitlines()[-1])
+    assert probe['loaded'] == []
+    assert probe['seconds'] < 1.0
+
+
+def test_cli_runs_each_analytic(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    rule_manager = ValidationRuleManager(str(tmp_path / 'rules'))
+    for name, formula, analytic in [('Amount Positive', '=[Amount]>0', 'QA-1'),
+                                    ('Owner Present', '=NOT(ISBLANK([Owner]))', 'QA-2')]:
+        rule = ValidationRule(name=name, formula=formula)
+        rule.analytic_id = analytic
+        rule_manager.add_rule(rule)
+    data_file = tmp_path / 'extract.csv'
+    pd.DataFrame({'Amount': [1, 2, 3], 'Owner': ['a', 'b', 'c'], 'Leader': ['L1', 'L2', 'L1']}).to_csv(
+        data_file, index=False)
+
+    exit_code = cli.main([str(data_file), '--rules-dir', str(tmp_path / 'rules'),
+                          '--analytic', 'QA-1', '--analytic', 'QA-2', '--party-column', 'Leader',
+                          '--output-dir', str(tmp_path / 'out'), '--summary', str(tmp_path / 'summary.json')])
+
+    assert exit_code == 0
+    runs = json.loads((tmp_path / 'summary.json').read_text())
+    assert [(run['analytic_id'], run['status'], run['total_rules']) for run in runs] == [
+        ('QA-1', 'FULLY_COMPLIANT', 1), ('QA-2', 'FULLY_COMPLIANT', 1)
+    ]
+    assert all(os.path.exists(path) and path.endswith('_results.json')
+               for run in runs for path in run['output_files'])
+    assert 'QA-2' in capsys.readouterr().out
+
+    assert cli.main([str(data_file), '--rules-dir', str(tmp_path / 'rules'), '--analytic', 'MISSING',
+                     '--output-dir', str(tmp_path / 'out')]) == 1
@@ -0,0 +1,86 @@
+# tests/test_columnar_export.py
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.rule_engine.rule_evaluator import RuleEvaluator
+from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
+from data_integration.io.columnar_export import build_columnar_tables, results_from_metrics
+
+
+@pytest.fixture
+def evaluated(tmp_path):
+    rule_manager = ValidationRuleManager(str(tmp_path / 'rules'))
+    evaluator = RuleEvaluator(rule_manager=rule_manager, formula_backend='native')
+    data = pd.DataFrame({
+        'Amount': [5, -1, 3, -2, 0],
+        'Owner': ['a', None, 'c', 'd', None],
+        'party': [1, 2, 3, 4, 5],  # Input column clashing with a key column
+        'Leader': ['L1', 'L2', 'L1', 'L2', 'L2']
+    })
+    rule_results = {}
+    for name, formula in [('Amount Positive', '=[Amount]>0'), ('Owner Present', '=NOT(ISBLANK([Owner]))')]:
+        rule = ValidationRule(name=name, formula=formula)
+        rule_results[rule.rule_id] = evaluator.evaluate_rule(rule, data, 'Leader')
+    results = {'analytic_id': 'QA-7', 'timestamp': '2024-01-02T03:04:05', 'status': 'NON_COMPLIANT'}
+    return results, rule_results
+
+
+def test_tables_are_built_in_one_pass(evaluated):
+    results, rule_results = evaluated
+    metrics, failing = build_columnar_tables(results, rule_results, 'Leader')
+
+    amount_id, owner_id = list(rule_results)
+    # One overall row and one row per party for each rule
+    assert len(metrics) == 6
+    overall = metrics[metrics['party'].isna()].set_index('rule_id')
+    assert overall.loc[amount_id, 'dnc_count'] == 3 and overall.loc[owner_id, 'total_count'] == 5
+
+    assert isinstance(failing['rule_id'].dtype, pd.CategoricalDtype)
+    assert isinstance(failing['party'].dtype, pd.CategoricalDtype)
+    assert list(failing['rule_id'].cat.categories) == [amount_id, owner_id]
+    assert failing.loc[failing['rule_id'] == amount_id, 'row'].tolist() == [1, 3, 4]
+    assert failing.loc[failing['rule_id'] == owner_id, 'party'].tolist() == ['L2', 'L2']
+    assert failing['party (data)'].tolist() == [2, 4, 5, 2, 5]
+    assert (failing['result'] == False).all()
+
+
+def test_metrics_rebuild_results_for_aggregation(evaluated):
+    results, rule_results = evaluated
+    metrics, _ = build_columnar_tables(results, rule_results, 'Leader')
+
+    [rebuilt] = results_from_metrics(metrics)
+    amount_id = next(iter(rule_results))
+    assert rebuilt['analytic_id'] == 'QA-7' and rebuilt['status'] == 'NON_COMPLIANT'
+    assert rebuilt['rule_results'][amount_id]['dnc_count'] == 3
+    assert rebuilt['rule_results'][amount_id]['party_results']['L2']['metrics']['total_count'] == 3
+    assert rebuilt['grouped_summary']['L1'] == {
+        'total_rules': 2,
+        'GC': sum(r.party_results['L1']['status'] == 'GC' for r in rule_results.values()),
+        'PC': sum(r.party_results['L1']['status'] == 'PC' for r in rule_results.values()),
+        'DNC': sum(r.party_results['L1']['status'] == 'DNC' for r in rule_results.values()),
+        'compliance_rate': rebuilt['grouped_summary']['L1']['GC'] / 2
+    }
+
+
+def test_parquet_files_feed_aggregate_analytics(evaluated, tmp_path):
+    pytest.importorskip('pyarrow')
+    from data_integration.io.columnar_export import read_columnar_table, write_columnar_results
+    from services.validation_service import ValidationPipeline
+
+    results, rule_results = evaluated
+    metrics_path, failing_path = write_columnar_results(results, rule_results, tmp_path, 'QA-7_run',
+                                                        fmt='parquet', responsible_party_column='Leader')
+    failing = read_columnar_table(failing_path)
+    assert isinstance(failing['rule_id'].dtype, pd.CategoricalDtype) and len(failing) == 5
+
+    pipeline = ValidationPipeline(rule_manager=ValidationRuleManager(str(tmp_path / 'rules')),
+                                  output_dir=str(tmp_path / 'out'))
+    aggregated = pipeline.aggregate_analytics([metrics_path], output_dir=str(tmp_path / 'out'))
+    assert aggregated['success'] and aggregated['leader_count'] == 2
@@ -0,0 +1,86 @@
+# tests/test_compliance_determiner.py
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.rule_engine.compliance_determiner import ComplianceDeterminer, error_mask_from_column
+
+
+def test_vectorized_counts_match_row_rules():
+    """Column classification agrees with determine_row_compliance for every result type"""
+    determiner = ComplianceDeterminer()
+    values = [True, False, None, np.nan, 1.0, 0.85, 0.5, 1, "TRUE", "false",
+              "ERROR: bad formula", "ERROR_DIV_ZERO", "#N/A", "unexpected"]
+    result_df = pd.DataFrame({'Result': pd.Series(values, dtype=object)})
+
+    status, metrics = determiner.determine_overall_compliance(result_df, 'Result', 0.9)
+
+    expected = [determiner.determine_row_compliance(v, 0.9) for v in values if not pd.isna(v)]
+    assert metrics['total_count'] == len(expected) == 12
+    assert metrics['gc_count'] == expected.count("GC") == 4
+    assert metrics['pc_count'] == expected.count("PC") == 1
+    assert metrics['dnc_count'] == expected.count("DNC") == 7
+    assert metrics['error_count'] == 2
+    assert metrics['gc_rate'] == 4 / 12
+    assert status == "DNC"
+
+
+def test_party_counts_from_single_groupby():
+    """Per-party metrics have the same shape as the overall metrics"""
+    determiner = ComplianceDeterminer()
+    result_df = pd.DataFrame({
+        'Result': [True, True, False, True, None],
+        'Party': ['Team1', 'Team1', 'Team2', 'Team2', 'Team3']
+    })
+
+    party_results = determiner.aggregate_by_responsible_party(result_df, 'Result', 'Party')
+
+    assert list(party_results) == ['Team1', 'Team2', 'Team3']
+    assert party_results['Team1']['status'] == "GC"
+    assert party_results['Team2']['metrics']['dnc_count'] == 1
+    assert party_results['Team2']['status'] == "DNC"
+    # A party with only null results has the zero-total metrics
+    assert party_results['Team3']['metrics']['total_count'] == 0
+    assert set(party_results['Team3']['metrics']) == set(party_results['Team1']['metrics'])
+
+
+def test_error_column_feeds_error_count():
+    """Errors flagged in a processor's error column count without reading result text"""
+    determiner = ComplianceDeterminer()
+    result_df = pd.DataFrame({
+        'Result': pd.Series([True, 'ERROR_DIV_ZERO', False, None, 'ERROR_NA', True], dtype=object),
+        'Result_Error': ['', 'ERROR_DIV_ZERO', '', None, 'ERROR_NA', '']
+    })
+    error_mask = error_mask_from_column(result_df['Result_Error'])
+    assert list(error_mask) == [False, True, False, False, True, False]
+    assert error_mask_from_column(result_df.get('Missing_Error')) is None
+
+    expected = determiner.determine_overall_compliance(result_df, 'Result')
+    assert determiner.determine_overall_compliance(result_df, 'Result', error_mask=error_mask) == expected
+    assert expected[1]['error_count'] == 2 and expected[1]['total_count'] == 5
+
+    # An Excel COM error code is a number in the result column; the error column marks it
+    result_df.loc[1, 'Result'] = -2146826281
+    _, metrics = determiner.determine_overall_compliance(result_df, 'Result', error_mask=error_mask)
+    assert metrics == expected[1]
+
+
+def test_numpy_scalars_mixed_with_strings():
+    """NumPy scalars in a mixed column classify like the Python values they hold"""
+    determiner = ComplianceDeterminer()
+    numpy_values = [np.float64(0.85), np.int64(1), np.bool_(False), 'TRUE', 'ERROR_NA', None]
+    python_values = [0.85, 1, False, 'TRUE', 'ERROR_NA', None]
+
+    status, metrics = determiner.determine_overall_compliance(
+        pd.DataFrame({'Result': pd.Series(numpy_values, dtype=object)}), 'Result')
+    expected = determiner.determine_overall_compliance(
+        pd.DataFrame({'Result': pd.Series(python_values, dtype=object)}), 'Result')
+
+    assert (status, metrics) == expected
+    assert (metrics['gc_count'], metrics['pc_count'], metrics['dnc_count'], metrics['error_count']) == (2, 1, 2, 1)
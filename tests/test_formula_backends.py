@@ -0,0 +1,84 @@
+# tests/test_formula_backends.py
+
+import os
+import sys
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.formula_engine.backends import FormulaBackendRegistry, default_backend_registry
+from core.rule_engine.rule_evaluator import RuleEvaluator
+from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
+from services.validation_service import ValidationPipeline
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(3)
+    return pd.DataFrame({
+        'Amount': rng.integers(-10, 50, 3000).astype(float),
+        'Name': rng.choice(['bob', 'Ann', ''], 3000),
+        'Leader': rng.choice(['L1', 'L2', 'L3'], 3000)
+    })
+
+
+def _sqlite_first_registry(tmp_path):
+    """Default backends with SQLite ranked fastest, so fallback to native can be observed"""
+    default = default_backend_registry()
+    return FormulaBackendRegistry([
+        replace(default.get('sqlite'), speed_rank=0, processor_options={'database_dir': str(tmp_path / 'db')}),
+        replace(default.get('native'), speed_rank=1),
+        default.get('excel')
+    ])
+
+
+def test_capability_matrix_and_routing():
+    registry = default_backend_registry()
+    matrix = registry.capability_matrix(['IF', 'UPPER', 'vlookup'])
+    assert list(matrix.columns) == ['native', 'sqlite', 'excel']
+    assert list(matrix.index) == ['IF', 'UPPER', 'VLOOKUP', 'available']
+    assert matrix.loc['IF'].all() and not matrix.loc['UPPER', 'sqlite'] and matrix.loc['VLOOKUP', 'excel']
+    assert matrix.loc['available', 'native'] and matrix.loc['available', 'sqlite']
+
+    assert registry.route('=[Amount]>0').name == 'native'
+    assert [b.name for b in registry.candidates('=UPPER([Name])="BOB"')
+            if b.name != 'excel'] == ['native']
+    # A function no bundled engine implements is routed to Excel only
+    assert all(b.name == 'excel' for b in registry.candidates('=VLOOKUP([Name], A1:B2, 2, FALSE)'))
+    with pytest.raises(ValueError):
+        registry.get('duckdb')
+
+
+def test_rules_fall_back_and_record_backend(data, tmp_path):
+    rule_manager = ValidationRuleManager(str(tmp_path / 'rules'))
+    registry = _sqlite_first_registry(tmp_path)
+    evaluator = RuleEvaluator(rule_manager=rule_manager, backend_registry=registry)
+    rules = [
+        ValidationRule(name='Positive', formula='=[Amount]>0'),
+        # Routed to native: SQLite has no UPPER
+        ValidationRule(name='Upper', formula='=UPPER([Name])="BOB"'),
+        # Routed to SQLite, which turns text arithmetic down at evaluation time
+        ValidationRule(name='Coerced', formula='=[Name]+1>0')
+    ]
+    expected_backends = {'Positive': 'sqlite', 'Upper': 'native', 'Coerced': 'native'}
+    reference = RuleEvaluator(rule_manager=rule_manager, formula_backend='native')
+
+    for rule in rules:
+        result = evaluator.evaluate_rule(rule, data, 'Leader')
+        assert result.formula_backend == expected_backends[rule.name]
+        assert result.summary['formula_backend'] == expected_backends[rule.name]
+        assert result.compliance_metrics == reference.evaluate_rule(rule, data, 'Leader').compliance_metrics
+
+    # The batch path groups rules per backend and records the same choice
+    batch_results = evaluator.evaluate_rules_batch(rules, data, 'Leader')
+    assert {r.rule.name: r.formula_backend for r in batch_results.values()} == expected_backends
+
+    pipeline = ValidationPipeline(rule_manager=rule_manager, evaluator=evaluator, output_dir=str(tmp_path / 'out'))
+    results = {'rule_results': {}}
+    pipeline._process_evaluation_results(batch_results, results, 'Leader')
+    assert results['summary']['formula_backends'] == {'sqlite': 1, 'native': 2}
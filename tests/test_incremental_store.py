@@ -0,0 +1,105 @@
+# tests/test_incremental_store.py
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.rule_engine.incremental_store import MAX_REPORTED_RANGES, IncrementalResultStore, row_ranges
+from core.rule_engine.rule_evaluator import RuleEvaluator
+from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
+
+
+@pytest.fixture
+def workspace():
+    """Temporary rules and store directories with a native evaluator"""
+    with tempfile.TemporaryDirectory() as root:
+        evaluator = RuleEvaluator(
+            rule_manager=ValidationRuleManager(os.path.join(root, 'rules')),
+            formula_backend="native"
+        )
+        yield evaluator, IncrementalResultStore(os.path.join(root, 'incremental'))
+
+
+@pytest.fixture
+def rules():
+    return [
+        ValidationRule(name='Owner Present', formula='=NOT(ISBLANK([Owner]))', threshold=1.0),
+        ValidationRule(name='Amount Positive', formula='=[Amount]>0', threshold=1.0)
+    ]
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({
+        'Owner': ['Ann', None, 'Bob', ''],
+        'Amount': [10, -1, 5, 0],
+        'Party': ['P1', 'P1', 'P2', 'P2']
+    })
+
+
+def assert_matches_full_run(evaluator, results, rules, data_df):
+    """Incremental results equal a full evaluation of the same data"""
+    expected = evaluator.evaluate_multiple_rules(rules, data_df, 'Party')
+    for rule in rules:
+        result = results[rule.rule_id]
+        full = expected[rule.rule_id]
+        assert result.compliance_status == full.compliance_status
+        assert result.compliance_metrics == full.compliance_metrics
+        assert result.party_results == full.party_results
+        assert result.result_df[result.result_column].tolist() == full.result_df[full.result_column].tolist()
+
+
+def test_first_run_evaluates_every_row(workspace, rules, data):
+    evaluator, store = workspace
+    results, report = store.evaluate('src', rules, data, evaluator, 'Party')
+
+    assert report['evaluated_rows'] == 4
+    assert report['reused_rows'] == 0
+    assert report['evaluated_row_ranges'] == [[0, 3]] and report['reused_row_ranges'] == []
+    assert_matches_full_run(evaluator, results, rules, data)
+
+
+def test_appended_and_edited_rows_only(workspace, rules, data):
+    """Only appended rows and rows whose referenced values changed are evaluated"""
+    evaluator, store = workspace
+    store.evaluate('src', rules, data, evaluator, 'Party')
+
+    updated = pd.concat([data, pd.DataFrame({
+        'Owner': ['Cy'], 'Amount': [-3], 'Party': ['P3']
+    })], ignore_index=True)
+    updated.loc[1, 'Owner'] = 'Dee'
+    results, report = store.evaluate('src', rules, updated, evaluator, 'Party')
+
+    assert report['evaluated_rows'] == 2
+    assert report['evaluated_row_ranges'] == [[1, 1], [4, 4]]
+    assert report['reused_row_ranges'] == [[0, 0], [2, 3]]
+    owner_rule, amount_rule = rules
+    assert report['rules'][owner_rule.rule_id] == {'reused_rows': 3, 'evaluated_rows': 2}
+    assert report['rules'][amount_rule.rule_id] == {'reused_rows': 4, 'evaluated_rows': 1}
+    assert_matches_full_run(evaluator, results, rules, updated)
+
+    # Unchanged data reuses every row
+    _, report = store.evaluate('src', rules, updated, evaluator, 'Party')
+    assert report['evaluated_rows'] == 0
+
+
+def test_sources_are_kept_apart(workspace, rules, data):
+    evaluator, store = workspace
+    store.evaluate('src', rules, data, evaluator, 'Party')
+    _, report = store.evaluate('other', rules, data, evaluator, 'Party')
+    assert report['reused_rows'] == 0
+
+
+def test_row_ranges_are_capped():
+    index = pd.Index([f'r{i}' for i in range(100)])
+    mask = np.arange(100) % 3 == 0
+    assert row_ranges(index, mask, limit=2) == [['r0', 'r0'], ['r3', 'r3']]
+    assert row_ranges(index, np.arange(100) >= 40) == [['r40', 'r99']]
+    assert len(row_ranges(index, mask)) == MAX_REPORTED_RANGES
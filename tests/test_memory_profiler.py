@@ -0,0 +1,56 @@
+# tests/test_memory_profiler.py
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.memory_profiler import MemoryProfiler, frame_memory
+from utils.process_monitor import read_memory_usage
+
+
+def test_read_memory_usage_reports_rss():
+    memory = read_memory_usage()
+    if memory['rss_bytes'] is not None:
+        assert memory['rss_bytes'] > 0
+        assert memory['peak_rss_bytes'] >= memory['rss_bytes'] or memory['peak_rss_bytes'] is None
+
+
+def test_nested_sections_attribute_allocations():
+    profiler = MemoryProfiler(top_allocations=3)
+    profiler.start()
+    try:
+        with profiler.section('evaluation'):
+            with profiler.section('rule:Big', rule_id='big') as section:
+                data = np.ones(2_000_000)  # 16 MB
+                section['array_bytes'] = data.nbytes
+            del data
+        df = pd.DataFrame({'text': ['abc'] * 1000})
+        profiler.record_frame('input', df)
+    finally:
+        profiler.stop()
+
+    profile = profiler.to_dict()
+    evaluation = profile['sections'][0]
+    rule = evaluation['children'][0]
+    assert rule['name'] == 'rule:Big' and rule['rule_id'] == 'big'
+    assert rule['array_bytes'] == 16_000_000
+    assert rule['python_peak_bytes'] >= 16_000_000
+    assert rule['top_allocations'][0]['location'].startswith(__file__)
+    # The child's peak counts towards its parent even though the array was freed
+    assert evaluation['python_peak_bytes'] >= rule['python_peak_bytes']
+    assert evaluation['python_allocated_bytes'] < 16_000_000
+    assert profile['frames']['input'] == frame_memory(df) > df['text'].to_numpy().nbytes
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = MemoryProfiler(enabled=False)
+    profiler.start()
+    with profiler.section('load') as section:
+        section['array_bytes'] = 1
+    profiler.record_frame('input', pd.DataFrame({'a': [1]}))
+    assert profiler.sections == [] and profiler.to_dict()['frames'] == {}
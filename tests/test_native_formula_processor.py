@@ -0,0 +1,232 @@
+# tests/test_native_formula_processor.py
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.formula_engine.native_formula_processor import (
+    ERROR_VALUES, NativeFormulaProcessor, UnsupportedFormulaError, _VectorEvaluator
+)
+from core.rule_engine.rule_parser import compile_formula
+from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
+from core.rule_engine.rule_evaluator import RuleEvaluator
+
+
+@pytest.fixture
+def sample_data():
+    """Fixture with the column shapes our business monitoring rules use"""
+    return pd.DataFrame({
+        'ImpactOccurred': ['Yes - material', 'No', 'yes', None, 'Yes'],
+        'CaseSource': ['Hotline', None, 'Audit', 'Audit', ''],
+        'ImpactDescription': ['  lost revenue ', '', '   ', None, 'ok'],
+        'Value': [100, 200, 50, 0, np.nan],
+        'Status': ['Active', 'inactive', 'Other', None, 'ACTIVE'],
+        'ResponsibleParty': ['Team1', 'Team2', 'Team1', 'Team3', 'Team2']
+    })
+
+
+def evaluate(data, formula):
+    """Evaluate a single formula and return (results, errors) as lists"""
+    with NativeFormulaProcessor() as processor:
+        result_df = processor.process_formulas(data, {'Result': formula})
+    return list(result_df['Result']), list(result_df['Result_Error'])
+
+
+def test_logical_functions_and_blanks(sample_data):
+    """IF/AND/NOT/ISBLANK with LEFT text comparison (case-insensitive)"""
+    results, errors = evaluate(
+        sample_data,
+        '=IF(LEFT([ImpactOccurred],3)="Yes",AND(NOT(ISBLANK([CaseSource]))),TRUE)'
+    )
+    # Empty strings and None are both blank cells
+    assert results == [True, True, True, True, False]
+    assert errors == [''] * 5
+
+
+def test_len_trim(sample_data):
+    """Whitespace-only descriptions trim to an empty string"""
+    results, _ = evaluate(
+        sample_data,
+        '=IF(LEFT([ImpactOccurred],3)="Yes",LEN(TRIM([ImpactDescription]))>0,TRUE)'
+    )
+    assert results == [True, True, False, True, True]
+
+
+def test_comparisons_treat_blank_as_zero(sample_data):
+    """Numeric comparisons against blank cells compare with zero"""
+    results, _ = evaluate(sample_data, '=OR(ISBLANK([Value]), AND([Value]>=1, [Value]<=5))')
+    assert results == [False, False, False, False, True]
+
+    results, _ = evaluate(sample_data, '=[Value]=0')
+    assert results == [False, False, False, True, True]
+
+
+def test_error_values_match_excel_processor(sample_data):
+    """Errors are reported with the ExcelFormulaProcessor sentinel strings"""
+    results, errors = evaluate(sample_data, '=[Value]/([Value]-100)')
+    assert results[0] == 'ERROR_DIV_ZERO'
+    assert errors[0] == 'ERROR_DIV_ZERO'
+    assert results[1] == 2.0
+    assert errors[1:] == [''] * 4
+
+    results, errors = evaluate(sample_data, '=[Status]+1')
+    assert results[0] == 'ERROR_VALUE'
+    assert errors[3] == ''  # Blank status counts as zero
+    assert results[3] == 1.0
+
+
+def test_error_codes_propagate_and_short_circuit():
+    """Errors travel as int8 codes; IF, ISERROR and IFERROR only see the branch a row takes"""
+    data = pd.DataFrame({'A': [4.0, 1.0, np.nan, -2.0], 'B': [2.0, 0.0, 0.0, 1.0]})
+    values = _VectorEvaluator(data).evaluate(compile_formula('=[A]/[B]+[B]/[A]').ast)
+    # Leftmost error wins; numeric errors need no text array
+    assert values.txt is None and values.err.dtype == np.int8
+    assert [ERROR_VALUES[code] for code in values.err] == ['', '#DIV/0!', '#DIV/0!', '']
+
+    results, errors = evaluate(data, '=IF([B]=0, "none", [A]/[B])')
+    assert results == [2.0, 'none', 'none', -2.0] and errors == [''] * 4
+    results, errors = evaluate(data, '=IF([A]/[B]>0, #N/A, 1)')
+    assert results == ['ERROR_NA', 'ERROR_DIV_ZERO', 'ERROR_DIV_ZERO', 1.0]
+    assert errors[:3] == results[:3]
+
+    results, _ = evaluate(data, '=ISERROR([A]/[B])')
+    assert results == [False, True, True, False]
+    results, errors = evaluate(data, '=IFERROR([A]/[B], [B]/[A])')
+    assert results == [2.0, 0.0, 'ERROR_DIV_ZERO', -2.0]
+    assert errors == ['', '', 'ERROR_DIV_ZERO', '']
+
+
+def test_text_concatenation():
+    """Numbers and logicals are converted to text like Excel's General format"""
+    data = pd.DataFrame({'Mixed': [10, 'text', None, True, 3.14]})
+    results, _ = evaluate(data, '=[Mixed]&"|"')
+    assert results == ['10|', 'text|', '|', 'TRUE|', '3.14|']
+
+
+def test_dates_compare_as_serial_numbers():
+    """Date columns are evaluated as Excel date serials"""
+    data = pd.DataFrame({'Dates': pd.to_datetime(['2023-01-01', None, '2023-01-03'])})
+    results, _ = evaluate(data, '=[Dates]>=44929')  # 44929 = 2023-01-03
+    assert results == [False, False, True]
+
+
+def test_syntax_error_marks_column():
+    """Invalid formulas behave like a formula Excel refuses to accept"""
+    data = pd.DataFrame({'A': [1, 2]})
+    results, errors = evaluate(data, '=IF([A]>1,')
+    assert all(str(r).startswith('ERROR:') for r in results)
+    assert errors == ['FORMULA_SETTING_ERROR'] * 2
+
+
+def test_unsupported_function_raises():
+    """Functions outside the supported subset are rejected, not guessed"""
+    data = pd.DataFrame({'A': [1, 2]})
+    processor = NativeFormulaProcessor()
+    assert not processor.supports_formula('=VLOOKUP([A], {1,100;2,200}, 2, FALSE)')
+    with pytest.raises(UnsupportedFormulaError):
+        processor.process_formulas(data, {'Result': '=VLOOKUP([A], {1,100;2,200}, 2, FALSE)'})
+
+
+def test_result_index_preserved(sample_data):
+    """Result columns align with the input index"""
+    data = sample_data.set_index(pd.Index([10, 20, 30, 40, 50]))
+    with NativeFormulaProcessor() as processor:
+        result_df = processor.process_formulas(data, {'Result': '=NOT(ISBLANK([CaseSource]))'})
+    assert list(result_df.index) == [10, 20, 30, 40, 50]
+    assert list(result_df.columns[:len(data.columns)]) == list(data.columns)
+
+
+def test_rule_evaluator_native_backend(sample_data):
+    """RuleEvaluator runs end to end on the native backend"""
+    with tempfile.TemporaryDirectory() as rules_dir:
+        evaluator = RuleEvaluator(rule_manager=ValidationRuleManager(rules_dir), formula_backend="native")
+        rule = ValidationRule(
+            name="StatusValid",
+            formula='=OR([Status]="Active", [Status]="Inactive")',
+            threshold=0.5
+        )
+        result = evaluator.evaluate_rule(rule, sample_data, 'ResponsibleParty')
+
+    assert result.compliance_metrics['gc_count'] == 3
+    assert result.compliance_metrics['dnc_count'] == 2
+    assert set(result.party_results.keys()) == {'Team1', 'Team2', 'Team3'}
+    assert len(result.get_failing_items()) == 2
+
+
+def test_batch_evaluation_matches_per_rule(sample_data):
+    """Batched evaluation splits into the same per-rule results as one-by-one evaluation"""
+    rules = [
+        ValidationRule(name="HasSource", formula='=NOT(ISBLANK([CaseSource]))', threshold=0.5),
+        ValidationRule(name="HasSource", formula='=LEN(TRIM([ImpactDescription]))>0', threshold=0.5),
+        ValidationRule(name="Broken", formula='=NOT(ISBLANK([Missing]))'),
+    ]
+    with tempfile.TemporaryDirectory() as rules_dir:
+        evaluator = RuleEvaluator(rule_manager=ValidationRuleManager(rules_dir), formula_backend="native")
+        batched = evaluator.evaluate_multiple_rules(rules, sample_data, 'ResponsibleParty')
+        single = evaluator.evaluate_multiple_rules(rules, sample_data, 'ResponsibleParty', batch=False)
+
+    # The rule referencing a missing column is skipped in both modes
+    assert set(batched) == set(single) == {rules[0].rule_id, rules[1].rule_id}
+    for rule_id, result in batched.items():
+        expected = single[rule_id]
+        assert result.result_column == 'Result_HasSource'
+        assert list(result.result_df.columns) == list(expected.result_df.columns)
+        pd.testing.assert_frame_equal(result.result_df, expected.result_df)
+        assert result.compliance_metrics == expected.compliance_metrics
+        assert result.party_results == expected.party_results
+
+
+def test_shared_subexpressions_computed_once(sample_data):
+    """Identical subtrees across formulas are evaluated once per batch"""
+    formulas = {
+        'R1': '=IF(LEFT([ImpactOccurred],3)="Yes",NOT(ISBLANK([CaseSource])),TRUE)',
+        'R2': '=IF(LEFT([ImpactOccurred],3)="Yes",LEN(TRIM([ImpactDescription]))>0,TRUE)',
+        'R3': '=AND(NOT(ISBLANK([CaseSource])), [Value]>0)',
+    }
+    with NativeFormulaProcessor() as shared_processor:
+        shared_df = shared_processor.process_formulas(sample_data, formulas)
+    with NativeFormulaProcessor(share_subexpressions=False) as plain_processor:
+        plain_df = plain_processor.process_formulas(sample_data, formulas)
+
+    pd.testing.assert_frame_equal(shared_df, plain_df)
+    stats = shared_processor.last_plan.to_dict()
+    # Shared: LEFT(...)="Yes", LEFT(...), NOT(ISBLANK(...)) and ISBLANK(...).
+    # Repeated nodes: LEFT(...)="Yes" subtree (5), TRUE, NOT(ISBLANK([CaseSource])) subtree (3)
+    # and the literal 0
+    assert stats['shared_subexpressions'] == 4
+    assert stats['deduplicated_nodes'] == 10
+    assert plain_processor.last_plan is None
+
+
+def test_only_referenced_columns_reach_processor(sample_data):
+    """The processor sees the projected columns; results still cover the full input"""
+    data = sample_data.set_index(pd.Index([10, 20, 30, 40, 50]))
+    seen_columns = []
+
+    class RecordingProcessor(NativeFormulaProcessor):
+        def process_formulas_bulk(self, data, formulas, input_range="A2"):
+            seen_columns.append(list(data.columns))
+            return super().process_formulas_bulk(data, formulas, input_range)
+
+    with tempfile.TemporaryDirectory() as rules_dir:
+        evaluator = RuleEvaluator(rule_manager=ValidationRuleManager(rules_dir), formula_backend="native")
+        evaluator._create_formula_processor = lambda: RecordingProcessor()
+        rule = ValidationRule(name="HasSource", formula='=NOT(ISBLANK([CaseSource]))')
+        result = evaluator.evaluate_rule(rule, data, 'ResponsibleParty')
+
+    assert seen_columns == [['CaseSource', 'ResponsibleParty']]
+    assert list(result.result_df.columns) == list(data.columns) + ['Result_HasSource', 'Result_HasSource_Error']
+    assert list(result.result_df.index) == [10, 20, 30, 40, 50]
+
+    failing = result.get_failing_items()
+    assert list(failing.index) == [20, 50]
+    assert list(failing['Status']) == ['inactive', 'ACTIVE']
+    assert set(result.get_failing_items_by_party()) == set()  # rule has no party metadata
+    assert set(result.get_failing_items_by_party('ResponsibleParty')) == {'Team2'}
@@ -0,0 +1,99 @@
+# tests/test_party_aggregation.py
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.rule_engine.compliance_determiner import ComplianceDeterminer, party_status_matrix
+from core.rule_engine.row_index import PartyCodes
+from core.rule_engine.incremental_store import IncrementalResultStore
+from core.rule_engine.result_cache import RuleResultCache
+from core.rule_engine.rule_evaluator import RuleEvaluator
+from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
+from core.scoring.iag_scoring_calculator import IAGScoringCalculator
+from services.validation_service import ValidationPipeline
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(11)
+    return pd.DataFrame({
+        'Amount': rng.integers(-20, 100, 4000),
+        'Owner': rng.choice(['a', None, 'c', 'd'], 4000),
+        'Leader': rng.choice(['Lee', 'Ann', 'Bo', 'Cy', None], 4000)
+    })
+
+
+def _reference_party_results(determiner, result_df, column, party_column):
+    """Per-party results computed one party at a time with the overall-compliance path"""
+    expected = {}
+    for party, rows in result_df.groupby(party_column):
+        status, metrics = determiner.determine_overall_compliance(rows, column)
+        expected[party] = {'status': status, 'metrics': metrics}
+    return expected
+
+
+def test_code_counts_match_per_party_compliance(data):
+    determiner = ComplianceDeterminer(gc_threshold=0.9, pc_threshold=0.6)
+    result_df = data.copy()
+    values = np.where(data['Amount'] > 5, True, False).astype(object)
+    values[::37] = None
+    values[::53] = 'ERROR: division by zero'
+    # One party has only null results and is excluded from every count
+    values[(data['Leader'] == 'Cy').to_numpy()] = None
+    result_df['Result'] = values
+
+    party_results = determiner.aggregate_by_responsible_party(result_df, 'Result', 'Leader')
+    assert list(party_results) == ['Ann', 'Bo', 'Cy', 'Lee']
+    assert party_results == _reference_party_results(determiner, result_df, 'Result', 'Leader')
+    assert party_results['Cy']['metrics']['total_count'] == 0
+
+    # Shared codes give the same answer, and the status codes agree with the dict
+    party_codes = PartyCodes.from_series(result_df['Leader'])
+    counts = determiner.count_by_party(result_df['Result'], party_codes)
+    assert determiner.party_results_from_counts(counts, party_codes.labels) == party_results
+    statuses = determiner.party_statuses(counts)
+    assert [('GC', 'PC', 'DNC')[code] for code in statuses] == [r['status'] for r in party_results.values()]
+
+
+def test_summaries_count_rules_on_party_codes(data, tmp_path):
+    rule_manager = ValidationRuleManager(str(tmp_path / 'rules'))
+    pipeline = ValidationPipeline(
+        rule_manager=rule_manager,
+        evaluator=RuleEvaluator(rule_manager=rule_manager, formula_backend='native'),
+        output_dir=str(tmp_path / 'out'),
+        result_cache=RuleResultCache(str(tmp_path / 'cache')),
+        incremental_store=IncrementalResultStore(str(tmp_path / 'incremental'))
+    )
+    rule_results = {}
+    for name, formula in [('Amount Positive', '=[Amount]>0'), ('Owner Present', '=NOT(ISBLANK([Owner]))'),
+                          ('Amount Small', '=[Amount]<90')]:
+        rule = ValidationRule(name=name, formula=formula)
+        rule_results[rule.rule_id] = pipeline.evaluator.evaluate_rule(rule, data, 'Leader')
+
+    statuses, party_codes = party_status_matrix(list(rule_results.values()))
+    assert statuses.shape == (3, 4) and party_codes.labels == ['Ann', 'Bo', 'Cy', 'Lee']
+
+    results = {'rule_results': {}}
+    pipeline._process_evaluation_results(rule_results, results, 'Leader')
+
+    # Same summary as counting each rule's party_results dict
+    for result in rule_results.values():
+        result.party_statuses = None
+    assert party_status_matrix(list(rule_results.values())) is None
+    expected = {'rule_results': {}}
+    pipeline._process_evaluation_results(rule_results, expected, 'Leader')
+    assert results['grouped_summary'] == expected['grouped_summary']
+
+    calculator = IAGScoringCalculator()
+    by_leader = {party: [{'compliance_status': result.party_results[party]['status']}
+                         for result in rule_results.values()]
+                 for party in party_codes.labels}
+    assert (calculator.calculate_scores_from_status_codes(statuses, party_codes.labels, 'Leader')
+            == calculator.calculate_overall_iag_score(by_leader, 'Leader'))
@@ -0,0 +1,85 @@
+# tests/test_performance_store.py
+
+import os
+import sys
+import tempfile
+
+import pandas as pd
+import pytest
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.rule_engine.performance_store import RulePerformanceStore
+from core.rule_engine.rule_evaluator import RuleEvaluator
+from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
+
+
+@pytest.fixture
+def store():
+    with tempfile.TemporaryDirectory() as root:
+        yield RulePerformanceStore(os.path.join(root, 'perf', 'rules.db'))
+
+
+def test_seconds_per_row_averages_recent_runs(store):
+    # Oldest run falls outside a window of two
+    for seconds in (10.0, 2.0, 4.0):
+        store.record_run([{'rule_id': 'r1', 'seconds': seconds}, {'rule_id': 'r2', 'seconds': 1.0}], 100)
+
+    history = store.seconds_per_row(window=2)
+    assert history['r1'] == pytest.approx(0.03)
+    assert history['r2'] == pytest.approx(0.01)
+    assert store.seconds_per_row(['r2'], window=2) == {'r2': pytest.approx(0.01)}
+    assert store.seconds_per_row([]) == {}
+
+
+def test_slowest_rules_over_recent_runs(store):
+    store.record_run([{'rule_id': 'old', 'rule_name': 'Old', 'seconds': 50.0}], 1000, backend='native')
+    for _ in range(2):
+        store.record_run([
+            {'rule_id': 'fast', 'rule_name': 'Fast', 'seconds': 0.5},
+            {'rule_id': 'slow', 'rule_name': 'Slow', 'seconds': 3.0, 'batched': True}
+        ], 1000, backend='native', workers=2)
+
+    slowest = store.slowest_rules(recent_runs=2)
+    assert [row['rule_id'] for row in slowest] == ['slow', 'fast']
+    assert slowest[0]['rule_name'] == 'Slow'
+    assert slowest[0]['runs'] == 2
+    assert slowest[0]['avg_seconds_per_row'] == pytest.approx(0.003)
+
+    assert store.slowest_rules(limit=1, recent_runs=10)[0]['rule_id'] == 'old'
+
+
+def test_database_opened_on_first_record(tmp_path):
+    store = RulePerformanceStore(str(tmp_path / 'perf' / 'rules.db'))
+    # Reads before any record find no history and create nothing
+    assert store.seconds_per_row() == {} and store.slowest_rules() == []
+    assert not (tmp_path / 'perf').exists()
+
+    store.record_run([{'rule_id': 'r1', 'seconds': 1.0}], 10)
+    assert store.seconds_per_row() == {'r1': pytest.approx(0.1)}
+
+
+def test_unwritable_location_degrades_to_no_history(tmp_path):
+    # The database directory cannot be created under a file
+    (tmp_path / 'blocked').write_text('')
+    store = RulePerformanceStore(str(tmp_path / 'blocked' / 'rules.db'))
+
+    assert store.record_run([{'rule_id': 'r1', 'seconds': 1.0}], 10, run_id='run-1') == 'run-1'
+    assert store.seconds_per_row(['r1']) == {}
+    assert store.slowest_rules() == []
+
+
+def test_evaluator_reports_rule_timings():
+    rules = [
+        ValidationRule(name='Amount Positive', formula='=[Amount]>0'),
+        ValidationRule(name='Owner Present', formula='=NOT(ISBLANK([Owner]))')
+    ]
+    data = pd.DataFrame({'Amount': [1, -2, 3], 'Owner': ['a', None, 'c']})
+    with tempfile.TemporaryDirectory() as root:
+        evaluator = RuleEvaluator(rule_manager=ValidationRuleManager(root), formula_backend="native")
+        results = evaluator.evaluate_multiple_rules(rules, data)
+
+    timings = {timing['rule_id']: timing for timing in evaluator.last_rule_timings}
+    assert set(timings) == set(results)
+    assert all(timing['seconds'] >= 0 for timing in timings.values())
@@ -0,0 +1,89 @@
+# tests/test_process_pool_evaluator.py
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.rule_engine.process_pool_evaluator import (
+    ProcessPoolRuleEvaluator, SharedColumnStore, attach_columns
+)
+from core.rule_engine.rule_evaluator import RuleEvaluator
+from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(3)
+    size = 500
+    return pd.DataFrame({
+        'Amount': rng.integers(-10, 100, size),
+        'Rate': rng.random(size),
+        'Owner': rng.choice(['Ann', 'Bob', None], size),
+        'Opened': pd.date_range('2024-01-01', periods=size, freq='h'),
+        'Party': rng.choice(['P1', 'P2', 'P3'], size)
+    }, index=np.arange(size) * 3)
+
+
+def test_shared_columns_round_trip(data):
+    """Workers see the same values; raw columns are read-only views of shared memory"""
+    with SharedColumnStore(data, list(data.columns)) as store:
+        attached, blocks = attach_columns(store.specs)
+        try:
+            for column in data.columns:
+                assert attached[column].tolist() == data[column].tolist()
+            assert not attached['Amount'].to_numpy().flags.writeable
+        finally:
+            del attached
+            for block in blocks:
+                block.close()
+
+
+def test_process_pool_matches_serial_evaluation(data):
+    rules = [
+        ValidationRule(name='Amount Positive', formula='=[Amount]>0'),
+        ValidationRule(name='Owner Present', formula='=NOT(ISBLANK([Owner]))'),
+        ValidationRule(name='Rate Check', formula='=IF([Rate]>0.5, [Amount]>10, TRUE)'),
+        ValidationRule(name='Missing Column', formula='=[Nope]>1')
+    ]
+    with tempfile.TemporaryDirectory() as root:
+        evaluator = RuleEvaluator(rule_manager=ValidationRuleManager(root), formula_backend="native")
+        expected = evaluator.evaluate_multiple_rules(rules, data, 'Party')
+
+    process_evaluator = ProcessPoolRuleEvaluator(max_workers=2)
+    results = process_evaluator.evaluate_rules(rules, data, 'Party')
+
+    assert list(results) == list(expected)
+    for rule_id, full in expected.items():
+        result = results[rule_id]
+        assert result.compliance_metrics == full.compliance_metrics
+        assert result.party_results == full.party_results
+        pd.testing.assert_frame_equal(result.result_df, full.result_df)
+
+    stats = process_evaluator.last_run_stats
+    assert stats['workers'] == 2
+    assert sum(batch['rules'] for batch in stats['batches']) == 3
+    assert set(stats['rule_cpu_seconds']) == set(expected)
+    # The pool does not fork the scheduler's threads
+    assert process_evaluator.mp_context.get_start_method() in ('forkserver', 'spawn')
+
+
+def test_process_pool_groups_rules_per_task(data):
+    rules = [ValidationRule(name=f'Amount Above {i}', formula=f'=[Amount]>{i}') for i in range(16)]
+    process_evaluator = ProcessPoolRuleEvaluator(max_workers=2)
+    results = process_evaluator.evaluate_rules(rules, data, 'Party')
+
+    assert list(results) == [rule.rule_id for rule in rules]
+    assert results[rules[5].rule_id].compliance_metrics['gc_count'] == int((data['Amount'] > 5).sum())
+
+    # Sixteen rules on two workers are sent as groups of two
+    stats = process_evaluator.last_run_stats
+    assert stats['batch_size'] == 2
+    assert sum(batch['rules'] for batch in stats['batches']) == 16
+    assert len(stats['batches']) < 16 and max(batch['rules'] for batch in stats['batches']) == 2
@@ -0,0 +1,126 @@
+# tests/test_result_cache.py
+
+import os
+import sys
+import tempfile
+
+import pandas as pd
+import pytest
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.rule_engine.compliance_determiner import ComplianceDeterminer
+from core.rule_engine.performance_store import RulePerformanceStore
+from core.rule_engine.result_cache import RuleResultCache
+from core.rule_engine.rule_evaluator import RuleEvaluator
+from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
+from services.validation_service import ValidationPipeline
+
+
+@pytest.fixture
+def workspace():
+    """Temporary rules and cache directories with a native evaluator"""
+    with tempfile.TemporaryDirectory() as root:
+        evaluator = RuleEvaluator(
+            rule_manager=ValidationRuleManager(os.path.join(root, 'rules')),
+            formula_backend="native"
+        )
+        yield evaluator, RuleResultCache(os.path.join(root, 'cache'))
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({
+        'Owner': ['Ann', None, 'Bob', ''],
+        'Notes': ['a', 'b', 'c', 'd'],
+        'Party': ['P1', 'P1', 'P2', 'P2']
+    }, index=[5, 6, 7, 8])
+
+
+def test_cached_result_matches_evaluation(workspace, data):
+    """A stored result is returned for the same rule and unchanged columns"""
+    evaluator, cache = workspace
+    rule = ValidationRule(name="HasOwner", formula='=NOT(ISBLANK([Owner]))', threshold=0.9)
+    result = evaluator.evaluate_rule(rule, data, 'Party')
+
+    assert cache.lookup(rule, data, 'Party', 'native') is None
+    assert cache.store(result, data, 'Party', 'native')
+    cached = cache.lookup(rule, data, 'Party', 'native')
+
+    assert cached is not None
+    pd.testing.assert_frame_equal(cached.result_df, result.result_df)
+    assert cached.compliance_metrics == result.compliance_metrics
+    assert cached.party_results == result.party_results
+    assert list(cached.get_failing_items().index) == [6, 8]
+    assert cache.get_stats()['hits'] == 1
+    assert cache.get_stats()['misses'] == 1
+
+
+def test_key_tracks_referenced_columns_only(workspace, data):
+    """Changing a referenced column or the formula misses; other columns do not matter"""
+    evaluator, cache = workspace
+    rule = ValidationRule(name="HasOwner", formula='=NOT(ISBLANK([Owner]))')
+    cache.store(evaluator.evaluate_rule(rule, data, 'Party'), data, 'Party', 'native')
+
+    assert cache.lookup(rule, data.assign(Notes='changed'), 'Party', 'native') is not None
+    assert cache.lookup(rule, data.assign(Owner='x'), 'Party', 'native') is None
+    assert cache.lookup(rule, data, 'Party', 'excel') is None
+
+    rule.formula = '=NOT(ISBLANK([Notes]))'
+    assert cache.lookup(rule, data, 'Party', 'native') is None
+
+
+def test_lru_eviction(workspace, data, tmp_path):
+    """The least recently used entries are evicted past the size limit"""
+    evaluator, _ = workspace
+    first = ValidationRule(name="HasOwner", formula='=NOT(ISBLANK([Owner]))')
+    second = ValidationRule(name="HasNotes", formula='=NOT(ISBLANK([Notes]))')
+
+    cache = RuleResultCache(str(tmp_path / 'cache'))
+    cache.store(evaluator.evaluate_rule(first, data), data)
+    entry_size = cache.get_stats()['size_bytes']
+
+    # Room for a single entry: storing the second rule evicts the first
+    cache.max_size_bytes = int(entry_size * 1.5)
+    cache.store(evaluator.evaluate_rule(second, data), data)
+
+    stats = cache.get_stats()
+    assert stats['evictions'] == 1
+    assert stats['entries'] == 1
+    assert cache.lookup(first, data) is None
+    assert cache.lookup(second, data) is not None
+
+
+def test_column_digest_of_short_lived_frames(workspace, data):
+    """A frame reusing the id of a freed one does not get its memoized digest"""
+    _, cache = workspace
+    for i in range(200):
+        first = cache._column_digest(data.assign(Owner=f'x{i}'), 'Owner')
+        second = cache._column_digest(data.assign(Owner=f'y{i}'), 'Owner')
+        assert first != second
+
+
+def test_pipelines_with_different_thresholds_share_cache(data, tmp_path):
+    """Results cached under one evaluator's thresholds are not served to another"""
+    cache_dir = str(tmp_path / 'cache')
+    rule_manager = ValidationRuleManager(str(tmp_path / 'rules'))
+    rule = ValidationRule(name="HasOwner", formula='=NOT(ISBLANK([Owner]))', threshold=1.0)
+    rule_manager.add_rule(rule)
+
+    statuses = []
+    for determiner in [ComplianceDeterminer(), ComplianceDeterminer(gc_threshold=0.5, pc_threshold=0.4)]:
+        pipeline = ValidationPipeline(
+            rule_manager=rule_manager,
+            evaluator=RuleEvaluator(rule_manager=rule_manager, formula_backend='native',
+                                    compliance_determiner=determiner),
+            output_dir=str(tmp_path / 'out'),
+            result_cache=RuleResultCache(cache_dir),
+            performance_store=RulePerformanceStore(str(tmp_path / 'performance.db'))
+        )
+        results = pipeline.validate_data_source(data, rule_ids=[rule.rule_id], output_formats=[])
+        statuses.append(results['rule_results'][rule.rule_id]['compliance_status'])
+        assert pipeline.result_cache.get_stats()['hits'] == 0
+
+    # Half the rows have an owner: DNC under the defaults, GC at a 50% threshold
+    assert statuses == ['DNC', 'GC']
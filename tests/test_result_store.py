@@ -0,0 +1,81 @@
+# tests/test_result_store.py
+
+import gc
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.rule_engine.result_store import RuleResultStore
+from core.rule_engine.rule_evaluator import RuleEvaluator
+from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
+
+
+@pytest.fixture
+def evaluator(tmp_path):
+    return RuleEvaluator(rule_manager=ValidationRuleManager(str(tmp_path / 'rules')), formula_backend='native')
+
+
+@pytest.fixture
+def data():
+    return pd.DataFrame({
+        'Amount': np.arange(-500, 1500),
+        'Owner': ['a', None, 'c', 'd'] * 500,
+        'Leader': ['L1', 'L2'] * 1000
+    }, index=np.arange(2000) * 10)
+
+
+def _evaluate(evaluator, data, rules):
+    return {name: evaluator.evaluate_rule(ValidationRule(name=name, formula=formula), data, 'Leader')
+            for name, formula in rules}
+
+
+RULES = [('Amount Positive', '=[Amount]>0'), ('Owner Present', '=NOT(ISBLANK([Owner]))'),
+         ('Amount Ratio', '=[Amount]/([Amount]-7)>0')]
+
+
+def test_store_trims_results_to_their_columns(evaluator, data, tmp_path):
+    results = _evaluate(evaluator, data, RULES)
+    expected = {name: result.get_failing_items() for name, result in results.items()}
+
+    store = RuleResultStore(spill_dir=str(tmp_path / 'spill'))
+    store.add_all(results)
+
+    for name, result in results.items():
+        assert set(result.evaluated_df.columns) <= {f"Result_{name}", f"Result_{name}_Error"}
+        pd.testing.assert_frame_equal(result.get_failing_items(), expected[name], check_like=True)
+    assert store.stats['spilled'] == 0 and not (tmp_path / 'spill').exists()
+
+
+def test_results_over_budget_spill_to_memory_maps(evaluator, data, tmp_path):
+    results = _evaluate(evaluator, data, RULES)
+    expected = {name: (result.get_failing_items(), result.get_failing_items_by_party('Leader'))
+                for name, result in results.items()}
+
+    # Room for the last rule's columns (32 kB) but not all three
+    store = RuleResultStore(memory_budget_mb=40000 / 1024 / 1024, spill_dir=str(tmp_path / 'spill'))
+    store.add_all(results)
+
+    spilled = [name for name, result in results.items() if result.is_spilled]
+    assert spilled == ['Amount Positive', 'Owner Present']
+    assert store.resident_bytes <= store.memory_budget_bytes
+
+    for name, result in results.items():
+        failing, by_party = expected[name]
+        pd.testing.assert_frame_equal(result.get_failing_items(), failing, check_like=True)
+        assert by_party.keys() == result.get_failing_items_by_party('Leader').keys()
+        assert (result.get_failing_items_by_party('Leader').get('L2', pd.DataFrame()).index.tolist()
+                == by_party.get('L2', pd.DataFrame()).index.tolist())
+
+    # Spill files are removed with their results
+    spill_dirs = list((tmp_path / 'spill').glob('*/*'))
+    assert len(spill_dirs) == 2
+    del results, result
+    gc.collect()
+    assert not any(path.exists() for path in spill_dirs)
+    assert store.resident_bytes == 0
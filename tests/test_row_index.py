@@ -0,0 +1,106 @@
+# tests/test_row_index.py
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.rule_engine.compliance_determiner import party_status_matrix
+from core.rule_engine.incremental_store import IncrementalResultStore
+from core.rule_engine.performance_store import RulePerformanceStore
+from core.rule_engine.result_cache import RuleResultCache
+from core.rule_engine.row_index import FailingRowIndex, PartyCodes, factorize_parties
+from core.rule_engine.rule_evaluator import RuleEvaluator
+from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
+from services.validation_service import ValidationPipeline
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(7)
+    return pd.DataFrame({
+        'Amount': rng.integers(-50, 100, 5000),
+        'Owner': rng.choice(['a', None, 'c'], 5000),
+        'Leader': rng.choice(['Lee', 'Ann', 'Bo', None], 5000)
+    }, index=np.arange(5000) + 100)
+
+
+def test_party_codes_match_groupby(data):
+    party_codes = PartyCodes.from_series(data['Leader'])
+    assert party_codes.labels == ['Ann', 'Bo', 'Lee']
+    assert (party_codes.codes == -1).sum() == data['Leader'].isna().sum()
+    expected = [data.index.get_indexer(rows.index) for _, rows in data.groupby('Leader')]
+    assert all(np.array_equal(party_codes.rows_of(label), rows) for label, rows in zip(party_codes.labels, expected))
+
+    index = FailingRowIndex.from_mask(data['Amount'].to_numpy() < 0)
+    assert index.counts_by_party(party_codes) == data[data['Amount'] < 0].groupby('Leader').size().to_dict()
+    assert len(index.for_party(party_codes, 'Nobody')) == 0
+
+
+def test_results_share_one_factorization(data, tmp_path):
+    evaluator = RuleEvaluator(rule_manager=ValidationRuleManager(str(tmp_path / 'rules')), formula_backend='native')
+    results = [evaluator.evaluate_rule(ValidationRule(name=name, formula=formula), data, 'Leader')
+               for name, formula in [('Amount Positive', '=[Amount]>0'), ('Owner Present', '=NOT(ISBLANK([Owner]))')]]
+
+    assert results[0].party_codes is results[1].party_codes is factorize_parties(data, 'Leader')
+
+    for result in results:
+        failing = result.get_failing_items()
+        assert failing.index.is_monotonic_increasing
+        pd.testing.assert_frame_equal(result.get_failing_items(limit=10), failing.head(10))
+
+        # Per-party rows come from the index and match a groupby of all failing rows
+        by_party = result.get_failing_items_by_party('Leader')
+        expected = dict(tuple(failing.groupby('Leader')))
+        assert list(by_party) == list(expected)
+        for party, rows in expected.items():
+            pd.testing.assert_frame_equal(by_party[party], rows)
+            pd.testing.assert_frame_equal(result.get_failing_items_for_party(party, 'Leader', limit=3), rows.head(3))
+
+        blocks = list(result.iter_failing_items(chunk_rows=700))
+        pd.testing.assert_frame_equal(pd.concat(blocks), failing)
+
+
+def test_one_factorization_per_pipeline_run(data, tmp_path, monkeypatch):
+    """Profiled runs evaluate rule by rule, yet factorize the party column once per run"""
+    data = data.iloc[:500].copy()
+    factorized = []
+    from_series = PartyCodes.from_series.__func__
+    monkeypatch.setattr(PartyCodes, 'from_series',
+                        classmethod(lambda cls, series: factorized.append(series.name) or from_series(cls, series)))
+
+    rule_manager = ValidationRuleManager(str(tmp_path / 'rules'))
+    rules = [ValidationRule(name=f'Amount Above {i}', formula=f'=[Amount]>{i}') for i in range(3)]
+    for rule in rules:
+        rule_manager.add_rule(rule)
+    pipeline = ValidationPipeline(
+        rule_manager=rule_manager,
+        evaluator=RuleEvaluator(rule_manager=rule_manager, formula_backend='native'),
+        output_dir=str(tmp_path / 'out'),
+        result_cache=RuleResultCache(str(tmp_path / 'cache')),
+        incremental_store=IncrementalResultStore(str(tmp_path / 'incremental')),
+        performance_store=RulePerformanceStore(str(tmp_path / 'performance.db'))
+    )
+
+    def run():
+        results = pipeline.validate_data_source(data, rule_ids=[rule.rule_id for rule in rules], output_formats=[],
+                                                responsible_party_column='Leader', use_cache=False,
+                                                profile_memory=True)
+        return list(results['_rule_evaluation_results'].values())
+
+    first = run()
+    assert factorized == ['Leader']
+    assert len({id(result.party_codes) for result in first}) == 1
+    assert party_status_matrix(first) is not None
+
+    # Renaming a party in place keeps the DataFrame, but the next run sees the new labels
+    data.loc[data['Leader'] == 'Ann', 'Leader'] = 'Zoe'
+    second = run()
+    assert factorized == ['Leader', 'Leader']
+    assert second[0].party_results['Zoe'] == first[0].party_results['Ann']
+    assert second[0].party_codes.labels == ['Bo', 'Lee', 'Zoe']
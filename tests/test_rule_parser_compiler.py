@@ -0,0 +1,69 @@
+# tests/test_rule_parser_compiler.py
+
+import os
+import sys
+
+import pandas as pd
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.formula_engine.formula_parser import FunctionCall
+from core.rule_engine.rule_parser import (
+    ValidationRuleParser, clear_compiled_formula_cache, compile_formula, normalize_formula
+)
+from core.rule_engine.rule_manager import ValidationRule
+
+
+def test_normalization_shares_cache_entry():
+    """Whitespace and function-name case do not create separate cache entries"""
+    clear_compiled_formula_cache()
+    first = compile_formula('=not(isblank([Status]))')
+    second = compile_formula('  = NOT( ISBLANK( [Status] ) )')
+
+    assert normalize_formula('= not ( [A] >1 )') == '=NOT([A]>1)'
+    assert first is second
+    assert isinstance(first.ast, FunctionCall)
+    assert first.functions == frozenset({'NOT', 'ISBLANK'})
+
+
+def test_columns_come_from_ast():
+    """Column names inside string literals are not column references"""
+    parser = ValidationRuleParser()
+    formula = '=IF([A]="[B]", [C]&[A], "x")'
+    assert parser.extract_column_references(formula) == ['A', 'C']
+
+
+def test_invalid_formulas():
+    """Unbalanced or malformed formulas are rejected, with the parse error kept"""
+    parser = ValidationRuleParser()
+    assert not parser.is_valid_formula('NOT([A])')
+    assert not parser.is_valid_formula('=IF([A]>1,')
+    assert not parser.is_valid_formula('=SUM([A]))')
+    assert parser.compile('=IF([A]>1,').error
+
+    # Partially typed formulas still report their column references
+    assert parser.extract_column_references('=IF([A]>1,') == ['A']
+
+
+def test_schema_keyed_validation():
+    """Missing columns are computed per schema and cached separately"""
+    parser = ValidationRuleParser()
+    formula = '=AND([A]>0, [B]<>"")'
+
+    with_both = parser.compile(formula, ('A', 'B'))
+    only_a = parser.compile(formula, ('A',))
+    assert with_both.missing_columns == ()
+    assert only_a.missing_columns == ('B',)
+    assert only_a.ast is with_both.ast
+
+    is_valid, error = parser.validate_formula_with_dataframe(formula, pd.DataFrame({'A': [1]}))
+    assert not is_valid
+    assert error == 'Formula references non-existent columns: B'
+
+
+def test_rule_exposes_compiled_formula():
+    """ValidationRule shares the compiled formula with its column extraction"""
+    rule = ValidationRule(name='Check', formula='=NOT(ISBLANK([Owner]))')
+    assert rule.compiled_formula is compile_formula(rule.formula)
+    assert rule.get_required_columns() == ['Owner']
@@ -0,0 +1,70 @@
+# tests/test_rule_scheduler.py
+
+import os
+import sys
+import time
+
+import pytest
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.rule_engine.rule_manager import ValidationRule
+from core.rule_engine.rule_scheduler import RuleCostModel, WorkStealingScheduler, estimate_formula_cost
+
+
+def test_ast_cost_ranks_string_work_above_blank_checks():
+    cheap = ValidationRule(name='Cheap', formula='=NOT(ISBLANK([Owner]))')
+    costly = ValidationRule(name='Costly', formula='=IF(LEFT(UPPER(TRIM([Code])),2)="AB", LEN([Name])>3, [Owner]&"x"<>"")')
+    assert estimate_formula_cost(costly) > 5 * estimate_formula_cost(cheap)
+
+
+def test_plan_deals_longest_first_to_least_loaded():
+    rules = [ValidationRule(name=f'R{i}', formula='=[A]>0') for i in range(5)]
+    model = RuleCostModel({rule.rule_id: cost for rule, cost in zip(rules, [1, 5, 3, 2, 4])})
+
+    queues = WorkStealingScheduler(2, model).plan(rules, 1)
+    assert [[item.estimated_seconds for item in queue] for queue in queues] == [[5, 2, 1], [4, 3]]
+
+
+def test_idle_worker_steals_and_history_is_recorded():
+    """A rule that runs far longer than estimated does not hold up the queued work"""
+    rules = [ValidationRule(name=f'R{i}', formula='=[A]>0') for i in range(6)]
+    slow = rules[0]
+    durations = {rule.rule_id: 0.2 if rule is slow else 0.01 for rule in rules}
+    model = RuleCostModel()
+
+    scheduler = WorkStealingScheduler(2, model)
+    results = scheduler.run(rules, 100, lambda rule: time.sleep(durations[rule.rule_id]) or rule.name)
+
+    assert results == {rule.rule_id: rule.name for rule in rules}
+    stats = scheduler.last_run_stats
+    assert stats['steals'] >= 1
+    assert stats['makespan_seconds'] < 0.2 + 0.1
+    assert all(0 <= worker['utilization'] <= 1.0 for worker in stats['worker_stats'])
+    assert sum(worker['rules'] for worker in stats['worker_stats']) == 6
+
+    # Measured runtimes now drive the estimates
+    assert model.estimate(slow, 100) > model.estimate(rules[1], 100)
+
+
+def test_batches_group_rules_and_split_their_time():
+    rules = [ValidationRule(name=f'R{i}', formula='=[A]>0') for i in range(10)]
+    model = RuleCostModel({rule.rule_id: 1.0 for rule in rules})
+
+    batches = []
+    scheduler = WorkStealingScheduler(1, model)
+    results = scheduler.run_batches(rules, 1, lambda batch: batches.append(batch) or len(batch), batch_size=3)
+    assert [len(batch) for batch in batches] == [3, 3, 3, 1]
+    assert all(results[rule.rule_id] == len(batch) for batch in batches for rule in batch)
+
+    stats = scheduler.last_run_stats
+    assert sorted(stats['batched_rules']) == sorted(rule.rule_id for rule in rules[:9])
+    # Equal estimates share a batch's time equally, so per-rule spans add up to the busy time
+    assert sum(stats['rule_seconds'].values()) == pytest.approx(stats['worker_stats'][0]['busy_seconds'])
+
+    # Stolen batches also stay within the batch size
+    batches = []
+    WorkStealingScheduler(2, model).run_batches(rules, 1, lambda batch: batches.append(batch), batch_size=3)
+    assert max(len(batch) for batch in batches) <= 3
+    assert sorted(rule.rule_id for batch in batches for rule in batch) == sorted(rule.rule_id for rule in rules)
@@ -0,0 +1,76 @@
+# tests/test_sqlite_formula_processor.py
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.formula_engine.native_formula_processor import NativeFormulaProcessor, UnsupportedFormulaError
+from core.formula_engine.sqlite_formula_processor import SqliteFormulaProcessor
+from core.rule_engine.rule_evaluator import RuleEvaluator
+from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(5)
+    size = 2000
+    return pd.DataFrame({
+        'Amount': np.where(rng.random(size) < 0.1, np.nan, rng.integers(-5, 20, size).astype(float)),
+        'Name': rng.choice(['  Ann  Lee ', 'bob', '', None, 'TRUE'], size),
+        'Flag': rng.choice([True, False], size),
+        'Opened': pd.date_range('2024-01-01', periods=size, freq='7h'),
+        'Leader': rng.choice(['L1', 'L2', None], size)
+    })
+
+
+FORMULAS = [
+    '=IF(ISBLANK([Amount]), TRUE, [Amount]/([Amount]-3)>1)',
+    '=AND(NOT(ISBLANK([Name])), LEN(TRIM([Name]))>3)',
+    '=OR([Name], [Flag])',
+    '=LEFT([Name], 3)="ann"',
+    '=[Name]&"-"&[Amount]',
+    '=[Opened]>45300',
+    '=[Amount]>[Name]',
+    '=IF([Flag], [Amount]/0, -[Amount]%)',
+]
+
+
+def test_results_match_native_engine(data, tmp_path):
+    formulas = {f"Result_{i}": formula for i, formula in enumerate(FORMULAS)}
+    expected = NativeFormulaProcessor().process_formulas(data, formulas)
+    with SqliteFormulaProcessor(database_dir=str(tmp_path)) as processor:
+        result = processor.process_formulas(data, formulas)
+        assert list(processor.column_kinds) == ['Amount', 'Name', 'Flag', 'Opened']
+    pd.testing.assert_frame_equal(result, expected)
+    # The temporary database goes with the processor
+    assert not list(tmp_path.iterdir())
+
+    with SqliteFormulaProcessor(database_dir=str(tmp_path)) as processor:
+        assert not processor.supports_formula('=UPPER([Name])="BOB"')
+        with pytest.raises(UnsupportedFormulaError):
+            processor.process_formulas(data, {'Result': '=[Name]+1'})
+
+
+def test_group_by_counts_match_evaluator(data, tmp_path):
+    rule_manager = ValidationRuleManager(str(tmp_path / 'rules'))
+    evaluator = RuleEvaluator(rule_manager=rule_manager, formula_backend='sqlite')
+    rule = ValidationRule(name='Ratio', formula=FORMULAS[0])
+    result = evaluator.evaluate_rule(rule, data, 'Leader')
+
+    # Chunks are loaded one at a time
+    chunks = (data.iloc[start:start + 300] for start in range(0, len(data), 300))
+    with SqliteFormulaProcessor(database_dir=str(tmp_path), fetch_rows=128) as processor:
+        counts = processor.aggregate_by_party(chunks, {'Ratio': FORMULAS[0]}, 'Leader')['Ratio']
+
+    assert list(counts.index) == ['L1', 'L2', None]
+    for party, party_result in result.party_results.items():
+        metrics = party_result['metrics']
+        assert counts.loc[party].to_dict() == {key: metrics[key] for key in counts.columns}
+    overall = counts.sum()
+    assert {key: result.compliance_metrics[key] for key in counts.columns} == overall.to_dict()
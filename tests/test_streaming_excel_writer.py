@@ -0,0 +1,83 @@
+# tests/test_streaming_excel_writer.py
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import load_workbook
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.rule_engine.incremental_store import IncrementalResultStore
+from core.rule_engine.result_cache import RuleResultCache
+from core.rule_engine.rule_evaluator import RuleEvaluator
+from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
+from reporting.generation.streaming_excel_writer import StreamingExcelReportWriter
+from services.validation_service import ValidationPipeline
+
+
+@pytest.fixture
+def run(tmp_path):
+    rule_manager = ValidationRuleManager(str(tmp_path / 'rules'))
+    pipeline = ValidationPipeline(
+        rule_manager=rule_manager,
+        evaluator=RuleEvaluator(rule_manager=rule_manager, formula_backend='native'),
+        output_dir=str(tmp_path / 'out'),
+        result_cache=RuleResultCache(str(tmp_path / 'cache')),
+        incremental_store=IncrementalResultStore(str(tmp_path / 'incremental'))
+    )
+    data = pd.DataFrame({
+        'Amount': np.arange(-2500, 500),
+        'Owner': ['a', None, 'c'] * 1000,
+        'Opened': pd.date_range('2024-01-01', periods=3000, freq='h'),
+        'Leader': ['L1', 'L2'] * 1500
+    })
+    rule_results = {}
+    for name, formula in [('Amount Positive', '=[Amount]>0'), ('Owner Present', '=NOT(ISBLANK([Owner]))'),
+                          ('Amount Known', '=NOT(ISBLANK([Amount]))')]:
+        rule = ValidationRule(name=name, formula=formula)
+        rule_results[rule.rule_id] = pipeline.evaluator.evaluate_rule(rule, data, 'Leader')
+    results = {'rule_results': {}, 'timestamp': '2024-01-01T00:00:00'}
+    pipeline._process_evaluation_results(rule_results, results, 'Leader')
+    return results, rule_results, data
+
+
+def _sheet_rows(path, sheet_name):
+    workbook = load_workbook(path, read_only=True)
+    return [list(row) for row in workbook[sheet_name].iter_rows(values_only=True)]
+
+
+def test_report_keeps_sheets_and_caps_failures(run, tmp_path):
+    results, rule_results, data = run
+    path = StreamingExcelReportWriter(str(tmp_path / 'report.xlsx')).write(results, rule_results, data, 1.5)
+
+    amount_id, owner_id, _ = list(rule_results)
+    sheet_names = load_workbook(path, read_only=True).sheetnames
+    # The rule without failures gets no sheet
+    assert sheet_names == ['Summary', 'Rules', 'Data Sample', 'By Category', 'By Severity',
+                           'By Responsible Party', f"Rule_{amount_id[-20:]}", f"Rule_{owner_id[-20:]}"]
+
+    assert _sheet_rows(path, 'Summary')[1:3] == [['Status', 'NON_COMPLIANT'], ['Total Rules', 3]]
+    assert len(_sheet_rows(path, 'Data Sample')) == 101
+
+    failures = _sheet_rows(path, f"Rule_{amount_id[-20:]}")
+    assert failures[0] == ['Amount', 'Owner', 'Opened', 'Leader', 'Result_Amount Positive',
+                           'Result_Amount Positive_Error']
+    assert len(failures) == 1001
+    assert failures[2][:4] == [-2499, None, pd.Timestamp('2024-01-01 01:00'), 'L2']
+
+
+def test_small_memory_ceiling_streams_the_same_rows(run, tmp_path):
+    results, rule_results, data = run
+    full = StreamingExcelReportWriter(str(tmp_path / 'full.xlsx'), max_failures_per_rule=None)
+    tight = StreamingExcelReportWriter(str(tmp_path / 'tight.xlsx'), memory_limit_mb=0.01,
+                                       max_failures_per_rule=None)
+    assert tight._block_rows(next(iter(rule_results.values()))) < 100
+
+    owner_sheet = f"Rule_{list(rule_results)[1][-20:]}"
+    full_rows = _sheet_rows(full.write(results, rule_results, data, 0), owner_sheet)
+    tight_rows = _sheet_rows(tight.write(results, rule_results, data, 0), owner_sheet)
+    assert len(full_rows) == 1001 and tight_rows == full_rows
@@ -0,0 +1,118 @@
+# tests/test_streaming_validator.py
+
+import gc
+import os
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from core.rule_engine.rule_evaluator import RuleEvaluator
+from core.rule_engine.rule_manager import ValidationRule, ValidationRuleManager
+from core.rule_engine.streaming_validator import StreamingValidator
+from data_integration.io.importer import DataImporter
+
+
+@pytest.fixture
+def workspace():
+    """Temporary directory with a native evaluator"""
+    with tempfile.TemporaryDirectory() as root:
+        evaluator = RuleEvaluator(
+            rule_manager=ValidationRuleManager(os.path.join(root, 'rules')),
+            formula_backend="native"
+        )
+        yield root, evaluator
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(7)
+    size = 250
+    return pd.DataFrame({
+        'ID': np.arange(size),
+        'Amount': rng.integers(-20, 100, size),
+        'Owner': rng.choice(['Ann', 'Bob', 'Cy', ''], size),
+        'Party': rng.choice(['P1', 'P2', 'P3'], size)
+    })
+
+
+@pytest.fixture
+def rules():
+    return [
+        ValidationRule(name='Amount Positive', formula='=[Amount]>0', threshold=1.0),
+        ValidationRule(name='Owner Present', formula='=LEN([Owner])>0', threshold=1.0)
+    ]
+
+
+@pytest.mark.parametrize('extension', ['.csv', '.xlsx'])
+def test_streamed_results_match_full_run(workspace, data, rules, extension):
+    """Accumulated counts and spilled failing rows equal a single full evaluation"""
+    root, evaluator = workspace
+    path = os.path.join(root, f'source{extension}')
+    if extension == '.csv':
+        data.to_csv(path, index=False)
+    else:
+        data.to_excel(path, index=False)
+
+    chunks = DataImporter.iter_file_chunks(path, 60, detect_dates=False)
+    results, stats = StreamingValidator(evaluator, spill_dir=os.path.join(root, 'spill')).validate(
+        chunks, rules, 'Party'
+    )
+    assert stats['chunks'] == 5
+    assert stats['rows'] == len(data)
+    assert stats['max_chunk_rows'] == 60
+
+    full_data = DataImporter.load_file(path, detect_dates=False)
+    expected = evaluator.evaluate_multiple_rules(rules, full_data, 'Party')
+    for rule in rules:
+        streamed, full = results[rule.rule_id], expected[rule.rule_id]
+        assert streamed.compliance_status == full.compliance_status
+        assert streamed.compliance_metrics == pytest.approx(full.compliance_metrics)
+        assert streamed.party_results.keys() == full.party_results.keys()
+        for party, party_result in full.party_results.items():
+            assert streamed.party_results[party]['metrics'] == pytest.approx(party_result['metrics'])
+
+        failing = streamed.get_failing_items()
+        assert failing['ID'].tolist() == full.get_failing_items()['ID'].tolist()
+        assert failing.index.tolist() == full.get_failing_items().index.tolist()
+        assert set(streamed.get_failing_items_by_party('Party')) <= set(full.party_results)
+
+
+def test_spill_files_removed_with_results(workspace, data, rules):
+    """Spill files of failed rules go at once, the others when their result is released"""
+    root, evaluator = workspace
+    spill_dir = os.path.join(root, 'spill')
+    # The column checked by the last rule is missing from the second chunk
+    chunks = [data.iloc[:100].assign(Extra=-1), data.iloc[100:]]
+    failed_rule = ValidationRule(name='Extra Positive', formula='=[Extra]>0')
+
+    results, stats = StreamingValidator(evaluator, spill_dir=spill_dir).validate(
+        iter(chunks), rules + [failed_rule], 'Party'
+    )
+    assert list(results) == [rule.rule_id for rule in rules]
+    spill_paths = [path for result in results.values() for path in result.spill_paths]
+    assert spill_paths and all(path.exists() for path in spill_paths)
+    assert set(os.listdir(stats['spill_dir'])) == {path.parent.name for path in spill_paths}
+
+    del results
+    gc.collect()
+    assert not any(path.exists() for path in spill_paths)
+    assert os.listdir(spill_dir) == []
+
+
+@pytest.mark.parametrize('date_columns', [None, ['Opened']])
+def test_chunks_parse_dates_with_first_chunk_format(workspace, date_columns):
+    """A later chunk whose values alone read month-first keeps the first chunk's day-first format"""
+    root, _ = workspace
+    path = os.path.join(root, 'dates.csv')
+    pd.DataFrame({'Opened': ['13/05/2024', '25/06/2024', '05/01/2024', '06/02/2024']}).to_csv(path, index=False)
+
+    chunks = list(DataImporter.iter_file_chunks(path, 2, date_columns=date_columns))
+    opened = pd.concat(chunks)['Opened']
+    assert all(pd.api.types.is_datetime64_any_dtype(chunk['Opened']) for chunk in chunks)
+    assert opened.dt.strftime('%Y-%m-%d').tolist() == ['2024-05-13', '2024-06-25', '2024-01-05', '2024-02-06']
@@ -0,0 +1,57 @@
+# tests/test_tracing.py
+
+import os
+import sys
+import tempfile
+
+import pandas as pd
+
+# Add the project root to path for imports
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from data_integration.io.importer import DataImporter
+from utils.tracing import NULL_SPAN, Tracer
+
+
+def test_spans_nest_and_record_rows():
+    tracer = Tracer()
+    with tracer.span('evaluation', rows=10) as evaluation:
+        with tracer.span('inner') as inner:
+            inner.set(hits=2)
+        tracer.record('rule:A', 0.5, 0.25, rows=10, rule_id='a')
+    with tracer.span('outputs'):
+        pass
+
+    timings = tracer.to_dict()
+    assert [span['name'] for span in timings['spans']] == ['evaluation', 'outputs']
+    evaluation = timings['spans'][0]
+    assert evaluation['rows'] == 10
+    assert evaluation['wall_seconds'] >= 0 and evaluation['cpu_seconds'] >= 0
+    assert [child['name'] for child in evaluation['children']] == ['inner', 'rule:A']
+    assert evaluation['children'][0]['hits'] == 2
+    assert evaluation['children'][1] == {'name': 'rule:A', 'wall_seconds': 0.5, 'cpu_seconds': 0.25,
+                                         'rows': 10, 'rule_id': 'a'}
+    assert timings['wall_seconds'] >= evaluation['wall_seconds']
+
+
+def test_disabled_tracer_records_nothing():
+    tracer = Tracer(enabled=False)
+    with tracer.span('load') as span:
+        span.set_rows(5)
+        tracer.record('rule:A', 1.0)
+    assert span is NULL_SPAN
+    assert tracer.to_dict()['spans'] == []
+
+
+def test_importer_times_read_and_date_detection():
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, 'data.csv')
+        pd.DataFrame({'Opened': ['2024-01-02', '2024-02-03'], 'Amount': [1, 2]}).to_csv(path, index=False)
+
+        tracer = Tracer()
+        with tracer.span('load'):
+            DataImporter.load_file(path, tracer=tracer)
+
+    load = tracer.to_dict()['spans'][0]
+    assert [child['name'] for child in load['children']] == ['read', 'date_detection']
+    assert load['children'][0]['rows'] == 2
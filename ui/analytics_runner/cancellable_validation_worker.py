@@ -76,7 +76,8 @@ class CancellableValidationWorker(QRunnable):
                  responsible_party_column: Optional[str] = None,
                  generate_leader_packs: bool = False,
                  analytic_title: Optional[str] = None,
-                 use_template: bool = False):
+                 use_template: bool = False,
+                 source_id: Optional[str] = None):
         super().__init__()
         
         # Validation parameters
@@ -93,6 +94,7 @@ class CancellableValidationWorker(QRunnable):
         self.generate_leader_packs = generate_leader_packs
         self.analytic_title = analytic_title
         self.use_template = use_template
+        self.source_id = source_id  # Saved data source ID, enables incremental re-validation
         
         # Execution management
         self._cancel_event = threading.Event()
@@ -221,7 +223,8 @@ class CancellableValidationWorker(QRunnable):
                 'use_parallel': getattr(self, 'use_parallel', False),  # Get from instance if set
                 'responsible_party_column': getattr(self, 'responsible_party_column', None),
                 'progress_callback': progress_callback,
-                'analytic_title': self.analytic_title
+                'analytic_title': self.analytic_title,
+                'source_id': self.source_id
             }
             
             # Excel format now uses template by default, no need to convert
@@ -3236,6 +3236,10 @@ class AnalyticsRunnerApp(QMainWindow):
         if generate_leader_packs:
             self.log_message("Audit Leader-Specific Workbooks will be generated", "INFO")
 
+        # Saved sources keep per-row results so reruns only evaluate new or changed rows
+        saved_source = self.data_source_panel.get_current_source_metadata()
+        source_id = saved_source.source_id if saved_source else None
+
         # Create and start cancellable validation worker
         self.validation_worker = CancellableValidationWorker(
             pipeline=None,  # Will be created in worker
@@ -3248,7 +3252,8 @@ class AnalyticsRunnerApp(QMainWindow):
             output_dir=output_dir,
             use_parallel=use_parallel,
             responsible_party_column=responsible_party_column,
-            generate_leader_packs=generate_leader_packs
+            generate_leader_packs=generate_leader_packs,
+            source_id=source_id
         )
 
         # Connect worker signals
@@ -43,12 +43,8 @@ class FailingItemsLoader(QRunnable):
     def run(self):
         """Load failing items data"""
         try:
-            # Get failing items
-            failing_items = self.rule_result.get_failing_items()
-            
-            # Limit rows for performance
-            if len(failing_items) > self.max_rows:
-                failing_items = failing_items.head(self.max_rows)
+            # Only the displayed rows are materialized, via the failing-row index
+            failing_items = self.rule_result.get_failing_items(limit=self.max_rows)
                 
             self.signals.dataLoaded.emit(failing_items)
             
@@ -0,0 +1,209 @@
+# utils/memory_profiler.py
+
+"""
+Opt-in memory accounting for pipeline stages and rule evaluations.
+
+Each measured section reports the process's resident set size and its peak
+while the section ran, the Python heap growth and peak seen by tracemalloc,
+and the source lines that allocated the most memory. DataFrames can be sized
+with memory_usage(deep=True) to show what each copy costs.
+
+Peak RSS is per section only where the operating system lets the peak be
+reset (Linux); elsewhere it is the process peak so far.
+"""
+
+import contextlib
+import sysconfig
+import tracemalloc
+from typing import Any, Dict, List
+
+import pandas as pd
+
+from utils import process_monitor
+from utils.process_monitor import read_memory_usage, reset_peak_rss
+
+# Allocation sites inside these files are profiler overhead, not pipeline memory
+_IGNORED_FILES = (tracemalloc.__file__, __file__, process_monitor.__file__)
+
+# Allocations made inside libraries are attributed to the application line calling them
+_LIBRARY_DIRS = tuple({sysconfig.get_paths()[key] for key in ("stdlib", "purelib", "platlib")})
+
+# Stack depth recorded per allocation, enough to reach the calling application line
+TRACEBACK_FRAMES = 10
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """
+    Deep memory usage of a DataFrame, including its index and object values.
+
+    Args:
+        df: DataFrame to measure
+
+    Returns:
+        Size in bytes
+    """
+    return int(df.memory_usage(deep=True, index=True).sum())
+
+
+class _Section:
+    """Measurements of one profiled section, while it runs"""
+
+    def __init__(self, name: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.attributes = attributes
+        self.children: List[Dict[str, Any]] = []
+        self.child_python_peak = 0
+        self.child_rss_peak = 0
+
+
+class MemoryProfiler:
+    """
+    Records memory use of nested sections of work.
+    """
+
+    def __init__(self, enabled: bool = True, top_allocations: int = 5):
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled: Whether sections are measured
+            top_allocations: Number of largest allocation sites reported per section
+                             (0 disables tracemalloc snapshots)
+        """
+        self.enabled = enabled
+        self.top_allocations = top_allocations
+        self.sections: List[Dict[str, Any]] = []
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self.peak_rss_resettable = False
+        self._stack: List[_Section] = []
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        """Start tracing Python allocations"""
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEBACK_FRAMES)
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        """Stop tracing Python allocations, if this profiler started it"""
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def record_frame(self, name: str, df: pd.DataFrame) -> None:
+        """
+        Record a DataFrame whose deep memory usage is reported.
+
+        The frame is sized in to_dict(): deep sizing visits every object value,
+        which is very slow while tracemalloc is tracing, so stop() first.
+
+        Args:
+            name: Label for the DataFrame
+            df: DataFrame to measure
+        """
+        if self.enabled:
+            self._frames[name] = df
+
+    @contextlib.contextmanager
+    def section(self, name: str, **attributes):
+        """
+        Measure the memory used by a block of work.
+
+        Sections nest; a section's peaks include those of its children.
+
+        Args:
+            name: Section name
+            **attributes: Extra values reported with the section (e.g. rule_id)
+
+        Yields:
+            Dictionary of attributes the block may add to
+        """
+        if not self.enabled:
+            yield attributes
+            return
+
+        section = _Section(name, attributes)
+        tracing = tracemalloc.is_tracing()
+        if self._stack:
+            # Keep the parent's peaks so far before resetting them for this section
+            parent = self._stack[-1]
+            parent.child_rss_peak = max(parent.child_rss_peak, read_memory_usage()["peak_rss_bytes"] or 0)
+            if tracing:
+                parent.child_python_peak = max(parent.child_python_peak, tracemalloc.get_traced_memory()[1])
+        snapshot = tracemalloc.take_snapshot() if tracing and self.top_allocations else None
+        if tracing:
+            tracemalloc.reset_peak()
+            python_start = tracemalloc.get_traced_memory()[0]
+        self.peak_rss_resettable = reset_peak_rss()
+        rss_start = read_memory_usage()["rss_bytes"]
+        self._stack.append(section)
+        try:
+            yield attributes
+        finally:
+            self._stack.pop()
+            memory = read_memory_usage()
+            peak_rss = max(memory["peak_rss_bytes"] or 0, section.child_rss_peak) or None
+            entry = {"name": name, "rss_bytes": memory["rss_bytes"], "peak_rss_bytes": peak_rss}
+            if memory["rss_bytes"] is not None and rss_start is not None:
+                entry["rss_delta_bytes"] = memory["rss_bytes"] - rss_start
+
+            python_peak = 0
+            if tracing and tracemalloc.is_tracing():
+                python_now, python_peak = tracemalloc.get_traced_memory()
+                python_peak = max(python_peak, section.child_python_peak)
+                entry["python_allocated_bytes"] = python_now - python_start
+                entry["python_peak_bytes"] = python_peak - python_start
+                if snapshot is not None:
+                    entry["top_allocations"] = self._top_allocations(snapshot)
+
+            entry.update(section.attributes)
+            if section.children:
+                entry["children"] = section.children
+
+            if self._stack:
+                # Resetting the peaks for this section hid them from the parent
+                parent = self._stack[-1]
+                parent.children.append(entry)
+                parent.child_python_peak = max(parent.child_python_peak, python_peak)
+                parent.child_rss_peak = max(parent.child_rss_peak, peak_rss or 0)
+            else:
+                self.sections.append(entry)
+
+    def _top_allocations(self, before: tracemalloc.Snapshot) -> List[Dict[str, Any]]:
+        """Application lines whose allocations grew the most since a snapshot"""
+        after = tracemalloc.take_snapshot()
+
+        growth: Dict[str, List[int]] = {}
+        for stat in after.compare_to(before, "traceback"):
+            allocator = stat.traceback[-1]  # Frames run from oldest to most recent
+            if stat.size_diff == 0 or allocator.filename in _IGNORED_FILES:
+                continue
+            # Walk back past frames inside pandas, numpy and the stdlib
+            frame = next((f for f in reversed(stat.traceback) if not f.filename.startswith(_LIBRARY_DIRS)),
+                         allocator)
+            totals = growth.setdefault(f"{frame.filename}:{frame.lineno}", [0, 0])
+            totals[0] += stat.size_diff
+            totals[1] += stat.count_diff
+
+        ranked = sorted(growth.items(), key=lambda item: item[1][0], reverse=True)
+        return [{"location": location, "size_bytes": size, "count": count}
+                for location, (size, count) in ranked[:self.top_allocations] if size > 0]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the measurements to a dictionary.
+
+        Returns:
+            Dictionary with the process memory now, whether peaks are per
+            section, DataFrame sizes and the measured sections
+        """
+        return {
+            **read_memory_usage(),
+            "peak_rss_per_section": self.peak_rss_resettable,
+            "frames": {name: frame_memory(df) for name, df in self._frames.items()},
+            "sections": list(self.sections)
+        }
+
+
+# Shared disabled profiler for runs that are not being profiled
+NULL_MEMORY_PROFILER = MemoryProfiler(enabled=False)
@@ -113,4 +113,65 @@ class ProcessMonitor:
                     except ValueError:
                         counts[name] = 0
 
-        return counts
\ No newline at end of file
+        return counts
+
+_PROC_STATUS = "/proc/self/status"
+_PROC_CLEAR_REFS = "/proc/self/clear_refs"
+
+
+def read_memory_usage() -> Dict[str, Optional[int]]:
+    """
+    Read the current and peak resident set size of this process.
+
+    On Linux the values come from /proc/self/status (VmRSS and VmHWM). Elsewhere
+    psutil is used if available, then the resource module's lifetime peak.
+
+    Returns:
+        Dictionary with rss_bytes and peak_rss_bytes (None when unavailable)
+    """
+    if os.path.exists(_PROC_STATUS):
+        try:
+            values = {}
+            with open(_PROC_STATUS) as f:
+                for line in f:
+                    key, _, rest = line.partition(":")
+                    if key in ("VmRSS", "VmHWM"):
+                        values[key] = int(rest.split()[0]) * 1024  # Reported in kB
+            if "VmRSS" in values:
+                return {"rss_bytes": values["VmRSS"], "peak_rss_bytes": values.get("VmHWM")}
+        except (OSError, ValueError) as e:
+            logger.debug(f"Could not read {_PROC_STATUS}: {str(e)}")
+
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        # Peak working set is only reported on Windows
+        return {"rss_bytes": info.rss, "peak_rss_bytes": getattr(info, "peak_wset", None)}
+    except ImportError:
+        pass
+
+    try:
+        import resource
+        import sys
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kB elsewhere
+        return {"rss_bytes": None, "peak_rss_bytes": peak if sys.platform == "darwin" else peak * 1024}
+    except ImportError:
+        return {"rss_bytes": None, "peak_rss_bytes": None}
+
+
+def reset_peak_rss() -> bool:
+    """
+    Reset the process's peak resident set size to its current value.
+
+    Only supported on Linux, by writing to /proc/self/clear_refs.
+
+    Returns:
+        True if the peak was reset
+    """
+    try:
+        with open(_PROC_CLEAR_REFS, "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
@@ -0,0 +1,212 @@
+# utils/tracing.py
+
+"""
+Lightweight nested timing spans.
+
+A Tracer records a tree of spans, each with its wall-clock time, CPU time and
+the number of rows it processed. A disabled tracer hands out a single shared
+no-op span, so instrumented code costs one attribute check per span.
+
+Span CPU time is the CPU time of the whole process, so a span that waits on
+worker threads includes their work.
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+
+class Span:
+    """
+    One timed section of work.
+    """
+
+    __slots__ = ("name", "rows", "attributes", "children", "_tracer", "_parent",
+                 "_start", "_cpu_start", "wall_seconds", "cpu_seconds")
+
+    def __init__(self, tracer: "Tracer", name: str, rows: Optional[int] = None,
+                 parent: Optional["Span"] = None, attributes: Optional[Dict[str, Any]] = None):
+        self.name = name
+        self.rows = rows
+        self.attributes = attributes or {}
+        self.children: List["Span"] = []
+        self._tracer = tracer
+        self._parent = parent
+        self._start = None
+        self._cpu_start = None
+        self.wall_seconds: Optional[float] = None
+        self.cpu_seconds: Optional[float] = None
+
+    def set_rows(self, rows: int) -> None:
+        """Set the number of rows the span processed"""
+        self.rows = rows
+
+    def set(self, **attributes) -> None:
+        """Attach attributes to the span"""
+        self.attributes.update(attributes)
+
+    def __enter__(self) -> "Span":
+        self._tracer._push(self, self._parent)
+        self._start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.wall_seconds = time.perf_counter() - self._start
+        self.cpu_seconds = time.process_time() - self._cpu_start
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self._tracer._pop(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the span and its children to a dictionary.
+
+        A span that is still open reports its time so far.
+        """
+        wall, cpu = self.wall_seconds, self.cpu_seconds
+        in_progress = wall is None and self._start is not None
+        if in_progress:
+            wall = time.perf_counter() - self._start
+            cpu = time.process_time() - self._cpu_start
+
+        span = {"name": self.name, "wall_seconds": wall, "cpu_seconds": cpu}
+        if self.rows is not None:
+            span["rows"] = self.rows
+        if self.attributes:
+            span.update(self.attributes)
+        if in_progress:
+            span["in_progress"] = True
+        if self.children:
+            span["children"] = [child.to_dict() for child in self.children]
+        return span
+
+
+class _NullSpan:
+    """Span handed out by a disabled tracer"""
+
+    __slots__ = ()
+
+    def set_rows(self, rows: int) -> None:
+        pass
+
+    def set(self, **attributes) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Collects a tree of timing spans.
+
+    Spans opened with ``with tracer.span(...)`` nest under the span currently
+    open in the same thread. Work timed elsewhere (e.g. in worker threads or
+    processes) can be added afterwards with record().
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize the tracer.
+
+        Args:
+            enabled: Whether spans are recorded
+        """
+        self.enabled = enabled
+        self.spans: List[Span] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    def span(self, name: str, rows: Optional[int] = None, parent: Optional[Span] = None, **attributes):
+        """
+        Create a span to use as a context manager.
+
+        Args:
+            name: Span name
+            rows: Number of rows processed, if known up front
+            parent: Span to nest under (default: the span open in this thread)
+            **attributes: Extra values reported with the span
+
+        Returns:
+            Span, or a shared no-op span when the tracer is disabled
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        return Span(self, name, rows, parent, attributes)
+
+    def record(self,
+               name: str,
+               wall_seconds: float,
+               cpu_seconds: Optional[float] = None,
+               rows: Optional[int] = None,
+               parent: Optional[Span] = None,
+               **attributes) -> None:
+        """
+        Add a span for work that has already been timed.
+
+        Args:
+            name: Span name
+            wall_seconds: Wall-clock time of the work
+            cpu_seconds: CPU time of the work, if known
+            rows: Number of rows processed
+            parent: Span to nest under (default: the span open in this thread)
+            **attributes: Extra values reported with the span
+        """
+        if not self.enabled:
+            return
+        span = Span(self, name, rows, parent, attributes)
+        span.wall_seconds = wall_seconds
+        span.cpu_seconds = cpu_seconds
+        self._attach(span, parent or self._current())
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _current(self) -> Optional[Span]:
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def _attach(self, span: Span, parent: Optional[Span]) -> None:
+        with self._lock:
+            (parent.children if parent is not None else self.spans).append(span)
+
+    def _push(self, span: Span, parent: Optional[Span]) -> None:
+        self._attach(span, parent or self._current())
+        self._stack().append(span)
+
+    def _pop(self, span: Span) -> None:
+        stack = self._stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the timing tree to a dictionary.
+
+        Returns:
+            Dictionary with the total wall and CPU time since the tracer was
+            created and the top-level spans
+        """
+        with self._lock:
+            spans = list(self.spans)
+        return {
+            "wall_seconds": time.perf_counter() - self._start,
+            "cpu_seconds": time.process_time() - self._cpu_start,
+            "spans": [span.to_dict() for span in spans]
+        }
+
+
+# Shared disabled tracer for code paths that are not being traced
+NULL_TRACER = Tracer(enabled=False)